@@ -86,6 +86,19 @@ STATIC mp_obj_t mod_trezorcrypto_Blake2s_digest(mp_obj_t self) {
 }
 STATIC MP_DEFINE_CONST_FUN_OBJ_1(mod_trezorcrypto_Blake2s_digest_obj, mod_trezorcrypto_Blake2s_digest);
 
+/// def copy(self) -> Blake2s:
+///     '''
+///     Returns a copy of the hash context.
+///     '''
+STATIC mp_obj_t mod_trezorcrypto_Blake2s_copy(mp_obj_t self) {
+    mp_obj_Blake2s_t *o = MP_OBJ_TO_PTR(self);
+    mp_obj_Blake2s_t *c = m_new_obj(mp_obj_Blake2s_t);
+    c->base.type = o->base.type;
+    memcpy(&(c->ctx), &(o->ctx), sizeof(BLAKE2S_CTX));
+    return MP_OBJ_FROM_PTR(c);
+}
+STATIC MP_DEFINE_CONST_FUN_OBJ_1(mod_trezorcrypto_Blake2s_copy_obj, mod_trezorcrypto_Blake2s_copy);
+
 STATIC mp_obj_t mod_trezorcrypto_Blake2s___del__(mp_obj_t self) {
     mp_obj_Blake2s_t *o = MP_OBJ_TO_PTR(self);
     memzero(&(o->ctx), sizeof(BLAKE2S_CTX));
@@ -96,6 +109,7 @@ STATIC MP_DEFINE_CONST_FUN_OBJ_1(mod_trezorcrypto_Blake2s___del___obj, mod_trezo
 STATIC const mp_rom_map_elem_t mod_trezorcrypto_Blake2s_locals_dict_table[] = {
     { MP_ROM_QSTR(MP_QSTR_update), MP_ROM_PTR(&mod_trezorcrypto_Blake2s_update_obj) },
     { MP_ROM_QSTR(MP_QSTR_digest), MP_ROM_PTR(&mod_trezorcrypto_Blake2s_digest_obj) },
+    { MP_ROM_QSTR(MP_QSTR_copy), MP_ROM_PTR(&mod_trezorcrypto_Blake2s_copy_obj) },
     { MP_ROM_QSTR(MP_QSTR___del__), MP_ROM_PTR(&mod_trezorcrypto_Blake2s___del___obj) },
     { MP_ROM_QSTR(MP_QSTR_block_size), MP_OBJ_NEW_SMALL_INT(BLAKE2S_BLOCK_LENGTH) },
     { MP_ROM_QSTR(MP_QSTR_digest_size), MP_OBJ_NEW_SMALL_INT(BLAKE2S_DIGEST_LENGTH) },
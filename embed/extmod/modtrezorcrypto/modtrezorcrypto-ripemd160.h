@@ -79,6 +79,19 @@ STATIC mp_obj_t mod_trezorcrypto_Ripemd160_digest(mp_obj_t self) {
 }
 STATIC MP_DEFINE_CONST_FUN_OBJ_1(mod_trezorcrypto_Ripemd160_digest_obj, mod_trezorcrypto_Ripemd160_digest);
 
+/// def copy(self) -> Ripemd160:
+///     '''
+///     Returns a copy of the hash context.
+///     '''
+STATIC mp_obj_t mod_trezorcrypto_Ripemd160_copy(mp_obj_t self) {
+    mp_obj_Ripemd160_t *o = MP_OBJ_TO_PTR(self);
+    mp_obj_Ripemd160_t *c = m_new_obj(mp_obj_Ripemd160_t);
+    c->base.type = o->base.type;
+    memcpy(&(c->ctx), &(o->ctx), sizeof(RIPEMD160_CTX));
+    return MP_OBJ_FROM_PTR(c);
+}
+STATIC MP_DEFINE_CONST_FUN_OBJ_1(mod_trezorcrypto_Ripemd160_copy_obj, mod_trezorcrypto_Ripemd160_copy);
+
 STATIC mp_obj_t mod_trezorcrypto_Ripemd160___del__(mp_obj_t self) {
     mp_obj_Ripemd160_t *o = MP_OBJ_TO_PTR(self);
     memzero(&(o->ctx), sizeof(RIPEMD160_CTX));
@@ -89,6 +102,7 @@ STATIC MP_DEFINE_CONST_FUN_OBJ_1(mod_trezorcrypto_Ripemd160___del___obj, mod_tre
 STATIC const mp_rom_map_elem_t mod_trezorcrypto_Ripemd160_locals_dict_table[] = {
     { MP_ROM_QSTR(MP_QSTR_update), MP_ROM_PTR(&mod_trezorcrypto_Ripemd160_update_obj) },
     { MP_ROM_QSTR(MP_QSTR_digest), MP_ROM_PTR(&mod_trezorcrypto_Ripemd160_digest_obj) },
+    { MP_ROM_QSTR(MP_QSTR_copy), MP_ROM_PTR(&mod_trezorcrypto_Ripemd160_copy_obj) },
     { MP_ROM_QSTR(MP_QSTR___del__), MP_ROM_PTR(&mod_trezorcrypto_Ripemd160___del___obj) },
     { MP_ROM_QSTR(MP_QSTR_block_size), MP_OBJ_NEW_SMALL_INT(RIPEMD160_BLOCK_LENGTH) },
     { MP_ROM_QSTR(MP_QSTR_digest_size), MP_OBJ_NEW_SMALL_INT(RIPEMD160_DIGEST_LENGTH) },
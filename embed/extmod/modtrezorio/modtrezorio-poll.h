@@ -26,6 +26,13 @@
 #define POLL_READ  (0x0000)
 #define POLL_WRITE (0x0100)
 
+#if defined TREZOR_MODEL_EMU
+// emulator can receive several reports in one datagram, see embed/unix/usb.c
+#define USB_PACKET_LEN (4096)
+#else
+#define USB_PACKET_LEN (64)
+#endif
+
 #define CHECK_PARAM_RANGE(value, minimum, maximum) \
     if (value < minimum || value > maximum) { \
         mp_raise_ValueError(#value " is out of range"); \
@@ -75,7 +82,7 @@ STATIC mp_obj_t mod_trezorio_poll(mp_obj_t ifaces, mp_obj_t list_ref, mp_obj_t t
             } else
             if (mode == POLL_READ) {
                 if (sectrue == usb_hid_can_read(iface)) {
-                    uint8_t buf[64];
+                    uint8_t buf[USB_PACKET_LEN];
                     int len = usb_hid_read(iface, buf, sizeof(buf));
                     if (len > 0) {
                         ret->items[0] = MP_OBJ_NEW_SMALL_INT(i);
@@ -83,7 +90,7 @@ STATIC mp_obj_t mod_trezorio_poll(mp_obj_t ifaces, mp_obj_t list_ref, mp_obj_t t
                         return mp_const_true;
                     }
                 } else if (sectrue == usb_webusb_can_read(iface)) {
-                    uint8_t buf[64];
+                    uint8_t buf[USB_PACKET_LEN];
                     int len = usb_webusb_read(iface, buf, sizeof(buf));
                     if (len > 0) {
                         ret->items[0] = MP_OBJ_NEW_SMALL_INT(i);
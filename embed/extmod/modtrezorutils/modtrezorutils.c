@@ -93,6 +93,49 @@ STATIC mp_obj_t mod_trezorutils_memcpy(size_t n_args, const mp_obj_t *args) {
 }
 STATIC MP_DEFINE_CONST_FUN_OBJ_VAR_BETWEEN(mod_trezorutils_memcpy_obj, 5, 5, mod_trezorutils_memcpy);
 
+/// def memcpy_rev(dst: bytearray, dst_ofs: int,
+///                src: bytearray, src_ofs: int,
+///                n: int) -> int:
+///     '''
+///     Copies at most `n` bytes from `src` at offset `src_ofs` to
+///     `dst` at offset `dst_ofs` in reversed order.  Returns the number
+///     of actually copied bytes.  The buffers must not overlap.
+///     '''
+STATIC mp_obj_t mod_trezorutils_memcpy_rev(size_t n_args, const mp_obj_t *args) {
+    mp_arg_check_num(n_args, 0, 5, 5, false);
+
+    mp_buffer_info_t dst;
+    mp_get_buffer_raise(args[0], &dst, MP_BUFFER_WRITE);
+    int dst_ofs = mp_obj_get_int(args[1]);
+    if (dst_ofs < 0) {
+        mp_raise_ValueError("Invalid dst offset (has to be >= 0)");
+    }
+
+    mp_buffer_info_t src;
+    mp_get_buffer_raise(args[2], &src, MP_BUFFER_READ);
+    int src_ofs = mp_obj_get_int(args[3]);
+    if (src_ofs < 0) {
+        mp_raise_ValueError("Invalid src offset (has to be >= 0)");
+    }
+
+    int n = mp_obj_get_int(args[4]);
+    if (n < 0) {
+        mp_raise_ValueError("Invalid byte count (has to be >= 0)");
+    }
+    size_t dst_rem = (dst_ofs < dst.len) ? dst.len - dst_ofs : 0;
+    size_t src_rem = (src_ofs < src.len) ? src.len - src_ofs : 0;
+    size_t ncpy = MIN(n, MIN(src_rem, dst_rem));
+
+    uint8_t *d = ((uint8_t*)dst.buf) + dst_ofs;
+    const uint8_t *s = ((const uint8_t*)src.buf) + src_ofs;
+    for (size_t i = 0; i < ncpy; i++) {
+        d[i] = s[ncpy - 1 - i];
+    }
+
+    return mp_obj_new_int(ncpy);
+}
+STATIC MP_DEFINE_CONST_FUN_OBJ_VAR_BETWEEN(mod_trezorutils_memcpy_rev_obj, 5, 5, mod_trezorutils_memcpy_rev);
+
 /// def halt(msg: str = None) -> None:
 ///     '''
 ///     Halts execution.
@@ -165,6 +208,7 @@ STATIC const mp_rom_map_elem_t mp_module_trezorutils_globals_table[] = {
     { MP_ROM_QSTR(MP_QSTR___name__), MP_ROM_QSTR(MP_QSTR_trezorutils) },
     { MP_ROM_QSTR(MP_QSTR_consteq), MP_ROM_PTR(&mod_trezorutils_consteq_obj) },
     { MP_ROM_QSTR(MP_QSTR_memcpy), MP_ROM_PTR(&mod_trezorutils_memcpy_obj) },
+    { MP_ROM_QSTR(MP_QSTR_memcpy_rev), MP_ROM_PTR(&mod_trezorutils_memcpy_rev_obj) },
     { MP_ROM_QSTR(MP_QSTR_halt), MP_ROM_PTR(&mod_trezorutils_halt_obj) },
     { MP_ROM_QSTR(MP_QSTR_set_mode_unprivileged), MP_ROM_PTR(&mod_trezorutils_set_mode_unprivileged_obj) },
     { MP_ROM_QSTR(MP_QSTR_symbol), MP_ROM_PTR(&mod_trezorutils_symbol_obj) },
@@ -36,16 +36,37 @@ void __attribute__((noreturn)) __fatal_error(const char *expr, const char *msg,
 // and emulates HID/WebUSB interface TREZOR_UDP_IFACE
 // gracefully ignores all other USB interfaces
 
+// by default every datagram carries one 64-byte report.  host can negotiate
+// bulk framing by sending BULKBULK (answered with BULKBULK), afterwards the
+// datagrams from the host can carry several reports of one message, and the
+// reports written by the device are coalesced into one datagram, flushed when
+// a report completes a message, the interface is polled for reading or the
+// buffer is full.  PINGPING or a
+// different host address switch back to one report per datagram.  bulk
+// framing is disabled by setting TREZOR_UDP_BULK=0
+
 #define USBD_MAX_NUM_INTERFACES     8
 #define TREZOR_UDP_PORT             21324
+#define TREZOR_UDP_BULK_LEN         4096
+
+// codec_v1 report layout, see src/trezor/wire/codec_v1.py
+#define REP_LEN                     64
+#define REP_INIT_DATA               9
+#define REP_CONT_DATA               1
 
 static struct {
     usb_iface_type_t type;
     int sock;
     struct sockaddr_in si_me, si_other;
     socklen_t slen;
+    secbool bulk;
+    uint8_t tx[TREZOR_UDP_BULK_LEN];
+    uint32_t tx_len;
+    uint32_t tx_left;  // payload of the written message still to come
 } usb_ifaces[USBD_MAX_NUM_INTERFACES];
 
+static secbool usb_bulk_enabled = sectrue;
+
 void usb_init(const usb_dev_info_t *dev_info) {
     (void)dev_info;
     for (int i = 0; i < USBD_MAX_NUM_INTERFACES; i++) {
@@ -54,6 +75,9 @@ void usb_init(const usb_dev_info_t *dev_info) {
         memset(&usb_ifaces[i].si_me, 0, sizeof(struct sockaddr_in));
         memset(&usb_ifaces[i].si_other, 0, sizeof(struct sockaddr_in));
         usb_ifaces[i].slen = 0;
+        usb_ifaces[i].bulk = secfalse;
+        usb_ifaces[i].tx_len = 0;
+        usb_ifaces[i].tx_left = 0;
     }
 }
 
@@ -63,6 +87,11 @@ void usb_deinit(void) {
 void usb_start(void) {
     const char *ip = getenv("TREZOR_UDP_IP");
     const char *port = getenv("TREZOR_UDP_PORT");
+    const char *bulk = getenv("TREZOR_UDP_BULK");
+
+    if (bulk && 0 == strcmp(bulk, "0")) {
+        usb_bulk_enabled = secfalse;
+    }
 
     // iterate interfaces
     for (int i = 0; i < USBD_MAX_NUM_INTERFACES; i++) {
@@ -116,7 +145,34 @@ secbool usb_vcp_add(const usb_vcp_info_t *info) {
     return sectrue;
 }
 
+static void usb_emulated_flush(uint8_t iface_num) {
+    if (usb_ifaces[iface_num].tx_len > 0 && usb_ifaces[iface_num].slen > 0) {
+        sendto(usb_ifaces[iface_num].sock, usb_ifaces[iface_num].tx, usb_ifaces[iface_num].tx_len, MSG_DONTWAIT, (const struct sockaddr *)&usb_ifaces[iface_num].si_other, usb_ifaces[iface_num].slen);
+    }
+    usb_ifaces[iface_num].tx_len = 0;
+}
+
+static secbool usb_emulated_message_end(uint8_t iface_num, const uint8_t *buf, uint32_t len) {
+    if (len != REP_LEN || buf[0] != '?') {
+        return sectrue;  // not a codec_v1 report, do not hold it back
+    }
+    uint32_t left = usb_ifaces[iface_num].tx_left;
+    if (buf[1] == '#' && buf[2] == '#') {
+        // initial report, the big-endian message size follows the type
+        left = ((uint32_t)buf[5] << 24) | ((uint32_t)buf[6] << 16) | ((uint32_t)buf[7] << 8) | buf[8];
+        left = left > REP_LEN - REP_INIT_DATA ? left - (REP_LEN - REP_INIT_DATA) : 0;
+    } else {
+        left = left > REP_LEN - REP_CONT_DATA ? left - (REP_LEN - REP_CONT_DATA) : 0;
+    }
+    usb_ifaces[iface_num].tx_left = left;
+    return sectrue * (left == 0);
+}
+
 static secbool usb_emulated_poll(uint8_t iface_num, short dir) {
+    if (dir == POLLIN) {
+        // device is waiting for the host, send out the coalesced reports
+        usb_emulated_flush(iface_num);
+    }
     struct pollfd fds[] = {
         { usb_ifaces[iface_num].sock, dir, 0 },
     };
@@ -131,22 +187,52 @@ static int usb_emulated_read(uint8_t iface_num, uint8_t *buf, uint32_t len) {
     if (r < 0) {
         return r;
     }
+    if (usb_ifaces[iface_num].si_other.sin_addr.s_addr != si.sin_addr.s_addr || usb_ifaces[iface_num].si_other.sin_port != si.sin_port) {
+        // new host, fall back to one report per datagram
+        usb_ifaces[iface_num].bulk = secfalse;
+        usb_ifaces[iface_num].tx_len = 0;
+        usb_ifaces[iface_num].tx_left = 0;
+    }
     usb_ifaces[iface_num].si_other = si;
     usb_ifaces[iface_num].slen = sl;
     static const char *ping_req = "PINGPING";
     static const char *ping_resp = "PONGPONG";
     if (r == strlen(ping_req) && 0 == memcmp(ping_req, buf, strlen(ping_req))) {
+        usb_ifaces[iface_num].bulk = secfalse;
+        usb_ifaces[iface_num].tx_len = 0;
+        usb_ifaces[iface_num].tx_left = 0;
         if (usb_ifaces[iface_num].slen > 0) {
             sendto(usb_ifaces[iface_num].sock, ping_resp, strlen(ping_resp), MSG_DONTWAIT, (const struct sockaddr *)&usb_ifaces[iface_num].si_other, usb_ifaces[iface_num].slen);
         }
         return 0;
     }
+    static const char *bulk_req = "BULKBULK";
+    if (r == strlen(bulk_req) && 0 == memcmp(bulk_req, buf, strlen(bulk_req))) {
+        if (sectrue == usb_bulk_enabled) {
+            usb_ifaces[iface_num].bulk = sectrue;
+            sendto(usb_ifaces[iface_num].sock, bulk_req, strlen(bulk_req), MSG_DONTWAIT, (const struct sockaddr *)&usb_ifaces[iface_num].si_other, usb_ifaces[iface_num].slen);
+        }
+        return 0;
+    }
     return r;
 }
 
 static int usb_emulated_write(uint8_t iface_num, const uint8_t *buf, uint32_t len)
 {
     ssize_t r = len;
+    if (sectrue == usb_ifaces[iface_num].bulk && len <= TREZOR_UDP_BULK_LEN) {
+        if (usb_ifaces[iface_num].tx_len + len > TREZOR_UDP_BULK_LEN) {
+            usb_emulated_flush(iface_num);
+        }
+        memcpy(usb_ifaces[iface_num].tx + usb_ifaces[iface_num].tx_len, buf, len);
+        usb_ifaces[iface_num].tx_len += len;
+        if (sectrue == usb_emulated_message_end(iface_num, buf, len)) {
+            // the host gets the whole message now, even if the device goes
+            // on without polling the interface (i.e. animating a layout)
+            usb_emulated_flush(iface_num);
+        }
+        return r;
+    }
     if (usb_ifaces[iface_num].slen > 0) {
         r = sendto(usb_ifaces[iface_num].sock, buf, len, MSG_DONTWAIT, (const struct sockaddr *)&usb_ifaces[iface_num].si_other, usb_ifaces[iface_num].slen);
     }
@@ -166,6 +166,11 @@ class Blake256:
         Returns the digest of hashed data.
         '''
 
+    def copy(self) -> Blake256:
+        '''
+        Returns a copy of the hash context.
+        '''
+
 # extmod/modtrezorcrypto/modtrezorcrypto-blake2b.h
 class Blake2b:
     '''
@@ -187,6 +192,11 @@ class Blake2b:
         Returns the digest of hashed data.
         '''
 
+    def copy(self) -> Blake2b:
+        '''
+        Returns a copy of the hash context.
+        '''
+
 # extmod/modtrezorcrypto/modtrezorcrypto-blake2s.h
 class Blake2s:
     '''
@@ -208,6 +218,11 @@ class Blake2s:
         Returns the digest of hashed data.
         '''
 
+    def copy(self) -> Blake2s:
+        '''
+        Returns a copy of the hash context.
+        '''
+
 # extmod/modtrezorcrypto/modtrezorcrypto-chacha20poly1305.h
 class ChaCha20Poly1305:
     '''
@@ -419,6 +434,11 @@ class Ripemd160:
         Returns the digest of hashed data.
         '''
 
+    def copy(self) -> Ripemd160:
+        '''
+        Returns a copy of the hash context.
+        '''
+
 # extmod/modtrezorcrypto/modtrezorcrypto-secp256k1.h
 def generate_secret() -> bytes:
     '''
@@ -479,6 +499,11 @@ class Sha1:
         Returns the digest of hashed data.
         '''
 
+    def copy(self) -> Sha1:
+        '''
+        Returns a copy of the hash context.
+        '''
+
 # extmod/modtrezorcrypto/modtrezorcrypto-sha256.h
 class Sha256:
     '''
@@ -500,6 +525,11 @@ class Sha256:
         Returns the digest of hashed data.
         '''
 
+    def copy(self) -> Sha256:
+        '''
+        Returns a copy of the hash context.
+        '''
+
 # extmod/modtrezorcrypto/modtrezorcrypto-sha3-256.h
 class Sha3_256:
     '''
@@ -521,6 +551,11 @@ class Sha3_256:
         Returns the digest of hashed data.
         '''
 
+    def copy(self) -> Sha3_256:
+        '''
+        Returns a copy of the hash context.
+        '''
+
 # extmod/modtrezorcrypto/modtrezorcrypto-sha3-512.h
 class Sha3_512:
     '''
@@ -542,6 +577,11 @@ class Sha3_512:
         Returns the digest of hashed data.
         '''
 
+    def copy(self) -> Sha3_512:
+        '''
+        Returns a copy of the hash context.
+        '''
+
 # extmod/modtrezorcrypto/modtrezorcrypto-sha512.h
 class Sha512:
     '''
@@ -562,3 +602,8 @@ class Sha512:
         '''
         Returns the digest of hashed data.
         '''
+
+    def copy(self) -> Sha512:
+        '''
+        Returns a copy of the hash context.
+        '''
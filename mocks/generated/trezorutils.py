@@ -19,6 +19,16 @@ def memcpy(dst: bytearray, dst_ofs: int,
     copied bytes.
     '''
 
+# extmod/modtrezorutils/modtrezorutils.c
+def memcpy_rev(dst: bytearray, dst_ofs: int,
+               src: bytearray, src_ofs: int,
+               n: int) -> int:
+    '''
+    Copies at most `n` bytes from `src` at offset `src_ofs` to
+    `dst` at offset `dst_ofs` in reversed order.  Returns the number
+    of actually copied bytes.  The buffers must not overlap.
+    '''
+
 # extmod/modtrezorutils/modtrezorutils.c
 def halt(msg: str = None) -> None:
     '''
@@ -4,6 +4,7 @@ from apps.common import storage
 memory = {}
 _seed = None
 _passphrase = None
+_features = None  # encoded Features message
 
 
 def get_state(state: bytes=None, passphrase: str=None):
@@ -33,6 +34,8 @@ def get_seed():
 
 def set_seed(seed, passphrase):
     global _seed, _passphrase
+    if (passphrase is None) != (_passphrase is None):
+        clear_features()  # passphrase_cached changes
     _seed, _passphrase = seed, passphrase
 
 
@@ -43,4 +46,21 @@ def has_passphrase():
 
 def clear():
     global _seed, _passphrase
+    if _passphrase is not None:
+        clear_features()  # passphrase_cached changes
     _seed, _passphrase = None, None
+
+
+def get_features():
+    return _features
+
+
+def set_features(features: bytes):
+    global _features
+    _features = features
+
+
+def clear_features():
+    '''Invalidate the encoded Features, call on any change of its fields.'''
+    global _features
+    _features = None
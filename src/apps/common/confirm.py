@@ -1,7 +1,9 @@
+import utime
 from trezor import loop, ui, wire
 from trezor.messages import ButtonRequestType, FailureType, wire_types
 from trezor.messages.ButtonRequest import ButtonRequest
 from trezor.ui.confirm import CONFIRMED, ConfirmDialog, HoldToConfirmDialog
+from trezor.wire import metrics
 from apps.common import cache
 
 # used to confirm/cancel the dialogs from outside of this module (i.e.
@@ -10,34 +12,64 @@ if __debug__:
     signal = cache.memory.setdefault('confirm_signal', loop.signal())
 
 
-@ui.layout
-async def confirm(ctx, content, code=None, *args, **kwargs):
+async def confirm(ctx, content, code=None, *args, after_ack=None, **kwargs):
     if code is None:
         code = ButtonRequestType.Other
-    await ctx.call(ButtonRequest(code=code), wire_types.ButtonAck)
-
+    # the request is on the wire while the layout fades out the old screen
+    await ctx.write(ButtonRequest(code=code))
     dialog = ConfirmDialog(content, *args, **kwargs)
-
-    if __debug__:
-        waiter = ctx.wait(signal, dialog)
-    else:
-        waiter = ctx.wait(dialog)
-    return await waiter == CONFIRMED
+    return await interact(ctx, dialog, after_ack) == CONFIRMED
 
 
-@ui.layout
-async def hold_to_confirm(ctx, content, code=None, *args, **kwargs):
+async def hold_to_confirm(ctx, content, code=None, *args, after_ack=None, **kwargs):
     if code is None:
         code = ButtonRequestType.Other
-    await ctx.call(ButtonRequest(code=code), wire_types.ButtonAck)
-
+    await ctx.write(ButtonRequest(code=code))
     dialog = HoldToConfirmDialog(content, 'Hold to confirm', *args, **kwargs)
+    return await interact(ctx, dialog, after_ack) == CONFIRMED
+
+
+@ui.layout
+async def interact(ctx, dialog, after_ack=None):
+    '''
+    Show `dialog` after a `ButtonRequest` has been written to `ctx`.  The dialog
+    runs in a separate task while the `ButtonAck` is read, followed by the
+    optional `after_ack` coroutine, so the wire is never interrupted in the
+    middle of a message.  The result is returned only after both are done.
+    '''
+    # draw the first frame right away, the dialog task does not repeat it
+    dialog.content.render()
+    dialog.content.drawn = True
+    dialog.render()
+    dialog.drawn = True
+    # latency of ButtonRequest is measured from the last received message
+    metrics.latency(wire_types.ButtonRequest,
+                    utime.ticks_diff(utime.ticks_us(), ctx.received))
+
+    result = loop.signal()
+    task = run_dialog(dialog, result)
+    loop.schedule(task)
+    try:
+        await ctx.read((wire_types.ButtonAck, ))
+        if after_ack is not None:
+            await after_ack
+        return await ctx.wait(result)
+    finally:
+        loop.close(task)
+        # content with its own __iter__ never consumes the flag
+        dialog.content.drawn = False
+        dialog.drawn = False
+
 
-    if __debug__:
-        waiter = ctx.wait(signal, dialog)
-    else:
-        waiter = ctx.wait(dialog)
-    return await waiter == CONFIRMED
+async def run_dialog(dialog, result):
+    try:
+        if __debug__:
+            r = await loop.wait(signal, dialog)
+        else:
+            r = await dialog
+    except Exception as e:
+        r = e  # re-raised in the waiting task
+    result.send(r)
 
 
 async def require_confirm(*args, **kwargs):
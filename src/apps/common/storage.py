@@ -56,6 +56,7 @@ def get_homescreen() -> bytes:
 
 
 def load_mnemonic(mnemonic: str, needs_backup: bool) -> None:
+    cache.clear_features()
     config.set(_APP, _MNEMONIC, mnemonic.encode())
     config.set(_APP, _VERSION, _STORAGE_VERSION)
     if needs_backup:
@@ -69,6 +70,7 @@ def needs_backup() -> bool:
 
 
 def set_backed_up() -> None:
+    cache.clear_features()
     config.set(_APP, _NEEDS_BACKUP, b'')
 
 
@@ -77,6 +79,7 @@ def unfinished_backup() -> bool:
 
 
 def set_unfinished_backup(state: bool) -> None:
+    cache.clear_features()
     if state:
         config.set(_APP, _UNFINISHED_BACKUP, b'\x01')
     else:
@@ -94,6 +97,7 @@ def get_passphrase_source() -> int:
 
 
 def load_settings(label: str=None, use_passphrase: bool=None, homescreen: bytes=None, passphrase_source: int=None) -> None:
+    cache.clear_features()
     if label is not None:
         config.set(_APP, _LABEL, label.encode(), True)  # public
     if use_passphrase is True:
@@ -128,6 +132,7 @@ def set_flags(flags: int) -> None:
     flags = (flags | b) & 0xFFFFFFFF
     if flags != b:
         config.set(_APP, _FLAGS, flags.to_bytes(4, 'big'))
+        cache.clear_features()
 
 
 def next_u2f_counter() -> int:
@@ -147,3 +152,4 @@ def set_u2f_counter(cntr: int):
 def wipe():
     config.wipe()
     cache.clear()
+    cache.clear_features()
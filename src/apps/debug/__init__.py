@@ -2,11 +2,12 @@ import micropython
 import gc
 from uctypes import bytes_at, bytearray_at
 
-from trezor import loop
+from trezor import loop, wire
 from trezor.wire import register, protobuf_workflow
 from trezor.messages.wire_types import \
     DebugLinkDecision, DebugLinkGetState, DebugLinkStop, \
-    DebugLinkMemoryRead, DebugLinkMemoryWrite, DebugLinkFlashErase
+    DebugLinkMemoryRead, DebugLinkMemoryWrite, DebugLinkFlashErase, \
+    DebugLinkLog
 from trezor.messages.DebugLinkMemory import DebugLinkMemory
 from trezor.messages.DebugLinkState import DebugLinkState
 from trezor.ui.confirm import CONFIRMED, CANCELLED
@@ -50,6 +51,37 @@ async def dispatch_DebugLinkFlashErase(ctx, msg):
     pass
 
 
+async def dispatch_DebugLinkLog(ctx, msg):
+    # DebugLinkLog queries runtime statistics: bucket 'wire.metrics' returns the
+    # wire statistics, bucket 'utils.unimport' the import times of dispatchers,
+    # bucket 'wallet.nodes' the hits and misses of the signing node cache,
+    # text 'reset' clears the statistics after the query
+    from trezor.messages.DebugLinkLog import DebugLinkLog
+    from trezor.messages.FailureType import DataError
+    from trezor import utils
+    from trezor.wire import metrics
+
+    if msg.bucket == 'wire.metrics':
+        text = metrics.report()
+        if msg.text == 'reset':
+            metrics.reset()
+    elif msg.bucket == 'utils.unimport':
+        text = utils.residency_report()
+        if msg.text == 'reset':
+            utils.residency_reset()
+    elif msg.bucket == 'wallet.nodes':
+        from apps.wallet.sign_tx import signing
+        text = 'hits=%d misses=%d' % tuple(signing.node_cache_stats)
+        if msg.text == 'reset':
+            signing.node_cache_stats[0] = signing.node_cache_stats[1] = 0
+    else:
+        raise wire.FailureError(DataError, 'Unknown log bucket')
+    m = DebugLinkLog()
+    m.bucket = msg.bucket
+    m.text = text
+    return m
+
+
 async def memory_stats(interval):
     sleep = loop.sleep(interval * 1000 * 1000)
     while True:
@@ -65,5 +97,6 @@ def boot():
     register(DebugLinkMemoryRead, protobuf_workflow, dispatch_DebugLinkMemoryRead)
     register(DebugLinkMemoryWrite, protobuf_workflow, dispatch_DebugLinkMemoryWrite)
     register(DebugLinkFlashErase, protobuf_workflow, dispatch_DebugLinkFlashErase)
+    register(DebugLinkLog, protobuf_workflow, dispatch_DebugLinkLog)
 
     # loop.schedule(memory_stats(10))
@@ -1,6 +1,7 @@
-from trezor.wire import register, protobuf_workflow
+from trezor.wire import register, protobuf_workflow, typed_workflow
 from trezor.utils import unimport
 from trezor.messages.wire_types import EthereumGetAddress, EthereumSignTx
+from .messages import EthereumSignTxExt
 # from trezor.messages.wire_types import EthereumSignMessage, EthereumVerifyMessage
 
 
@@ -30,7 +31,7 @@ def dispatch_EthereumVerifyMessage(*args, **kwargs):
 
 def boot():
     register(EthereumGetAddress, protobuf_workflow, dispatch_EthereumGetAddress)
-    register(EthereumSignTx, protobuf_workflow, dispatch_EthereumSignTx)
+    register(EthereumSignTx, typed_workflow, EthereumSignTxExt, dispatch_EthereumSignTx)
     # TODO: re-enable once https://github.com/ethereum/EIPs/pull/712 is accepted/implemented
     # register(EthereumSignMessage, protobuf_workflow, dispatch_EthereumSignMessage)
     # register(EthereumVerifyMessage, protobuf_workflow, dispatch_EthereumVerifyMessage)
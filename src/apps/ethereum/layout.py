@@ -47,6 +47,16 @@ async def require_confirm_data(ctx, data, data_total):
     await require_confirm(ctx, content, ButtonRequestType.SignTx)  # we use SignTx, not ConfirmOutput, for compatibility with T1
 
 
+def report_progress_init():
+    ui.display.clear()
+    ui.header('Signing transaction')
+
+
+def report_progress(done, total):
+    p = 1000 * done // total
+    ui.display.loader(p, 18, ui.WHITE, ui.BG)
+
+
 def split_address(address):
     return chunks(address, 17)
 
@@ -0,0 +1,40 @@
+'''
+Ethereum messages extended with fields that are not in trezor-common yet, see
+`protobuf.extend_fields`.  Replace them by the generated messages once the
+fields are added to the .proto files.
+'''
+
+import protobuf as p
+from trezor.messages.EthereumSignTx import EthereumSignTx
+from trezor.messages.EthereumTxRequest import EthereumTxRequest
+
+
+class EthereumSignTxExt(EthereumSignTx):
+    FIELDS = p.extend_fields(EthereumSignTx.FIELDS, {
+        p.EXPERIMENTAL_TAG: ('chunk_size', p.UVarintType, 0),
+        p.EXPERIMENTAL_TAG + 1: ('stream', p.BoolType, 0),
+    })
+
+    def __init__(
+        self,
+        chunk_size: int = None,
+        stream: bool = None,
+        **kwargs,
+    ):
+        self.chunk_size = chunk_size
+        self.stream = stream
+        EthereumSignTx.__init__(self, **kwargs)
+
+
+class EthereumTxRequestExt(EthereumTxRequest):
+    FIELDS = p.extend_fields(EthereumTxRequest.FIELDS, {
+        p.EXPERIMENTAL_TAG: ('chunk_size', p.UVarintType, 0),
+    })
+
+    def __init__(
+        self,
+        chunk_size: int = None,
+        **kwargs,
+    ):
+        self.chunk_size = chunk_size
+        EthereumTxRequest.__init__(self, **kwargs)
@@ -1,14 +1,29 @@
+from micropython import const
+
+import protobuf
 from trezor.messages.EthereumSignTx import EthereumSignTx
 from trezor.messages.EthereumTxRequest import EthereumTxRequest
 from trezor.messages import FailureType
 from trezor.utils import HashWriter
 from trezor.crypto import rlp
 from apps.ethereum import tokens
+from apps.ethereum.messages import EthereumTxRequestExt
 from apps.ethereum.layout import require_confirm_tx, require_confirm_data, require_confirm_fee
+from apps.ethereum.layout import report_progress_init, report_progress
 
 # maximum supported chain id
 MAX_CHAIN_ID = 2147483630
 
+# chunk size used if the host does not ask for one, and the largest one we
+# accept; the chunks are hashed as they arrive, so none is ever allocated.  the
+# host asks for a chunk size and stream mode only in debug builds, see
+# apps.ethereum.messages
+DEFAULT_CHUNK_SIZE = const(1024)
+MAX_CHUNK_SIZE = const(16384)
+
+_DATA_CHUNK_KEY = const(0x0a)  # EthereumTxAck.data_chunk, tag 1, wire type 2
+_READ_BUFFER = bytearray(256)
+
 
 async def ethereum_sign_tx(ctx, msg):
     from trezor.crypto.hashlib import sha3_256
@@ -37,34 +52,43 @@ async def ethereum_sign_tx(ctx, msg):
 
     await require_confirm_fee(ctx, value, int.from_bytes(msg.gas_price, 'big'), int.from_bytes(msg.gas_limit, 'big'), msg.chain_id, token)
 
-    data = bytearray()
-    data += msg.data_initial_chunk
-    data_left = data_total - len(msg.data_initial_chunk)
+    data = msg.data_initial_chunk
+    data_left = data_total - len(data)
 
     total_length = get_total_length(msg, data_total)
 
     sha = HashWriter(sha3_256)
-    sha.extend(rlp.encode_length(total_length, True))  # total length
+    rlp.write_header(sha, total_length, True)  # total length
 
     for field in [msg.nonce, msg.gas_price, msg.gas_limit, msg.to, msg.value]:
-        sha.extend(rlp.encode(field))
+        rlp.write(sha, field)
 
     if data_left == 0:
-        sha.extend(rlp.encode(data))
+        rlp.write(sha, data)
     else:
-        sha.extend(rlp.encode_length(data_total, False))
-        sha.extend(rlp.encode(data, False))
-
-    while data_left > 0:
-        resp = await send_request_chunk(ctx, data_left)
-        data_left -= len(resp.data_chunk)
-        sha.extend(resp.data_chunk)
+        rlp.write_header(sha, data_total, False)
+        sha.extend(data)
+
+    if data_left > 0:
+        chunk_size = get_chunk_size(msg)
+        report_progress_init()
+        report_progress(data_total - data_left, data_total)
+        if msg.stream:
+            # request all of the data at once, the host then sends it in
+            # consecutive chunks without waiting for further requests
+            await send_request_chunk(ctx, data_left, chunk_size)
+        while data_left > 0:
+            limit = min(data_left, chunk_size)
+            if not msg.stream:
+                await send_request_chunk(ctx, limit, chunk_size)
+            data_left -= await read_chunk(ctx, sha, limit)
+            report_progress(data_total - data_left, data_total)
 
     # eip 155 replay protection
     if msg.chain_id:
-        sha.extend(rlp.encode(msg.chain_id))
-        sha.extend(rlp.encode(0))
-        sha.extend(rlp.encode(0))
+        rlp.write(sha, msg.chain_id)
+        rlp.write(sha, 0)
+        rlp.write(sha, 0)
 
     digest = sha.get_digest(True)  # True -> use keccak mode
     return await send_signature(ctx, msg, digest)
@@ -73,27 +97,69 @@ async def ethereum_sign_tx(ctx, msg):
 def get_total_length(msg: EthereumSignTx, data_total: int) -> int:
     length = 0
     for field in [msg.nonce, msg.gas_price, msg.gas_limit, msg.to, msg.value]:
-        length += rlp.field_length(len(field), field[:1])
+        length += rlp.length(field)
 
     if msg.chain_id:  # forks replay protection
-        length += rlp.field_length(1, [msg.chain_id])
-        length += rlp.field_length(0, 0)
-        length += rlp.field_length(0, 0)
+        length += rlp.length(msg.chain_id)
+        length += rlp.length(0)
+        length += rlp.length(0)
 
     length += rlp.field_length(data_total, msg.data_initial_chunk)
     return length
 
 
-async def send_request_chunk(ctx, data_left: int):
+def get_chunk_size(msg: EthereumSignTx) -> int:
+    if not msg.chunk_size:
+        return DEFAULT_CHUNK_SIZE
+    return min(msg.chunk_size, MAX_CHUNK_SIZE)
+
+
+async def send_request_chunk(ctx, data_length: int, chunk_size: int):
+    req = EthereumTxRequestExt()
+    req.data_length = data_length
+    req.chunk_size = chunk_size
+    await ctx.write(req)
+
+
+async def read_chunk(ctx, sha: HashWriter, limit: int) -> int:
+    '''
+    Read EthereumTxAck and hash its data chunk while it arrives, the chunk is
+    never kept in memory.  Returns the length of the chunk, at most `limit`.
+    '''
     from trezor.messages.wire_types import EthereumTxAck
-    # TODO: layoutProgress ?
-    req = EthereumTxRequest()
-    if data_left <= 1024:
-        req.data_length = data_left
-    else:
-        req.data_length = 1024
 
-    return await ctx.call(req, EthereumTxAck)
+    reader = await ctx.read_raw((EthereumTxAck, ))
+    length = 0
+    while reader.size > 0:
+        fkey = await protobuf.load_uvarint(reader)
+        if fkey & 7 == 0:  # unknown varint field, skip it
+            await protobuf.load_uvarint(reader)
+            continue
+        if fkey & 7 != 2:
+            raise ValueError(FailureType.DataError, 'Invalid data chunk')
+        flen = await protobuf.load_uvarint(reader)
+        if fkey != _DATA_CHUNK_KEY:  # unknown field, skip it
+            await read_into(reader, None, flen)
+            continue
+        if length + flen > limit:
+            await read_into(reader, None, reader.size)
+            raise ValueError(FailureType.DataError, 'Data chunk too long')
+        await read_into(reader, sha, flen)
+        length += flen
+
+    if length == 0:
+        raise ValueError(FailureType.DataError, 'Empty data chunk')
+    return length
+
+
+async def read_into(reader, sha, n: int):
+    buf = memoryview(_READ_BUFFER)
+    while n > 0:
+        part = buf[:min(n, len(buf))]
+        await reader.areadinto(part)
+        if sha is not None:
+            sha.extend(part)
+        n -= len(part)
 
 
 async def send_signature(ctx, msg: EthereumSignTx, digest):
@@ -1,535 +1,632 @@
+from micropython import const
+
+# _TOKENS holds a record of _RECORD_LEN bytes for every token, sorted by the
+# key of chain id (uint32 big-endian) and address.  The key is followed by the
+# decimals (uint8), and the offset (uint16 big-endian) and length (uint8) of
+# the symbol in _SYMBOLS.  Only the looked up record is decoded.
+_KEY_LEN = const(24)
+_RECORD_LEN = const(28)
+
+
 def token_by_chain_address(chain_id, address):
-    if not address:
+    if not address or len(address) != 20 or chain_id is None or not 0 <= chain_id <= 0xFFFFFFFF:
         return None
-    for token in tokens:
-        if chain_id == token[0] and address == token[1]:
-            return token
+    key = chain_id.to_bytes(4, 'big') + bytes(address)
+    lo = 0
+    hi = len(_TOKENS) // _RECORD_LEN
+    while lo < hi:
+        mid = (lo + hi) // 2
+        ofs = mid * _RECORD_LEN
+        k = _TOKENS[ofs:ofs + _KEY_LEN]
+        if k < key:
+            lo = mid + 1
+        elif k > key:
+            hi = mid
+        else:
+            return _token(mid)
     return None
 
 
-# rest of the file is generated using trezor-common/ethereum_tokens-gen.py
+def _token(index):
+    ofs = index * _RECORD_LEN
+    r = _TOKENS[ofs:ofs + _RECORD_LEN]
+    chain_id = int.from_bytes(r[0:4], 'big')
+    symbol_ofs = (r[25] << 8) | r[26]
+    symbol = str(_SYMBOLS[symbol_ofs:symbol_ofs + r[27]], 'utf8')
+    return (chain_id, r[4:_KEY_LEN], symbol, r[24])
+
+
+def _count():
+    return len(_TOKENS) // _RECORD_LEN
+
+
+# rest of the file is generated using tools/codegen/gen_tokens.py
 # DO NOT EDIT MANUALLY!
-tokens = [
+_TOKENS = (
     # eth
-    (1, b'\x7d\xd7\xf5\x6d\x69\x7c\xc0\xf2\xb5\x2b\xd5\x5c\x05\x7f\x37\x8f\x1f\xe6\xab\x4b', '$TEAK', 18),  # $TEAK
-    (1, b'\xaf\x30\xd2\xa7\xe9\x0d\x7d\xc3\x61\xc8\xc4\x58\x5e\x9b\xb7\xd2\xf6\xf1\x5b\xc7', '1ST', 18),  # FirstBlood
-    (1, b'\xfd\xbc\x1a\xdc\x26\xf0\xf8\xf8\x60\x6a\x5d\x63\xb7\xd3\xa3\xcd\x21\xc2\x2b\x23', '1WO', 8),  # 1WO
-    (1, b'\xae\xc9\x8a\x70\x88\x10\x41\x48\x78\xc3\xbc\xdf\x46\xaa\xd3\x1d\xed\x4a\x45\x57', '300', 18),  # 300 Token Sparta
-    (1, b'\xb9\x8d\x4c\x97\x42\x5d\x99\x08\xe6\x6e\x53\xa6\xfd\xf6\x73\xac\xca\x0b\xe9\x86', 'ABT', 18),  # ArcBlock Token
-    (1, b'\x13\xf1\xb7\xfd\xfb\xe1\xfc\x66\x67\x6d\x56\x48\x3e\x21\xb1\xec\xb4\x0b\x58\xe2', 'ACC', 18),  # Accelerator Network
-    (1, b'\x88\x10\xc6\x34\x70\xd3\x86\x39\x95\x4c\x6b\x41\xaa\xc5\x45\x84\x8c\x46\x48\x4a', 'ADI', 18),  # Aditus
-    (1, b'\x42\x28\x66\xa8\xf0\xb0\x32\xc5\xcf\x1d\xfb\xde\xf3\x1a\x20\xf4\x50\x95\x62\xb0', 'ADST', 0),  # AdShares
-    (1, b'\xd0\xd6\xd6\xc5\xfe\x4a\x67\x7d\x34\x3c\xc4\x33\x53\x6b\xb7\x17\xba\xe1\x67\xdd', 'ADT', 9),  # AdToken
-    (1, b'\x44\x70\xbb\x87\xd7\x7b\x96\x3a\x01\x3d\xb9\x39\xbe\x33\x2f\x92\x7f\x2b\x99\x2e', 'ADX', 4),  # AdEx Network
-    (1, b'\x5c\xa9\xa7\x1b\x1d\x01\x84\x9c\x0a\x95\x49\x0c\xc0\x05\x59\x71\x7f\xcf\x0d\x1d', 'AE', 18),  # aeternity
-    (1, b'\x8e\xb2\x43\x19\x39\x37\x16\x66\x8d\x76\x8d\xce\xc2\x93\x56\xae\x9c\xff\xe2\x85', 'AGI', 8),  # SingularityNET
-    (1, b'\x4c\xed\xa7\x90\x6a\x5e\xd2\x17\x97\x85\xcd\x3a\x40\xa6\x9e\xe8\xbc\x99\xc4\x66', 'AION', 8),  # Aion
-    (1, b'\x27\xdc\xe1\xec\x4d\x3f\x72\xc3\xe4\x57\xcc\x50\x35\x4f\x1f\x97\x5d\xde\xf4\x88', 'AIR', 8),  # AirToken
-    (1, b'\x10\x63\xce\x52\x42\x65\xd5\xa3\xa6\x24\xf4\x91\x4a\xcd\x57\x3d\xd8\x9c\xe9\x88', 'AIX', 18),  # Aigang
-    (1, b'\x18\x1a\x63\x74\x6d\x3a\xdc\xf3\x56\xcb\xc7\x3a\xce\x22\x83\x2f\xfb\xb1\xee\x5a', 'ALCO', 8),  # ALCO
-    (1, b'\xea\x61\x0b\x11\x53\x47\x77\x20\x74\x8d\xc1\x3e\xd3\x78\x00\x39\x41\xd8\x4f\xab', 'ALIS', 18),  # ALIS Token
-    (1, b'\x63\x8a\xc1\x49\xea\x8e\xf9\xa1\x28\x6c\x41\xb9\x77\x01\x7a\xa7\x35\x9e\x6c\xfa', 'ALTS', 18),  # ALTS Token
-    (1, b'\x4d\xc3\x64\x3d\xbc\x64\x2b\x72\xc1\x58\xe7\xf3\xd2\xff\x23\x2d\xf6\x1c\xb6\xce', 'AMB', 18),  # Amber Token
-    (1, b'\x94\x9b\xed\x88\x6c\x73\x9f\x1a\x32\x73\x62\x9b\x33\x20\xdb\x0c\x50\x24\xc7\x19', 'AMIS', 9),  # AMIS
-    (1, b'\x96\x0b\x23\x6a\x07\xcf\x12\x26\x63\xc4\x30\x33\x50\x60\x9a\x66\xa7\xb2\x88\xc0', 'ANT', 18),  # ANT
-    (1, b'\x1a\x7a\x8b\xd9\x10\x6f\x2b\x8d\x97\x7e\x08\x58\x2d\xc7\xd2\x4c\x72\x3a\xb0\xdb', 'APPC', 18),  # AppCoins
-    (1, b'\x23\xae\x3c\x5b\x39\xb1\x2f\x06\x93\xe0\x54\x35\xee\xaa\x1e\x51\xd8\xc6\x15\x30', 'APT', 18),  # AIGang
-    (1, b'\xac\x70\x9f\xcb\x44\xa4\x3c\x35\xf0\xda\x4e\x31\x63\xb1\x17\xa1\x7f\x37\x70\xf5', 'ARC', 18),  # ARC
-    (1, b'\x12\x45\xef\x80\xf4\xd9\xe0\x2e\xd9\x42\x53\x75\xe8\xf6\x49\xb9\x22\x1b\x31\xd8', 'ARCT', 8),  # ArbitrageCT
-    (1, b'\x75\xaa\x7b\x0d\x02\x53\x2f\x38\x33\xb6\x6c\x7f\x0a\xd3\x53\x76\xd3\x73\xdd\xf8', 'ARD', 18),  # Accord
-    (1, b'\xba\x5f\x11\xb1\x6b\x15\x57\x92\xcf\x3b\x2e\x68\x80\xe8\x70\x68\x59\xa8\xae\xb6', 'ARN', 8),  # Aeron Token
-    (1, b'\xfe\xc0\xcf\x7f\xe0\x78\xa5\x00\xab\xf1\x5f\x12\x84\x95\x8f\x22\x04\x9c\x2c\x7e', 'ART', 18),  # ART
-    (1, b'\x77\x05\xfa\xa3\x4b\x16\xeb\x6d\x77\xdf\xc7\x81\x2b\xe2\x36\x7b\xa6\xb0\x24\x8e', 'ARX', 8),  # ARX
-    (1, b'\x27\x05\x4b\x13\xb1\xb7\x98\xb3\x45\xb5\x91\xa4\xd2\x2e\x65\x62\xd4\x7e\xa7\x5a', 'AST', 4),  # Airswap
-    (1, b'\x17\x05\x2d\x51\xe9\x54\x59\x2c\x10\x46\x32\x0c\x23\x71\xab\xab\x6c\x73\xef\x10', 'ATH', 18),  # Athenian Warrior Token
-    (1, b'\x78\xb7\xfa\xda\x55\xa6\x4d\xd8\x95\xd8\xc8\xc3\x57\x79\xdd\x8b\x67\xfa\x8a\x05', 'ATL', 18),  # ATL
-    (1, b'\x88\x78\x34\xd3\xb8\xd4\x50\xb6\xba\xb1\x09\xc2\x52\xdf\x3d\xa2\x86\xd7\x3c\xe4', 'ATT', 18),  # Atmatrix Token
-    (1, b'\x63\x39\x78\x4d\x94\x78\xda\x43\x10\x6a\x42\x91\x96\x77\x2a\x02\x9c\x2f\x17\x7d', 'ATTN', 18),  # Attention Token
-    (1, b'\xed\x24\x79\x80\x39\x6b\x10\x16\x9b\xb1\xd3\x6f\x6e\x27\x8e\xd1\x67\x00\xa6\x0f', 'AVA', 4),  # AVA
-    (1, b'\x0d\x88\xed\x6e\x74\xbb\xfd\x96\xb8\x31\x23\x16\x38\xb6\x6c\x05\x57\x1e\x82\x4f', 'AVT', 18),  # AVT
-    (1, b'\x9a\xf2\xc6\xb1\xa2\x8d\x3d\x6b\xc0\x84\xbd\x26\x7f\x70\xe9\x0d\x49\x74\x1d\x5b', 'AXP', 8),  # AXP
-    (1, b'\xf8\x7f\x0d\x91\x53\xfe\xa5\x49\xc7\x28\xad\x61\xcb\x80\x15\x95\xa6\x8b\x73\xde', 'BANX', 18),  # BANX
-    (1, b'\x0d\x87\x75\xf6\x48\x43\x06\x79\xa7\x09\xe9\x8d\x2b\x0c\xb6\x25\x0d\x28\x87\xef', 'BAT', 18),  # BAT
-    (1, b'\x73\x67\xa6\x80\x39\xd4\x70\x4f\x30\xbf\xbf\x6d\x94\x80\x20\xc3\xb0\x7d\xfc\x59', 'BCBC', 18),  # Beercoin
-    (1, b'\x1e\x79\x7c\xe9\x86\xc3\xcf\xf4\x47\x2f\x7d\x38\xd5\xc4\xab\xa5\x5d\xfe\xfe\x40', 'BCDN', 15),  # BCDN
-    (1, b'\xac\xfa\x20\x9f\xb7\x3b\xf3\xdd\x5b\xbf\xb1\x10\x1b\x9b\xc9\x99\xc4\x90\x62\xa5', 'BCDT', 18),  # Blockchain Certified Data Token
-    (1, b'\xbc\x12\x34\x55\x2e\xbe\xa3\x2b\x51\x21\x19\x03\x56\xbb\xa6\xd3\xbb\x22\x5b\xb5', 'BCL', 18),  # BCL
-    (1, b'\x1c\x44\x81\x75\x0d\xaa\x5f\xf5\x21\xa2\xa7\x49\x0d\x99\x81\xed\x46\x46\x5d\xbd', 'BCPT', 18),  # BCPT
-    (1, b'\x19\x61\xb3\x33\x19\x69\xed\x52\x77\x07\x51\xfc\x71\x8e\xf5\x30\x83\x8b\x6d\xee', 'BDG', 18),  # BitDegree Token
-    (1, b'\x4d\x8f\xc1\x45\x3a\x0f\x35\x9e\x99\xc9\x67\x59\x54\xe6\x56\xd8\x0d\x99\x6f\xbf', 'BEE', 18),  # Bee Token
-    (1, b'\x74\xc1\xe4\xb8\xca\xe5\x92\x69\xec\x1d\x85\xd3\xd4\xf3\x24\x39\x60\x48\xf4\xac', 'BeerCoin', 0),  # BeerCoin
-    (1, b'\x8a\xa3\x3a\x78\x99\xfc\xc8\xea\x5f\xbe\x6a\x60\x8a\x10\x9c\x38\x93\xa1\xb8\xb2', 'BET', 18),  # BET
-    (1, b'\xb2\xbf\xeb\x70\xb9\x03\xf1\xba\xac\x7f\x2b\xa2\xc6\x29\x34\xc7\xe5\xb9\x74\xc4', 'BKB', 8),  # BetKing Bankroll Token
-    (1, b'\x10\x7c\x45\x04\xcd\x79\xc5\xd2\x69\x6e\xa0\x03\x0a\x8d\xd4\xe9\x26\x01\xb8\x2e', 'BLT', 18),  # Bloom
-    (1, b'\xce\x59\xd2\x9b\x09\xaa\xe5\x65\xfe\xee\xf8\xe5\x2f\x47\xc3\xcd\x53\x68\xc6\x63', 'BLX (Bullion)', 18),  # Bullion Crypto
-    (1, b'\xe5\xa7\xc1\x29\x72\xf3\xbb\xfe\x70\xed\x29\x52\x1c\x89\x49\xb8\xaf\x6a\x09\x70', 'BLX (Iconomi)', 18),  # Iconomi
-    (1, b'\xdf\x6e\xf3\x43\x35\x07\x80\xbf\x8c\x34\x10\xbf\x06\x2e\x0c\x01\x5b\x1d\xd6\x71', 'BMC', 8),  # Blackmoon Crypto BMC Token
-    (1, b'\xf0\x28\xad\xee\x51\x53\x3b\x1b\x47\xbe\xaa\x89\x0f\xeb\x54\xa4\x57\xf5\x1e\x89', 'BMT', 18),  # BMT
-    (1, b'\x98\x6e\xe2\xb9\x44\xc4\x2d\x01\x7f\x52\xaf\x21\xc4\xc6\x9b\x84\xdb\xea\x35\xd8', 'BMX', 18),  # BitMartToken
-    (1, b'\xb8\xc7\x74\x82\xe4\x5f\x1f\x44\xde\x17\x45\xf5\x2c\x74\x42\x6c\x63\x1b\xdd\x52', 'BNB', 18),  # BNB
-    (1, b'\xdd\x6b\xf5\x6c\xa2\xad\xa2\x4c\x68\x3f\xac\x50\xe3\x77\x83\xe5\x5b\x57\xaf\x9f', 'BNC', 12),  # BNC
-    (1, b'\x1f\x57\x3d\x6f\xb3\xf1\x3d\x68\x9f\xf8\x44\xb4\xce\x37\x79\x4d\x79\xa7\xff\x1c', 'BNT', 18),  # Bancor
-    (1, b'\xd2\xd6\x15\x86\x83\xae\xe4\xcc\x83\x80\x67\x72\x72\x09\xa0\xaa\xf4\x35\x9d\xe3', 'BNTY', 18),  # Bounty0x Token
-    (1, b'\xcc\x34\x36\x6e\x38\x42\xca\x1b\xd3\x6c\x1f\x32\x4d\x15\x25\x79\x60\xfc\xc8\x01', 'BON', 18),  # Bonpay
-    (1, b'\x7f\x1e\x2c\x7d\x6a\x69\xbf\x34\x82\x4d\x72\xc5\x3b\x45\x50\xe8\x95\xc0\xd8\xc2', 'BOP', 8),  # BlockOptiopns Token
-    (1, b'\xc2\xc6\x3f\x23\xec\x5e\x97\xef\xbd\x75\x65\xdf\x9e\xc7\x64\xfd\xc7\xd4\xe9\x1d', 'BOU', 18),  # Boule Coin
-    (1, b'\x32\x76\x82\x77\x9b\xab\x2b\xf4\xd1\x33\x7e\x89\x74\xab\x9d\xe8\x27\x5a\x7c\xa8', 'BPT', 18),  # Blockport Token
-    (1, b'\x5a\xf2\xbe\x19\x3a\x6a\xbc\xa9\xc8\x81\x70\x01\xf4\x57\x44\x77\x7d\xb3\x07\x56', 'BQX', 8),  # Bitquence
-    (1, b'\x9e\x77\xd5\xa1\x25\x1b\x6f\x7d\x45\x67\x22\xa6\xea\xc6\xd2\xd5\x98\x0b\xd8\x91', 'BRAT', 8),  # BRAT
-    (1, b'\xf2\x6e\xf5\xe0\x54\x53\x84\xb7\xdc\xc0\xf2\x97\xf2\x67\x41\x89\x58\x68\x30\xdf', 'BSDC', 18),  # BSDC
-    (1, b'\x50\x9a\x38\xb7\xa1\xcc\x0d\xcd\x83\xaa\x9d\x06\x21\x46\x63\xd9\xec\x7c\x7f\x4a', 'BST', 18),  # BlocksquareToken
-    (1, b'\x08\x86\x94\x9c\x1b\x8c\x41\x28\x60\xc4\x26\x4c\xeb\x80\x83\xd1\x36\x5e\x86\xcf', 'BTCE', 8),  # EthereumBitcoin
-    (1, b'\x73\xdd\x06\x9c\x29\x9a\x5d\x69\x1e\x98\x36\x24\x3b\xca\xec\x9c\x8c\x1d\x87\x34', 'BTE', 8),  # BTE
-    (1, b'\xfa\xd5\x72\xdb\x56\x6e\x52\x34\xac\x9f\xc3\xd5\x70\xc4\xed\xc0\x05\x0e\xaa\x92', 'BTH', 18),  # Bytether
-    (1, b'\x2a\xcc\xab\x9c\xb7\xa4\x8c\x3e\x82\x28\x6f\x0b\x2f\x87\x98\xd2\x01\xf4\xec\x3f', 'BTL (Battle)', 18),  # BTL (Battle)
-    (1, b'\x92\x68\x5e\x93\x95\x65\x37\xc2\x5b\xb7\x5d\x5d\x47\xfc\xa4\x26\x6d\xd6\x28\xb8', 'BTL (Bitlle)', 4),  # Bitlle Token
-    (1, b'\xcb\x97\xe6\x5f\x07\xda\x24\xd4\x6b\xcd\xd0\x78\xeb\xeb\xd7\xc6\xe6\xe3\xd7\x50', 'BTM', 8),  # Bytom
-    (1, b'\x16\xb0\xe6\x2a\xc1\x3a\x2f\xae\xd3\x6d\x18\xbc\xe2\x35\x6d\x25\xab\x3c\xfa\xd3', 'BTQ', 18),  # Bitcoin Boutique
-    (1, b'\x08\x0a\xa0\x7e\x2c\x71\x85\x15\x0d\x7e\x4d\xa9\x88\x38\xa8\xd2\xfe\xac\x3d\xfc', 'BTT', 0),  # Bitether
-    (1, b'\x26\xe7\x53\x07\xfc\x0c\x02\x14\x72\xfe\xb8\xf7\x27\x83\x95\x31\xf1\x12\xf3\x17', 'C20', 18),  # Crypto20's Token
-    (1, b'\x7d\x4b\x8c\xce\x05\x91\xc9\x04\x4a\x22\xee\x54\x35\x33\xb7\x2e\x97\x6e\x36\xc3', 'CAG', 18),  # Change Bank
-    (1, b'\x1d\x46\x24\x14\xfe\x14\xcf\x48\x9c\x7a\x21\xca\xc7\x85\x09\xf4\xbf\x8c\xd7\xc0', 'CAN', 6),  # CAN
-    (1, b'\x42\x3e\x43\x22\xcd\xda\x29\x15\x6b\x49\xa1\x7d\xfb\xd2\xac\xc4\xb2\x80\x60\x0d', 'CAR', 9),  # Car Sharing Community
-    (1, b'\x21\x08\xe6\x2d\x33\x5b\xbd\xc8\x9e\xc3\xe9\xd8\x58\x2f\x18\xdc\xfb\x0c\xdf\xf4', 'CARCO', 8),  # CARCO
-    (1, b'\xe8\x78\x0b\x48\xbd\xb0\x5f\x92\x86\x97\xa5\xe8\x15\x5f\x67\x2e\xd9\x14\x62\xf7', 'CAS', 18),  # Cashaa
-    (1, b'\x12\x34\x56\x74\x61\xd3\xf8\xdb\x74\x96\x58\x17\x74\xbd\x86\x9c\x83\xd5\x1c\x93', 'CAT (BitClave)', 18),  # CAT (BitClave)
-    (1, b'\x56\xba\x2e\xe7\x89\x04\x61\xf4\x63\xf7\xbe\x02\xaa\xc3\x09\x9f\x6d\x58\x11\xa8', 'CAT (Blockcat)', 18),  # CAT (Blockcat)
-    (1, b'\x68\xe1\x4b\xb5\xa4\x5b\x96\x81\x32\x7e\x16\xe5\x28\x08\x4b\x9d\x96\x2c\x1a\x39', 'CATs (BitClave)_Old', 18),  # CATs (BitClave)_Old
-    (1, b'\xc1\x66\x03\x87\x05\xff\xba\xb3\x79\x41\x85\xb3\xa9\xd9\x25\x63\x2a\x1d\xf3\x7d', 'CC3', 18),  # Coal Coin
-    (1, b'\x28\x57\x7a\x6d\x31\x55\x9b\xd2\x65\xce\x3a\xdb\x62\xd0\x45\x85\x50\xf7\xb8\xa7', 'CCC (CryptoCrashCourse)', 18),  # CryptoCrashCourse
-    (1, b'\xbe\x11\xee\xb1\x86\xe6\x24\xb8\xf2\x6a\x50\x45\x57\x5a\x13\x40\xe4\x05\x45\x52', 'CCC (ICONOMI)', 18),  # CCC (ICONOMI)
-    (1, b'\xd3\x48\xe0\x7a\x28\x06\x50\x5b\x85\x61\x23\x04\x5d\x27\xae\xed\x90\x92\x4b\x50', 'CCLC', 8),  # Christ Coin
-    (1, b'\x31\x5c\xe5\x9f\xaf\xd3\xa8\xd5\x62\xb7\xec\x1c\x85\x42\x38\x2d\x27\x10\xb0\x6c', 'CCS', 18),  # CacaoShares
-    (1, b'\x8a\x95\xca\x44\x8a\x52\xc0\xad\xf0\x05\x4b\xb3\x40\x2d\xc5\xe0\x9c\xd6\xb2\x32', 'CDL', 18),  # Confideal
-    (1, b'\x17\x7d\x39\xac\x67\x6e\xd1\xc6\x7a\x2b\x26\x8a\xd7\xf1\xe5\x88\x26\xe5\xb0\xaf', 'CDT', 18),  # CoinDash
-    (1, b'\x6f\xff\x38\x06\xbb\xac\x52\xa2\x0e\x0d\x79\xbc\x53\x8d\x52\x7f\x6a\x22\xc9\x6b', 'CDX', 18),  # CDX
-    (1, b'\x12\xfe\xf5\xe5\x7b\xf4\x58\x73\xcd\x9b\x62\xe9\xdb\xd7\xbf\xb9\x9e\x32\xd7\x3e', 'CFI', 18),  # CFI
-    (1, b'\x06\x01\x2c\x8c\xf9\x7b\xea\xd5\xde\xae\x23\x70\x70\xf9\x58\x7f\x8e\x7a\x26\x6d', 'CK', 0),  # CK
-    (1, b'\x41\x62\x17\x8b\x78\xd6\x98\x54\x80\xa3\x08\xb2\x19\x0e\xe5\x51\x74\x60\x40\x6d', 'CLN', 18),  # ColuLocalNetwork
-    (1, b'\x7f\xce\x28\x56\x89\x9a\x68\x06\xee\xef\x70\x80\x79\x85\xfc\x75\x54\xc6\x63\x40', 'CLP', 9),  # CryptoLending
-    (1, b'\x3e\xdd\x23\x5c\x3e\x84\x0c\x1f\x29\x28\x6b\x2e\x39\x37\x0a\x25\x5c\x7b\x6f\xdb', 'CMBT', 8),  # CMBToken
-    (1, b'\x7e\x66\x75\x25\x52\x1c\xf6\x13\x52\xe2\xe0\x1b\x50\xfa\xaa\xe7\xdf\x39\x74\x9a', 'CMC', 18),  # CryptoMart
-    (1, b'\xf8\x5f\xee\xa2\xfd\xd8\x1d\x51\x17\x7f\x6b\x8f\x35\xf0\xe6\x73\x4c\xe4\x5f\x5f', 'CMT', 18),  # CyberMiles Token
-    (1, b'\xd4\xc4\x35\xf5\xb0\x9f\x85\x5c\x33\x17\xc8\x52\x4c\xb1\xf5\x86\xe4\x27\x95\xfa', 'CND', 18),  # Cindicator
-    (1, b'\xb4\xb1\xd2\xc2\x17\xec\x07\x76\x58\x4c\xe0\x8d\x3d\xd9\x8f\x90\xed\xed\xa4\x4b', 'CO2', 18),  # Climatecoin
-    (1, b'\xb2\xf7\xeb\x1f\x2c\x37\x64\x5b\xe6\x1d\x73\x95\x30\x35\x36\x0e\x76\x8d\x81\xe6', 'COB', 18),  # Cobinhood Token
-    (1, b'\x31\x36\xef\x85\x15\x92\xac\xf4\x9c\xa4\xc8\x25\x13\x1e\x36\x41\x70\xfa\x32\xb3', 'COFI', 18),  # CoinFi Token
-    (1, b'\x65\x29\x2e\xea\xdf\x14\x26\xcd\x2d\xf1\xc4\x79\x3a\x3d\x75\x19\xf2\x53\x91\x3b', 'COSS', 18),  # Coss Token
-    (1, b'\xf4\x47\x45\xfb\xd4\x1f\x6a\x1b\xa1\x51\xdf\x19\x0d\xb0\x56\x4c\x5f\xcc\x44\x10', 'CPY', 18),  # COPYTRACK
-    (1, b'\x7f\x58\x5b\x91\x30\xc6\x4e\x9e\x9f\x47\x0b\x61\x8a\x7b\xad\xd0\x3d\x79\xca\x7e', 'CR7', 18),  # CR7Coin
-    (1, b'\xae\xf3\x8f\xbf\xbf\x93\x2d\x1a\xef\x3b\x80\x8b\xc8\xfb\xd8\xcd\x8e\x1f\x8b\xc5', 'CRB', 8),  # CRB
-    (1, b'\x67\x2a\x1a\xd4\xf6\x67\xfb\x18\xa3\x33\xaf\x13\x66\x7a\xa0\xaf\x1f\x5b\x5b\xdd', 'CRED', 18),  # CRED
-    (1, b'\x4e\x06\x03\xe2\xa2\x7a\x30\x48\x0e\x5e\x3a\x4f\xe5\x48\xe2\x9e\xf1\x2f\x64\xbe', 'CREDO', 18),  # Credo / Bitbounce
-    (1, b'\x80\xa7\xe0\x48\xf3\x7a\x50\x50\x03\x51\xc2\x04\xcb\x40\x77\x66\xfa\x3b\xae\x7f', 'CRPT', 18),  # CrypteriumToken
-    (1, b'\xf0\xda\x11\x86\xa4\x97\x72\x26\xb9\x13\x5d\x06\x13\xee\x72\xe2\x29\xec\x3f\x4d', 'CRT', 18),  # CreamtoeCoin
-    (1, b'\xe4\xc9\x4d\x45\xf7\xae\xf7\x01\x8a\x5d\x66\xf4\x4a\xf7\x80\xec\x60\x23\x37\x8e', 'CryptoCarbon', 6),  # CryptoCarbon
-    (1, b'\x45\x45\x75\x0f\x39\xaf\x6b\xe4\xf2\x37\xb6\x86\x9d\x4e\xcc\xa9\x28\xfd\x5a\x85', 'CTF', 18),  # CryptoTask
-    (1, b'\xbf\x4c\xfd\x7d\x1e\xde\xee\xa5\xf6\x60\x08\x27\x41\x1b\x41\xa2\x1e\xb0\x8a\xbd', 'CTL', 2),  # CTL
-    (1, b'\xe3\xfa\x17\x7a\xce\xcf\xb8\x67\x21\xcf\x6f\x9f\x42\x06\xbd\x3b\xd6\x72\xd7\xd5', 'CTT', 18),  # ChainTrade Token
-    (1, b'\x66\x2a\xbc\xad\x0b\x7f\x34\x5a\xb7\xff\xb1\xb1\xfb\xb9\xdf\x78\x94\xf1\x8e\x66', 'CTX', 18),  # CarTaxi
-    (1, b'\xda\x6c\xb5\x8a\x0d\x0c\x01\x61\x0a\x29\xc5\xa6\x5c\x30\x3e\x13\xe8\x85\x88\x7c', 'cV', 18),  # carVertical
-    (1, b'\x41\xe5\x56\x00\x54\x82\x4e\xa6\xb0\x73\x2e\x65\x6e\x3a\xd6\x4e\x20\xe9\x4e\x45', 'CVC', 8),  # CVC
-    (1, b'\x21\x34\x05\x7c\x0b\x46\x1f\x89\x8d\x37\x5c\xea\xd6\x52\xac\xae\x62\xb5\x95\x41', 'CXC', 18),  # CoxxxCoin
-    (1, b'\xb6\xee\x96\x68\x77\x1a\x79\xbe\x79\x67\xee\x29\xa6\x3d\x41\x84\xf8\x09\x71\x43', 'CXO', 18),  # CargoX
-    (1, b'\xda\xb0\xc3\x1b\xf3\x4c\x89\x7f\xb0\xfe\x90\xd1\x2e\xc9\x40\x1c\xaf\x5c\x36\xec', 'DAB', 0),  # DAB
-    (1, b'\xfb\x2f\x26\xf2\x66\xfb\x28\x05\xa3\x87\x23\x0f\x2a\xa0\xa3\x31\xb4\xd9\x6f\xba', 'DADI', 18),  # DADI
-    (1, b'\x89\xd2\x4a\x6b\x4c\xcb\x1b\x6f\xaa\x26\x25\xfe\x56\x2b\xdd\x9a\x23\x26\x03\x59', 'DAI', 18),  # Dai Stablecoin v1.0
-    (1, b'\x07\xd9\xe4\x9e\xa4\x02\x19\x4b\xf4\x8a\x82\x76\xda\xfb\x16\xe4\xed\x63\x33\x17', 'DALC', 8),  # DaleCoin
-    (1, b'\x9b\x70\x74\x0e\x70\x8a\x08\x3c\x6f\xf3\x8d\xf5\x22\x97\x02\x0f\x5d\xfa\xa5\xee', 'DAN', 10),  # DaneelToken
-    (1, b'\xbb\x9b\xc2\x44\xd7\x98\x12\x3f\xde\x78\x3f\xcc\x1c\x72\xd3\xbb\x8c\x18\x94\x13', 'DAO', 16),  # DAO
-    (1, b'\x81\xc9\x15\x1d\xe0\xc8\xba\xfc\xd3\x25\xa5\x7e\x3d\xb5\xa5\xdf\x1c\xeb\xf7\x9c', 'DAT', 18),  # Datum Token
-    (1, b'\x1b\x5f\x21\xee\x98\xee\xd4\x8d\x29\x2e\x8e\x2d\x3e\xd8\x2b\x40\xa9\x72\x8a\x22', 'DATABroker', 18),  # DataBrokerDAO Token
-    (1, b'\x0c\xf0\xee\x63\x78\x8a\x08\x49\xfe\x52\x97\xf3\x40\x7f\x70\x1e\x12\x2c\xc0\x23', 'DATACoin', 18),  # DATACoin
-    (1, b'\x38\x6f\xaa\x47\x03\xa3\x4a\x7f\xdb\x19\xbe\xc2\xe1\x4f\xd4\x27\xc9\x63\x84\x16', 'DCA', 18),  # DoBetAcceptBet
-    (1, b'\x39\x9a\x0e\x6f\xbe\xb3\xd7\x4c\x85\x35\x74\x39\xf4\xc8\xae\xd9\x67\x8a\x5c\xbf', 'DCL', 3),  # DCL
-    (1, b'\x08\xd3\x2b\x0d\xa6\x3e\x2c\x3b\xcf\x80\x19\xc9\xc5\xd8\x49\xd7\xa9\xd7\x91\xe6', 'DCN', 0),  # Dentacoin
-    (1, b'\xcc\x4e\xf9\xee\xaf\x65\x6a\xc1\xa2\xab\x88\x67\x43\xe9\x8e\x97\xe0\x90\xed\x38', 'DDF', 18),  # DDF
-    (1, b'\x15\x12\x02\xc9\xc1\x8e\x49\x56\x56\xf3\x72\x28\x1f\x49\x3e\xb7\x69\x89\x61\xd5', 'DEB', 18),  # DEBITUM
-    (1, b'\x35\x97\xbf\xd5\x33\xa9\x9c\x9a\xa0\x83\x58\x7b\x07\x44\x34\xe6\x1e\xb0\xa2\x58', 'DENT', 8),  # DENT
-    (1, b'\xdd\x94\xde\x9c\xfe\x06\x35\x77\x05\x1a\x5e\xb7\x46\x5d\x08\x31\x7d\x88\x08\xb6', 'Devcon2 Token', 0),  # Devcon2 Token
-    (1, b'\xe0\xb7\x92\x7c\x4a\xf2\x37\x65\xcb\x51\x31\x4a\x0e\x05\x21\xa9\x64\x5f\x0e\x2a', 'DGD', 9),  # Digix DAO
-    (1, b'\xf6\xcf\xe5\x3d\x6f\xeb\xae\xea\x05\x1f\x40\x0f\xf5\xfc\x14\xf0\xcb\xbd\xac\xa1', 'DGPT', 18),  # DigiPulse
-    (1, b'\x55\xb9\xa1\x1c\x2e\x83\x51\xb4\xff\xc7\xb1\x15\x61\x14\x8b\xfa\xc9\x97\x78\x55', 'DGX', 9),  # DGX
-    (1, b'\x2e\x07\x1d\x29\x66\xaa\x7d\x8d\xec\xb1\x00\x58\x85\xba\x19\x77\xd6\x03\x8a\x65', 'DICE', 16),  # Etheroll
-    (1, b'\x13\xf1\x1c\x99\x05\xa0\x8c\xa7\x6e\x3e\x85\x3b\xe6\x3d\x4f\x09\x44\x32\x6c\x72', 'DIVX', 18),  # DIVX
-    (1, b'\xba\x18\x7b\x09\xff\xa8\xdd\xdc\x80\xd2\x57\x1e\xd3\xcb\xc4\xbe\x0a\xf6\x9e\x0c', 'DKP', 18),  # Draggin Karma Points
-    (1, b'\x07\xe3\xc7\x06\x53\x54\x8b\x04\xf0\xa7\x59\x70\xc1\xf8\x1b\x4c\xbb\xfb\x60\x6f', 'DLT', 18),  # Agrello
-    (1, b'\x2c\xcb\xff\x3a\x04\x2c\x68\x71\x6e\xd2\xa2\xcb\x0c\x54\x4a\x9f\x1d\x19\x35\xe1', 'DMT', 8),  # DMarket Token
-    (1, b'\x0a\xbd\xac\xe7\x0d\x37\x90\x23\x5a\xf4\x48\xc8\x85\x47\x60\x3b\x94\x56\x04\xea', 'DNT', 18),  # DistrictOx
-    (1, b'\xe4\x3e\x20\x41\xdc\x37\x86\xe1\x66\x96\x1e\xd9\x48\x4a\x55\x39\x03\x3d\x10\xfb', 'DNX', 18),  # DenCity
-    (1, b'\xee\xf6\xe9\x00\x34\xee\xa8\x9e\x31\xeb\x4b\x8e\xac\xd3\x23\xf2\x8a\x92\xea\xe4', 'DOW', 18),  # DOW
-    (1, b'\x01\xb3\xec\x4a\xae\x1b\x87\x29\x52\x9b\xeb\x49\x65\xf2\x7d\x00\x87\x88\xb0\xeb', 'DPP', 18),  # Digital Assets Power Play
-    (1, b'\x41\x9c\x4d\xb4\xb9\xe2\x5d\x6d\xb2\xad\x96\x91\xcc\xb8\x32\xc8\xd9\xfd\xa0\x5e', 'DRGN', 18),  # Dragon
-    (1, b'\x3c\x75\x22\x65\x55\xfc\x49\x61\x68\xd4\x8b\x88\xdf\x83\xb9\x5f\x16\x77\x1f\x37', 'DROP', 0),  # Droplex
-    (1, b'\x46\x72\xba\xd5\x27\x10\x74\x71\xcb\x50\x67\xa8\x87\xf4\x65\x6d\x58\x5a\x8a\x31', 'DROP (dropil)', 18),  # Dropil
-    (1, b'\x62\x1d\x78\xf2\xef\x2f\xd9\x37\xbf\xca\x69\x6c\xab\xaf\x9a\x77\x9f\x59\xb3\xed', 'DRP', 2),  # DCorp
-    (1, b'\x1e\x09\xbd\x8c\xad\xb4\x41\x63\x2e\x44\x1d\xb3\xe1\xd7\x99\x09\xee\x0a\x22\x56', 'DSC', 1),  # Digital Safe Coin
-    (1, b'\xd2\x34\xbf\x24\x10\xa0\x00\x9d\xf9\xc3\xc6\x3b\x61\x0c\x09\x73\x8f\x18\xcc\xd7', 'DTR', 8),  # DTR
-    (1, b'\xd4\xcf\xfe\xef\x10\xf6\x0e\xca\x58\x1b\x5e\x11\x46\xb5\xac\xa4\x19\x4a\x4c\x3b', 'DUBI', 18),  # Decentralized Universal Basic Income
-    (1, b'\x99\x4f\x0d\xff\xdb\xae\x0b\xbf\x09\xb6\x52\xd6\xf1\x1a\x49\x3f\xd3\x3f\x42\xb9', 'EAGLE', 18),  # EagleCoin
-    (1, b'\xaf\xc3\x97\x88\xc5\x1f\x0c\x1f\xf7\xb5\x53\x17\xf3\xe7\x02\x99\xe5\x21\xff\xf6', 'eBCH', 8),  # eBCH
-    (1, b'\xeb\x7c\x20\x02\x71\x72\xe5\xd1\x43\xfb\x03\x0d\x50\xf9\x1c\xec\xe2\xd1\x48\x5d', 'eBTC', 8),  # eBTC
-    (1, b'\xa5\x78\xac\xc0\xcb\x78\x75\x78\x1b\x78\x80\x90\x3f\x45\x94\xd1\x3c\xfa\x8b\x98', 'ECN', 2),  # ECN
-    (1, b'\x17\xf9\x34\x75\xd2\xa9\x78\xf5\x27\xc3\xf7\xc4\x4a\xbf\x44\xad\xfb\xa6\x0d\x5c', 'ECO2', 2),  # EtherCO2
-    (1, b'\x08\x71\x1d\x3b\x02\xc8\x75\x8f\x2f\xb3\xab\x4e\x80\x22\x84\x18\xa7\xf8\xe3\x9c', 'EDG', 0),  # Edgeless
-    (1, b'\xce\xd4\xe9\x31\x98\x73\x4d\xda\xff\x84\x92\xd5\x25\xbd\x25\x8d\x49\xeb\x38\x8e', 'EDO', 18),  # Eidoo
-    (1, b'\x5b\x26\xc5\xd0\x77\x2e\x5b\xba\xc8\xb3\x18\x2a\xe9\xa1\x3f\x9b\xb2\xd0\x37\x65', 'EDU', 8),  # EDU
-    (1, b'\xb5\x3a\x96\xbc\xbd\xd9\xcf\x78\xdf\xf2\x0b\xab\x6c\x2b\xe7\xba\xec\x8f\x00\xf8', 'eGAS', 8),  # ETH GAS
-    (1, b'\xf9\xf0\xfc\x71\x67\xc3\x11\xdd\x2f\x1e\x21\xe9\x20\x4f\x87\xeb\xa9\x01\x2f\xb2', 'EHT', 8),  # EasyHomes
-    (1, b'\xbf\x21\x79\x85\x9f\xc6\xd5\xbe\xe9\xbf\x91\x58\x63\x2d\xc5\x16\x78\xa4\x10\x0e', 'ELF', 18),  # ELF Token
-    (1, b'\xc8\xc6\xa3\x1a\x4a\x80\x6d\x37\x10\xa7\xb3\x8b\x7b\x29\x6d\x2f\xab\xcc\xdb\xa8', 'ELIX', 18),  # Elixir Token
-    (1, b'\x44\x19\x7a\x4c\x44\xd6\xa0\x59\x29\x7c\xaf\x6b\xe4\xf7\xe1\x72\xbd\x56\xca\xaf', 'ELTCOIN', 8),  # ELTCOIN
-    (1, b'\xb6\x7b\x88\xa2\x57\x08\xa3\x5a\xe7\xc2\xd7\x36\xd3\x98\xd2\x68\xce\x4f\x7f\x83', 'EMON', 8),  # Etheremon
-    (1, b'\x95\xda\xaa\xb9\x80\x46\x84\x6b\xf4\xb2\x85\x3e\x23\xcb\xa2\x36\xfa\x39\x4a\x31', 'EMONT', 8),  # Etheremon Token
-    (1, b'\xb8\x02\xb2\x4e\x06\x37\xc2\xb8\x7d\x2e\x8b\x77\x84\xc0\x55\xbb\xe9\x21\x01\x1a', 'EMV', 2),  # EMovieVenture
-    (1, b'\xf6\x29\xcb\xd9\x4d\x37\x91\xc9\x25\x01\x52\xbd\x8d\xfb\xdf\x38\x0e\x2a\x3b\x9c', 'ENJ', 18),  # ENJIN
-    (1, b'\x5b\xc7\xe5\xf0\xab\x8b\x2e\x10\xd2\xd0\xa3\xf2\x17\x39\xfc\xe6\x24\x59\xae\xf3', 'ENTRP', 18),  # Hut34 Entropy Token
-    (1, b'\x86\xfa\x04\x98\x57\xe0\x20\x9a\xa7\xd9\xe6\x16\xf7\xeb\x3b\x3b\x78\xec\xfd\xb0', 'EOS', 18),  # EOS
-    (1, b'\xe8\xa1\xdf\x95\x8b\xe3\x79\x04\x5e\x2b\x46\xa3\x1a\x98\xb9\x3a\x2e\xcd\xfd\xed', 'ESZ', 18),  # ESZCoin
-    (1, b'\x1b\x97\x43\xf5\x56\xd6\x5e\x75\x7c\x4c\x65\x0b\x45\x55\xba\xf3\x54\xcb\x8b\xd3', 'ETBS', 12),  # Ethbits
-    (1, b'\x3a\x26\x74\x6d\xdb\x79\xb1\xb8\xe4\x45\x0e\x3f\x4f\xfe\x32\x85\xa3\x07\x38\x7e', 'ETHB', 8),  # EtherBTC
-    (1, b'\xab\xdf\x14\x78\x70\x23\x5f\xcf\xc3\x41\x53\x82\x8c\x76\x9a\x70\xb3\xfa\xe0\x1f', 'EURT', 6),  # EUR Tether (erc20)
-    (1, b'\x92\x31\x08\xa4\x39\xc4\xe8\xc2\x31\x5c\x4f\x65\x21\xe5\xce\x95\xb4\x4e\x9b\x4c', 'EVE', 18),  # EVE
-    (1, b'\xd7\x80\xae\x2b\xf0\x4c\xd9\x6e\x57\x7d\x3d\x01\x47\x62\xf8\x31\xd9\x71\x29\xd0', 'EVN', 18),  # Envion AG
-    (1, b'\xf3\xdb\x5f\xa2\xc6\x6b\x7a\xf3\xeb\x0c\x0b\x78\x25\x10\x81\x6c\xbe\x48\x13\xb8', 'EVX', 4),  # EVX Token
-    (1, b'\xc9\x8e\x06\x39\xc6\xd2\xec\x03\x7a\x61\x53\x41\xc3\x69\x66\x6b\x11\x0e\x80\xe5', 'EXMR', 8),  # eXMRcoin
-    (1, b'\xb6\x77\x34\x52\x1e\xab\xbe\x9c\x77\x37\x29\xdb\x73\xe1\x6c\xc2\xdf\xb2\x0a\x58', 'E₹', 2),  # eRupee
-    (1, b'\x19\x0e\x56\x9b\xe0\x71\xf4\x0c\x70\x4e\x15\x82\x5f\x28\x54\x81\xcb\x74\xb6\xcc', 'FAM', 12),  # FAM
-    (1, b'\x00\x9e\x86\x49\x23\xb4\x92\x63\xc7\xf1\x0d\x19\xb7\xf8\xab\x7a\x9a\x5a\xad\x33', 'FKX', 18),  # Knoxstertoken
-    (1, b'\xf0\x4a\x8a\xc5\x53\xfc\xed\xb5\xba\x99\xa6\x47\x99\x15\x58\x26\xc1\x36\xb0\xbe', 'FLIXX', 18),  # FLIXX
-    (1, b'\x3a\x1b\xda\x28\xad\xb5\xb0\xa8\x12\xa7\xcf\x10\xa1\x95\x0c\x92\x0f\x79\xbc\xd3', 'FLP', 18),  # FLIP Token
-    (1, b'\x95\x4b\x5d\xe0\x9a\x55\xe5\x97\x55\xac\xbd\xa2\x9e\x1e\xb7\x4a\x45\xd3\x01\x75', 'FLUZ', 18),  # Fluz Fluz Global
-    (1, b'\x70\xb1\x47\xe0\x1e\x92\x85\xe7\xce\x68\xb9\xba\x43\x7f\xe3\xa9\x19\x0e\x75\x6a', 'FLX', 18),  # BitFlux
-    (1, b'\x4d\xf4\x7b\x49\x69\xb2\x91\x1c\x96\x65\x06\xe3\x59\x2c\x41\x38\x94\x93\x95\x3b', 'FND', 18),  # FundRequest
-    (1, b'\x0a\xbe\xfb\x76\x11\xcb\x3a\x01\xea\x3f\xad\x85\xf3\x3c\x3c\x93\x4f\x8e\x2c\xf4', 'FRD', 18),  # FARAD Cryptoken
-    (1, b'\xe6\xf7\x4d\xcf\xa0\xe2\x08\x83\x00\x8d\x8c\x16\xb6\xd9\xa3\x29\x18\x9d\x0c\x30', 'FTC', 2),  # FTC
-    (1, b'\x20\x23\xdc\xf7\xc4\x38\xc8\xc8\xc0\xb0\xf2\x8d\xba\xe1\x55\x20\xb4\xf3\xee\x20', 'FTR', 18),  # Futourist Token
-    (1, b'\xab\x16\xe0\xd2\x5c\x06\xcb\x37\x62\x59\xcc\x18\xc1\xde\x4a\xca\x57\x60\x55\x89', 'FUCK', 4),  # FinallyUsableCryptoKarma
-    (1, b'\xea\x38\xea\xa3\xc8\x6c\x8f\x9b\x75\x15\x33\xba\x2e\x56\x2d\xeb\x9a\xcd\xed\x40', 'FUEL', 18),  # Etherparty FUEL
-    (1, b'\x41\x9d\x0d\x8b\xdd\x9a\xf5\xe6\x06\xae\x22\x32\xed\x28\x5a\xff\x19\x0e\x71\x1b', 'FUN', 8),  # Funfair
-    (1, b'\x88\xfc\xfb\xc2\x2c\x6d\x3d\xba\xa2\x5a\xf4\x78\xc5\x78\x97\x83\x39\xbd\xe7\x7a', 'FYN', 18),  # Fund Yourself Now
-    (1, b'\xf6\x74\x51\xdc\x84\x21\xf0\xe0\xaf\xeb\x52\xfa\xa8\x10\x10\x34\xed\x08\x1e\xd9', 'GAM', 8),  # Gambit
-    (1, b'\x70\x88\x76\xf4\x86\xe4\x48\xee\x89\xeb\x33\x2b\xfb\xc8\xe5\x93\x55\x30\x58\xb9', 'GAVEL', 18),  # GAVEL
-    (1, b'\x75\x85\xf8\x35\xae\x2d\x52\x27\x22\xd2\x68\x43\x23\xa0\xba\x83\x40\x1f\x32\xf5', 'GBT', 18),  # GBT
-    (1, b'\x4f\x4f\x0d\xb4\xde\x90\x3b\x88\xf2\xb1\xa2\x84\x79\x71\xe2\x31\xd5\x4f\x8f\xd3', 'GEE', 8),  # Geens NPO
-    (1, b'\x24\x08\x3b\xb3\x00\x72\x64\x3c\x3b\xb9\x0b\x44\xb7\x28\x58\x60\xa7\x55\xe6\x87', 'GELD', 18),  # GELD
-    (1, b'\xae\x4f\x56\xf0\x72\xc3\x4c\x0a\x65\xb3\xae\x3e\x4d\xb7\x97\xd8\x31\x43\x9d\x93', 'GIM', 8),  # Gimli
-    (1, b'\xb3\xbd\x49\xe2\x8f\x8f\x83\x2b\x8d\x1e\x24\x61\x06\x99\x1e\x54\x6c\x32\x35\x02', 'GMT', 18),  # GMT
-    (1, b'\x68\x10\xe7\x76\x88\x0c\x02\x93\x3d\x47\xdb\x1b\x9f\xc0\x59\x08\xe5\x38\x6b\x96', 'GNO', 18),  # Gnosis
-    (1, b'\xa7\x44\x76\x44\x31\x19\xa9\x42\xde\x49\x85\x90\xfe\x1f\x24\x54\xd7\xd4\xac\x0d', 'GNT', 18),  # Golem
-    (1, b'\xea\xb4\x31\x93\xcf\x06\x23\x07\x3c\xa8\x9d\xb9\xb7\x12\x79\x63\x56\xfa\x74\x14', 'GOLDX', 18),  # GOLDX
-    (1, b'\x12\xb1\x9d\x3e\x2c\xcc\x14\xda\x04\xfa\xe3\x3e\x63\x65\x2c\xe4\x69\xb3\xf2\xfd', 'GRID', 12),  # GRID
-    (1, b'\xb7\x08\x35\xd7\x82\x2e\xbb\x94\x26\xb5\x65\x43\xe3\x91\x84\x6c\x10\x7b\xd3\x2c', 'GTC', 18),  # GTC Token
-    (1, b'\x02\x5a\xba\xd9\xe5\x18\x51\x6f\xda\xaf\xbd\xcd\xb9\x70\x1b\x37\xfb\x7e\xf0\xfa', 'GTKT', 0),  # GTKT
-    (1, b'\xf7\xb0\x98\x29\x8f\x7c\x69\xfc\x14\x61\x0b\xf7\x1d\x5e\x02\xc6\x07\x92\x89\x4c', 'GUP', 3),  # GUP
-    (1, b'\x10\x3c\x3a\x20\x9d\xa5\x9d\x3e\x7c\x4a\x89\x30\x7e\x66\x52\x1e\x08\x1c\xfd\xf0', 'GVT', 18),  # Genesis Vision
-    (1, b'\x58\xca\x30\x65\xc0\xf2\x4c\x7c\x96\xae\xe8\xd6\x05\x6b\x5b\x5d\xec\xf9\xc2\xf8', 'GXC', 10),  # GXC
-    (1, b'\x22\xf0\xaf\x8d\x78\x85\x1b\x72\xee\x79\x9e\x05\xf5\x4a\x77\x00\x15\x86\xb1\x8a', 'GXVC', 10),  # Genevieve VC
-    (1, b'\x8c\x65\xe9\x92\x29\x7d\x5f\x09\x2a\x75\x6d\xef\x24\xf4\x78\x1a\x28\x01\x98\xff', 'GZE', 18),  # GazeCoin
-    (1, b'\x90\x02\xd4\x48\x5b\x75\x94\xe3\xe8\x50\xf0\xa2\x06\x71\x3b\x30\x51\x13\xf6\x9e', 'HAT', 18),  # Hawala Today
-    (1, b'\xff\xe8\x19\x6b\xc2\x59\xe8\xde\xdc\x54\x4d\x93\x57\x86\xaa\x47\x09\xec\x3e\x64', 'HDG', 18),  # Hedge Crypto
-    (1, b'\xe9\xff\x07\x80\x9c\xcf\xf0\x5d\xae\x74\x99\x0e\x25\x83\x1d\x0b\xc5\xcb\xe5\x75', 'Hdp', 18),  # HEdpAY
-    (1, b'\x84\x54\x3f\x86\x8e\xc1\xb1\xfa\xc5\x10\xd4\x9d\x13\xc0\x69\xf6\x4c\xd2\xd5\xf9', 'Hdp.ф', 18),  # HEdpAY
-    (1, b'\xba\x21\x84\x52\x0a\x1c\xc4\x9a\x61\x59\xc5\x7e\x61\xe1\x84\x4e\x08\x56\x15\xb6', 'HGT', 8),  # HGT
-    (1, b'\xa9\x24\x0f\xbc\xac\x1f\x0b\x9a\x6a\xdf\xb0\x4a\x53\xc8\xe3\xb0\xcc\x1d\x14\x44', 'HIG', 18),  # ethereumhigh
-    (1, b'\x14\xf3\x7b\x57\x42\x42\xd3\x66\x55\x8d\xb6\x1f\x33\x35\x28\x9a\x50\x35\xc5\x06', 'HKG', 3),  # HKG
-    (1, b'\xcb\xcc\x0f\x03\x6e\xd4\x78\x8f\x63\xfc\x0f\xee\x32\x87\x3d\x6a\x74\x87\xb9\x08', 'HMQ', 8),  # HMQ
-    (1, b'\xb4\x5d\x7b\xc4\xce\xbc\xab\x98\xad\x09\xba\xbd\xf8\xc8\x18\xb2\x29\x2b\x67\x2c', 'HODL', 18),  # HODLCoin
-    (1, b'\x55\x4c\x20\xb7\xc4\x86\xbe\xee\x43\x92\x77\xb4\x54\x0a\x43\x45\x66\xdc\x4c\x02', 'HST', 18),  # HST
-    (1, b'\xc0\xeb\x85\x28\x5d\x83\x21\x7c\xd7\xc8\x91\x70\x2b\xcb\xc0\xfc\x40\x1e\x2d\x9d', 'HVN', 8),  # Hive Project
-    (1, b'\x5a\x84\x96\x9b\xb6\x63\xfb\x64\xf6\xd0\x15\xdc\xf9\xf6\x22\xae\xdc\x79\x67\x50', 'ICE', 18),  # ICE
-    (1, b'\x88\x86\x66\xca\x69\xe0\xf1\x78\xde\xd6\xd7\x5b\x57\x26\xce\xe9\x9a\x87\xd6\x98', 'ICN', 18),  # ICN
-    (1, b'\xa3\x3e\x72\x9b\xf4\xfd\xeb\x86\x8b\x53\x4e\x1f\x20\x52\x34\x63\xd9\xc4\x6b\xee', 'ICO', 10),  # ICO
-    (1, b'\x01\x4b\x50\x46\x65\x90\x34\x0d\x41\x30\x7c\xc5\x4d\xce\xe9\x90\xc8\xd5\x8a\xa8', 'ICOS', 6),  # ICOS
-    (1, b'\xb5\xa5\xf2\x26\x94\x35\x2c\x15\xb0\x03\x23\x84\x4a\xd5\x45\xab\xb2\xb1\x10\x28', 'ICX', 18),  # ICON
-    (1, b'\x81\x4c\xaf\xd4\x78\x2d\x2e\x72\x81\x70\xfd\xa6\x82\x57\x98\x3f\x03\x32\x1c\x58', 'IDEA', 0),  # IDEA Token
-    (1, b'\x76\x54\x91\x5a\x1b\x82\xd6\xd2\xd0\xaf\xc3\x7c\x52\xaf\x55\x6e\xa8\x98\x3c\x7e', 'IFT', 18),  # InvestFeed
-    (1, b'\x16\x66\x2f\x73\xdf\x3e\x79\xe5\x4c\x6c\x59\x38\xb4\x31\x3f\x92\xc5\x24\xc1\x20', 'IIC', 18),  # IIC
-    (1, b'\x88\xae\x96\x84\x5e\x15\x75\x58\xef\x59\xe9\xff\x90\xe7\x66\xe2\x2e\x48\x03\x90', 'IKB', 0),  # IKB
-    (1, b'\xe3\x83\x1c\x5a\x98\x2b\x27\x9a\x19\x84\x56\xd5\x77\xcf\xb9\x04\x24\xcb\x63\x40', 'IMC', 6),  # Immune Coin
-    (1, b'\x22\xe5\xf6\x2d\x0f\xa1\x99\x74\x74\x9f\xaa\x19\x4e\x3d\x3e\xf6\xd8\x9c\x08\xd7', 'IMT', 0),  # IMT
-    (1, b'\xf8\xe3\x86\xed\xa8\x57\x48\x4f\x5a\x12\xe4\xb5\xda\xa9\x98\x4e\x06\xe7\x37\x05', 'IND', 18),  # Indorse
-    (1, b'\x5b\x2e\x4a\x70\x0d\xfb\xc5\x60\x06\x1e\x95\x7e\xde\xc8\xf6\xee\xeb\x74\xa3\x20', 'INS', 10),  # INS
-    (1, b'\xa8\x00\x6c\x4c\xa5\x6f\x24\xd6\x83\x67\x27\xd1\x06\x34\x93\x20\xdb\x7f\xef\x82', 'INXT', 8),  # Internxt
-    (1, b'\xc3\x4b\x21\xf6\xf8\xe5\x1c\xc9\x65\xc2\x39\x3b\x3c\xcf\xa3\xb8\x2b\xeb\x24\x03', 'IoT', 6),  # IoTコイン
-    (1, b'\x64\xcd\xf8\x19\xd3\xe7\x5a\xc8\xec\x21\x7b\x34\x96\xd7\xce\x16\x7b\xe4\x2e\x80', 'IPL', 18),  # InsurePal token
-    (1, b'\x5e\x6b\x6d\x9a\xba\xd9\x09\x3f\xdc\x86\x1e\xa1\x60\x0e\xba\x1b\x35\x5c\xd9\x40', 'ITC', 18),  # IoT Chain
-    (1, b'\x0a\xef\x06\xdc\xcc\xc5\x31\xe5\x81\xf0\x44\x00\x59\xe6\xff\xcc\x20\x60\x39\xee', 'ITT', 8),  # ITT Token
-    (1, b'\xfc\xa4\x79\x62\xd4\x5a\xdf\xdf\xd1\xab\x2d\x97\x23\x15\xdb\x4c\xe7\xcc\xf0\x94', 'IXT', 8),  # InsureX
-    (1, b'\x0d\x26\x2e\x5d\xc4\xa0\x6a\x0f\x1c\x90\xce\x79\xc7\xa6\x0c\x09\xdf\xc8\x84\xe4', 'J8T', 8),  # J8T Token
-    (1, b'\x0a\xaf\x56\x1e\xff\x5b\xd9\xc8\xf9\x11\x61\x69\x33\xf8\x41\x66\xa1\x7c\xfe\x0c', 'JBX', 0),  # JBX
-    (1, b'\x87\x27\xc1\x12\xc7\x12\xc4\xa0\x33\x71\xac\x87\xa7\x4d\xd6\xab\x10\x4a\xf7\x68', 'JET', 18),  # JET
-    (1, b'\x77\x34\x50\x33\x5e\xd4\xec\x3d\xb4\x5a\xf7\x4f\x34\xf2\xc8\x53\x48\x64\x5d\x39', 'JetCoins', 18),  # JetCoins
-    (1, b'\xa5\xfd\x1a\x79\x1c\x4d\xfc\xaa\xcc\x96\x3d\x4f\x73\xc6\xae\x58\x24\x14\x9e\xa7', 'JNT', 18),  # JNT
-    (1, b'\x72\xd3\x2a\xc1\xc5\xe6\x6b\xfc\x5b\x08\x80\x62\x71\xf8\xee\xf9\x15\x54\x51\x64', 'KEE', 0),  # CryptoKEE
-    (1, b'\x4c\xc1\x93\x56\xf2\xd3\x73\x38\xb9\x80\x2a\xa8\xe8\xfc\x58\xb0\x37\x32\x96\xe7', 'KEY', 18),  # SelfKey
-    (1, b'\x27\x69\x5e\x09\x14\x9a\xdc\x73\x8a\x97\x8e\x9a\x67\x8f\x99\xe4\xc3\x9e\x9e\xb9', 'KICK', 8),  # KICK
-    (1, b'\x81\x8f\xc6\xc2\xec\x59\x86\xbc\x6e\x2c\xbf\x00\x93\x9d\x90\x55\x6a\xb1\x2c\xe5', 'KIN', 18),  # Kin Foundation
-    (1, b'\xdd\x97\x4d\x5c\x2e\x29\x28\xde\xa5\xf7\x1b\x98\x25\xb8\xb6\x46\x68\x6b\xd2\x00', 'KNC', 18),  # Kyber Network
-    (1, b'\x95\x41\xfd\x8b\x9b\x5f\xa9\x73\x81\x78\x37\x83\xce\xbf\x2f\x5f\xa7\x93\xc2\x62', 'KZN', 8),  # KaizenCoin
-    (1, b'\xe5\x03\x65\xf5\xd6\x79\xcb\x98\xa1\xdd\x62\xd6\xf6\xe5\x8e\x59\x32\x1b\xcd\xdf', 'LA', 18),  # LATOKEN
-    (1, b'\xfd\x10\x7b\x47\x3a\xb9\x0e\x8f\xbd\x89\x87\x21\x44\xa3\xdc\x92\xc4\x0f\xa8\xc9', 'LALA', 18),  # LALA World Token
-    (1, b'\xd6\xe3\x54\xf0\x73\x19\xe2\x47\x44\x91\xd8\xc7\xc7\x12\x13\x7b\xee\x68\x62\xa2', 'LEMO', 0),  # Lemo
-    (1, b'\xc7\x98\xcd\x1c\x49\xdb\x0e\x29\x73\x12\xe4\xc6\x82\x75\x26\x68\xce\x1d\xb2\xad', 'LFR', 5),  # LifeRun Coin
-    (1, b'\x2e\xb8\x6e\x8f\xc5\x20\xe0\xf6\xbb\x5d\x9a\xf0\x8f\x92\x4f\xe7\x05\x58\xab\x89', 'LGR', 8),  # Logarithm
-    (1, b'\xeb\x99\x51\x02\x16\x98\xb4\x2e\x43\x99\xf9\xcb\xb6\x26\x7a\xa3\x5f\x82\xd5\x9d', 'LIF', 18),  # LIF
-    (1, b'\xff\x18\xdb\xc4\x87\xb4\xc2\xe3\x22\x2d\x11\x59\x52\xba\xbf\xda\x8b\xa5\x2f\x5f', 'LIFE', 18),  # LIFE
-    (1, b'\x51\x49\x10\x77\x1a\xf9\xca\x65\x6a\xf8\x40\xdf\xf8\x3e\x82\x64\xec\xf9\x86\xca', 'LINK (Chainlink)', 18),  # LINK Chainlink
-    (1, b'\xe2\xe6\xd4\xbe\x08\x6c\x69\x38\xb5\x3b\x22\x14\x48\x55\xee\xf6\x74\x28\x16\x39', 'LINK Platform', 18),  # Link Platform
-    (1, b'\x24\xa7\x7c\x1f\x17\xc5\x47\x10\x5e\x14\x81\x3e\x51\x7b\xe0\x6b\x00\x40\xaa\x76', 'LIVE', 18),  # LIVE Token
-    (1, b'\x63\xe6\x34\x33\x0a\x20\x15\x0d\xbb\x61\xb1\x56\x48\xbc\x73\x85\x5d\x6c\xcf\x07', 'LNC', 18),  # Lancer Token
-    (1, b'\x6b\xeb\x41\x8f\xc6\xe1\x95\x82\x04\xac\x8b\xad\xdc\xf1\x09\xb8\xe9\x69\x49\x66', 'LNC-Linker Coin', 18),  # Linker Coin
-    (1, b'\x5e\x33\x46\x44\x40\x10\x13\x53\x22\x26\x8a\x46\x30\xd2\xed\x5f\x8d\x09\x44\x6c', 'LOC', 18),  # LockChain
-    (1, b'\x9c\x23\xd6\x7a\xea\x7b\x95\xd8\x09\x42\xe3\x83\x6b\xcd\xf7\xe7\x08\xa7\x47\xc2', 'LOCI', 18),  # LOCIcoin
-    (1, b'\x21\xae\x23\xb8\x82\xa3\x40\xa2\x22\x82\x16\x20\x86\xbc\x98\xd3\xe2\xb7\x30\x18', 'LOK', 18),  # LOK
-    (1, b'\xef\x68\xe7\xc6\x94\xf4\x0c\x82\x02\x82\x1e\xdf\x52\x5d\xe3\x78\x24\x58\x63\x9f', 'LRC', 18),  # LRC
-    (1, b'\xfb\x12\xe3\xcc\xa9\x83\xb9\xf5\x9d\x90\x91\x2f\xd1\x7f\x8d\x74\x5a\x8b\x29\x53', 'LUCK', 0),  # LUCK
-    (1, b'\xa8\x9b\x59\x34\x86\x34\x47\xf6\xe4\xfc\x53\xb3\x15\xa9\x3e\x87\x3b\xda\x69\xa3', 'LUM', 18),  # Lumino Coin
-    (1, b'\xfa\x05\xa7\x3f\xfe\x78\xef\x8f\x1a\x73\x94\x73\xe4\x62\xc5\x4b\xae\x65\x67\xd9', 'LUN', 18),  # LUN
-    (1, b'\x3f\x4b\x72\x66\x68\xda\x46\xf5\xe0\xe7\x5a\xa5\xd4\x78\xac\xec\x9f\x38\x21\x0f', 'M-ETH', 18),  # M-ETH
-    (1, b'\x0f\x5d\x2f\xb2\x9f\xb7\xd3\xcf\xee\x44\x4a\x20\x02\x98\xf4\x68\x90\x8c\xc9\x42', 'MANA', 18),  # Decentraland MANA
-    (1, b'\x38\x64\x67\xf1\xf3\xdd\xbe\x83\x24\x48\x65\x04\x18\x31\x1a\x47\x9e\xec\xfc\x57', 'MBRS', 0),  # Embers
-    (1, b'\x93\xe6\x82\x10\x7d\x1e\x9d\xef\xb0\xb5\xee\x70\x1c\x71\x70\x7a\x4b\x2e\x46\xbc', 'MCAP', 8),  # MCAP
-    (1, b'\x13\x8a\x87\x52\x09\x3f\x4f\x9a\x79\xaa\xed\xf4\x8d\x4b\x92\x48\xfa\xb9\x3c\x9c', 'MCI', 18),  # Musiconomi
-    (1, b'\xb6\x3b\x60\x6a\xc8\x10\xa5\x2c\xca\x15\xe4\x4b\xb6\x30\xfd\x42\xd8\xd1\xd8\x3d', 'MCO', 8),  # MCO
-    (1, b'\x51\xdb\x5a\xd3\x5c\x67\x1a\x87\x20\x7d\x88\xfc\x11\xd5\x93\xac\x0c\x84\x15\xbd', 'MDA', 18),  # MDA
-    (1, b'\x5b\x8d\x43\xff\xde\x4a\x29\x82\xb9\xa5\x38\x7c\xdf\x21\xd5\x4e\xad\x64\xac\x8d', 'MEST', 18),  # Monaco Estate
-    (1, b'\x40\x39\x50\x44\xac\x3c\x0c\x57\x05\x19\x06\xda\x93\x8b\x54\xbd\x65\x57\xf2\x12', 'MGO', 8),  # MGO
-    (1, b'\xe2\x3c\xd1\x60\x76\x1f\x63\xfc\x3a\x1c\xf7\x8a\xa0\x34\xb6\xcd\xf9\x7d\x3e\x0c', 'MIT', 18),  # MIT
-    (1, b'\x9f\x8f\x72\xaa\x93\x04\xc8\xb5\x93\xd5\x55\xf1\x2e\xf6\x58\x9c\xc3\xa5\x79\xa2', 'MKR', 18),  # MakerDAO
-    (1, b'\xbe\xb9\xef\x51\x4a\x37\x9b\x99\x7e\x07\x98\xfd\xcc\x90\x1e\xe4\x74\xb6\xd9\xa1', 'MLN', 18),  # Melonport
-    (1, b'\x1a\x95\xb2\x71\xb0\x53\x5d\x15\xfa\x49\x93\x2d\xab\xa3\x1b\xa6\x12\xb5\x29\x46', 'MNE', 8),  # MNE
-    (1, b'\xa9\x87\x7b\x1e\x05\xd0\x35\x89\x91\x31\xdb\xd1\xe4\x03\x82\x51\x66\xd0\x9f\x92', 'MNT', 18),  # Media Network Token
-    (1, b'\x83\xce\xe9\xe0\x86\xa7\x7e\x49\x2e\xe0\xbb\x93\xc2\xb0\x43\x7a\xd6\xfd\xec\xcc', 'MNTP', 18),  # Goldmint MNT Prelaunch Token
-    (1, b'\x95\x7c\x30\xab\x04\x26\xe0\xc9\x3c\xd8\x24\x1e\x2c\x60\x39\x2d\x08\xc6\xac\x8e', 'MOD', 0),  # Modum
-    (1, b'\x21\xf0\xf0\xfd\x31\x41\xee\x9e\x11\xb3\xd7\xf1\x3a\x10\x28\xcd\x51\x5f\x45\x9c', 'MRP', 18),  # MoneyRebel Token
-    (1, b'\xab\x6c\xf8\x7a\x50\xf1\x7d\x7f\x5e\x1f\xea\xf8\x1b\x6f\xe9\xff\xbe\x8e\xbf\x84', 'MRV', 18),  # MRV
-    (1, b'\x68\xaa\x3f\x23\x2d\xa9\xbd\xc2\x34\x34\x65\x54\x57\x94\xef\x3e\xea\x52\x09\xbd', 'MSP', 18),  # Mothership
-    (1, b'\xaf\x4d\xce\x16\xda\x28\x77\xf8\xc9\xe0\x05\x44\xc9\x3b\x62\xac\x40\x63\x1f\x16', 'MTH', 5),  # Monetha
-    (1, b'\xf4\x33\x08\x93\x66\x89\x9d\x83\xa9\xf2\x6a\x77\x3d\x59\xec\x7e\xcf\x30\x35\x5e', 'MTL', 8),  # MetalPay
-    (1, b'\x41\xdb\xec\xc1\xcd\xc5\x51\x7c\x6f\x76\xf6\xa6\xe8\x36\xad\xbe\xe2\x75\x4d\xe3', 'MTN', 18),  # MedToken
-    (1, b'\x7f\xc4\x08\x01\x11\x65\x76\x0e\xe3\x1b\xe2\xbf\x20\xda\xf4\x50\x35\x66\x92\xaf', 'MTR', 8),  # Mitrav
-    (1, b'\x1e\x49\xff\x77\xc3\x55\xa3\xe3\x8d\x66\x51\xce\x84\x04\xaf\x0e\x48\xc5\x39\x5f', 'MTRc', 18),  # MTRCToken
-    (1, b'\x0a\xf4\x4e\x27\x84\x63\x72\x18\xdd\x1d\x32\xa3\x22\xd4\x4e\x60\x3a\x8f\x0c\x6a', 'MTX', 18),  # MTX
-    (1, b'\x64\x25\xc6\xbe\x90\x2d\x69\x2a\xe2\xdb\x75\x2b\x3c\x26\x8a\xfa\xdb\x09\x9d\x3b', 'MWAT', 18),  # RED MWAT
-    (1, b'\xf7\xe9\x83\x78\x16\x09\x01\x23\x07\xf2\x51\x4f\x63\xd5\x26\xd8\x3d\x24\xf4\x66', 'MYD', 16),  # MYD
-    (1, b'\xa6\x45\x26\x4c\x56\x03\xe9\x6c\x3b\x0b\x07\x8c\xda\xb6\x87\x33\x79\x4b\x0a\x71', 'MYST', 8),  # Mysterium
-    (1, b'\x9e\x46\xa3\x8f\x5d\xaa\xbe\x86\x83\xe1\x07\x93\xb0\x67\x49\xee\xf7\xd7\x33\xd1', 'NCT', 18),  # Nectar
-    (1, b'\xa5\x4d\xdc\x7b\x3c\xce\x7f\xc8\xb1\xe3\xfa\x02\x56\xd0\xdb\x80\xd2\xc1\x09\x70', 'NDC', 18),  # Neverdie
-    (1, b'\xcf\xb9\x86\x37\xbc\xae\x43\xc1\x33\x23\xea\xa1\x73\x1c\xed\x2b\x71\x69\x62\xfd', 'NET', 18),  # NIMIQ
-    (1, b'\xa8\x23\xe6\x72\x20\x06\xaf\xe9\x9e\x91\xc3\x0f\xf5\x29\x50\x52\xfe\x6b\x8e\x32', 'NEU', 18),  # NEU Fund
-    (1, b'\x72\xdd\x4b\x6b\xd8\x52\xa3\xaa\x17\x2b\xe4\xd6\xc5\xa6\xdb\xec\x58\x8c\xf1\x31', 'NGC', 18),  # NAGA Coin
-    (1, b'\xe2\x65\x17\xa9\x96\x72\x99\x45\x3d\x3f\x1b\x48\xaa\x00\x5e\x61\x27\xe6\x72\x10', 'NIMFA', 18),  # Ninfa Money
-    (1, b'\x17\x76\xe1\xf2\x6f\x98\xb1\xa5\xdf\x9c\xd3\x47\x95\x3a\x26\xdd\x3c\xb4\x66\x71', 'NMR', 18),  # NMR
-    (1, b'\xec\x46\xf8\x20\x7d\x76\x60\x12\x45\x4c\x40\x8d\xe2\x10\xbc\xbc\x22\x43\xe7\x1c', 'NOX', 18),  # NOX
-    (1, b'\xb9\x13\x18\xf3\x5b\xdb\x26\x2e\x94\x23\xbc\x7c\x7c\x2a\x3a\x93\xdd\x93\xc9\x2c', 'NULS', 18),  # NULS
-    (1, b'\x45\xe4\x2d\x65\x9d\x9f\x94\x66\xcd\x5d\xf6\x22\x50\x60\x33\x14\x5a\x9b\x89\xbc', 'NxC', 3),  # Nexium
-    (1, b'\x76\x27\xde\x4b\x93\x26\x3a\x6a\x75\x70\xb8\xda\xfa\x64\xba\xe8\x12\xe5\xc3\x94', 'NXX', 8),  # NXX
-    (1, b'\x5c\x61\x83\xd1\x0a\x00\xcd\x74\x7a\x6d\xbb\x5f\x65\x8a\xd5\x14\x38\x3e\x94\x19', 'NXX OLD', 8),  # NXX OLD
-    (1, b'\x70\x1c\x24\x4b\x98\x8a\x51\x3c\x94\x59\x73\xde\xfa\x05\xde\x93\x3b\x23\xfe\x1d', 'OAX', 18),  # OAX
-    (1, b'\x02\x35\xfe\x62\x4e\x04\x4a\x05\xee\xd7\xa4\x3e\x16\xe3\x08\x3b\xc8\xa4\x28\x7a', 'OCC', 18),  # Original Crypto Coin
-    (1, b'\x7f\x21\x76\xce\xb1\x6d\xcb\x64\x8d\xc9\x24\xef\xf6\x17\xc3\xdc\x2b\xef\xd3\x0d', 'OHNI', 0),  # OHNI
-    (1, b'\xc6\x6e\xa8\x02\x71\x7b\xfb\x98\x33\x40\x02\x64\xdd\x12\xc2\xbc\xea\xa3\x4a\x6d', 'OLD_MKR', 18),  # MakerDAO
-    (1, b'\xd2\x61\x14\xcd\x6e\xe2\x89\xac\xcf\x82\x35\x0c\x8d\x84\x87\xfe\xdb\x8a\x0c\x07', 'OMG', 18),  # OMG
-    (1, b'\xb2\x3b\xe7\x35\x73\xbc\x7e\x03\xdb\x6e\x5d\xfc\x62\x40\x53\x68\x71\x6d\x28\xa8', 'ONEK', 18),  # One K Token
-    (1, b'\xd3\x41\xd1\x68\x0e\xee\xe3\x25\x5b\x8c\x4c\x75\xbc\xce\x7e\xb5\x7f\x14\x4d\xae', 'onG', 18),  # onG
-    (1, b'\x43\x55\xfc\x16\x0f\x74\x32\x8f\x9b\x38\x3d\xf2\xec\x58\x9b\xb3\xdf\xd8\x2b\xa0', 'OPT', 18),  # Opus Foundation
-    (1, b'\x2c\x4e\x8f\x2d\x74\x61\x13\xd0\x69\x6c\xe8\x9b\x35\xf0\xd8\xbf\x88\xe0\xae\xca', 'OST', 18),  # Simple Token 'OST'
-    (1, b'\x65\xa1\x50\x14\x96\x4f\x21\x02\xff\x58\x64\x7e\x16\xa1\x6a\x6b\x9e\x14\xbc\xf6', 'Ox Fina', 3),  # Ox Fina
-    (1, b'\xea\x5f\x88\xe5\x4d\x98\x2c\xbb\x0c\x44\x1c\xde\x4e\x79\xbc\x30\x5e\x5b\x43\xbc', 'PARETO', 18),  # PARETO
-    (1, b'\x69\x44\x04\x59\x5e\x30\x75\xa9\x42\x39\x7f\x46\x6a\xac\xd4\x62\xff\x1a\x7b\xd0', 'PATENTS', 18),  # PATENTS
-    (1, b'\xb9\x70\x48\x62\x8d\xb6\xb6\x61\xd4\xc2\xaa\x83\x3e\x95\xdb\xe1\xa9\x05\xb2\x80', 'PAY', 18),  # TenX
-    (1, b'\x55\x64\x8d\xe1\x98\x36\x33\x85\x49\x13\x0b\x1a\xf5\x87\xf1\x6b\xea\x46\xf6\x6b', 'PBL', 18),  # PBL
-    (1, b'\xfc\xac\x7a\x75\x15\xe9\xa9\xd7\x61\x9f\xa7\x7a\x1f\xa7\x38\x11\x1f\x66\x72\x7e', 'PCH', 18),  # PITCH
-    (1, b'\x36\x18\x51\x6f\x45\xcd\x3c\x91\x3f\x81\xf9\x98\x7a\xf4\x10\x77\x93\x2b\xc4\x0d', 'PCL', 8),  # Peculium
-    (1, b'\x53\x14\x8b\xb4\x55\x17\x07\xed\xf5\x1a\x1e\x8d\x7a\x93\x69\x8d\x18\x93\x12\x25', 'PCLOLD', 8),  # PeculiumOLD
-    (1, b'\x58\x84\x96\x9e\xc0\x48\x05\x56\xe1\x1d\x11\x99\x80\x13\x6a\x4c\x17\xed\xde\xd1', 'PET', 18),  # PETHEREUM
-    (1, b'\xec\x18\xf8\x98\xb4\x07\x6a\x3e\x18\xf1\x08\x9d\x33\x37\x6c\xc3\x80\xbd\xe6\x1d', 'PETRO', 18),  # PETRO
-    (1, b'\x55\xc2\xa0\xc1\x71\xd9\x20\x84\x35\x60\x59\x4d\xe3\xd6\xee\xcc\x09\xef\xc0\x98', 'PEXT', 4),  # PEX-Token
-    (1, b'\xe6\x45\x09\xf0\xbf\x07\xce\x2d\x29\xa7\xef\x19\xa8\xa9\xbc\x06\x54\x77\xc1\xb4', 'PIPL', 8),  # PIPL Coin
-    (1, b'\x8e\xff\xd4\x94\xeb\x69\x8c\xc3\x99\xaf\x62\x31\xfc\xcd\x39\xe0\x8f\xd2\x0b\x15', 'PIX', 0),  # PIX
-    (1, b'\x59\x41\x6a\x25\x62\x8a\x76\xb4\x73\x0e\xc5\x14\x86\x11\x4c\x32\xe0\xb5\x82\xa1', 'PLASMA', 6),  # PLASMA
-    (1, b'\xe4\x77\x29\x2f\x1b\x32\x68\x68\x7a\x29\x37\x61\x16\xb0\xed\x27\xa9\xc7\x61\x70', 'PLAY', 18),  # HeroCoin
-    (1, b'\x0a\xff\xa0\x6e\x7f\xbe\x5b\xc9\xa7\x64\xc9\x79\xaa\x66\xe8\x25\x6a\x63\x1f\x02', 'PLBT', 6),  # Polybius
-    (1, b'\xe3\x81\x85\x04\xc1\xb3\x2b\xf1\x55\x7b\x16\xc2\x38\xb2\xe0\x1f\xd3\x14\x9c\x17', 'PLR', 18),  # Pillar Project
-    (1, b'\xd8\x91\x2c\x10\x68\x1d\x8b\x21\xfd\x37\x42\x24\x4f\x44\x65\x8d\xba\x12\x26\x4e', 'PLU', 18),  # Plutus
-    (1, b'\x0e\x09\x89\xb1\xf9\xb8\xa3\x89\x83\xc2\xba\x80\x53\x26\x9c\xa6\x2e\xc9\xb1\x95', 'POE', 8),  # Po.et Tokens
-    (1, b'\x43\xf6\xa1\xbe\x99\x2d\xee\x40\x87\x21\x74\x84\x90\x77\x2b\x15\x14\x3c\xe0\xa7', 'POIN', 0),  # Potatoin
-    (1, b'\x99\x92\xec\x3c\xf6\xa5\x5b\x00\x97\x8c\xdd\xf2\xb2\x7b\xc6\x88\x2d\x88\xd1\xec', 'POLY', 18),  # Polymath Network
-    (1, b'\x77\x9b\x7b\x71\x3c\x86\xe3\xe6\x77\x4f\x50\x40\xd9\xcc\xc2\xd4\x3a\xd3\x75\xf8', 'POOL', 8),  # Stake Pool
-    (1, b'\xee\x60\x9f\xe2\x92\x12\x8c\xad\x03\xb7\x86\xdb\xb9\xbc\x26\x34\xcc\xdb\xe7\xfc', 'POS', 18),  # PoSToken
-    (1, b'\x59\x58\x32\xf8\xfc\x6b\xf5\x9c\x85\xc5\x27\xfe\xc3\x74\x0a\x1b\x7a\x36\x12\x69', 'POWR', 6),  # PowerLedger
-    (1, b'\xc4\x22\x09\xac\xcc\x14\x02\x9c\x10\x12\xfb\x56\x80\xd9\x5f\xbd\x60\x36\xe2\xa0', 'PPP', 18),  # PayPie
-    (1, b'\xd4\xfa\x14\x60\xf5\x37\xbb\x90\x85\xd2\x2c\x7b\xcc\xb5\xdd\x45\x0e\xf2\x8e\x3a', 'PPT', 8),  # Populous
-    (1, b'\x88\xa3\xe4\xf3\x5d\x64\xaa\xd4\x1a\x6d\x40\x30\xac\x9a\xfe\x43\x56\xcb\x84\xfa', 'PRE', 18),  # Presearch
-    (1, b'\x77\x28\xdf\xef\x5a\xbd\x46\x86\x69\xeb\x7f\x9b\x48\xa7\xf7\x0a\x50\x1e\xd2\x9d', 'PRG', 6),  # PRG
-    (1, b'\x18\x44\xb2\x15\x93\x26\x26\x68\xb7\x24\x8d\x0f\x57\xa2\x20\xca\xab\xa4\x6a\xb9', 'PRL', 18),  # Oyster Pearl
-    (1, b'\x22\x6b\xb5\x99\xa1\x2c\x82\x64\x76\xe3\xa7\x71\x45\x46\x97\xea\x52\xe9\xe2\x20', 'PRO', 8),  # Propy
-    (1, b'\x76\x41\xb2\xca\x9d\xdd\x58\xad\xdf\x6e\x33\x81\xc1\xf9\x94\xaa\xc5\xf1\xa3\x2f', 'PRPS', 18),  # Purpose
-    (1, b'\x16\x37\x33\xbc\xc2\x8d\xbf\x26\xb4\x1a\x8c\xfa\x83\xe3\x69\xb5\xb3\xaf\x74\x1b', 'PRS', 18),  # Persians
-    (1, b'\x0c\x04\xd4\xf3\x31\xda\x8d\xf7\x5f\x9e\x2e\x27\x1e\x3f\x3f\x14\x94\xc6\x6c\x36', 'PRSP', 9),  # PRSP
-    (1, b'\x66\x49\x7a\x28\x3e\x0a\x00\x7b\xa3\x97\x4e\x83\x77\x84\xc6\xae\x32\x34\x47\xde', 'PT', 18),  # PornToken
-    (1, b'\x8a\xe4\xbf\x2c\x33\xa8\xe6\x67\xde\x34\xb5\x49\x38\xb0\xcc\xd0\x3e\xb8\xcc\x06', 'PTOY', 8),  # PTOY
-    (1, b'\x55\x12\xe1\xd6\xa7\xbe\x42\x4b\x43\x23\x12\x6b\x4f\x9e\x86\xd0\x23\xf9\x57\x64', 'PTWO', 18),  # PornTokenV2
-    (1, b'\xef\x6b\x4c\xe8\xc9\xbc\x83\x74\x4f\xbc\xde\x26\x57\xb3\x2e\xc1\x87\x90\x45\x8a', 'PUC', 0),  # Pour Coin
-    (1, b'\xc1\x48\x30\xe5\x3a\xa3\x44\xe8\xc1\x46\x03\xa9\x12\x29\xa0\xb9\x25\xb0\xb2\x62', 'PXT', 8),  # Populous XBRL Token (PXT)
-    (1, b'\x67\x1a\xbb\xe5\xce\x65\x24\x91\x98\x53\x42\xe8\x54\x28\xeb\x1b\x07\xbc\x6c\x64', 'QAU', 8),  # QAU
-    (1, b'\x69\x7b\xea\xc2\x8b\x09\xe1\x22\xc4\x33\x2d\x16\x39\x85\xe8\xa7\x31\x21\xb9\x7f', 'QRL', 8),  # QRL
-    (1, b'\x99\xea\x4d\xb9\xee\x77\xac\xd4\x0b\x11\x9b\xd1\xdc\x4e\x33\xe1\xc0\x70\xb8\x0d', 'QSP', 18),  # Quantstamp Token
-    (1, b'\x2c\x3c\x1f\x05\x18\x7d\xba\x7a\x5f\x2d\xd4\x7d\xca\x57\x28\x1c\x4d\x4f\x18\x3f', 'QTQ', 18),  # TiiQu's Q Token
-    (1, b'\x9a\x64\x2d\x6b\x33\x68\xdd\xc6\x62\xca\x24\x4b\xad\xf3\x2c\xda\x71\x60\x05\xbc', 'QTUM', 18),  # Qtum
-    (1, b'\x2a\x3a\xa9\xec\xa4\x1e\x72\x0e\xd4\x6b\x5a\x70\xd6\xc3\x7e\xfa\x47\xf7\x68\xac', 'RCT', 18),  # RCT
-    (1, b'\x25\x5a\xa6\xdf\x07\x54\x0c\xb5\xd3\xd2\x97\xf0\xd0\xd4\xd8\x4c\xb5\x2b\xc8\xe6', 'RDN', 18),  # Raiden Network
-    (1, b'\x76\x7b\xa2\x91\x5e\xc3\x44\x01\x5a\x79\x38\xe3\xee\xdf\xec\x27\x85\x19\x5d\x05', 'REA', 18),  # Realisto
-    (1, b'\x5f\x53\xf7\xa8\x07\x56\x14\xb6\x99\xba\xad\x0b\xc2\xc8\x99\xf4\xba\xd8\xfb\xbf', 'REBL', 18),  # Rebellious
-    (1, b'\x40\x8e\x41\x87\x6c\xcc\xdc\x0f\x92\x21\x06\x00\xef\x50\x37\x26\x56\x05\x2a\x38', 'REN', 18),  # Republic Token
-    (1, b'\xe9\x43\x27\xd0\x7f\xc1\x79\x07\xb4\xdb\x78\x8e\x5a\xdf\x2e\xd4\x24\xad\xdf\xf6', 'REP', 18),  # Augur
-    (1, b'\x8f\x82\x21\xaf\xbb\x33\x99\x8d\x85\x84\xa2\xb0\x57\x49\xba\x73\xc3\x7a\x93\x8a', 'REQ', 18),  # Request Network
-    (1, b'\xf0\x5a\x93\x82\xa4\xc3\xf2\x9e\x27\x84\x50\x27\x54\x29\x3d\x88\xb8\x35\x10\x9c', 'REX', 18),  # REX
-    (1, b'\xdd\x00\x72\x78\xb6\x67\xf6\xbe\xf5\x2f\xd0\xa4\xc2\x36\x04\xaa\x1f\x96\x03\x9a', 'RIPT', 8),  # RiptideCoin
-    (1, b'\x60\x7f\x4c\x5b\xb6\x72\x23\x0e\x86\x72\x08\x55\x32\xf7\xe9\x01\x54\x4a\x73\x75', 'RLC', 9),  # IEx.ec
-    (1, b'\xcc\xed\x5b\x82\x88\x08\x6b\xe8\xc3\x8e\x23\x56\x7e\x68\x4c\x37\x40\xbe\x4d\x48', 'RLT', 10),  # RLT
-    (1, b'\xbe\x99\xb0\x97\x09\xfc\x75\x3b\x09\xbc\xf5\x57\xa9\x92\xf6\x60\x5d\x59\x97\xb0', 'RLTY', 8),  # SMARTRealty
-    (1, b'\x4a\x42\xd2\xc5\x80\xf8\x3d\xce\x40\x4a\xca\xd1\x8d\xab\x26\xdb\x11\xa1\x75\x0e', 'RLX', 18),  # Relex
-    (1, b'\x09\x96\xbf\xb5\xd0\x57\xfa\xa2\x37\x64\x0e\x25\x06\xbe\x7b\x4f\x9c\x46\xde\x0b', 'RNDR', 18),  # Render Token
-    (1, b'\xc9\xde\x4b\x7f\x0c\x3d\x99\x1e\x96\x71\x58\xe4\xd4\xbf\xa4\xb5\x1e\xc0\xb1\x14', 'ROK', 18),  # Rocketchain
-    (1, b'\x49\x93\xcb\x95\xc7\x44\x3b\xdc\x06\x15\x5c\x5f\x56\x88\xbe\x9d\x8f\x69\x99\xa5', 'ROUND', 18),  # ROUND
-    (1, b'\xb4\xef\xd8\x5c\x19\x99\x9d\x84\x25\x13\x04\xbd\xa9\x9e\x90\xb9\x23\x00\xbd\x93', 'RPL', 18),  # Rocket Pool
-    (1, b'\x54\xb2\x93\x22\x60\x00\xcc\xbf\xc0\x4d\xf9\x02\xee\xc5\x67\xcb\x4c\x35\xa9\x03', 'RTN', 18),  # RiderToken
-    (1, b'\x41\xf6\x15\xe2\x4f\xab\xd2\xb0\x97\xa3\x20\xe9\xe6\xc1\xf4\x48\xcb\x40\x52\x1c', 'RVL', 18),  # RVL
-    (1, b'\x3d\x1b\xa9\xbe\x9f\x66\xb8\xee\x10\x19\x11\xbc\x36\xd3\xfb\x56\x2e\xac\x22\x44', 'RVT', 18),  # Rivetz
-    (1, b'\x1e\xc8\xfe\x51\xa9\xb6\xa3\xa6\xc4\x27\xd1\x7d\x9e\xcc\x30\x60\xfb\xc4\xa4\x5c', 'S-A-PAT', 18),  # S-A-PAT
-    (1, b'\x3e\xb9\x1d\x23\x7e\x49\x1e\x0d\xee\x85\x82\xc4\x02\xd8\x5c\xb4\x40\xfb\x6b\x54', 'S-ETH', 18),  # S-ETH
-    (1, b'\x41\x56\xd3\x34\x2d\x5c\x38\x5a\x87\xd2\x64\xf9\x06\x53\x73\x35\x92\x00\x05\x81', 'SALT', 8),  # Salt Lending Token
-    (1, b'\x7c\x5a\x0c\xe9\x26\x7e\xd1\x9b\x22\xf8\xca\xe6\x53\xf1\x98\xe3\xe8\xda\xf0\x98', 'SAN', 18),  # Santiment
-    (1, b'\x78\xfe\x18\xe4\x1f\x43\x6e\x19\x81\xa3\xa6\x0d\x15\x57\xc8\xa7\xa9\x37\x04\x61', 'SCANDI', 2),  # Scandiweb Coin
-    (1, b'\xd7\x63\x17\x87\xb4\xdc\xc8\x7b\x12\x54\xcf\xd1\xe5\xce\x48\xe9\x68\x23\xde\xe8', 'SCL', 8),  # SocialCoin
-    (1, b'\x4c\xa7\x41\x85\x53\x2d\xc1\x78\x95\x27\x19\x4e\x5b\x9c\x86\x6d\xd3\x3f\x4e\x82', 'SenSatorI', 18),  # SenSatorI Token
-    (1, b'\x67\x45\xfa\xb6\x80\x1e\x37\x6c\xd2\x4f\x03\x57\x2b\x9c\x9b\x0d\x4e\xdd\xdc\xcf', 'SENSE', 8),  # Sensay
-    (1, b'\xe0\x6e\xda\x74\x35\xba\x74\x9b\x04\x73\x80\xce\xd4\x91\x21\xdd\xe9\x33\x34\xae', 'SET', 0),  # SET
-    (1, b'\x98\xf5\xe9\xb7\xf0\xe3\x39\x56\xc0\x44\x3e\x81\xbf\x7d\xeb\x8b\x5b\x1e\xd5\x45', 'SEXY', 18),  # Sexy Token
-    (1, b'\xa1\xcc\xc1\x66\xfa\xf0\xe9\x98\xb3\xe3\x32\x25\xa1\xa0\x30\x1b\x1c\x86\x11\x9d', 'SGEL', 18),  # SGELDER
-    (1, b'\xd2\x48\xb0\xd4\x8e\x44\xaa\xf9\xc4\x9a\xea\x03\x12\xbe\x7e\x13\xa6\xdc\x14\x68', 'SGT', 1),  # SGT
-    (1, b'\xef\x2e\x99\x66\xeb\x61\xbb\x49\x4e\x53\x75\xd5\xdf\x8d\x67\xb7\xdb\x8a\x78\x0d', 'SHIT', 0),  # SHIT
-    (1, b'\x8a\x18\x7d\x52\x85\xd3\x16\xbc\xbc\x9a\xda\xfc\x08\xb5\x1d\x70\xa0\xd8\xe0\x00', 'SIFT', 0),  # SIFT
-    (1, b'\x2b\xdc\x0d\x42\x99\x60\x17\xfc\xe2\x14\xb2\x16\x07\xa5\x15\xda\x41\xa9\xe0\xc5', 'SKIN', 6),  # SKIN
-    (1, b'\x49\x94\xe8\x18\x97\xa9\x20\xc0\xfe\xa2\x35\xeb\x8c\xed\xee\xd3\xc6\xff\xf6\x97', 'SKO1', 18),  # Sikoba
-    (1, b'\x4c\x38\x2f\x8e\x09\x61\x5a\xc8\x6e\x08\xce\x58\x26\x6c\xc2\x27\xe7\xd4\xd9\x13', 'SKR', 6),  # SKR Token
-    (1, b'\x32\x4a\x48\xeb\xcb\xb4\x6e\x61\x99\x39\x31\xef\x9d\x35\xf6\x69\x7c\xd2\x90\x1b', 'SKRP', 18),  # Skraps
-    (1, b'\x6e\x34\xd8\xd8\x47\x64\xd4\x0f\x6d\x7b\x39\xcd\x56\x9f\xd0\x17\xbf\x53\x17\x7d', 'SKRP', 18),  # Skraps
-    (1, b'\x7a\x5f\xf2\x95\xdc\x82\x39\xd5\xc2\x37\x4e\x4d\x89\x42\x02\xaa\xf0\x29\xca\xb6', 'SLT', 3),  # Smartlands
-    (1, b'\x6f\x6d\xeb\x5d\xb0\xc4\x99\x4a\x82\x83\xa0\x1d\x6c\xfe\xeb\x27\xfc\x3b\xbe\x9c', 'SMART', 0),  # Smart Billions
-    (1, b'\x2d\xcf\xaa\xc1\x1c\x9e\xeb\xd8\xc6\xc4\x21\x03\xfe\x9e\x2a\x6a\xd2\x37\xaf\x27', 'SMT', 18),  # Smart Node
-    (1, b'\xf4\x13\x41\x46\xaf\x2d\x51\x1d\xd5\xea\x8c\xdb\x1c\x4a\xc8\x8c\x57\xd6\x04\x04', 'SNC', 18),  # SNC
-    (1, b'\xf3\x33\xb2\xac\xe9\x92\xac\x2b\xbd\x87\x98\xbf\x57\xbc\x65\xa0\x61\x84\xaf\xba', 'SND', 0),  # Sandcoin
-    (1, b'\xcf\xd6\xae\x8b\xf1\x3f\x42\xde\x14\x86\x73\x51\xea\xff\x7a\x8a\x3b\x9f\xbb\xe7', 'SNG', 8),  # SINERGIA
-    (1, b'\xae\xc2\xe8\x7e\x0a\x23\x52\x66\xd9\xc5\xad\xc9\xde\xb4\xb2\xe2\x9b\x54\xd0\x09', 'SNGLS', 0),  # SingularDTV
-    (1, b'\x44\xf5\x88\xae\xeb\x8c\x44\x47\x14\x39\xd1\x27\x0b\x36\x03\xc6\x6a\x92\x62\xf1', 'SNIP', 18),  # SNIP
-    (1, b'\x98\x3f\x6d\x60\xdb\x79\xea\x8c\xa4\xeb\x99\x68\xc6\xaf\xf8\xcf\xa0\x4b\x3c\x63', 'SNM', 18),  # SNM
-    (1, b'\xbd\xc5\xba\xc3\x9d\xbe\x13\x2b\x1e\x03\x0e\x89\x8a\xe3\x83\x00\x17\xd7\xd9\x69', 'SNOV', 18),  # SNOV
-    (1, b'\x74\x4d\x70\xfd\xbe\x2b\xa4\xcf\x95\x13\x16\x26\x61\x4a\x17\x63\xdf\x80\x5b\x9e', 'SNT', 18),  # Status Network Token
-    (1, b'\x1f\x54\x63\x8b\x77\x37\x19\x3f\xfd\x86\xc1\x9e\xc5\x19\x07\xa7\xc4\x17\x55\xd8', 'SOL', 6),  # Sola Token
-    (1, b'\x42\xd6\x62\x2d\xec\xe3\x94\xb5\x49\x99\xfb\xd7\x3d\x10\x81\x23\x80\x6f\x6a\x18', 'SPANK', 18),  # SpankChain
-    (1, b'\x58\xbf\x7d\xf5\x7d\x9d\xa7\x11\x3c\x4c\xcb\x49\xd8\x46\x3d\x49\x08\xc7\x35\xcb', 'SPARC', 18),  # SPARC
-    (1, b'\x24\xae\xf3\xbf\x1a\x47\x56\x15\x00\xf9\x43\x0d\x74\xed\x40\x97\xc4\x7f\x51\xf2', 'SPARTA', 4),  # SPARTA
-    (1, b'\x85\x08\x93\x89\xc1\x4b\xd9\xc7\x7f\xc2\xb8\xf0\xc3\xd1\xdc\x33\x63\xbf\x06\xef', 'SPF', 18),  # Sportify
-    (1, b'\x68\xd5\x7c\x9a\x1c\x35\xf6\x3e\x2c\x83\xee\x8e\x49\xa6\x4e\x9d\x70\x52\x8d\x25', 'SRN', 18),  # Sirin Labs
-    (1, b'\xb1\x5f\xe5\xa1\x23\xe6\x47\xba\x59\x4c\xea\x7a\x1e\x64\x86\x46\xf9\x5e\xb4\xaa', 'SS', 18),  # Sharder
-    (1, b'\x9a\x00\x5c\x9a\x89\xbd\x72\xa4\xbd\x27\x72\x1e\x7a\x09\xa3\xc1\x1d\x2b\x03\xc4', 'STAC', 18),  # Starter Coin
-    (1, b'\xf7\x0a\x64\x2b\xd3\x87\xf9\x43\x80\xff\xb9\x04\x51\xc2\xc8\x1d\x4e\xb8\x2c\xbc', 'STAR', 18),  # Star Token
-    (1, b'\x62\x9a\xee\x55\xed\x49\x58\x1c\x33\xab\x27\xf9\x40\x3f\x79\x92\xa2\x89\xff\xd5', 'STC', 18),  # StrikeCoin Token
-    (1, b'\xae\x73\xb3\x8d\x1c\x9a\x8b\x27\x41\x27\xec\x30\x16\x0a\x49\x27\xc4\xd7\x18\x24', 'STK', 18),  # STK Token
-    (1, b'\x59\x93\x46\x77\x9e\x90\xfc\x3f\x5f\x99\x7b\x5e\xa7\x15\x34\x98\x20\xf9\x15\x71', 'STN', 4),  # Saturn Network
-    (1, b'\xb6\x4e\xf5\x1c\x88\x89\x72\xc9\x08\xcf\xac\xf5\x9b\x47\xc1\xaf\xbc\x0a\xb8\xac', 'STORJ', 8),  # STORJ
-    (1, b'\xd0\xa4\xb8\x94\x6c\xb5\x2f\x06\x61\x27\x3b\xfb\xc6\xfd\x0e\x0c\x75\xfc\x64\x33', 'STORM', 18),  # Storm Token
-    (1, b'\xec\xd5\x70\xbb\xf7\x47\x61\xb9\x60\xfa\x04\xcc\x10\xfe\x2c\x4e\x86\xff\xda\x36', 'STP', 8),  # StashPay
-    (1, b'\x46\x49\x24\x73\x75\x5e\x8d\xf9\x60\xf8\x03\x48\x77\xf6\x17\x32\xd7\x18\xce\x96', 'STRC', 8),  # STRC
-    (1, b'\x00\x6b\xea\x43\xba\xa3\xf7\xa6\xf7\x65\xf1\x4f\x10\xa1\xa1\xb0\x83\x34\xef\x45', 'STX', 18),  # StoxToken
-    (1, b'\x12\x48\x0e\x24\xeb\x5b\xec\x1a\x9d\x43\x69\xca\xb6\xa8\x0c\xad\x3c\x0a\x37\x7a', 'SUB', 2),  # Substratum
-    (1, b'\x9e\x88\x61\x34\x18\xcf\x03\xdc\xa5\x4d\x6a\x2c\xf6\xad\x93\x4a\x78\xc7\xa1\x7a', 'SWM', 18),  # Swarm Fund Token
-    (1, b'\xb9\xe7\xf8\x56\x8e\x08\xd5\x65\x9f\x5d\x29\xc4\x99\x71\x73\xd8\x4c\xdf\x26\x07', 'SWT', 18),  # Swarm City Token
-    (1, b'\x12\xb3\x06\xfa\x98\xf4\xcb\xb8\xd4\x45\x7f\xdf\xf3\xa0\xa0\xa5\x6f\x07\xcc\xdf', 'SXDT', 18),  # Spectre.ai D-Token
-    (1, b'\x2c\x82\xc7\x3d\x5b\x34\xaa\x01\x59\x89\x46\x2b\x29\x48\xcd\x61\x6a\x37\x64\x1f', 'SXUT', 18),  # Spectre.ai U-Token
-    (1, b'\x10\xb1\x23\xfd\xdd\xe0\x03\x24\x31\x99\xaa\xd0\x35\x22\x06\x5d\xc0\x58\x27\xa0', 'SYN', 18),  # Synapse
-    (1, b'\xe7\x77\x5a\x6e\x9b\xcf\x90\x4e\xb3\x9d\xa2\xb6\x8c\x5e\xfb\x4f\x93\x60\xe0\x8c', 'TaaS', 6),  # Token-as-a-Service
-    (1, b'\xc2\x7a\x2f\x05\xfa\x57\x7a\x83\xba\x0f\xdb\x4c\x38\x44\x3c\x07\x18\x35\x65\x01', 'TAU', 18),  # Lamden Tau
-    (1, b'\xfa\xcc\xd5\xfc\x83\xc3\xe4\xc3\xc1\xac\x1e\xf3\x5d\x15\xad\xf0\x6b\xcf\x20\x9c', 'TBC2', 8),  # TBC2
-    (1, b'\xaf\xe6\x05\x11\x34\x1a\x37\x48\x8d\xe2\x5b\xef\x35\x19\x52\x56\x2e\x31\xfc\xc1', 'TBT', 8),  # TBitBot
-    (1, b'\x85\xe0\x76\x36\x1c\xc8\x13\xa9\x08\xff\x67\x2f\x9b\xad\x15\x41\x47\x44\x02\xb2', 'TEL', 2),  # Telcoin
-    (1, b'\xa7\xf9\x76\xc3\x60\xeb\xbe\xd4\x46\x5c\x28\x55\x68\x4d\x1a\xae\x52\x71\xef\xa9', 'TFL', 8),  # TrueFlip
-    (1, b'\x65\x31\xf1\x33\xe6\xde\xeb\xe7\xf2\xdc\xe5\xa0\x44\x1a\xa7\xef\x33\x0b\x4e\x53', 'TIME', 8),  # Chronobank
-    (1, b'\x80\xbc\x55\x12\x56\x1c\x7f\x85\xa3\xa9\x50\x8c\x7d\xf7\x90\x1b\x37\x0f\xa1\xdf', 'TIO', 18),  # TIO
-    (1, b'\xea\x1f\x34\x6f\xaf\x02\x3f\x97\x4e\xb5\xad\xaf\x08\x8b\xbc\xdf\x02\xd7\x61\xf4', 'TIX', 18),  # Blocktix
-    (1, b'\xaa\xaf\x91\xd9\xb9\x0d\xf8\x00\xdf\x4f\x55\xc2\x05\xfd\x69\x89\xc9\x77\xe7\x3a', 'TKN', 8),  # TokenCard
-    (1, b'\x08\xf5\xa9\x23\x5b\x08\x17\x3b\x75\x69\xf8\x36\x45\xd2\xc7\xfb\x55\xe8\xcc\xd8', 'TNT', 8),  # Tierion Network Token
-    (1, b'\xcb\x3f\x90\x2b\xf9\x76\x26\x39\x1b\xf8\xba\x87\x26\x4b\xbc\x3d\xc1\x34\x69\xbe', 'TRC', 18),  # The Real Coin
-    (1, b'\x56\x6f\xd7\x99\x9b\x1f\xc3\x98\x80\x22\xbd\x38\x50\x7a\x48\xf0\xbc\xf2\x2c\x77', 'TRCN', 18),  # The Real Coin
-    (1, b'\xcb\x94\xbe\x6f\x13\xa1\x18\x2e\x4a\x4b\x61\x40\xcb\x7b\xf2\x02\x5d\x28\xe4\x1b', 'TRST', 6),  # TRST
-    (1, b'\xf2\x30\xb7\x90\xe0\x53\x90\xfc\x82\x95\xf4\xd3\xf6\x03\x32\xc9\x3b\xed\x42\xe2', 'TRX', 6),  # Tron Lab Token
-    (1, b'\x2e\xf1\xab\x8a\x26\x18\x7c\x58\xbb\x8a\xae\xb1\x1b\x2f\xc6\xd2\x5c\x5c\x07\x16', 'TWN', 18),  # The World News
-    (1, b'\xfb\xd0\xd1\xc7\x7b\x50\x17\x96\xa3\x5d\x86\xcf\x91\xd6\x5d\x97\x78\xee\xe6\x95', 'TWNKL', 3),  # Twinkle
-    (1, b'\x24\x69\x27\x91\xbc\x44\x4c\x5c\xd0\xb8\x1e\x3c\xbc\xab\xa4\xb0\x4a\xcd\x1f\x3b', 'UKG', 18),  # UnikoinGold
-    (1, b'\x89\x20\x5a\x3a\x3b\x2a\x69\xde\x6d\xbf\x7f\x01\xed\x13\xb2\x10\x8b\x2c\x43\xe7', 'Unicorn', 0),  # Unicorn
-    (1, b'\xd0\x1d\xb7\x3e\x04\x78\x55\xef\xb4\x14\xe6\x20\x20\x98\xc4\xbe\x4c\xd2\x42\x3b', 'UQC', 18),  # Uquid Coin
-    (1, b'\xda\xc1\x7f\x95\x8d\x2e\xe5\x23\xa2\x20\x62\x06\x99\x45\x97\xc1\x3d\x83\x1e\xc7', 'USDT', 6),  # USD Tether (erc20)
-    (1, b'\x70\xa7\x28\x33\xd6\xbf\x7f\x50\x8c\x82\x24\xce\x59\xea\x1e\xf3\xd0\xea\x3a\x38', 'UTK', 18),  # UTK
-    (1, b'\x9e\x33\x19\x63\x6e\x21\x26\xe3\xc0\xbc\x9e\x31\x34\xae\xc5\xe1\x50\x8a\x46\xc7', 'UTN-P', 18),  # Universa
-    (1, b'\x34\x0d\x2b\xde\x5e\xb2\x8c\x1e\xed\x91\xb2\xf7\x90\x72\x3e\x3b\x16\x06\x13\xb7', 'VEE', 18),  # BLOCKv
-    (1, b'\xeb\xed\x4f\xf9\xfe\x34\x41\x3d\xb8\xfc\x82\x94\x55\x6b\xbd\x15\x28\xa4\xda\xca', 'VENUS', 3),  # VENUS
-    (1, b'\x8f\x34\x70\xa7\x38\x8c\x05\xee\x4e\x7a\xf3\xd0\x1d\x8c\x72\x2b\x0f\xf5\x23\x74', 'VERI', 18),  # Veritas
-    (1, b'\xd8\x50\x94\x2e\xf8\x81\x1f\x2a\x86\x66\x92\xa6\x23\x01\x1b\xde\x52\xa4\x62\xc1', 'VET', 18),  # Vechain
-    (1, b'\x2c\x97\x4b\x2d\x0b\xa1\x71\x6e\x64\x4c\x1f\xc5\x99\x82\xa8\x9d\xdd\x2f\xf7\x24', 'VIB', 18),  # VIB
-    (1, b'\xe8\xff\x5c\x9c\x75\xde\xb3\x46\xac\xac\x49\x3c\x46\x3c\x89\x50\xbe\x03\xdf\xba', 'VIBEX', 18),  # VIBEX
-    (1, b'\x88\x24\x48\xf8\x3d\x90\xb2\xbf\x47\x7a\xf2\xea\x79\x32\x7f\xde\xa1\x33\x5d\x93', 'VIBEX', 18),  # VIBEX Exchange Token
-    (1, b'\x51\x94\x75\xb3\x16\x53\xe4\x6d\x20\xcd\x09\xf9\xfd\xcf\x3b\x12\xbd\xac\xb4\xf5', 'VIU', 18),  # VIU
-    (1, b'\x83\xee\xa0\x0d\x83\x8f\x92\xde\xc4\xd1\x47\x56\x97\xb9\xf4\xd3\x53\x7b\x56\xe3', 'VOISE', 8),  # Voise
-    (1, b'\xed\xba\xf3\xc5\x10\x03\x02\xdc\xdd\xa5\x32\x69\x32\x2f\x37\x30\xb1\xf0\x41\x6d', 'VRS', 5),  # Veros
-    (1, b'\x5c\x54\x3e\x7a\xe0\xa1\x10\x4f\x78\x40\x6c\x34\x0e\x9c\x64\xfd\x9f\xce\x51\x70', 'VSL', 18),  # Vdice
-    (1, b'\x28\x6b\xda\x14\x13\xa2\xdf\x81\x73\x1d\x49\x30\xce\x2f\x86\x2a\x35\xa6\x09\xfe', 'WaBi', 18),  # WaBi
-    (1, b'\x39\xbb\x25\x9f\x66\xe1\xc5\x9d\x5a\xbe\xf8\x83\x75\x97\x9b\x4d\x20\xd9\x80\x22', 'WAX', 8),  # WAX
-    (1, b'\x74\x95\x1b\x67\x7d\xe3\x2d\x59\x6e\xe8\x51\xa2\x33\x33\x69\x26\xe6\xa2\xcd\x09', 'WBA', 7),  # WeBetCrypto
-    (1, b'\x6a\x0a\x97\xe4\x7d\x15\xaa\xd1\xd1\x32\xa1\xac\x79\xa4\x80\xe3\xf2\x07\x90\x63', 'WCT', 18),  # WePower
-    (1, b'\xc0\x2a\xaa\x39\xb2\x23\xfe\x8d\x0a\x0e\x5c\x4f\x27\xea\xd9\x08\x3c\x75\x6c\xc2', 'WETH', 18),  # WETH
-    (1, b'\xe2\x00\x64\x18\x90\x77\x2f\xce\x8e\xe6\xed\xc5\x35\x4c\xce\xa3\x0a\xc9\x2f\x49', 'WHO', 18),  # WhoHas
-    (1, b'\xe9\x33\xc0\xcd\x97\x84\x41\x4d\x5f\x27\x8c\x11\x49\x04\xf5\xa8\x4b\x39\x69\x19', 'WHO', 18),  # WhoHas
-    (1, b'\x5e\x4a\xbe\x64\x19\x65\x0c\xa8\x39\xce\x5b\xb7\xdb\x42\x2b\x88\x1a\x60\x64\xbb', 'WiC', 18),  # Wi Coin
-    (1, b'\x62\xcd\x07\xd4\x14\xec\x50\xb6\x8c\x7e\xca\xa8\x63\xa2\x3d\x34\x4f\x2d\x06\x2f', 'WIC', 0),  # WickNote
-    (1, b'\xd3\xc0\x07\x72\xb2\x4d\x99\x7a\x81\x22\x49\xca\x63\x7a\x92\x1e\x81\x35\x77\x01', 'WILD', 18),  # WILD Token
-    (1, b'\x66\x70\x88\xb2\x12\xce\x3d\x06\xa1\xb5\x53\xa7\x22\x1e\x1f\xd1\x90\x00\xd9\xaf', 'WINGS', 18),  # WINGS
-    (1, b'\xf6\xb5\x5a\xcb\xbc\x49\xf4\x52\x4a\xa4\x8d\x19\x28\x1a\x9a\x77\xc5\x4d\xe1\x0f', 'WOLK', 18),  # Wolk Token
-    (1, b'\x62\x08\x72\x45\x08\x71\x25\xd3\xdb\x5b\x9a\x3d\x71\x3d\x78\xe7\xbb\xc3\x1e\x54', 'WPC', 18),  # WorldPeaceCoin
-    (1, b'\x4c\xf4\x88\x38\x7f\x03\x5f\xf0\x8c\x37\x15\x15\x56\x2c\xba\x71\x2f\x90\x15\xd4', 'WPR', 18),  # WePower Token
-    (1, b'\x71\xe8\xd7\x4f\xf1\xc9\x23\xe3\x69\xd0\xe7\x0d\xfb\x09\x86\x66\x29\xc4\xdd\x35', 'WRK', 18),  # WorkCoin
-    (1, b'\x05\x60\x17\xc5\x5a\xe7\xae\x32\xd1\x2a\xef\x7c\x67\x9d\xf8\x3a\x85\xca\x75\xff', 'WYV', 18),  # WyvernToken
-    (1, b'\x91\x0d\xfc\x18\xd6\xea\x3d\x6a\x71\x24\xa6\xf8\xb5\x45\x8f\x28\x10\x60\xfa\x4c', 'X8X', 18),  # X8X
-    (1, b'\x4d\xf8\x12\xf6\x06\x4d\xef\x1e\x5e\x02\x9f\x1c\xa8\x58\x77\x7c\xc9\x8d\x2d\x81', 'XAUR', 8),  # Xaurum
-    (1, b'\x4d\x82\x9f\x8c\x92\xa6\x69\x1c\x56\x30\x0d\x02\x0c\x9e\x0d\xb9\x84\xcf\xe2\xba', 'XCC', 18),  # CoinCrowd
-    (1, b'\x53\x3e\xf0\x98\x4b\x2f\xaa\x22\x7a\xcc\x62\x0c\x67\xcc\xe1\x2a\xa3\x9c\xd8\xcd', 'XGM', 8),  # XGM
-    (1, b'\x30\xf4\xa3\xe0\xab\x7a\x76\x73\x3d\x8b\x60\xb8\x9d\xd9\x3c\x3d\x0b\x4c\x9e\x2f', 'XGT', 18),  # XGT
-    (1, b'\xb1\x10\xec\x7b\x1d\xcb\x8f\xab\x8d\xed\xbf\x28\xf5\x3b\xc6\x3e\xa5\xbe\xdd\x84', 'XID', 8),  # XID
-    (1, b'\xab\x95\xe9\x15\xc1\x23\xfd\xed\x5b\xdf\xb6\x32\x5e\x35\xef\x55\x15\xf1\xea\x69', 'XNN', 18),  # XENON
-    (1, b'\x57\x2e\x6f\x31\x80\x56\xba\x0c\x5d\x47\xa4\x22\x65\x31\x13\x84\x3d\x25\x06\x91', 'XNT', 0),  # XNT
-    (1, b'\xb2\x47\x54\xbe\x79\x28\x15\x53\xdc\x1a\xdc\x16\x0d\xdf\x5c\xd9\xb7\x43\x61\xa4', 'XRL', 9),  # XRL
-    (1, b'\x0f\x51\x3f\xfb\x49\x26\xff\x82\xd7\xf6\x0a\x05\x06\x90\x47\xac\xa2\x95\xc4\x13', 'XSC', 18),  # XSC
-    (1, b'\x0f\x33\xbb\x20\xa2\x82\xa7\x64\x9c\x7b\x3a\xff\x64\x4f\x08\x4a\x93\x48\xe9\x33', 'YUPIE', 18),  # YUPIE
-    (1, b'\x67\x81\xa0\xf8\x4c\x7e\x9e\x84\x6d\xcb\x84\xa9\xa5\xbd\x49\x33\x30\x67\xb1\x04', 'ZAP', 18),  # ZAP
-    (1, b'\x05\xf4\xa4\x2e\x25\x1f\x2d\x52\xb8\xed\x15\xe9\xfe\xda\xac\xfc\xef\x1f\xad\x27', 'ZIL', 12),  # Zilliqa
-    (1, b'\xe4\x1d\x24\x89\x57\x1d\x32\x21\x89\x24\x6d\xaf\xa5\xeb\xde\x1f\x46\x99\xf4\x98', 'ZRX', 18),  # 0x Project
-    (1, b'\xe3\x86\xb1\x39\xed\x37\x15\xca\x4b\x18\xfd\x52\x67\x1b\xdc\xea\x1c\xdf\xe4\xb1', 'ZST', 8),  # Zeus Exchange
+    b'\x00\x00\x00\x01\x00\x6b\xea\x43\xba\xa3\xf7\xa6\xf7\x65\xf1\x4f\x10\xa1\xa1\xb0\x83\x34\xef\x45\x12\x00\x00\x03'  # STX, StoxToken
+    b'\x00\x00\x00\x01\x00\x9e\x86\x49\x23\xb4\x92\x63\xc7\xf1\x0d\x19\xb7\xf8\xab\x7a\x9a\x5a\xad\x33\x12\x00\x03\x03'  # FKX, Knoxstertoken
+    b'\x00\x00\x00\x01\x01\x4b\x50\x46\x65\x90\x34\x0d\x41\x30\x7c\xc5\x4d\xce\xe9\x90\xc8\xd5\x8a\xa8\x06\x00\x06\x04'  # ICOS, ICOS
+    b'\x00\x00\x00\x01\x01\xb3\xec\x4a\xae\x1b\x87\x29\x52\x9b\xeb\x49\x65\xf2\x7d\x00\x87\x88\xb0\xeb\x12\x00\x0a\x03'  # DPP, Digital Assets Power Play
+    b'\x00\x00\x00\x01\x02\x35\xfe\x62\x4e\x04\x4a\x05\xee\xd7\xa4\x3e\x16\xe3\x08\x3b\xc8\xa4\x28\x7a\x12\x00\x0d\x03'  # OCC, Original Crypto Coin
+    b'\x00\x00\x00\x01\x02\x5a\xba\xd9\xe5\x18\x51\x6f\xda\xaf\xbd\xcd\xb9\x70\x1b\x37\xfb\x7e\xf0\xfa\x00\x00\x10\x04'  # GTKT, GTKT
+    b'\x00\x00\x00\x01\x05\x60\x17\xc5\x5a\xe7\xae\x32\xd1\x2a\xef\x7c\x67\x9d\xf8\x3a\x85\xca\x75\xff\x12\x00\x14\x03'  # WYV, WyvernToken
+    b'\x00\x00\x00\x01\x05\xf4\xa4\x2e\x25\x1f\x2d\x52\xb8\xed\x15\xe9\xfe\xda\xac\xfc\xef\x1f\xad\x27\x0c\x00\x17\x03'  # ZIL, Zilliqa
+    b'\x00\x00\x00\x01\x06\x01\x2c\x8c\xf9\x7b\xea\xd5\xde\xae\x23\x70\x70\xf9\x58\x7f\x8e\x7a\x26\x6d\x00\x00\x1a\x02'  # CK, CK
+    b'\x00\x00\x00\x01\x07\xd9\xe4\x9e\xa4\x02\x19\x4b\xf4\x8a\x82\x76\xda\xfb\x16\xe4\xed\x63\x33\x17\x08\x00\x1c\x04'  # DALC, DaleCoin
+    b'\x00\x00\x00\x01\x07\xe3\xc7\x06\x53\x54\x8b\x04\xf0\xa7\x59\x70\xc1\xf8\x1b\x4c\xbb\xfb\x60\x6f\x12\x00\x20\x03'  # DLT, Agrello
+    b'\x00\x00\x00\x01\x08\x0a\xa0\x7e\x2c\x71\x85\x15\x0d\x7e\x4d\xa9\x88\x38\xa8\xd2\xfe\xac\x3d\xfc\x00\x00\x23\x03'  # BTT, Bitether
+    b'\x00\x00\x00\x01\x08\x71\x1d\x3b\x02\xc8\x75\x8f\x2f\xb3\xab\x4e\x80\x22\x84\x18\xa7\xf8\xe3\x9c\x00\x00\x26\x03'  # EDG, Edgeless
+    b'\x00\x00\x00\x01\x08\x86\x94\x9c\x1b\x8c\x41\x28\x60\xc4\x26\x4c\xeb\x80\x83\xd1\x36\x5e\x86\xcf\x08\x00\x29\x04'  # BTCE, EthereumBitcoin
+    b'\x00\x00\x00\x01\x08\xd3\x2b\x0d\xa6\x3e\x2c\x3b\xcf\x80\x19\xc9\xc5\xd8\x49\xd7\xa9\xd7\x91\xe6\x00\x00\x2d\x03'  # DCN, Dentacoin
+    b'\x00\x00\x00\x01\x08\xf5\xa9\x23\x5b\x08\x17\x3b\x75\x69\xf8\x36\x45\xd2\xc7\xfb\x55\xe8\xcc\xd8\x08\x00\x30\x03'  # TNT, Tierion Network Token
+    b'\x00\x00\x00\x01\x09\x96\xbf\xb5\xd0\x57\xfa\xa2\x37\x64\x0e\x25\x06\xbe\x7b\x4f\x9c\x46\xde\x0b\x12\x00\x33\x04'  # RNDR, Render Token
+    b'\x00\x00\x00\x01\x0a\xaf\x56\x1e\xff\x5b\xd9\xc8\xf9\x11\x61\x69\x33\xf8\x41\x66\xa1\x7c\xfe\x0c\x00\x00\x37\x03'  # JBX, JBX
+    b'\x00\x00\x00\x01\x0a\xbd\xac\xe7\x0d\x37\x90\x23\x5a\xf4\x48\xc8\x85\x47\x60\x3b\x94\x56\x04\xea\x12\x00\x3a\x03'  # DNT, DistrictOx
+    b'\x00\x00\x00\x01\x0a\xbe\xfb\x76\x11\xcb\x3a\x01\xea\x3f\xad\x85\xf3\x3c\x3c\x93\x4f\x8e\x2c\xf4\x12\x00\x3d\x03'  # FRD, FARAD Cryptoken
+    b'\x00\x00\x00\x01\x0a\xef\x06\xdc\xcc\xc5\x31\xe5\x81\xf0\x44\x00\x59\xe6\xff\xcc\x20\x60\x39\xee\x08\x00\x40\x03'  # ITT, ITT Token
+    b'\x00\x00\x00\x01\x0a\xf4\x4e\x27\x84\x63\x72\x18\xdd\x1d\x32\xa3\x22\xd4\x4e\x60\x3a\x8f\x0c\x6a\x12\x00\x43\x03'  # MTX, MTX
+    b'\x00\x00\x00\x01\x0a\xff\xa0\x6e\x7f\xbe\x5b\xc9\xa7\x64\xc9\x79\xaa\x66\xe8\x25\x6a\x63\x1f\x02\x06\x00\x46\x04'  # PLBT, Polybius
+    b'\x00\x00\x00\x01\x0c\x04\xd4\xf3\x31\xda\x8d\xf7\x5f\x9e\x2e\x27\x1e\x3f\x3f\x14\x94\xc6\x6c\x36\x09\x00\x4a\x04'  # PRSP, PRSP
+    b'\x00\x00\x00\x01\x0c\xf0\xee\x63\x78\x8a\x08\x49\xfe\x52\x97\xf3\x40\x7f\x70\x1e\x12\x2c\xc0\x23\x12\x00\x4e\x08'  # DATACoin, DATACoin
+    b'\x00\x00\x00\x01\x0d\x26\x2e\x5d\xc4\xa0\x6a\x0f\x1c\x90\xce\x79\xc7\xa6\x0c\x09\xdf\xc8\x84\xe4\x08\x00\x56\x03'  # J8T, J8T Token
+    b'\x00\x00\x00\x01\x0d\x87\x75\xf6\x48\x43\x06\x79\xa7\x09\xe9\x8d\x2b\x0c\xb6\x25\x0d\x28\x87\xef\x12\x00\x59\x03'  # BAT, BAT
+    b'\x00\x00\x00\x01\x0d\x88\xed\x6e\x74\xbb\xfd\x96\xb8\x31\x23\x16\x38\xb6\x6c\x05\x57\x1e\x82\x4f\x12\x00\x5c\x03'  # AVT, AVT
+    b'\x00\x00\x00\x01\x0e\x09\x89\xb1\xf9\xb8\xa3\x89\x83\xc2\xba\x80\x53\x26\x9c\xa6\x2e\xc9\xb1\x95\x08\x00\x5f\x03'  # POE, Po.et Tokens
+    b'\x00\x00\x00\x01\x0f\x33\xbb\x20\xa2\x82\xa7\x64\x9c\x7b\x3a\xff\x64\x4f\x08\x4a\x93\x48\xe9\x33\x12\x00\x62\x05'  # YUPIE, YUPIE
+    b'\x00\x00\x00\x01\x0f\x51\x3f\xfb\x49\x26\xff\x82\xd7\xf6\x0a\x05\x06\x90\x47\xac\xa2\x95\xc4\x13\x12\x00\x67\x03'  # XSC, XSC
+    b'\x00\x00\x00\x01\x0f\x5d\x2f\xb2\x9f\xb7\xd3\xcf\xee\x44\x4a\x20\x02\x98\xf4\x68\x90\x8c\xc9\x42\x12\x00\x6a\x04'  # MANA, Decentraland MANA
+    b'\x00\x00\x00\x01\x10\x3c\x3a\x20\x9d\xa5\x9d\x3e\x7c\x4a\x89\x30\x7e\x66\x52\x1e\x08\x1c\xfd\xf0\x12\x00\x6e\x03'  # GVT, Genesis Vision
+    b'\x00\x00\x00\x01\x10\x63\xce\x52\x42\x65\xd5\xa3\xa6\x24\xf4\x91\x4a\xcd\x57\x3d\xd8\x9c\xe9\x88\x12\x00\x71\x03'  # AIX, Aigang
+    b'\x00\x00\x00\x01\x10\x7c\x45\x04\xcd\x79\xc5\xd2\x69\x6e\xa0\x03\x0a\x8d\xd4\xe9\x26\x01\xb8\x2e\x12\x00\x74\x03'  # BLT, Bloom
+    b'\x00\x00\x00\x01\x10\xb1\x23\xfd\xdd\xe0\x03\x24\x31\x99\xaa\xd0\x35\x22\x06\x5d\xc0\x58\x27\xa0\x12\x00\x77\x03'  # SYN, Synapse
+    b'\x00\x00\x00\x01\x12\x34\x56\x74\x61\xd3\xf8\xdb\x74\x96\x58\x17\x74\xbd\x86\x9c\x83\xd5\x1c\x93\x12\x00\x7a\x0e'  # CAT (BitClave), CAT (BitClave)
+    b'\x00\x00\x00\x01\x12\x45\xef\x80\xf4\xd9\xe0\x2e\xd9\x42\x53\x75\xe8\xf6\x49\xb9\x22\x1b\x31\xd8\x08\x00\x88\x04'  # ARCT, ArbitrageCT
+    b'\x00\x00\x00\x01\x12\x48\x0e\x24\xeb\x5b\xec\x1a\x9d\x43\x69\xca\xb6\xa8\x0c\xad\x3c\x0a\x37\x7a\x02\x00\x8c\x03'  # SUB, Substratum
+    b'\x00\x00\x00\x01\x12\xb1\x9d\x3e\x2c\xcc\x14\xda\x04\xfa\xe3\x3e\x63\x65\x2c\xe4\x69\xb3\xf2\xfd\x0c\x00\x8f\x04'  # GRID, GRID
+    b'\x00\x00\x00\x01\x12\xb3\x06\xfa\x98\xf4\xcb\xb8\xd4\x45\x7f\xdf\xf3\xa0\xa0\xa5\x6f\x07\xcc\xdf\x12\x00\x93\x04'  # SXDT, Spectre.ai D-Token
+    b'\x00\x00\x00\x01\x12\xfe\xf5\xe5\x7b\xf4\x58\x73\xcd\x9b\x62\xe9\xdb\xd7\xbf\xb9\x9e\x32\xd7\x3e\x12\x00\x97\x03'  # CFI, CFI
+    b'\x00\x00\x00\x01\x13\x8a\x87\x52\x09\x3f\x4f\x9a\x79\xaa\xed\xf4\x8d\x4b\x92\x48\xfa\xb9\x3c\x9c\x12\x00\x9a\x03'  # MCI, Musiconomi
+    b'\x00\x00\x00\x01\x13\xf1\x1c\x99\x05\xa0\x8c\xa7\x6e\x3e\x85\x3b\xe6\x3d\x4f\x09\x44\x32\x6c\x72\x12\x00\x9d\x04'  # DIVX, DIVX
+    b'\x00\x00\x00\x01\x13\xf1\xb7\xfd\xfb\xe1\xfc\x66\x67\x6d\x56\x48\x3e\x21\xb1\xec\xb4\x0b\x58\xe2\x12\x00\xa1\x03'  # ACC, Accelerator Network
+    b'\x00\x00\x00\x01\x14\xf3\x7b\x57\x42\x42\xd3\x66\x55\x8d\xb6\x1f\x33\x35\x28\x9a\x50\x35\xc5\x06\x03\x00\xa4\x03'  # HKG, HKG
+    b'\x00\x00\x00\x01\x15\x12\x02\xc9\xc1\x8e\x49\x56\x56\xf3\x72\x28\x1f\x49\x3e\xb7\x69\x89\x61\xd5\x12\x00\xa7\x03'  # DEB, DEBITUM
+    b'\x00\x00\x00\x01\x16\x37\x33\xbc\xc2\x8d\xbf\x26\xb4\x1a\x8c\xfa\x83\xe3\x69\xb5\xb3\xaf\x74\x1b\x12\x00\xaa\x03'  # PRS, Persians
+    b'\x00\x00\x00\x01\x16\x66\x2f\x73\xdf\x3e\x79\xe5\x4c\x6c\x59\x38\xb4\x31\x3f\x92\xc5\x24\xc1\x20\x12\x00\xad\x03'  # IIC, IIC
+    b'\x00\x00\x00\x01\x16\xb0\xe6\x2a\xc1\x3a\x2f\xae\xd3\x6d\x18\xbc\xe2\x35\x6d\x25\xab\x3c\xfa\xd3\x12\x00\xb0\x03'  # BTQ, Bitcoin Boutique
+    b'\x00\x00\x00\x01\x17\x05\x2d\x51\xe9\x54\x59\x2c\x10\x46\x32\x0c\x23\x71\xab\xab\x6c\x73\xef\x10\x12\x00\xb3\x03'  # ATH, Athenian Warrior Token
+    b'\x00\x00\x00\x01\x17\x76\xe1\xf2\x6f\x98\xb1\xa5\xdf\x9c\xd3\x47\x95\x3a\x26\xdd\x3c\xb4\x66\x71\x12\x00\xb6\x03'  # NMR, NMR
+    b'\x00\x00\x00\x01\x17\x7d\x39\xac\x67\x6e\xd1\xc6\x7a\x2b\x26\x8a\xd7\xf1\xe5\x88\x26\xe5\xb0\xaf\x12\x00\xb9\x03'  # CDT, CoinDash
+    b'\x00\x00\x00\x01\x17\xf9\x34\x75\xd2\xa9\x78\xf5\x27\xc3\xf7\xc4\x4a\xbf\x44\xad\xfb\xa6\x0d\x5c\x02\x00\xbc\x04'  # ECO2, EtherCO2
+    b'\x00\x00\x00\x01\x18\x1a\x63\x74\x6d\x3a\xdc\xf3\x56\xcb\xc7\x3a\xce\x22\x83\x2f\xfb\xb1\xee\x5a\x08\x00\xc0\x04'  # ALCO, ALCO
+    b'\x00\x00\x00\x01\x18\x44\xb2\x15\x93\x26\x26\x68\xb7\x24\x8d\x0f\x57\xa2\x20\xca\xab\xa4\x6a\xb9\x12\x00\xc4\x03'  # PRL, Oyster Pearl
+    b'\x00\x00\x00\x01\x19\x0e\x56\x9b\xe0\x71\xf4\x0c\x70\x4e\x15\x82\x5f\x28\x54\x81\xcb\x74\xb6\xcc\x0c\x00\xc7\x03'  # FAM, FAM
+    b'\x00\x00\x00\x01\x19\x61\xb3\x33\x19\x69\xed\x52\x77\x07\x51\xfc\x71\x8e\xf5\x30\x83\x8b\x6d\xee\x12\x00\xca\x03'  # BDG, BitDegree Token
+    b'\x00\x00\x00\x01\x1a\x7a\x8b\xd9\x10\x6f\x2b\x8d\x97\x7e\x08\x58\x2d\xc7\xd2\x4c\x72\x3a\xb0\xdb\x12\x00\xcd\x04'  # APPC, AppCoins
+    b'\x00\x00\x00\x01\x1a\x95\xb2\x71\xb0\x53\x5d\x15\xfa\x49\x93\x2d\xab\xa3\x1b\xa6\x12\xb5\x29\x46\x08\x00\xd1\x03'  # MNE, MNE
+    b'\x00\x00\x00\x01\x1b\x5f\x21\xee\x98\xee\xd4\x8d\x29\x2e\x8e\x2d\x3e\xd8\x2b\x40\xa9\x72\x8a\x22\x12\x00\xd4\x0a'  # DATABroker, DataBrokerDAO Token
+    b'\x00\x00\x00\x01\x1b\x97\x43\xf5\x56\xd6\x5e\x75\x7c\x4c\x65\x0b\x45\x55\xba\xf3\x54\xcb\x8b\xd3\x0c\x00\xde\x04'  # ETBS, Ethbits
+    b'\x00\x00\x00\x01\x1c\x44\x81\x75\x0d\xaa\x5f\xf5\x21\xa2\xa7\x49\x0d\x99\x81\xed\x46\x46\x5d\xbd\x12\x00\xe2\x04'  # BCPT, BCPT
+    b'\x00\x00\x00\x01\x1d\x46\x24\x14\xfe\x14\xcf\x48\x9c\x7a\x21\xca\xc7\x85\x09\xf4\xbf\x8c\xd7\xc0\x06\x00\xe6\x03'  # CAN, CAN
+    b'\x00\x00\x00\x01\x1e\x09\xbd\x8c\xad\xb4\x41\x63\x2e\x44\x1d\xb3\xe1\xd7\x99\x09\xee\x0a\x22\x56\x01\x00\xe9\x03'  # DSC, Digital Safe Coin
+    b'\x00\x00\x00\x01\x1e\x49\xff\x77\xc3\x55\xa3\xe3\x8d\x66\x51\xce\x84\x04\xaf\x0e\x48\xc5\x39\x5f\x12\x00\xec\x04'  # MTRc, MTRCToken
+    b'\x00\x00\x00\x01\x1e\x79\x7c\xe9\x86\xc3\xcf\xf4\x47\x2f\x7d\x38\xd5\xc4\xab\xa5\x5d\xfe\xfe\x40\x0f\x00\xf0\x04'  # BCDN, BCDN
+    b'\x00\x00\x00\x01\x1e\xc8\xfe\x51\xa9\xb6\xa3\xa6\xc4\x27\xd1\x7d\x9e\xcc\x30\x60\xfb\xc4\xa4\x5c\x12\x00\xf4\x07'  # S-A-PAT, S-A-PAT
+    b'\x00\x00\x00\x01\x1f\x54\x63\x8b\x77\x37\x19\x3f\xfd\x86\xc1\x9e\xc5\x19\x07\xa7\xc4\x17\x55\xd8\x06\x00\xfb\x03'  # SOL, Sola Token
+    b'\x00\x00\x00\x01\x1f\x57\x3d\x6f\xb3\xf1\x3d\x68\x9f\xf8\x44\xb4\xce\x37\x79\x4d\x79\xa7\xff\x1c\x12\x00\xfe\x03'  # BNT, Bancor
+    b'\x00\x00\x00\x01\x20\x23\xdc\xf7\xc4\x38\xc8\xc8\xc0\xb0\xf2\x8d\xba\xe1\x55\x20\xb4\xf3\xee\x20\x12\x01\x01\x03'  # FTR, Futourist Token
+    b'\x00\x00\x00\x01\x21\x08\xe6\x2d\x33\x5b\xbd\xc8\x9e\xc3\xe9\xd8\x58\x2f\x18\xdc\xfb\x0c\xdf\xf4\x08\x01\x04\x05'  # CARCO, CARCO
+    b'\x00\x00\x00\x01\x21\x34\x05\x7c\x0b\x46\x1f\x89\x8d\x37\x5c\xea\xd6\x52\xac\xae\x62\xb5\x95\x41\x12\x01\x09\x03'  # CXC, CoxxxCoin
+    b'\x00\x00\x00\x01\x21\xae\x23\xb8\x82\xa3\x40\xa2\x22\x82\x16\x20\x86\xbc\x98\xd3\xe2\xb7\x30\x18\x12\x01\x0c\x03'  # LOK, LOK
+    b'\x00\x00\x00\x01\x21\xf0\xf0\xfd\x31\x41\xee\x9e\x11\xb3\xd7\xf1\x3a\x10\x28\xcd\x51\x5f\x45\x9c\x12\x01\x0f\x03'  # MRP, MoneyRebel Token
+    b'\x00\x00\x00\x01\x22\x6b\xb5\x99\xa1\x2c\x82\x64\x76\xe3\xa7\x71\x45\x46\x97\xea\x52\xe9\xe2\x20\x08\x01\x12\x03'  # PRO, Propy
+    b'\x00\x00\x00\x01\x22\xe5\xf6\x2d\x0f\xa1\x99\x74\x74\x9f\xaa\x19\x4e\x3d\x3e\xf6\xd8\x9c\x08\xd7\x00\x01\x15\x03'  # IMT, IMT
+    b'\x00\x00\x00\x01\x22\xf0\xaf\x8d\x78\x85\x1b\x72\xee\x79\x9e\x05\xf5\x4a\x77\x00\x15\x86\xb1\x8a\x0a\x01\x18\x04'  # GXVC, Genevieve VC
+    b'\x00\x00\x00\x01\x23\xae\x3c\x5b\x39\xb1\x2f\x06\x93\xe0\x54\x35\xee\xaa\x1e\x51\xd8\xc6\x15\x30\x12\x01\x1c\x03'  # APT, AIGang
+    b'\x00\x00\x00\x01\x24\x08\x3b\xb3\x00\x72\x64\x3c\x3b\xb9\x0b\x44\xb7\x28\x58\x60\xa7\x55\xe6\x87\x12\x01\x1f\x04'  # GELD, GELD
+    b'\x00\x00\x00\x01\x24\x69\x27\x91\xbc\x44\x4c\x5c\xd0\xb8\x1e\x3c\xbc\xab\xa4\xb0\x4a\xcd\x1f\x3b\x12\x01\x23\x03'  # UKG, UnikoinGold
+    b'\x00\x00\x00\x01\x24\xa7\x7c\x1f\x17\xc5\x47\x10\x5e\x14\x81\x3e\x51\x7b\xe0\x6b\x00\x40\xaa\x76\x12\x01\x26\x04'  # LIVE, LIVE Token
+    b'\x00\x00\x00\x01\x24\xae\xf3\xbf\x1a\x47\x56\x15\x00\xf9\x43\x0d\x74\xed\x40\x97\xc4\x7f\x51\xf2\x04\x01\x2a\x06'  # SPARTA, SPARTA
+    b'\x00\x00\x00\x01\x25\x5a\xa6\xdf\x07\x54\x0c\xb5\xd3\xd2\x97\xf0\xd0\xd4\xd8\x4c\xb5\x2b\xc8\xe6\x12\x01\x30\x03'  # RDN, Raiden Network
+    b'\x00\x00\x00\x01\x26\xe7\x53\x07\xfc\x0c\x02\x14\x72\xfe\xb8\xf7\x27\x83\x95\x31\xf1\x12\xf3\x17\x12\x01\x33\x03'  # C20, Crypto20's Token
+    b'\x00\x00\x00\x01\x27\x05\x4b\x13\xb1\xb7\x98\xb3\x45\xb5\x91\xa4\xd2\x2e\x65\x62\xd4\x7e\xa7\x5a\x04\x01\x36\x03'  # AST, Airswap
+    b'\x00\x00\x00\x01\x27\x69\x5e\x09\x14\x9a\xdc\x73\x8a\x97\x8e\x9a\x67\x8f\x99\xe4\xc3\x9e\x9e\xb9\x08\x01\x39\x04'  # KICK, KICK
+    b'\x00\x00\x00\x01\x27\xdc\xe1\xec\x4d\x3f\x72\xc3\xe4\x57\xcc\x50\x35\x4f\x1f\x97\x5d\xde\xf4\x88\x08\x01\x3d\x03'  # AIR, AirToken
+    b'\x00\x00\x00\x01\x28\x57\x7a\x6d\x31\x55\x9b\xd2\x65\xce\x3a\xdb\x62\xd0\x45\x85\x50\xf7\xb8\xa7\x12\x01\x40\x17'  # CCC (CryptoCrashCourse), CryptoCrashCourse
+    b'\x00\x00\x00\x01\x28\x6b\xda\x14\x13\xa2\xdf\x81\x73\x1d\x49\x30\xce\x2f\x86\x2a\x35\xa6\x09\xfe\x12\x01\x57\x04'  # WaBi, WaBi
+    b'\x00\x00\x00\x01\x2a\x3a\xa9\xec\xa4\x1e\x72\x0e\xd4\x6b\x5a\x70\xd6\xc3\x7e\xfa\x47\xf7\x68\xac\x12\x01\x5b\x03'  # RCT, RCT
+    b'\x00\x00\x00\x01\x2a\xcc\xab\x9c\xb7\xa4\x8c\x3e\x82\x28\x6f\x0b\x2f\x87\x98\xd2\x01\xf4\xec\x3f\x12\x01\x5e\x0c'  # BTL (Battle), BTL (Battle)
+    b'\x00\x00\x00\x01\x2b\xdc\x0d\x42\x99\x60\x17\xfc\xe2\x14\xb2\x16\x07\xa5\x15\xda\x41\xa9\xe0\xc5\x06\x01\x6a\x04'  # SKIN, SKIN
+    b'\x00\x00\x00\x01\x2c\x3c\x1f\x05\x18\x7d\xba\x7a\x5f\x2d\xd4\x7d\xca\x57\x28\x1c\x4d\x4f\x18\x3f\x12\x01\x6e\x03'  # QTQ, TiiQu's Q Token
+    b'\x00\x00\x00\x01\x2c\x4e\x8f\x2d\x74\x61\x13\xd0\x69\x6c\xe8\x9b\x35\xf0\xd8\xbf\x88\xe0\xae\xca\x12\x01\x71\x03'  # OST, Simple Token 'OST'
+    b'\x00\x00\x00\x01\x2c\x82\xc7\x3d\x5b\x34\xaa\x01\x59\x89\x46\x2b\x29\x48\xcd\x61\x6a\x37\x64\x1f\x12\x01\x74\x04'  # SXUT, Spectre.ai U-Token
+    b'\x00\x00\x00\x01\x2c\x97\x4b\x2d\x0b\xa1\x71\x6e\x64\x4c\x1f\xc5\x99\x82\xa8\x9d\xdd\x2f\xf7\x24\x12\x01\x78\x03'  # VIB, VIB
+    b'\x00\x00\x00\x01\x2c\xcb\xff\x3a\x04\x2c\x68\x71\x6e\xd2\xa2\xcb\x0c\x54\x4a\x9f\x1d\x19\x35\xe1\x08\x01\x7b\x03'  # DMT, DMarket Token
+    b'\x00\x00\x00\x01\x2d\xcf\xaa\xc1\x1c\x9e\xeb\xd8\xc6\xc4\x21\x03\xfe\x9e\x2a\x6a\xd2\x37\xaf\x27\x12\x01\x7e\x03'  # SMT, Smart Node
+    b'\x00\x00\x00\x01\x2e\x07\x1d\x29\x66\xaa\x7d\x8d\xec\xb1\x00\x58\x85\xba\x19\x77\xd6\x03\x8a\x65\x10\x01\x81\x04'  # DICE, Etheroll
+    b'\x00\x00\x00\x01\x2e\xb8\x6e\x8f\xc5\x20\xe0\xf6\xbb\x5d\x9a\xf0\x8f\x92\x4f\xe7\x05\x58\xab\x89\x08\x01\x85\x03'  # LGR, Logarithm
+    b'\x00\x00\x00\x01\x2e\xf1\xab\x8a\x26\x18\x7c\x58\xbb\x8a\xae\xb1\x1b\x2f\xc6\xd2\x5c\x5c\x07\x16\x12\x01\x88\x03'  # TWN, The World News
+    b'\x00\x00\x00\x01\x30\xf4\xa3\xe0\xab\x7a\x76\x73\x3d\x8b\x60\xb8\x9d\xd9\x3c\x3d\x0b\x4c\x9e\x2f\x12\x01\x8b\x03'  # XGT, XGT
+    b'\x00\x00\x00\x01\x31\x36\xef\x85\x15\x92\xac\xf4\x9c\xa4\xc8\x25\x13\x1e\x36\x41\x70\xfa\x32\xb3\x12\x01\x8e\x04'  # COFI, CoinFi Token
+    b'\x00\x00\x00\x01\x31\x5c\xe5\x9f\xaf\xd3\xa8\xd5\x62\xb7\xec\x1c\x85\x42\x38\x2d\x27\x10\xb0\x6c\x12\x01\x92\x03'  # CCS, CacaoShares
+    b'\x00\x00\x00\x01\x32\x4a\x48\xeb\xcb\xb4\x6e\x61\x99\x39\x31\xef\x9d\x35\xf6\x69\x7c\xd2\x90\x1b\x12\x01\x95\x04'  # SKRP, Skraps
+    b'\x00\x00\x00\x01\x32\x76\x82\x77\x9b\xab\x2b\xf4\xd1\x33\x7e\x89\x74\xab\x9d\xe8\x27\x5a\x7c\xa8\x12\x01\x99\x03'  # BPT, Blockport Token
+    b'\x00\x00\x00\x01\x34\x0d\x2b\xde\x5e\xb2\x8c\x1e\xed\x91\xb2\xf7\x90\x72\x3e\x3b\x16\x06\x13\xb7\x12\x01\x9c\x03'  # VEE, BLOCKv
+    b'\x00\x00\x00\x01\x35\x97\xbf\xd5\x33\xa9\x9c\x9a\xa0\x83\x58\x7b\x07\x44\x34\xe6\x1e\xb0\xa2\x58\x08\x01\x9f\x04'  # DENT, DENT
+    b'\x00\x00\x00\x01\x36\x18\x51\x6f\x45\xcd\x3c\x91\x3f\x81\xf9\x98\x7a\xf4\x10\x77\x93\x2b\xc4\x0d\x08\x01\xa3\x03'  # PCL, Peculium
+    b'\x00\x00\x00\x01\x38\x64\x67\xf1\xf3\xdd\xbe\x83\x24\x48\x65\x04\x18\x31\x1a\x47\x9e\xec\xfc\x57\x00\x01\xa6\x04'  # MBRS, Embers
+    b'\x00\x00\x00\x01\x38\x6f\xaa\x47\x03\xa3\x4a\x7f\xdb\x19\xbe\xc2\xe1\x4f\xd4\x27\xc9\x63\x84\x16\x12\x01\xaa\x03'  # DCA, DoBetAcceptBet
+    b'\x00\x00\x00\x01\x39\x9a\x0e\x6f\xbe\xb3\xd7\x4c\x85\x35\x74\x39\xf4\xc8\xae\xd9\x67\x8a\x5c\xbf\x03\x01\xad\x03'  # DCL, DCL
+    b'\x00\x00\x00\x01\x39\xbb\x25\x9f\x66\xe1\xc5\x9d\x5a\xbe\xf8\x83\x75\x97\x9b\x4d\x20\xd9\x80\x22\x08\x01\xb0\x03'  # WAX, WAX
+    b'\x00\x00\x00\x01\x3a\x1b\xda\x28\xad\xb5\xb0\xa8\x12\xa7\xcf\x10\xa1\x95\x0c\x92\x0f\x79\xbc\xd3\x12\x01\xb3\x03'  # FLP, FLIP Token
+    b'\x00\x00\x00\x01\x3a\x26\x74\x6d\xdb\x79\xb1\xb8\xe4\x45\x0e\x3f\x4f\xfe\x32\x85\xa3\x07\x38\x7e\x08\x01\xb6\x04'  # ETHB, EtherBTC
+    b'\x00\x00\x00\x01\x3c\x75\x22\x65\x55\xfc\x49\x61\x68\xd4\x8b\x88\xdf\x83\xb9\x5f\x16\x77\x1f\x37\x00\x01\xba\x04'  # DROP, Droplex
+    b'\x00\x00\x00\x01\x3d\x1b\xa9\xbe\x9f\x66\xb8\xee\x10\x19\x11\xbc\x36\xd3\xfb\x56\x2e\xac\x22\x44\x12\x01\xbe\x03'  # RVT, Rivetz
+    b'\x00\x00\x00\x01\x3e\xb9\x1d\x23\x7e\x49\x1e\x0d\xee\x85\x82\xc4\x02\xd8\x5c\xb4\x40\xfb\x6b\x54\x12\x01\xc1\x05'  # S-ETH, S-ETH
+    b'\x00\x00\x00\x01\x3e\xdd\x23\x5c\x3e\x84\x0c\x1f\x29\x28\x6b\x2e\x39\x37\x0a\x25\x5c\x7b\x6f\xdb\x08\x01\xc6\x04'  # CMBT, CMBToken
+    b'\x00\x00\x00\x01\x3f\x4b\x72\x66\x68\xda\x46\xf5\xe0\xe7\x5a\xa5\xd4\x78\xac\xec\x9f\x38\x21\x0f\x12\x01\xca\x05'  # M-ETH, M-ETH
+    b'\x00\x00\x00\x01\x40\x39\x50\x44\xac\x3c\x0c\x57\x05\x19\x06\xda\x93\x8b\x54\xbd\x65\x57\xf2\x12\x08\x01\xcf\x03'  # MGO, MGO
+    b'\x00\x00\x00\x01\x40\x8e\x41\x87\x6c\xcc\xdc\x0f\x92\x21\x06\x00\xef\x50\x37\x26\x56\x05\x2a\x38\x12\x01\xd2\x03'  # REN, Republic Token
+    b'\x00\x00\x00\x01\x41\x56\xd3\x34\x2d\x5c\x38\x5a\x87\xd2\x64\xf9\x06\x53\x73\x35\x92\x00\x05\x81\x08\x01\xd5\x04'  # SALT, Salt Lending Token
+    b'\x00\x00\x00\x01\x41\x62\x17\x8b\x78\xd6\x98\x54\x80\xa3\x08\xb2\x19\x0e\xe5\x51\x74\x60\x40\x6d\x12\x01\xd9\x03'  # CLN, ColuLocalNetwork
+    b'\x00\x00\x00\x01\x41\x9c\x4d\xb4\xb9\xe2\x5d\x6d\xb2\xad\x96\x91\xcc\xb8\x32\xc8\xd9\xfd\xa0\x5e\x12\x01\xdc\x04'  # DRGN, Dragon
+    b'\x00\x00\x00\x01\x41\x9d\x0d\x8b\xdd\x9a\xf5\xe6\x06\xae\x22\x32\xed\x28\x5a\xff\x19\x0e\x71\x1b\x08\x01\xe0\x03'  # FUN, Funfair
+    b'\x00\x00\x00\x01\x41\xdb\xec\xc1\xcd\xc5\x51\x7c\x6f\x76\xf6\xa6\xe8\x36\xad\xbe\xe2\x75\x4d\xe3\x12\x01\xe3\x03'  # MTN, MedToken
+    b'\x00\x00\x00\x01\x41\xe5\x56\x00\x54\x82\x4e\xa6\xb0\x73\x2e\x65\x6e\x3a\xd6\x4e\x20\xe9\x4e\x45\x08\x01\xe6\x03'  # CVC, CVC
+    b'\x00\x00\x00\x01\x41\xf6\x15\xe2\x4f\xab\xd2\xb0\x97\xa3\x20\xe9\xe6\xc1\xf4\x48\xcb\x40\x52\x1c\x12\x01\xe9\x03'  # RVL, RVL
+    b'\x00\x00\x00\x01\x42\x28\x66\xa8\xf0\xb0\x32\xc5\xcf\x1d\xfb\xde\xf3\x1a\x20\xf4\x50\x95\x62\xb0\x00\x01\xec\x04'  # ADST, AdShares
+    b'\x00\x00\x00\x01\x42\x3e\x43\x22\xcd\xda\x29\x15\x6b\x49\xa1\x7d\xfb\xd2\xac\xc4\xb2\x80\x60\x0d\x09\x01\xf0\x03'  # CAR, Car Sharing Community
+    b'\x00\x00\x00\x01\x42\xd6\x62\x2d\xec\xe3\x94\xb5\x49\x99\xfb\xd7\x3d\x10\x81\x23\x80\x6f\x6a\x18\x12\x01\xf3\x05'  # SPANK, SpankChain
+    b'\x00\x00\x00\x01\x43\x55\xfc\x16\x0f\x74\x32\x8f\x9b\x38\x3d\xf2\xec\x58\x9b\xb3\xdf\xd8\x2b\xa0\x12\x01\xf8\x03'  # OPT, Opus Foundation
+    b'\x00\x00\x00\x01\x43\xf6\xa1\xbe\x99\x2d\xee\x40\x87\x21\x74\x84\x90\x77\x2b\x15\x14\x3c\xe0\xa7\x00\x01\xfb\x04'  # POIN, Potatoin
+    b'\x00\x00\x00\x01\x44\x19\x7a\x4c\x44\xd6\xa0\x59\x29\x7c\xaf\x6b\xe4\xf7\xe1\x72\xbd\x56\xca\xaf\x08\x01\xff\x07'  # ELTCOIN, ELTCOIN
+    b'\x00\x00\x00\x01\x44\x70\xbb\x87\xd7\x7b\x96\x3a\x01\x3d\xb9\x39\xbe\x33\x2f\x92\x7f\x2b\x99\x2e\x04\x02\x06\x03'  # ADX, AdEx Network
+    b'\x00\x00\x00\x01\x44\xf5\x88\xae\xeb\x8c\x44\x47\x14\x39\xd1\x27\x0b\x36\x03\xc6\x6a\x92\x62\xf1\x12\x02\x09\x04'  # SNIP, SNIP
+    b'\x00\x00\x00\x01\x45\x45\x75\x0f\x39\xaf\x6b\xe4\xf2\x37\xb6\x86\x9d\x4e\xcc\xa9\x28\xfd\x5a\x85\x12\x02\x0d\x03'  # CTF, CryptoTask
+    b'\x00\x00\x00\x01\x45\xe4\x2d\x65\x9d\x9f\x94\x66\xcd\x5d\xf6\x22\x50\x60\x33\x14\x5a\x9b\x89\xbc\x03\x02\x10\x03'  # NxC, Nexium
+    b'\x00\x00\x00\x01\x46\x49\x24\x73\x75\x5e\x8d\xf9\x60\xf8\x03\x48\x77\xf6\x17\x32\xd7\x18\xce\x96\x08\x02\x13\x04'  # STRC, STRC
+    b'\x00\x00\x00\x01\x46\x72\xba\xd5\x27\x10\x74\x71\xcb\x50\x67\xa8\x87\xf4\x65\x6d\x58\x5a\x8a\x31\x12\x02\x17\x0d'  # DROP (dropil), Dropil
+    b'\x00\x00\x00\x01\x49\x93\xcb\x95\xc7\x44\x3b\xdc\x06\x15\x5c\x5f\x56\x88\xbe\x9d\x8f\x69\x99\xa5\x12\x02\x24\x05'  # ROUND, ROUND
+    b'\x00\x00\x00\x01\x49\x94\xe8\x18\x97\xa9\x20\xc0\xfe\xa2\x35\xeb\x8c\xed\xee\xd3\xc6\xff\xf6\x97\x12\x02\x29\x04'  # SKO1, Sikoba
+    b'\x00\x00\x00\x01\x4a\x42\xd2\xc5\x80\xf8\x3d\xce\x40\x4a\xca\xd1\x8d\xab\x26\xdb\x11\xa1\x75\x0e\x12\x02\x2d\x03'  # RLX, Relex
+    b'\x00\x00\x00\x01\x4c\x38\x2f\x8e\x09\x61\x5a\xc8\x6e\x08\xce\x58\x26\x6c\xc2\x27\xe7\xd4\xd9\x13\x06\x02\x30\x03'  # SKR, SKR Token
+    b'\x00\x00\x00\x01\x4c\xa7\x41\x85\x53\x2d\xc1\x78\x95\x27\x19\x4e\x5b\x9c\x86\x6d\xd3\x3f\x4e\x82\x12\x02\x33\x09'  # SenSatorI, SenSatorI Token
+    b'\x00\x00\x00\x01\x4c\xc1\x93\x56\xf2\xd3\x73\x38\xb9\x80\x2a\xa8\xe8\xfc\x58\xb0\x37\x32\x96\xe7\x12\x02\x3c\x03'  # KEY, SelfKey
+    b'\x00\x00\x00\x01\x4c\xed\xa7\x90\x6a\x5e\xd2\x17\x97\x85\xcd\x3a\x40\xa6\x9e\xe8\xbc\x99\xc4\x66\x08\x02\x3f\x04'  # AION, Aion
+    b'\x00\x00\x00\x01\x4c\xf4\x88\x38\x7f\x03\x5f\xf0\x8c\x37\x15\x15\x56\x2c\xba\x71\x2f\x90\x15\xd4\x12\x02\x43\x03'  # WPR, WePower Token
+    b'\x00\x00\x00\x01\x4d\x82\x9f\x8c\x92\xa6\x69\x1c\x56\x30\x0d\x02\x0c\x9e\x0d\xb9\x84\xcf\xe2\xba\x12\x02\x46\x03'  # XCC, CoinCrowd
+    b'\x00\x00\x00\x01\x4d\x8f\xc1\x45\x3a\x0f\x35\x9e\x99\xc9\x67\x59\x54\xe6\x56\xd8\x0d\x99\x6f\xbf\x12\x02\x49\x03'  # BEE, Bee Token
+    b'\x00\x00\x00\x01\x4d\xc3\x64\x3d\xbc\x64\x2b\x72\xc1\x58\xe7\xf3\xd2\xff\x23\x2d\xf6\x1c\xb6\xce\x12\x02\x4c\x03'  # AMB, Amber Token
+    b'\x00\x00\x00\x01\x4d\xf4\x7b\x49\x69\xb2\x91\x1c\x96\x65\x06\xe3\x59\x2c\x41\x38\x94\x93\x95\x3b\x12\x02\x4f\x03'  # FND, FundRequest
+    b'\x00\x00\x00\x01\x4d\xf8\x12\xf6\x06\x4d\xef\x1e\x5e\x02\x9f\x1c\xa8\x58\x77\x7c\xc9\x8d\x2d\x81\x08\x02\x52\x04'  # XAUR, Xaurum
+    b'\x00\x00\x00\x01\x4e\x06\x03\xe2\xa2\x7a\x30\x48\x0e\x5e\x3a\x4f\xe5\x48\xe2\x9e\xf1\x2f\x64\xbe\x12\x02\x56\x05'  # CREDO, Credo / Bitbounce
+    b'\x00\x00\x00\x01\x4f\x4f\x0d\xb4\xde\x90\x3b\x88\xf2\xb1\xa2\x84\x79\x71\xe2\x31\xd5\x4f\x8f\xd3\x08\x02\x5b\x03'  # GEE, Geens NPO
+    b'\x00\x00\x00\x01\x50\x9a\x38\xb7\xa1\xcc\x0d\xcd\x83\xaa\x9d\x06\x21\x46\x63\xd9\xec\x7c\x7f\x4a\x12\x02\x5e\x03'  # BST, BlocksquareToken
+    b'\x00\x00\x00\x01\x51\x49\x10\x77\x1a\xf9\xca\x65\x6a\xf8\x40\xdf\xf8\x3e\x82\x64\xec\xf9\x86\xca\x12\x02\x61\x10'  # LINK (Chainlink), LINK Chainlink
+    b'\x00\x00\x00\x01\x51\x94\x75\xb3\x16\x53\xe4\x6d\x20\xcd\x09\xf9\xfd\xcf\x3b\x12\xbd\xac\xb4\xf5\x12\x02\x71\x03'  # VIU, VIU
+    b'\x00\x00\x00\x01\x51\xdb\x5a\xd3\x5c\x67\x1a\x87\x20\x7d\x88\xfc\x11\xd5\x93\xac\x0c\x84\x15\xbd\x12\x02\x74\x03'  # MDA, MDA
+    b'\x00\x00\x00\x01\x53\x14\x8b\xb4\x55\x17\x07\xed\xf5\x1a\x1e\x8d\x7a\x93\x69\x8d\x18\x93\x12\x25\x08\x02\x77\x06'  # PCLOLD, PeculiumOLD
+    b'\x00\x00\x00\x01\x53\x3e\xf0\x98\x4b\x2f\xaa\x22\x7a\xcc\x62\x0c\x67\xcc\xe1\x2a\xa3\x9c\xd8\xcd\x08\x02\x7d\x03'  # XGM, XGM
+    b'\x00\x00\x00\x01\x54\xb2\x93\x22\x60\x00\xcc\xbf\xc0\x4d\xf9\x02\xee\xc5\x67\xcb\x4c\x35\xa9\x03\x12\x02\x80\x03'  # RTN, RiderToken
+    b'\x00\x00\x00\x01\x55\x12\xe1\xd6\xa7\xbe\x42\x4b\x43\x23\x12\x6b\x4f\x9e\x86\xd0\x23\xf9\x57\x64\x12\x02\x83\x04'  # PTWO, PornTokenV2
+    b'\x00\x00\x00\x01\x55\x4c\x20\xb7\xc4\x86\xbe\xee\x43\x92\x77\xb4\x54\x0a\x43\x45\x66\xdc\x4c\x02\x12\x02\x87\x03'  # HST, HST
+    b'\x00\x00\x00\x01\x55\x64\x8d\xe1\x98\x36\x33\x85\x49\x13\x0b\x1a\xf5\x87\xf1\x6b\xea\x46\xf6\x6b\x12\x02\x8a\x03'  # PBL, PBL
+    b'\x00\x00\x00\x01\x55\xb9\xa1\x1c\x2e\x83\x51\xb4\xff\xc7\xb1\x15\x61\x14\x8b\xfa\xc9\x97\x78\x55\x09\x02\x8d\x03'  # DGX, DGX
+    b'\x00\x00\x00\x01\x55\xc2\xa0\xc1\x71\xd9\x20\x84\x35\x60\x59\x4d\xe3\xd6\xee\xcc\x09\xef\xc0\x98\x04\x02\x90\x04'  # PEXT, PEX-Token
+    b'\x00\x00\x00\x01\x56\x6f\xd7\x99\x9b\x1f\xc3\x98\x80\x22\xbd\x38\x50\x7a\x48\xf0\xbc\xf2\x2c\x77\x12\x02\x94\x04'  # TRCN, The Real Coin
+    b'\x00\x00\x00\x01\x56\xba\x2e\xe7\x89\x04\x61\xf4\x63\xf7\xbe\x02\xaa\xc3\x09\x9f\x6d\x58\x11\xa8\x12\x02\x98\x0e'  # CAT (Blockcat), CAT (Blockcat)
+    b'\x00\x00\x00\x01\x57\x2e\x6f\x31\x80\x56\xba\x0c\x5d\x47\xa4\x22\x65\x31\x13\x84\x3d\x25\x06\x91\x00\x02\xa6\x03'  # XNT, XNT
+    b'\x00\x00\x00\x01\x58\x84\x96\x9e\xc0\x48\x05\x56\xe1\x1d\x11\x99\x80\x13\x6a\x4c\x17\xed\xde\xd1\x12\x02\xa9\x03'  # PET, PETHEREUM
+    b'\x00\x00\x00\x01\x58\xbf\x7d\xf5\x7d\x9d\xa7\x11\x3c\x4c\xcb\x49\xd8\x46\x3d\x49\x08\xc7\x35\xcb\x12\x02\xac\x05'  # SPARC, SPARC
+    b'\x00\x00\x00\x01\x58\xca\x30\x65\xc0\xf2\x4c\x7c\x96\xae\xe8\xd6\x05\x6b\x5b\x5d\xec\xf9\xc2\xf8\x0a\x02\xb1\x03'  # GXC, GXC
+    b'\x00\x00\x00\x01\x59\x41\x6a\x25\x62\x8a\x76\xb4\x73\x0e\xc5\x14\x86\x11\x4c\x32\xe0\xb5\x82\xa1\x06\x02\xb4\x06'  # PLASMA, PLASMA
+    b'\x00\x00\x00\x01\x59\x58\x32\xf8\xfc\x6b\xf5\x9c\x85\xc5\x27\xfe\xc3\x74\x0a\x1b\x7a\x36\x12\x69\x06\x02\xba\x04'  # POWR, PowerLedger
+    b'\x00\x00\x00\x01\x59\x93\x46\x77\x9e\x90\xfc\x3f\x5f\x99\x7b\x5e\xa7\x15\x34\x98\x20\xf9\x15\x71\x04\x02\xbe\x03'  # STN, Saturn Network
+    b'\x00\x00\x00\x01\x5a\x84\x96\x9b\xb6\x63\xfb\x64\xf6\xd0\x15\xdc\xf9\xf6\x22\xae\xdc\x79\x67\x50\x12\x02\xc1\x03'  # ICE, ICE
+    b'\x00\x00\x00\x01\x5a\xf2\xbe\x19\x3a\x6a\xbc\xa9\xc8\x81\x70\x01\xf4\x57\x44\x77\x7d\xb3\x07\x56\x08\x02\xc4\x03'  # BQX, Bitquence
+    b'\x00\x00\x00\x01\x5b\x26\xc5\xd0\x77\x2e\x5b\xba\xc8\xb3\x18\x2a\xe9\xa1\x3f\x9b\xb2\xd0\x37\x65\x08\x02\xc7\x03'  # EDU, EDU
+    b'\x00\x00\x00\x01\x5b\x2e\x4a\x70\x0d\xfb\xc5\x60\x06\x1e\x95\x7e\xde\xc8\xf6\xee\xeb\x74\xa3\x20\x0a\x02\xca\x03'  # INS, INS
+    b'\x00\x00\x00\x01\x5b\x8d\x43\xff\xde\x4a\x29\x82\xb9\xa5\x38\x7c\xdf\x21\xd5\x4e\xad\x64\xac\x8d\x12\x02\xcd\x04'  # MEST, Monaco Estate
+    b'\x00\x00\x00\x01\x5b\xc7\xe5\xf0\xab\x8b\x2e\x10\xd2\xd0\xa3\xf2\x17\x39\xfc\xe6\x24\x59\xae\xf3\x12\x02\xd1\x05'  # ENTRP, Hut34 Entropy Token
+    b'\x00\x00\x00\x01\x5c\x54\x3e\x7a\xe0\xa1\x10\x4f\x78\x40\x6c\x34\x0e\x9c\x64\xfd\x9f\xce\x51\x70\x12\x02\xd6\x03'  # VSL, Vdice
+    b'\x00\x00\x00\x01\x5c\x61\x83\xd1\x0a\x00\xcd\x74\x7a\x6d\xbb\x5f\x65\x8a\xd5\x14\x38\x3e\x94\x19\x08\x02\xd9\x07'  # NXX OLD, NXX OLD
+    b'\x00\x00\x00\x01\x5c\xa9\xa7\x1b\x1d\x01\x84\x9c\x0a\x95\x49\x0c\xc0\x05\x59\x71\x7f\xcf\x0d\x1d\x12\x02\xe0\x02'  # AE, aeternity
+    b'\x00\x00\x00\x01\x5e\x33\x46\x44\x40\x10\x13\x53\x22\x26\x8a\x46\x30\xd2\xed\x5f\x8d\x09\x44\x6c\x12\x02\xe2\x03'  # LOC, LockChain
+    b'\x00\x00\x00\x01\x5e\x4a\xbe\x64\x19\x65\x0c\xa8\x39\xce\x5b\xb7\xdb\x42\x2b\x88\x1a\x60\x64\xbb\x12\x02\xe5\x03'  # WiC, Wi Coin
+    b'\x00\x00\x00\x01\x5e\x6b\x6d\x9a\xba\xd9\x09\x3f\xdc\x86\x1e\xa1\x60\x0e\xba\x1b\x35\x5c\xd9\x40\x12\x02\xe8\x03'  # ITC, IoT Chain
+    b'\x00\x00\x00\x01\x5f\x53\xf7\xa8\x07\x56\x14\xb6\x99\xba\xad\x0b\xc2\xc8\x99\xf4\xba\xd8\xfb\xbf\x12\x02\xeb\x04'  # REBL, Rebellious
+    b'\x00\x00\x00\x01\x60\x7f\x4c\x5b\xb6\x72\x23\x0e\x86\x72\x08\x55\x32\xf7\xe9\x01\x54\x4a\x73\x75\x09\x02\xef\x03'  # RLC, IEx.ec
+    b'\x00\x00\x00\x01\x62\x08\x72\x45\x08\x71\x25\xd3\xdb\x5b\x9a\x3d\x71\x3d\x78\xe7\xbb\xc3\x1e\x54\x12\x02\xf2\x03'  # WPC, WorldPeaceCoin
+    b'\x00\x00\x00\x01\x62\x1d\x78\xf2\xef\x2f\xd9\x37\xbf\xca\x69\x6c\xab\xaf\x9a\x77\x9f\x59\xb3\xed\x02\x02\xf5\x03'  # DRP, DCorp
+    b'\x00\x00\x00\x01\x62\x9a\xee\x55\xed\x49\x58\x1c\x33\xab\x27\xf9\x40\x3f\x79\x92\xa2\x89\xff\xd5\x12\x02\xf8\x03'  # STC, StrikeCoin Token
+    b'\x00\x00\x00\x01\x62\xcd\x07\xd4\x14\xec\x50\xb6\x8c\x7e\xca\xa8\x63\xa2\x3d\x34\x4f\x2d\x06\x2f\x00\x02\xfb\x03'  # WIC, WickNote
+    b'\x00\x00\x00\x01\x63\x39\x78\x4d\x94\x78\xda\x43\x10\x6a\x42\x91\x96\x77\x2a\x02\x9c\x2f\x17\x7d\x12\x02\xfe\x04'  # ATTN, Attention Token
+    b'\x00\x00\x00\x01\x63\x8a\xc1\x49\xea\x8e\xf9\xa1\x28\x6c\x41\xb9\x77\x01\x7a\xa7\x35\x9e\x6c\xfa\x12\x03\x02\x04'  # ALTS, ALTS Token
+    b'\x00\x00\x00\x01\x63\xe6\x34\x33\x0a\x20\x15\x0d\xbb\x61\xb1\x56\x48\xbc\x73\x85\x5d\x6c\xcf\x07\x12\x03\x06\x03'  # LNC, Lancer Token
+    b'\x00\x00\x00\x01\x64\x25\xc6\xbe\x90\x2d\x69\x2a\xe2\xdb\x75\x2b\x3c\x26\x8a\xfa\xdb\x09\x9d\x3b\x12\x03\x09\x04'  # MWAT, RED MWAT
+    b'\x00\x00\x00\x01\x64\xcd\xf8\x19\xd3\xe7\x5a\xc8\xec\x21\x7b\x34\x96\xd7\xce\x16\x7b\xe4\x2e\x80\x12\x03\x0d\x03'  # IPL, InsurePal token
+    b'\x00\x00\x00\x01\x65\x29\x2e\xea\xdf\x14\x26\xcd\x2d\xf1\xc4\x79\x3a\x3d\x75\x19\xf2\x53\x91\x3b\x12\x03\x10\x04'  # COSS, Coss Token
+    b'\x00\x00\x00\x01\x65\x31\xf1\x33\xe6\xde\xeb\xe7\xf2\xdc\xe5\xa0\x44\x1a\xa7\xef\x33\x0b\x4e\x53\x08\x03\x14\x04'  # TIME, Chronobank
+    b'\x00\x00\x00\x01\x65\xa1\x50\x14\x96\x4f\x21\x02\xff\x58\x64\x7e\x16\xa1\x6a\x6b\x9e\x14\xbc\xf6\x03\x03\x18\x07'  # Ox Fina, Ox Fina
+    b'\x00\x00\x00\x01\x66\x2a\xbc\xad\x0b\x7f\x34\x5a\xb7\xff\xb1\xb1\xfb\xb9\xdf\x78\x94\xf1\x8e\x66\x12\x03\x1f\x03'  # CTX, CarTaxi
+    b'\x00\x00\x00\x01\x66\x49\x7a\x28\x3e\x0a\x00\x7b\xa3\x97\x4e\x83\x77\x84\xc6\xae\x32\x34\x47\xde\x12\x03\x22\x02'  # PT, PornToken
+    b'\x00\x00\x00\x01\x66\x70\x88\xb2\x12\xce\x3d\x06\xa1\xb5\x53\xa7\x22\x1e\x1f\xd1\x90\x00\xd9\xaf\x12\x03\x24\x05'  # WINGS, WINGS
+    b'\x00\x00\x00\x01\x67\x1a\xbb\xe5\xce\x65\x24\x91\x98\x53\x42\xe8\x54\x28\xeb\x1b\x07\xbc\x6c\x64\x08\x03\x29\x03'  # QAU, QAU
+    b'\x00\x00\x00\x01\x67\x2a\x1a\xd4\xf6\x67\xfb\x18\xa3\x33\xaf\x13\x66\x7a\xa0\xaf\x1f\x5b\x5b\xdd\x12\x03\x2c\x04'  # CRED, CRED
+    b'\x00\x00\x00\x01\x67\x45\xfa\xb6\x80\x1e\x37\x6c\xd2\x4f\x03\x57\x2b\x9c\x9b\x0d\x4e\xdd\xdc\xcf\x08\x03\x30\x05'  # SENSE, Sensay
+    b'\x00\x00\x00\x01\x67\x81\xa0\xf8\x4c\x7e\x9e\x84\x6d\xcb\x84\xa9\xa5\xbd\x49\x33\x30\x67\xb1\x04\x12\x03\x35\x03'  # ZAP, ZAP
+    b'\x00\x00\x00\x01\x68\x10\xe7\x76\x88\x0c\x02\x93\x3d\x47\xdb\x1b\x9f\xc0\x59\x08\xe5\x38\x6b\x96\x12\x03\x38\x03'  # GNO, Gnosis
+    b'\x00\x00\x00\x01\x68\xaa\x3f\x23\x2d\xa9\xbd\xc2\x34\x34\x65\x54\x57\x94\xef\x3e\xea\x52\x09\xbd\x12\x03\x3b\x03'  # MSP, Mothership
+    b'\x00\x00\x00\x01\x68\xd5\x7c\x9a\x1c\x35\xf6\x3e\x2c\x83\xee\x8e\x49\xa6\x4e\x9d\x70\x52\x8d\x25\x12\x03\x3e\x03'  # SRN, Sirin Labs
+    b'\x00\x00\x00\x01\x68\xe1\x4b\xb5\xa4\x5b\x96\x81\x32\x7e\x16\xe5\x28\x08\x4b\x9d\x96\x2c\x1a\x39\x12\x03\x41\x13'  # CATs (BitClave)_Old, CATs (BitClave)_Old
+    b'\x00\x00\x00\x01\x69\x44\x04\x59\x5e\x30\x75\xa9\x42\x39\x7f\x46\x6a\xac\xd4\x62\xff\x1a\x7b\xd0\x12\x03\x54\x07'  # PATENTS, PATENTS
+    b'\x00\x00\x00\x01\x69\x7b\xea\xc2\x8b\x09\xe1\x22\xc4\x33\x2d\x16\x39\x85\xe8\xa7\x31\x21\xb9\x7f\x08\x03\x5b\x03'  # QRL, QRL
+    b'\x00\x00\x00\x01\x6a\x0a\x97\xe4\x7d\x15\xaa\xd1\xd1\x32\xa1\xac\x79\xa4\x80\xe3\xf2\x07\x90\x63\x12\x03\x5e\x03'  # WCT, WePower
+    b'\x00\x00\x00\x01\x6b\xeb\x41\x8f\xc6\xe1\x95\x82\x04\xac\x8b\xad\xdc\xf1\x09\xb8\xe9\x69\x49\x66\x12\x03\x61\x0f'  # LNC-Linker Coin, Linker Coin
+    b'\x00\x00\x00\x01\x6e\x34\xd8\xd8\x47\x64\xd4\x0f\x6d\x7b\x39\xcd\x56\x9f\xd0\x17\xbf\x53\x17\x7d\x12\x01\x95\x04'  # SKRP, Skraps
+    b'\x00\x00\x00\x01\x6f\x6d\xeb\x5d\xb0\xc4\x99\x4a\x82\x83\xa0\x1d\x6c\xfe\xeb\x27\xfc\x3b\xbe\x9c\x00\x03\x70\x05'  # SMART, Smart Billions
+    b'\x00\x00\x00\x01\x6f\xff\x38\x06\xbb\xac\x52\xa2\x0e\x0d\x79\xbc\x53\x8d\x52\x7f\x6a\x22\xc9\x6b\x12\x03\x75\x03'  # CDX, CDX
+    b'\x00\x00\x00\x01\x70\x1c\x24\x4b\x98\x8a\x51\x3c\x94\x59\x73\xde\xfa\x05\xde\x93\x3b\x23\xfe\x1d\x12\x03\x78\x03'  # OAX, OAX
+    b'\x00\x00\x00\x01\x70\x88\x76\xf4\x86\xe4\x48\xee\x89\xeb\x33\x2b\xfb\xc8\xe5\x93\x55\x30\x58\xb9\x12\x03\x7b\x05'  # GAVEL, GAVEL
+    b'\x00\x00\x00\x01\x70\xa7\x28\x33\xd6\xbf\x7f\x50\x8c\x82\x24\xce\x59\xea\x1e\xf3\xd0\xea\x3a\x38\x12\x03\x80\x03'  # UTK, UTK
+    b'\x00\x00\x00\x01\x70\xb1\x47\xe0\x1e\x92\x85\xe7\xce\x68\xb9\xba\x43\x7f\xe3\xa9\x19\x0e\x75\x6a\x12\x03\x83\x03'  # FLX, BitFlux
+    b'\x00\x00\x00\x01\x71\xe8\xd7\x4f\xf1\xc9\x23\xe3\x69\xd0\xe7\x0d\xfb\x09\x86\x66\x29\xc4\xdd\x35\x12\x03\x86\x03'  # WRK, WorkCoin
+    b'\x00\x00\x00\x01\x72\xd3\x2a\xc1\xc5\xe6\x6b\xfc\x5b\x08\x80\x62\x71\xf8\xee\xf9\x15\x54\x51\x64\x00\x03\x89\x03'  # KEE, CryptoKEE
+    b'\x00\x00\x00\x01\x72\xdd\x4b\x6b\xd8\x52\xa3\xaa\x17\x2b\xe4\xd6\xc5\xa6\xdb\xec\x58\x8c\xf1\x31\x12\x03\x8c\x03'  # NGC, NAGA Coin
+    b'\x00\x00\x00\x01\x73\x67\xa6\x80\x39\xd4\x70\x4f\x30\xbf\xbf\x6d\x94\x80\x20\xc3\xb0\x7d\xfc\x59\x12\x03\x8f\x04'  # BCBC, Beercoin
+    b'\x00\x00\x00\x01\x73\xdd\x06\x9c\x29\x9a\x5d\x69\x1e\x98\x36\x24\x3b\xca\xec\x9c\x8c\x1d\x87\x34\x08\x03\x93\x03'  # BTE, BTE
+    b'\x00\x00\x00\x01\x74\x4d\x70\xfd\xbe\x2b\xa4\xcf\x95\x13\x16\x26\x61\x4a\x17\x63\xdf\x80\x5b\x9e\x12\x03\x96\x03'  # SNT, Status Network Token
+    b'\x00\x00\x00\x01\x74\x95\x1b\x67\x7d\xe3\x2d\x59\x6e\xe8\x51\xa2\x33\x33\x69\x26\xe6\xa2\xcd\x09\x07\x03\x99\x03'  # WBA, WeBetCrypto
+    b'\x00\x00\x00\x01\x74\xc1\xe4\xb8\xca\xe5\x92\x69\xec\x1d\x85\xd3\xd4\xf3\x24\x39\x60\x48\xf4\xac\x00\x03\x9c\x08'  # BeerCoin, BeerCoin
+    b'\x00\x00\x00\x01\x75\x85\xf8\x35\xae\x2d\x52\x27\x22\xd2\x68\x43\x23\xa0\xba\x83\x40\x1f\x32\xf5\x12\x03\xa4\x03'  # GBT, GBT
+    b'\x00\x00\x00\x01\x75\xaa\x7b\x0d\x02\x53\x2f\x38\x33\xb6\x6c\x7f\x0a\xd3\x53\x76\xd3\x73\xdd\xf8\x12\x03\xa7\x03'  # ARD, Accord
+    b'\x00\x00\x00\x01\x76\x27\xde\x4b\x93\x26\x3a\x6a\x75\x70\xb8\xda\xfa\x64\xba\xe8\x12\xe5\xc3\x94\x08\x03\xaa\x03'  # NXX, NXX
+    b'\x00\x00\x00\x01\x76\x41\xb2\xca\x9d\xdd\x58\xad\xdf\x6e\x33\x81\xc1\xf9\x94\xaa\xc5\xf1\xa3\x2f\x12\x03\xad\x04'  # PRPS, Purpose
+    b'\x00\x00\x00\x01\x76\x54\x91\x5a\x1b\x82\xd6\xd2\xd0\xaf\xc3\x7c\x52\xaf\x55\x6e\xa8\x98\x3c\x7e\x12\x03\xb1\x03'  # IFT, InvestFeed
+    b'\x00\x00\x00\x01\x76\x7b\xa2\x91\x5e\xc3\x44\x01\x5a\x79\x38\xe3\xee\xdf\xec\x27\x85\x19\x5d\x05\x12\x03\xb4\x03'  # REA, Realisto
+    b'\x00\x00\x00\x01\x77\x05\xfa\xa3\x4b\x16\xeb\x6d\x77\xdf\xc7\x81\x2b\xe2\x36\x7b\xa6\xb0\x24\x8e\x08\x03\xb7\x03'  # ARX, ARX
+    b'\x00\x00\x00\x01\x77\x28\xdf\xef\x5a\xbd\x46\x86\x69\xeb\x7f\x9b\x48\xa7\xf7\x0a\x50\x1e\xd2\x9d\x06\x03\xba\x03'  # PRG, PRG
+    b'\x00\x00\x00\x01\x77\x34\x50\x33\x5e\xd4\xec\x3d\xb4\x5a\xf7\x4f\x34\xf2\xc8\x53\x48\x64\x5d\x39\x12\x03\xbd\x08'  # JetCoins, JetCoins
+    b'\x00\x00\x00\x01\x77\x9b\x7b\x71\x3c\x86\xe3\xe6\x77\x4f\x50\x40\xd9\xcc\xc2\xd4\x3a\xd3\x75\xf8\x08\x03\xc5\x04'  # POOL, Stake Pool
+    b'\x00\x00\x00\x01\x78\xb7\xfa\xda\x55\xa6\x4d\xd8\x95\xd8\xc8\xc3\x57\x79\xdd\x8b\x67\xfa\x8a\x05\x12\x03\xc9\x03'  # ATL, ATL
+    b'\x00\x00\x00\x01\x78\xfe\x18\xe4\x1f\x43\x6e\x19\x81\xa3\xa6\x0d\x15\x57\xc8\xa7\xa9\x37\x04\x61\x02\x03\xcc\x06'  # SCANDI, Scandiweb Coin
+    b'\x00\x00\x00\x01\x7a\x5f\xf2\x95\xdc\x82\x39\xd5\xc2\x37\x4e\x4d\x89\x42\x02\xaa\xf0\x29\xca\xb6\x03\x03\xd2\x03'  # SLT, Smartlands
+    b'\x00\x00\x00\x01\x7c\x5a\x0c\xe9\x26\x7e\xd1\x9b\x22\xf8\xca\xe6\x53\xf1\x98\xe3\xe8\xda\xf0\x98\x12\x03\xd5\x03'  # SAN, Santiment
+    b'\x00\x00\x00\x01\x7d\x4b\x8c\xce\x05\x91\xc9\x04\x4a\x22\xee\x54\x35\x33\xb7\x2e\x97\x6e\x36\xc3\x12\x03\xd8\x03'  # CAG, Change Bank
+    b'\x00\x00\x00\x01\x7d\xd7\xf5\x6d\x69\x7c\xc0\xf2\xb5\x2b\xd5\x5c\x05\x7f\x37\x8f\x1f\xe6\xab\x4b\x12\x03\xdb\x05'  # $TEAK, $TEAK
+    b'\x00\x00\x00\x01\x7e\x66\x75\x25\x52\x1c\xf6\x13\x52\xe2\xe0\x1b\x50\xfa\xaa\xe7\xdf\x39\x74\x9a\x12\x03\xe0\x03'  # CMC, CryptoMart
+    b'\x00\x00\x00\x01\x7f\x1e\x2c\x7d\x6a\x69\xbf\x34\x82\x4d\x72\xc5\x3b\x45\x50\xe8\x95\xc0\xd8\xc2\x08\x03\xe3\x03'  # BOP, BlockOptiopns Token
+    b'\x00\x00\x00\x01\x7f\x21\x76\xce\xb1\x6d\xcb\x64\x8d\xc9\x24\xef\xf6\x17\xc3\xdc\x2b\xef\xd3\x0d\x00\x03\xe6\x04'  # OHNI, OHNI
+    b'\x00\x00\x00\x01\x7f\x58\x5b\x91\x30\xc6\x4e\x9e\x9f\x47\x0b\x61\x8a\x7b\xad\xd0\x3d\x79\xca\x7e\x12\x03\xea\x03'  # CR7, CR7Coin
+    b'\x00\x00\x00\x01\x7f\xc4\x08\x01\x11\x65\x76\x0e\xe3\x1b\xe2\xbf\x20\xda\xf4\x50\x35\x66\x92\xaf\x08\x03\xed\x03'  # MTR, Mitrav
+    b'\x00\x00\x00\x01\x7f\xce\x28\x56\x89\x9a\x68\x06\xee\xef\x70\x80\x79\x85\xfc\x75\x54\xc6\x63\x40\x09\x03\xf0\x03'  # CLP, CryptoLending
+    b'\x00\x00\x00\x01\x80\xa7\xe0\x48\xf3\x7a\x50\x50\x03\x51\xc2\x04\xcb\x40\x77\x66\xfa\x3b\xae\x7f\x12\x03\xf3\x04'  # CRPT, CrypteriumToken
+    b'\x00\x00\x00\x01\x80\xbc\x55\x12\x56\x1c\x7f\x85\xa3\xa9\x50\x8c\x7d\xf7\x90\x1b\x37\x0f\xa1\xdf\x12\x03\xf7\x03'  # TIO, TIO
+    b'\x00\x00\x00\x01\x81\x4c\xaf\xd4\x78\x2d\x2e\x72\x81\x70\xfd\xa6\x82\x57\x98\x3f\x03\x32\x1c\x58\x00\x03\xfa\x04'  # IDEA, IDEA Token
+    b'\x00\x00\x00\x01\x81\x8f\xc6\xc2\xec\x59\x86\xbc\x6e\x2c\xbf\x00\x93\x9d\x90\x55\x6a\xb1\x2c\xe5\x12\x03\xfe\x03'  # KIN, Kin Foundation
+    b'\x00\x00\x00\x01\x81\xc9\x15\x1d\xe0\xc8\xba\xfc\xd3\x25\xa5\x7e\x3d\xb5\xa5\xdf\x1c\xeb\xf7\x9c\x12\x04\x01\x03'  # DAT, Datum Token
+    b'\x00\x00\x00\x01\x83\xce\xe9\xe0\x86\xa7\x7e\x49\x2e\xe0\xbb\x93\xc2\xb0\x43\x7a\xd6\xfd\xec\xcc\x12\x04\x04\x04'  # MNTP, Goldmint MNT Prelaunch Token
+    b'\x00\x00\x00\x01\x83\xee\xa0\x0d\x83\x8f\x92\xde\xc4\xd1\x47\x56\x97\xb9\xf4\xd3\x53\x7b\x56\xe3\x08\x04\x08\x05'  # VOISE, Voise
+    b'\x00\x00\x00\x01\x84\x54\x3f\x86\x8e\xc1\xb1\xfa\xc5\x10\xd4\x9d\x13\xc0\x69\xf6\x4c\xd2\xd5\xf9\x12\x04\x0d\x06'  # Hdp.ф, HEdpAY
+    b'\x00\x00\x00\x01\x85\x08\x93\x89\xc1\x4b\xd9\xc7\x7f\xc2\xb8\xf0\xc3\xd1\xdc\x33\x63\xbf\x06\xef\x12\x04\x13\x03'  # SPF, Sportify
+    b'\x00\x00\x00\x01\x85\xe0\x76\x36\x1c\xc8\x13\xa9\x08\xff\x67\x2f\x9b\xad\x15\x41\x47\x44\x02\xb2\x02\x04\x16\x03'  # TEL, Telcoin
+    b'\x00\x00\x00\x01\x86\xfa\x04\x98\x57\xe0\x20\x9a\xa7\xd9\xe6\x16\xf7\xeb\x3b\x3b\x78\xec\xfd\xb0\x12\x04\x19\x03'  # EOS, EOS
+    b'\x00\x00\x00\x01\x87\x27\xc1\x12\xc7\x12\xc4\xa0\x33\x71\xac\x87\xa7\x4d\xd6\xab\x10\x4a\xf7\x68\x12\x04\x1c\x03'  # JET, JET
+    b'\x00\x00\x00\x01\x88\x10\xc6\x34\x70\xd3\x86\x39\x95\x4c\x6b\x41\xaa\xc5\x45\x84\x8c\x46\x48\x4a\x12\x04\x1f\x03'  # ADI, Aditus
+    b'\x00\x00\x00\x01\x88\x24\x48\xf8\x3d\x90\xb2\xbf\x47\x7a\xf2\xea\x79\x32\x7f\xde\xa1\x33\x5d\x93\x12\x04\x22\x05'  # VIBEX, VIBEX Exchange Token
+    b'\x00\x00\x00\x01\x88\x78\x34\xd3\xb8\xd4\x50\xb6\xba\xb1\x09\xc2\x52\xdf\x3d\xa2\x86\xd7\x3c\xe4\x12\x04\x27\x03'  # ATT, Atmatrix Token
+    b'\x00\x00\x00\x01\x88\x86\x66\xca\x69\xe0\xf1\x78\xde\xd6\xd7\x5b\x57\x26\xce\xe9\x9a\x87\xd6\x98\x12\x04\x2a\x03'  # ICN, ICN
+    b'\x00\x00\x00\x01\x88\xa3\xe4\xf3\x5d\x64\xaa\xd4\x1a\x6d\x40\x30\xac\x9a\xfe\x43\x56\xcb\x84\xfa\x12\x04\x2d\x03'  # PRE, Presearch
+    b'\x00\x00\x00\x01\x88\xae\x96\x84\x5e\x15\x75\x58\xef\x59\xe9\xff\x90\xe7\x66\xe2\x2e\x48\x03\x90\x00\x04\x30\x03'  # IKB, IKB
+    b'\x00\x00\x00\x01\x88\xfc\xfb\xc2\x2c\x6d\x3d\xba\xa2\x5a\xf4\x78\xc5\x78\x97\x83\x39\xbd\xe7\x7a\x12\x04\x33\x03'  # FYN, Fund Yourself Now
+    b'\x00\x00\x00\x01\x89\x20\x5a\x3a\x3b\x2a\x69\xde\x6d\xbf\x7f\x01\xed\x13\xb2\x10\x8b\x2c\x43\xe7\x00\x04\x36\x07'  # Unicorn, Unicorn
+    b'\x00\x00\x00\x01\x89\xd2\x4a\x6b\x4c\xcb\x1b\x6f\xaa\x26\x25\xfe\x56\x2b\xdd\x9a\x23\x26\x03\x59\x12\x04\x3d\x03'  # DAI, Dai Stablecoin v1.0
+    b'\x00\x00\x00\x01\x8a\x18\x7d\x52\x85\xd3\x16\xbc\xbc\x9a\xda\xfc\x08\xb5\x1d\x70\xa0\xd8\xe0\x00\x00\x04\x40\x04'  # SIFT, SIFT
+    b'\x00\x00\x00\x01\x8a\x95\xca\x44\x8a\x52\xc0\xad\xf0\x05\x4b\xb3\x40\x2d\xc5\xe0\x9c\xd6\xb2\x32\x12\x04\x44\x03'  # CDL, Confideal
+    b'\x00\x00\x00\x01\x8a\xa3\x3a\x78\x99\xfc\xc8\xea\x5f\xbe\x6a\x60\x8a\x10\x9c\x38\x93\xa1\xb8\xb2\x12\x04\x47\x03'  # BET, BET
+    b'\x00\x00\x00\x01\x8a\xe4\xbf\x2c\x33\xa8\xe6\x67\xde\x34\xb5\x49\x38\xb0\xcc\xd0\x3e\xb8\xcc\x06\x08\x04\x4a\x04'  # PTOY, PTOY
+    b'\x00\x00\x00\x01\x8c\x65\xe9\x92\x29\x7d\x5f\x09\x2a\x75\x6d\xef\x24\xf4\x78\x1a\x28\x01\x98\xff\x12\x04\x4e\x03'  # GZE, GazeCoin
+    b'\x00\x00\x00\x01\x8e\xb2\x43\x19\x39\x37\x16\x66\x8d\x76\x8d\xce\xc2\x93\x56\xae\x9c\xff\xe2\x85\x08\x04\x51\x03'  # AGI, SingularityNET
+    b'\x00\x00\x00\x01\x8e\xff\xd4\x94\xeb\x69\x8c\xc3\x99\xaf\x62\x31\xfc\xcd\x39\xe0\x8f\xd2\x0b\x15\x00\x04\x54\x03'  # PIX, PIX
+    b'\x00\x00\x00\x01\x8f\x34\x70\xa7\x38\x8c\x05\xee\x4e\x7a\xf3\xd0\x1d\x8c\x72\x2b\x0f\xf5\x23\x74\x12\x04\x57\x04'  # VERI, Veritas
+    b'\x00\x00\x00\x01\x8f\x82\x21\xaf\xbb\x33\x99\x8d\x85\x84\xa2\xb0\x57\x49\xba\x73\xc3\x7a\x93\x8a\x12\x04\x5b\x03'  # REQ, Request Network
+    b'\x00\x00\x00\x01\x90\x02\xd4\x48\x5b\x75\x94\xe3\xe8\x50\xf0\xa2\x06\x71\x3b\x30\x51\x13\xf6\x9e\x12\x04\x5e\x03'  # HAT, Hawala Today
+    b'\x00\x00\x00\x01\x91\x0d\xfc\x18\xd6\xea\x3d\x6a\x71\x24\xa6\xf8\xb5\x45\x8f\x28\x10\x60\xfa\x4c\x12\x04\x61\x03'  # X8X, X8X
+    b'\x00\x00\x00\x01\x92\x31\x08\xa4\x39\xc4\xe8\xc2\x31\x5c\x4f\x65\x21\xe5\xce\x95\xb4\x4e\x9b\x4c\x12\x04\x64\x03'  # EVE, EVE
+    b'\x00\x00\x00\x01\x92\x68\x5e\x93\x95\x65\x37\xc2\x5b\xb7\x5d\x5d\x47\xfc\xa4\x26\x6d\xd6\x28\xb8\x04\x04\x67\x0c'  # BTL (Bitlle), Bitlle Token
+    b'\x00\x00\x00\x01\x93\xe6\x82\x10\x7d\x1e\x9d\xef\xb0\xb5\xee\x70\x1c\x71\x70\x7a\x4b\x2e\x46\xbc\x08\x04\x73\x04'  # MCAP, MCAP
+    b'\x00\x00\x00\x01\x94\x9b\xed\x88\x6c\x73\x9f\x1a\x32\x73\x62\x9b\x33\x20\xdb\x0c\x50\x24\xc7\x19\x09\x04\x77\x04'  # AMIS, AMIS
+    b'\x00\x00\x00\x01\x95\x41\xfd\x8b\x9b\x5f\xa9\x73\x81\x78\x37\x83\xce\xbf\x2f\x5f\xa7\x93\xc2\x62\x08\x04\x7b\x03'  # KZN, KaizenCoin
+    b'\x00\x00\x00\x01\x95\x4b\x5d\xe0\x9a\x55\xe5\x97\x55\xac\xbd\xa2\x9e\x1e\xb7\x4a\x45\xd3\x01\x75\x12\x04\x7e\x04'  # FLUZ, Fluz Fluz Global
+    b'\x00\x00\x00\x01\x95\x7c\x30\xab\x04\x26\xe0\xc9\x3c\xd8\x24\x1e\x2c\x60\x39\x2d\x08\xc6\xac\x8e\x00\x04\x82\x03'  # MOD, Modum
+    b'\x00\x00\x00\x01\x95\xda\xaa\xb9\x80\x46\x84\x6b\xf4\xb2\x85\x3e\x23\xcb\xa2\x36\xfa\x39\x4a\x31\x08\x04\x85\x05'  # EMONT, Etheremon Token
+    b'\x00\x00\x00\x01\x96\x0b\x23\x6a\x07\xcf\x12\x26\x63\xc4\x30\x33\x50\x60\x9a\x66\xa7\xb2\x88\xc0\x12\x04\x8a\x03'  # ANT, ANT
+    b'\x00\x00\x00\x01\x98\x3f\x6d\x60\xdb\x79\xea\x8c\xa4\xeb\x99\x68\xc6\xaf\xf8\xcf\xa0\x4b\x3c\x63\x12\x04\x8d\x03'  # SNM, SNM
+    b'\x00\x00\x00\x01\x98\x6e\xe2\xb9\x44\xc4\x2d\x01\x7f\x52\xaf\x21\xc4\xc6\x9b\x84\xdb\xea\x35\xd8\x12\x04\x90\x03'  # BMX, BitMartToken
+    b'\x00\x00\x00\x01\x98\xf5\xe9\xb7\xf0\xe3\x39\x56\xc0\x44\x3e\x81\xbf\x7d\xeb\x8b\x5b\x1e\xd5\x45\x12\x04\x93\x04'  # SEXY, Sexy Token
+    b'\x00\x00\x00\x01\x99\x4f\x0d\xff\xdb\xae\x0b\xbf\x09\xb6\x52\xd6\xf1\x1a\x49\x3f\xd3\x3f\x42\xb9\x12\x04\x97\x05'  # EAGLE, EagleCoin
+    b'\x00\x00\x00\x01\x99\x92\xec\x3c\xf6\xa5\x5b\x00\x97\x8c\xdd\xf2\xb2\x7b\xc6\x88\x2d\x88\xd1\xec\x12\x04\x9c\x04'  # POLY, Polymath Network
+    b'\x00\x00\x00\x01\x99\xea\x4d\xb9\xee\x77\xac\xd4\x0b\x11\x9b\xd1\xdc\x4e\x33\xe1\xc0\x70\xb8\x0d\x12\x04\xa0\x03'  # QSP, Quantstamp Token
+    b'\x00\x00\x00\x01\x9a\x00\x5c\x9a\x89\xbd\x72\xa4\xbd\x27\x72\x1e\x7a\x09\xa3\xc1\x1d\x2b\x03\xc4\x12\x04\xa3\x04'  # STAC, Starter Coin
+    b'\x00\x00\x00\x01\x9a\x64\x2d\x6b\x33\x68\xdd\xc6\x62\xca\x24\x4b\xad\xf3\x2c\xda\x71\x60\x05\xbc\x12\x04\xa7\x04'  # QTUM, Qtum
+    b'\x00\x00\x00\x01\x9a\xf2\xc6\xb1\xa2\x8d\x3d\x6b\xc0\x84\xbd\x26\x7f\x70\xe9\x0d\x49\x74\x1d\x5b\x08\x04\xab\x03'  # AXP, AXP
+    b'\x00\x00\x00\x01\x9b\x70\x74\x0e\x70\x8a\x08\x3c\x6f\xf3\x8d\xf5\x22\x97\x02\x0f\x5d\xfa\xa5\xee\x0a\x04\xae\x03'  # DAN, DaneelToken
+    b'\x00\x00\x00\x01\x9c\x23\xd6\x7a\xea\x7b\x95\xd8\x09\x42\xe3\x83\x6b\xcd\xf7\xe7\x08\xa7\x47\xc2\x12\x04\xb1\x04'  # LOCI, LOCIcoin
+    b'\x00\x00\x00\x01\x9e\x33\x19\x63\x6e\x21\x26\xe3\xc0\xbc\x9e\x31\x34\xae\xc5\xe1\x50\x8a\x46\xc7\x12\x04\xb5\x05'  # UTN-P, Universa
+    b'\x00\x00\x00\x01\x9e\x46\xa3\x8f\x5d\xaa\xbe\x86\x83\xe1\x07\x93\xb0\x67\x49\xee\xf7\xd7\x33\xd1\x12\x04\xba\x03'  # NCT, Nectar
+    b'\x00\x00\x00\x01\x9e\x77\xd5\xa1\x25\x1b\x6f\x7d\x45\x67\x22\xa6\xea\xc6\xd2\xd5\x98\x0b\xd8\x91\x08\x04\xbd\x04'  # BRAT, BRAT
+    b'\x00\x00\x00\x01\x9e\x88\x61\x34\x18\xcf\x03\xdc\xa5\x4d\x6a\x2c\xf6\xad\x93\x4a\x78\xc7\xa1\x7a\x12\x04\xc1\x03'  # SWM, Swarm Fund Token
+    b'\x00\x00\x00\x01\x9f\x8f\x72\xaa\x93\x04\xc8\xb5\x93\xd5\x55\xf1\x2e\xf6\x58\x9c\xc3\xa5\x79\xa2\x12\x04\xc4\x03'  # MKR, MakerDAO
+    b'\x00\x00\x00\x01\xa1\xcc\xc1\x66\xfa\xf0\xe9\x98\xb3\xe3\x32\x25\xa1\xa0\x30\x1b\x1c\x86\x11\x9d\x12\x04\xc7\x04'  # SGEL, SGELDER
+    b'\x00\x00\x00\x01\xa3\x3e\x72\x9b\xf4\xfd\xeb\x86\x8b\x53\x4e\x1f\x20\x52\x34\x63\xd9\xc4\x6b\xee\x0a\x04\xcb\x03'  # ICO, ICO
+    b'\x00\x00\x00\x01\xa5\x4d\xdc\x7b\x3c\xce\x7f\xc8\xb1\xe3\xfa\x02\x56\xd0\xdb\x80\xd2\xc1\x09\x70\x12\x04\xce\x03'  # NDC, Neverdie
+    b'\x00\x00\x00\x01\xa5\x78\xac\xc0\xcb\x78\x75\x78\x1b\x78\x80\x90\x3f\x45\x94\xd1\x3c\xfa\x8b\x98\x02\x04\xd1\x03'  # ECN, ECN
+    b'\x00\x00\x00\x01\xa5\xfd\x1a\x79\x1c\x4d\xfc\xaa\xcc\x96\x3d\x4f\x73\xc6\xae\x58\x24\x14\x9e\xa7\x12\x04\xd4\x03'  # JNT, JNT
+    b'\x00\x00\x00\x01\xa6\x45\x26\x4c\x56\x03\xe9\x6c\x3b\x0b\x07\x8c\xda\xb6\x87\x33\x79\x4b\x0a\x71\x08\x04\xd7\x04'  # MYST, Mysterium
+    b'\x00\x00\x00\x01\xa7\x44\x76\x44\x31\x19\xa9\x42\xde\x49\x85\x90\xfe\x1f\x24\x54\xd7\xd4\xac\x0d\x12\x04\xdb\x03'  # GNT, Golem
+    b'\x00\x00\x00\x01\xa7\xf9\x76\xc3\x60\xeb\xbe\xd4\x46\x5c\x28\x55\x68\x4d\x1a\xae\x52\x71\xef\xa9\x08\x04\xde\x03'  # TFL, TrueFlip
+    b'\x00\x00\x00\x01\xa8\x00\x6c\x4c\xa5\x6f\x24\xd6\x83\x67\x27\xd1\x06\x34\x93\x20\xdb\x7f\xef\x82\x08\x04\xe1\x04'  # INXT, Internxt
+    b'\x00\x00\x00\x01\xa8\x23\xe6\x72\x20\x06\xaf\xe9\x9e\x91\xc3\x0f\xf5\x29\x50\x52\xfe\x6b\x8e\x32\x12\x04\xe5\x03'  # NEU, NEU Fund
+    b'\x00\x00\x00\x01\xa8\x9b\x59\x34\x86\x34\x47\xf6\xe4\xfc\x53\xb3\x15\xa9\x3e\x87\x3b\xda\x69\xa3\x12\x04\xe8\x03'  # LUM, Lumino Coin
+    b'\x00\x00\x00\x01\xa9\x24\x0f\xbc\xac\x1f\x0b\x9a\x6a\xdf\xb0\x4a\x53\xc8\xe3\xb0\xcc\x1d\x14\x44\x12\x04\xeb\x03'  # HIG, ethereumhigh
+    b'\x00\x00\x00\x01\xa9\x87\x7b\x1e\x05\xd0\x35\x89\x91\x31\xdb\xd1\xe4\x03\x82\x51\x66\xd0\x9f\x92\x12\x04\xee\x03'  # MNT, Media Network Token
+    b'\x00\x00\x00\x01\xaa\xaf\x91\xd9\xb9\x0d\xf8\x00\xdf\x4f\x55\xc2\x05\xfd\x69\x89\xc9\x77\xe7\x3a\x08\x04\xf1\x03'  # TKN, TokenCard
+    b'\x00\x00\x00\x01\xab\x16\xe0\xd2\x5c\x06\xcb\x37\x62\x59\xcc\x18\xc1\xde\x4a\xca\x57\x60\x55\x89\x04\x04\xf4\x04'  # FUCK, FinallyUsableCryptoKarma
+    b'\x00\x00\x00\x01\xab\x6c\xf8\x7a\x50\xf1\x7d\x7f\x5e\x1f\xea\xf8\x1b\x6f\xe9\xff\xbe\x8e\xbf\x84\x12\x04\xf8\x03'  # MRV, MRV
+    b'\x00\x00\x00\x01\xab\x95\xe9\x15\xc1\x23\xfd\xed\x5b\xdf\xb6\x32\x5e\x35\xef\x55\x15\xf1\xea\x69\x12\x04\xfb\x03'  # XNN, XENON
+    b'\x00\x00\x00\x01\xab\xdf\x14\x78\x70\x23\x5f\xcf\xc3\x41\x53\x82\x8c\x76\x9a\x70\xb3\xfa\xe0\x1f\x06\x04\xfe\x04'  # EURT, EUR Tether (erc20)
+    b'\x00\x00\x00\x01\xac\x70\x9f\xcb\x44\xa4\x3c\x35\xf0\xda\x4e\x31\x63\xb1\x17\xa1\x7f\x37\x70\xf5\x12\x05\x02\x03'  # ARC, ARC
+    b'\x00\x00\x00\x01\xac\xfa\x20\x9f\xb7\x3b\xf3\xdd\x5b\xbf\xb1\x10\x1b\x9b\xc9\x99\xc4\x90\x62\xa5\x12\x05\x05\x04'  # BCDT, Blockchain Certified Data Token
+    b'\x00\x00\x00\x01\xae\x4f\x56\xf0\x72\xc3\x4c\x0a\x65\xb3\xae\x3e\x4d\xb7\x97\xd8\x31\x43\x9d\x93\x08\x05\x09\x03'  # GIM, Gimli
+    b'\x00\x00\x00\x01\xae\x73\xb3\x8d\x1c\x9a\x8b\x27\x41\x27\xec\x30\x16\x0a\x49\x27\xc4\xd7\x18\x24\x12\x05\x0c\x03'  # STK, STK Token
+    b'\x00\x00\x00\x01\xae\xc2\xe8\x7e\x0a\x23\x52\x66\xd9\xc5\xad\xc9\xde\xb4\xb2\xe2\x9b\x54\xd0\x09\x00\x05\x0f\x05'  # SNGLS, SingularDTV
+    b'\x00\x00\x00\x01\xae\xc9\x8a\x70\x88\x10\x41\x48\x78\xc3\xbc\xdf\x46\xaa\xd3\x1d\xed\x4a\x45\x57\x12\x05\x14\x03'  # 300, 300 Token Sparta
+    b'\x00\x00\x00\x01\xae\xf3\x8f\xbf\xbf\x93\x2d\x1a\xef\x3b\x80\x8b\xc8\xfb\xd8\xcd\x8e\x1f\x8b\xc5\x08\x05\x17\x03'  # CRB, CRB
+    b'\x00\x00\x00\x01\xaf\x30\xd2\xa7\xe9\x0d\x7d\xc3\x61\xc8\xc4\x58\x5e\x9b\xb7\xd2\xf6\xf1\x5b\xc7\x12\x05\x1a\x03'  # 1ST, FirstBlood
+    b'\x00\x00\x00\x01\xaf\x4d\xce\x16\xda\x28\x77\xf8\xc9\xe0\x05\x44\xc9\x3b\x62\xac\x40\x63\x1f\x16\x05\x05\x1d\x03'  # MTH, Monetha
+    b'\x00\x00\x00\x01\xaf\xc3\x97\x88\xc5\x1f\x0c\x1f\xf7\xb5\x53\x17\xf3\xe7\x02\x99\xe5\x21\xff\xf6\x08\x05\x20\x04'  # eBCH, eBCH
+    b'\x00\x00\x00\x01\xaf\xe6\x05\x11\x34\x1a\x37\x48\x8d\xe2\x5b\xef\x35\x19\x52\x56\x2e\x31\xfc\xc1\x08\x05\x24\x03'  # TBT, TBitBot
+    b'\x00\x00\x00\x01\xb1\x10\xec\x7b\x1d\xcb\x8f\xab\x8d\xed\xbf\x28\xf5\x3b\xc6\x3e\xa5\xbe\xdd\x84\x08\x05\x27\x03'  # XID, XID
+    b'\x00\x00\x00\x01\xb1\x5f\xe5\xa1\x23\xe6\x47\xba\x59\x4c\xea\x7a\x1e\x64\x86\x46\xf9\x5e\xb4\xaa\x12\x05\x2a\x02'  # SS, Sharder
+    b'\x00\x00\x00\x01\xb2\x3b\xe7\x35\x73\xbc\x7e\x03\xdb\x6e\x5d\xfc\x62\x40\x53\x68\x71\x6d\x28\xa8\x12\x05\x2c\x04'  # ONEK, One K Token
+    b'\x00\x00\x00\x01\xb2\x47\x54\xbe\x79\x28\x15\x53\xdc\x1a\xdc\x16\x0d\xdf\x5c\xd9\xb7\x43\x61\xa4\x09\x05\x30\x03'  # XRL, XRL
+    b'\x00\x00\x00\x01\xb2\xbf\xeb\x70\xb9\x03\xf1\xba\xac\x7f\x2b\xa2\xc6\x29\x34\xc7\xe5\xb9\x74\xc4\x08\x05\x33\x03'  # BKB, BetKing Bankroll Token
+    b'\x00\x00\x00\x01\xb2\xf7\xeb\x1f\x2c\x37\x64\x5b\xe6\x1d\x73\x95\x30\x35\x36\x0e\x76\x8d\x81\xe6\x12\x05\x36\x03'  # COB, Cobinhood Token
+    b'\x00\x00\x00\x01\xb3\xbd\x49\xe2\x8f\x8f\x83\x2b\x8d\x1e\x24\x61\x06\x99\x1e\x54\x6c\x32\x35\x02\x12\x05\x39\x03'  # GMT, GMT
+    b'\x00\x00\x00\x01\xb4\x5d\x7b\xc4\xce\xbc\xab\x98\xad\x09\xba\xbd\xf8\xc8\x18\xb2\x29\x2b\x67\x2c\x12\x05\x3c\x04'  # HODL, HODLCoin
+    b'\x00\x00\x00\x01\xb4\xb1\xd2\xc2\x17\xec\x07\x76\x58\x4c\xe0\x8d\x3d\xd9\x8f\x90\xed\xed\xa4\x4b\x12\x05\x40\x03'  # CO2, Climatecoin
+    b'\x00\x00\x00\x01\xb4\xef\xd8\x5c\x19\x99\x9d\x84\x25\x13\x04\xbd\xa9\x9e\x90\xb9\x23\x00\xbd\x93\x12\x05\x43\x03'  # RPL, Rocket Pool
+    b'\x00\x00\x00\x01\xb5\x3a\x96\xbc\xbd\xd9\xcf\x78\xdf\xf2\x0b\xab\x6c\x2b\xe7\xba\xec\x8f\x00\xf8\x08\x05\x46\x04'  # eGAS, ETH GAS
+    b'\x00\x00\x00\x01\xb5\xa5\xf2\x26\x94\x35\x2c\x15\xb0\x03\x23\x84\x4a\xd5\x45\xab\xb2\xb1\x10\x28\x12\x05\x4a\x03'  # ICX, ICON
+    b'\x00\x00\x00\x01\xb6\x3b\x60\x6a\xc8\x10\xa5\x2c\xca\x15\xe4\x4b\xb6\x30\xfd\x42\xd8\xd1\xd8\x3d\x08\x05\x4d\x03'  # MCO, MCO
+    b'\x00\x00\x00\x01\xb6\x4e\xf5\x1c\x88\x89\x72\xc9\x08\xcf\xac\xf5\x9b\x47\xc1\xaf\xbc\x0a\xb8\xac\x08\x05\x50\x05'  # STORJ, STORJ
+    b'\x00\x00\x00\x01\xb6\x77\x34\x52\x1e\xab\xbe\x9c\x77\x37\x29\xdb\x73\xe1\x6c\xc2\xdf\xb2\x0a\x58\x02\x05\x55\x04'  # E₹, eRupee
+    b'\x00\x00\x00\x01\xb6\x7b\x88\xa2\x57\x08\xa3\x5a\xe7\xc2\xd7\x36\xd3\x98\xd2\x68\xce\x4f\x7f\x83\x08\x05\x59\x04'  # EMON, Etheremon
+    b'\x00\x00\x00\x01\xb6\xee\x96\x68\x77\x1a\x79\xbe\x79\x67\xee\x29\xa6\x3d\x41\x84\xf8\x09\x71\x43\x12\x05\x5d\x03'  # CXO, CargoX
+    b'\x00\x00\x00\x01\xb7\x08\x35\xd7\x82\x2e\xbb\x94\x26\xb5\x65\x43\xe3\x91\x84\x6c\x10\x7b\xd3\x2c\x12\x05\x60\x03'  # GTC, GTC Token
+    b'\x00\x00\x00\x01\xb8\x02\xb2\x4e\x06\x37\xc2\xb8\x7d\x2e\x8b\x77\x84\xc0\x55\xbb\xe9\x21\x01\x1a\x02\x05\x63\x03'  # EMV, EMovieVenture
+    b'\x00\x00\x00\x01\xb8\xc7\x74\x82\xe4\x5f\x1f\x44\xde\x17\x45\xf5\x2c\x74\x42\x6c\x63\x1b\xdd\x52\x12\x05\x66\x03'  # BNB, BNB
+    b'\x00\x00\x00\x01\xb9\x13\x18\xf3\x5b\xdb\x26\x2e\x94\x23\xbc\x7c\x7c\x2a\x3a\x93\xdd\x93\xc9\x2c\x12\x05\x69\x04'  # NULS, NULS
+    b'\x00\x00\x00\x01\xb9\x70\x48\x62\x8d\xb6\xb6\x61\xd4\xc2\xaa\x83\x3e\x95\xdb\xe1\xa9\x05\xb2\x80\x12\x05\x6d\x03'  # PAY, TenX
+    b'\x00\x00\x00\x01\xb9\x8d\x4c\x97\x42\x5d\x99\x08\xe6\x6e\x53\xa6\xfd\xf6\x73\xac\xca\x0b\xe9\x86\x12\x05\x70\x03'  # ABT, ArcBlock Token
+    b'\x00\x00\x00\x01\xb9\xe7\xf8\x56\x8e\x08\xd5\x65\x9f\x5d\x29\xc4\x99\x71\x73\xd8\x4c\xdf\x26\x07\x12\x05\x73\x03'  # SWT, Swarm City Token
+    b'\x00\x00\x00\x01\xba\x18\x7b\x09\xff\xa8\xdd\xdc\x80\xd2\x57\x1e\xd3\xcb\xc4\xbe\x0a\xf6\x9e\x0c\x12\x05\x76\x03'  # DKP, Draggin Karma Points
+    b'\x00\x00\x00\x01\xba\x21\x84\x52\x0a\x1c\xc4\x9a\x61\x59\xc5\x7e\x61\xe1\x84\x4e\x08\x56\x15\xb6\x08\x05\x79\x03'  # HGT, HGT
+    b'\x00\x00\x00\x01\xba\x5f\x11\xb1\x6b\x15\x57\x92\xcf\x3b\x2e\x68\x80\xe8\x70\x68\x59\xa8\xae\xb6\x08\x05\x7c\x03'  # ARN, Aeron Token
+    b'\x00\x00\x00\x01\xbb\x9b\xc2\x44\xd7\x98\x12\x3f\xde\x78\x3f\xcc\x1c\x72\xd3\xbb\x8c\x18\x94\x13\x10\x05\x7f\x03'  # DAO, DAO
+    b'\x00\x00\x00\x01\xbc\x12\x34\x55\x2e\xbe\xa3\x2b\x51\x21\x19\x03\x56\xbb\xa6\xd3\xbb\x22\x5b\xb5\x12\x05\x82\x03'  # BCL, BCL
+    b'\x00\x00\x00\x01\xbd\xc5\xba\xc3\x9d\xbe\x13\x2b\x1e\x03\x0e\x89\x8a\xe3\x83\x00\x17\xd7\xd9\x69\x12\x05\x85\x04'  # SNOV, SNOV
+    b'\x00\x00\x00\x01\xbe\x11\xee\xb1\x86\xe6\x24\xb8\xf2\x6a\x50\x45\x57\x5a\x13\x40\xe4\x05\x45\x52\x12\x05\x89\x0d'  # CCC (ICONOMI), CCC (ICONOMI)
+    b'\x00\x00\x00\x01\xbe\x99\xb0\x97\x09\xfc\x75\x3b\x09\xbc\xf5\x57\xa9\x92\xf6\x60\x5d\x59\x97\xb0\x08\x05\x96\x04'  # RLTY, SMARTRealty
+    b'\x00\x00\x00\x01\xbe\xb9\xef\x51\x4a\x37\x9b\x99\x7e\x07\x98\xfd\xcc\x90\x1e\xe4\x74\xb6\xd9\xa1\x12\x05\x9a\x03'  # MLN, Melonport
+    b'\x00\x00\x00\x01\xbf\x21\x79\x85\x9f\xc6\xd5\xbe\xe9\xbf\x91\x58\x63\x2d\xc5\x16\x78\xa4\x10\x0e\x12\x05\x9d\x03'  # ELF, ELF Token
+    b'\x00\x00\x00\x01\xbf\x4c\xfd\x7d\x1e\xde\xee\xa5\xf6\x60\x08\x27\x41\x1b\x41\xa2\x1e\xb0\x8a\xbd\x02\x05\xa0\x03'  # CTL, CTL
+    b'\x00\x00\x00\x01\xc0\x2a\xaa\x39\xb2\x23\xfe\x8d\x0a\x0e\x5c\x4f\x27\xea\xd9\x08\x3c\x75\x6c\xc2\x12\x05\xa3\x04'  # WETH, WETH
+    b'\x00\x00\x00\x01\xc0\xeb\x85\x28\x5d\x83\x21\x7c\xd7\xc8\x91\x70\x2b\xcb\xc0\xfc\x40\x1e\x2d\x9d\x08\x05\xa7\x03'  # HVN, Hive Project
+    b'\x00\x00\x00\x01\xc1\x48\x30\xe5\x3a\xa3\x44\xe8\xc1\x46\x03\xa9\x12\x29\xa0\xb9\x25\xb0\xb2\x62\x08\x05\xaa\x03'  # PXT, Populous XBRL Token (PXT)
+    b'\x00\x00\x00\x01\xc1\x66\x03\x87\x05\xff\xba\xb3\x79\x41\x85\xb3\xa9\xd9\x25\x63\x2a\x1d\xf3\x7d\x12\x05\xad\x03'  # CC3, Coal Coin
+    b'\x00\x00\x00\x01\xc2\x7a\x2f\x05\xfa\x57\x7a\x83\xba\x0f\xdb\x4c\x38\x44\x3c\x07\x18\x35\x65\x01\x12\x05\xb0\x03'  # TAU, Lamden Tau
+    b'\x00\x00\x00\x01\xc2\xc6\x3f\x23\xec\x5e\x97\xef\xbd\x75\x65\xdf\x9e\xc7\x64\xfd\xc7\xd4\xe9\x1d\x12\x05\xb3\x03'  # BOU, Boule Coin
+    b'\x00\x00\x00\x01\xc3\x4b\x21\xf6\xf8\xe5\x1c\xc9\x65\xc2\x39\x3b\x3c\xcf\xa3\xb8\x2b\xeb\x24\x03\x06\x05\xb6\x03'  # IoT, IoTコイン
+    b'\x00\x00\x00\x01\xc4\x22\x09\xac\xcc\x14\x02\x9c\x10\x12\xfb\x56\x80\xd9\x5f\xbd\x60\x36\xe2\xa0\x12\x05\xb9\x03'  # PPP, PayPie
+    b'\x00\x00\x00\x01\xc6\x6e\xa8\x02\x71\x7b\xfb\x98\x33\x40\x02\x64\xdd\x12\xc2\xbc\xea\xa3\x4a\x6d\x12\x05\xbc\x07'  # OLD_MKR, MakerDAO
+    b'\x00\x00\x00\x01\xc7\x98\xcd\x1c\x49\xdb\x0e\x29\x73\x12\xe4\xc6\x82\x75\x26\x68\xce\x1d\xb2\xad\x05\x05\xc3\x03'  # LFR, LifeRun Coin
+    b'\x00\x00\x00\x01\xc8\xc6\xa3\x1a\x4a\x80\x6d\x37\x10\xa7\xb3\x8b\x7b\x29\x6d\x2f\xab\xcc\xdb\xa8\x12\x05\xc6\x04'  # ELIX, Elixir Token
+    b'\x00\x00\x00\x01\xc9\x8e\x06\x39\xc6\xd2\xec\x03\x7a\x61\x53\x41\xc3\x69\x66\x6b\x11\x0e\x80\xe5\x08\x05\xca\x04'  # EXMR, eXMRcoin
+    b'\x00\x00\x00\x01\xc9\xde\x4b\x7f\x0c\x3d\x99\x1e\x96\x71\x58\xe4\xd4\xbf\xa4\xb5\x1e\xc0\xb1\x14\x12\x05\xce\x03'  # ROK, Rocketchain
+    b'\x00\x00\x00\x01\xcb\x3f\x90\x2b\xf9\x76\x26\x39\x1b\xf8\xba\x87\x26\x4b\xbc\x3d\xc1\x34\x69\xbe\x12\x05\xd1\x03'  # TRC, The Real Coin
+    b'\x00\x00\x00\x01\xcb\x94\xbe\x6f\x13\xa1\x18\x2e\x4a\x4b\x61\x40\xcb\x7b\xf2\x02\x5d\x28\xe4\x1b\x06\x05\xd4\x04'  # TRST, TRST
+    b'\x00\x00\x00\x01\xcb\x97\xe6\x5f\x07\xda\x24\xd4\x6b\xcd\xd0\x78\xeb\xeb\xd7\xc6\xe6\xe3\xd7\x50\x08\x05\xd8\x03'  # BTM, Bytom
+    b'\x00\x00\x00\x01\xcb\xcc\x0f\x03\x6e\xd4\x78\x8f\x63\xfc\x0f\xee\x32\x87\x3d\x6a\x74\x87\xb9\x08\x08\x05\xdb\x03'  # HMQ, HMQ
+    b'\x00\x00\x00\x01\xcc\x34\x36\x6e\x38\x42\xca\x1b\xd3\x6c\x1f\x32\x4d\x15\x25\x79\x60\xfc\xc8\x01\x12\x05\xde\x03'  # BON, Bonpay
+    b'\x00\x00\x00\x01\xcc\x4e\xf9\xee\xaf\x65\x6a\xc1\xa2\xab\x88\x67\x43\xe9\x8e\x97\xe0\x90\xed\x38\x12\x05\xe1\x03'  # DDF, DDF
+    b'\x00\x00\x00\x01\xcc\xed\x5b\x82\x88\x08\x6b\xe8\xc3\x8e\x23\x56\x7e\x68\x4c\x37\x40\xbe\x4d\x48\x0a\x05\xe4\x03'  # RLT, RLT
+    b'\x00\x00\x00\x01\xce\x59\xd2\x9b\x09\xaa\xe5\x65\xfe\xee\xf8\xe5\x2f\x47\xc3\xcd\x53\x68\xc6\x63\x12\x05\xe7\x0d'  # BLX (Bullion), Bullion Crypto
+    b'\x00\x00\x00\x01\xce\xd4\xe9\x31\x98\x73\x4d\xda\xff\x84\x92\xd5\x25\xbd\x25\x8d\x49\xeb\x38\x8e\x12\x05\xf4\x03'  # EDO, Eidoo
+    b'\x00\x00\x00\x01\xcf\xb9\x86\x37\xbc\xae\x43\xc1\x33\x23\xea\xa1\x73\x1c\xed\x2b\x71\x69\x62\xfd\x12\x05\xf7\x03'  # NET, NIMIQ
+    b'\x00\x00\x00\x01\xcf\xd6\xae\x8b\xf1\x3f\x42\xde\x14\x86\x73\x51\xea\xff\x7a\x8a\x3b\x9f\xbb\xe7\x08\x05\xfa\x03'  # SNG, SINERGIA
+    b'\x00\x00\x00\x01\xd0\x1d\xb7\x3e\x04\x78\x55\xef\xb4\x14\xe6\x20\x20\x98\xc4\xbe\x4c\xd2\x42\x3b\x12\x05\xfd\x03'  # UQC, Uquid Coin
+    b'\x00\x00\x00\x01\xd0\xa4\xb8\x94\x6c\xb5\x2f\x06\x61\x27\x3b\xfb\xc6\xfd\x0e\x0c\x75\xfc\x64\x33\x12\x06\x00\x05'  # STORM, Storm Token
+    b'\x00\x00\x00\x01\xd0\xd6\xd6\xc5\xfe\x4a\x67\x7d\x34\x3c\xc4\x33\x53\x6b\xb7\x17\xba\xe1\x67\xdd\x09\x06\x05\x03'  # ADT, AdToken
+    b'\x00\x00\x00\x01\xd2\x34\xbf\x24\x10\xa0\x00\x9d\xf9\xc3\xc6\x3b\x61\x0c\x09\x73\x8f\x18\xcc\xd7\x08\x06\x08\x03'  # DTR, DTR
+    b'\x00\x00\x00\x01\xd2\x48\xb0\xd4\x8e\x44\xaa\xf9\xc4\x9a\xea\x03\x12\xbe\x7e\x13\xa6\xdc\x14\x68\x01\x06\x0b\x03'  # SGT, SGT
+    b'\x00\x00\x00\x01\xd2\x61\x14\xcd\x6e\xe2\x89\xac\xcf\x82\x35\x0c\x8d\x84\x87\xfe\xdb\x8a\x0c\x07\x12\x06\x0e\x03'  # OMG, OMG
+    b'\x00\x00\x00\x01\xd2\xd6\x15\x86\x83\xae\xe4\xcc\x83\x80\x67\x72\x72\x09\xa0\xaa\xf4\x35\x9d\xe3\x12\x06\x11\x04'  # BNTY, Bounty0x Token
+    b'\x00\x00\x00\x01\xd3\x41\xd1\x68\x0e\xee\xe3\x25\x5b\x8c\x4c\x75\xbc\xce\x7e\xb5\x7f\x14\x4d\xae\x12\x06\x15\x03'  # onG, onG
+    b'\x00\x00\x00\x01\xd3\x48\xe0\x7a\x28\x06\x50\x5b\x85\x61\x23\x04\x5d\x27\xae\xed\x90\x92\x4b\x50\x08\x06\x18\x04'  # CCLC, Christ Coin
+    b'\x00\x00\x00\x01\xd3\xc0\x07\x72\xb2\x4d\x99\x7a\x81\x22\x49\xca\x63\x7a\x92\x1e\x81\x35\x77\x01\x12\x06\x1c\x04'  # WILD, WILD Token
+    b'\x00\x00\x00\x01\xd4\xc4\x35\xf5\xb0\x9f\x85\x5c\x33\x17\xc8\x52\x4c\xb1\xf5\x86\xe4\x27\x95\xfa\x12\x06\x20\x03'  # CND, Cindicator
+    b'\x00\x00\x00\x01\xd4\xcf\xfe\xef\x10\xf6\x0e\xca\x58\x1b\x5e\x11\x46\xb5\xac\xa4\x19\x4a\x4c\x3b\x12\x06\x23\x04'  # DUBI, Decentralized Universal Basic Income
+    b'\x00\x00\x00\x01\xd4\xfa\x14\x60\xf5\x37\xbb\x90\x85\xd2\x2c\x7b\xcc\xb5\xdd\x45\x0e\xf2\x8e\x3a\x08\x06\x27\x03'  # PPT, Populous
+    b'\x00\x00\x00\x01\xd6\xe3\x54\xf0\x73\x19\xe2\x47\x44\x91\xd8\xc7\xc7\x12\x13\x7b\xee\x68\x62\xa2\x00\x06\x2a\x04'  # LEMO, Lemo
+    b'\x00\x00\x00\x01\xd7\x63\x17\x87\xb4\xdc\xc8\x7b\x12\x54\xcf\xd1\xe5\xce\x48\xe9\x68\x23\xde\xe8\x08\x06\x2e\x03'  # SCL, SocialCoin
+    b'\x00\x00\x00\x01\xd7\x80\xae\x2b\xf0\x4c\xd9\x6e\x57\x7d\x3d\x01\x47\x62\xf8\x31\xd9\x71\x29\xd0\x12\x06\x31\x03'  # EVN, Envion AG
+    b'\x00\x00\x00\x01\xd8\x50\x94\x2e\xf8\x81\x1f\x2a\x86\x66\x92\xa6\x23\x01\x1b\xde\x52\xa4\x62\xc1\x12\x06\x34\x03'  # VET, Vechain
+    b'\x00\x00\x00\x01\xd8\x91\x2c\x10\x68\x1d\x8b\x21\xfd\x37\x42\x24\x4f\x44\x65\x8d\xba\x12\x26\x4e\x12\x06\x37\x03'  # PLU, Plutus
+    b'\x00\x00\x00\x01\xda\x6c\xb5\x8a\x0d\x0c\x01\x61\x0a\x29\xc5\xa6\x5c\x30\x3e\x13\xe8\x85\x88\x7c\x12\x06\x3a\x02'  # cV, carVertical
+    b'\x00\x00\x00\x01\xda\xb0\xc3\x1b\xf3\x4c\x89\x7f\xb0\xfe\x90\xd1\x2e\xc9\x40\x1c\xaf\x5c\x36\xec\x00\x06\x3c\x03'  # DAB, DAB
+    b'\x00\x00\x00\x01\xda\xc1\x7f\x95\x8d\x2e\xe5\x23\xa2\x20\x62\x06\x99\x45\x97\xc1\x3d\x83\x1e\xc7\x06\x06\x3f\x04'  # USDT, USD Tether (erc20)
+    b'\x00\x00\x00\x01\xdd\x00\x72\x78\xb6\x67\xf6\xbe\xf5\x2f\xd0\xa4\xc2\x36\x04\xaa\x1f\x96\x03\x9a\x08\x06\x43\x04'  # RIPT, RiptideCoin
+    b'\x00\x00\x00\x01\xdd\x6b\xf5\x6c\xa2\xad\xa2\x4c\x68\x3f\xac\x50\xe3\x77\x83\xe5\x5b\x57\xaf\x9f\x0c\x06\x47\x03'  # BNC, BNC
+    b'\x00\x00\x00\x01\xdd\x94\xde\x9c\xfe\x06\x35\x77\x05\x1a\x5e\xb7\x46\x5d\x08\x31\x7d\x88\x08\xb6\x00\x06\x4a\x0d'  # Devcon2 Token, Devcon2 Token
+    b'\x00\x00\x00\x01\xdd\x97\x4d\x5c\x2e\x29\x28\xde\xa5\xf7\x1b\x98\x25\xb8\xb6\x46\x68\x6b\xd2\x00\x12\x06\x57\x03'  # KNC, Kyber Network
+    b'\x00\x00\x00\x01\xdf\x6e\xf3\x43\x35\x07\x80\xbf\x8c\x34\x10\xbf\x06\x2e\x0c\x01\x5b\x1d\xd6\x71\x08\x06\x5a\x03'  # BMC, Blackmoon Crypto BMC Token
+    b'\x00\x00\x00\x01\xe0\x6e\xda\x74\x35\xba\x74\x9b\x04\x73\x80\xce\xd4\x91\x21\xdd\xe9\x33\x34\xae\x00\x06\x5d\x03'  # SET, SET
+    b'\x00\x00\x00\x01\xe0\xb7\x92\x7c\x4a\xf2\x37\x65\xcb\x51\x31\x4a\x0e\x05\x21\xa9\x64\x5f\x0e\x2a\x09\x06\x60\x03'  # DGD, Digix DAO
+    b'\x00\x00\x00\x01\xe2\x00\x64\x18\x90\x77\x2f\xce\x8e\xe6\xed\xc5\x35\x4c\xce\xa3\x0a\xc9\x2f\x49\x12\x06\x63\x03'  # WHO, WhoHas
+    b'\x00\x00\x00\x01\xe2\x3c\xd1\x60\x76\x1f\x63\xfc\x3a\x1c\xf7\x8a\xa0\x34\xb6\xcd\xf9\x7d\x3e\x0c\x12\x06\x66\x03'  # MIT, MIT
+    b'\x00\x00\x00\x01\xe2\x65\x17\xa9\x96\x72\x99\x45\x3d\x3f\x1b\x48\xaa\x00\x5e\x61\x27\xe6\x72\x10\x12\x06\x69\x05'  # NIMFA, Ninfa Money
+    b'\x00\x00\x00\x01\xe2\xe6\xd4\xbe\x08\x6c\x69\x38\xb5\x3b\x22\x14\x48\x55\xee\xf6\x74\x28\x16\x39\x12\x06\x6e\x0d'  # LINK Platform, Link Platform
+    b'\x00\x00\x00\x01\xe3\x81\x85\x04\xc1\xb3\x2b\xf1\x55\x7b\x16\xc2\x38\xb2\xe0\x1f\xd3\x14\x9c\x17\x12\x06\x7b\x03'  # PLR, Pillar Project
+    b'\x00\x00\x00\x01\xe3\x83\x1c\x5a\x98\x2b\x27\x9a\x19\x84\x56\xd5\x77\xcf\xb9\x04\x24\xcb\x63\x40\x06\x06\x7e\x03'  # IMC, Immune Coin
+    b'\x00\x00\x00\x01\xe3\x86\xb1\x39\xed\x37\x15\xca\x4b\x18\xfd\x52\x67\x1b\xdc\xea\x1c\xdf\xe4\xb1\x08\x06\x81\x03'  # ZST, Zeus Exchange
+    b'\x00\x00\x00\x01\xe3\xfa\x17\x7a\xce\xcf\xb8\x67\x21\xcf\x6f\x9f\x42\x06\xbd\x3b\xd6\x72\xd7\xd5\x12\x06\x84\x03'  # CTT, ChainTrade Token
+    b'\x00\x00\x00\x01\xe4\x1d\x24\x89\x57\x1d\x32\x21\x89\x24\x6d\xaf\xa5\xeb\xde\x1f\x46\x99\xf4\x98\x12\x06\x87\x03'  # ZRX, 0x Project
+    b'\x00\x00\x00\x01\xe4\x3e\x20\x41\xdc\x37\x86\xe1\x66\x96\x1e\xd9\x48\x4a\x55\x39\x03\x3d\x10\xfb\x12\x06\x8a\x03'  # DNX, DenCity
+    b'\x00\x00\x00\x01\xe4\x77\x29\x2f\x1b\x32\x68\x68\x7a\x29\x37\x61\x16\xb0\xed\x27\xa9\xc7\x61\x70\x12\x06\x8d\x04'  # PLAY, HeroCoin
+    b'\x00\x00\x00\x01\xe4\xc9\x4d\x45\xf7\xae\xf7\x01\x8a\x5d\x66\xf4\x4a\xf7\x80\xec\x60\x23\x37\x8e\x06\x06\x91\x0c'  # CryptoCarbon, CryptoCarbon
+    b'\x00\x00\x00\x01\xe5\x03\x65\xf5\xd6\x79\xcb\x98\xa1\xdd\x62\xd6\xf6\xe5\x8e\x59\x32\x1b\xcd\xdf\x12\x06\x9d\x02'  # LA, LATOKEN
+    b'\x00\x00\x00\x01\xe5\xa7\xc1\x29\x72\xf3\xbb\xfe\x70\xed\x29\x52\x1c\x89\x49\xb8\xaf\x6a\x09\x70\x12\x06\x9f\x0d'  # BLX (Iconomi), Iconomi
+    b'\x00\x00\x00\x01\xe6\x45\x09\xf0\xbf\x07\xce\x2d\x29\xa7\xef\x19\xa8\xa9\xbc\x06\x54\x77\xc1\xb4\x08\x06\xac\x04'  # PIPL, PIPL Coin
+    b'\x00\x00\x00\x01\xe6\xf7\x4d\xcf\xa0\xe2\x08\x83\x00\x8d\x8c\x16\xb6\xd9\xa3\x29\x18\x9d\x0c\x30\x02\x06\xb0\x03'  # FTC, FTC
+    b'\x00\x00\x00\x01\xe7\x77\x5a\x6e\x9b\xcf\x90\x4e\xb3\x9d\xa2\xb6\x8c\x5e\xfb\x4f\x93\x60\xe0\x8c\x06\x06\xb3\x04'  # TaaS, Token-as-a-Service
+    b'\x00\x00\x00\x01\xe8\x78\x0b\x48\xbd\xb0\x5f\x92\x86\x97\xa5\xe8\x15\x5f\x67\x2e\xd9\x14\x62\xf7\x12\x06\xb7\x03'  # CAS, Cashaa
+    b'\x00\x00\x00\x01\xe8\xa1\xdf\x95\x8b\xe3\x79\x04\x5e\x2b\x46\xa3\x1a\x98\xb9\x3a\x2e\xcd\xfd\xed\x12\x06\xba\x03'  # ESZ, ESZCoin
+    b'\x00\x00\x00\x01\xe8\xff\x5c\x9c\x75\xde\xb3\x46\xac\xac\x49\x3c\x46\x3c\x89\x50\xbe\x03\xdf\xba\x12\x04\x22\x05'  # VIBEX, VIBEX
+    b'\x00\x00\x00\x01\xe9\x33\xc0\xcd\x97\x84\x41\x4d\x5f\x27\x8c\x11\x49\x04\xf5\xa8\x4b\x39\x69\x19\x12\x06\x63\x03'  # WHO, WhoHas
+    b'\x00\x00\x00\x01\xe9\x43\x27\xd0\x7f\xc1\x79\x07\xb4\xdb\x78\x8e\x5a\xdf\x2e\xd4\x24\xad\xdf\xf6\x12\x06\xbd\x03'  # REP, Augur
+    b'\x00\x00\x00\x01\xe9\xff\x07\x80\x9c\xcf\xf0\x5d\xae\x74\x99\x0e\x25\x83\x1d\x0b\xc5\xcb\xe5\x75\x12\x06\xc0\x03'  # Hdp, HEdpAY
+    b'\x00\x00\x00\x01\xea\x1f\x34\x6f\xaf\x02\x3f\x97\x4e\xb5\xad\xaf\x08\x8b\xbc\xdf\x02\xd7\x61\xf4\x12\x06\xc3\x03'  # TIX, Blocktix
+    b'\x00\x00\x00\x01\xea\x38\xea\xa3\xc8\x6c\x8f\x9b\x75\x15\x33\xba\x2e\x56\x2d\xeb\x9a\xcd\xed\x40\x12\x06\xc6\x04'  # FUEL, Etherparty FUEL
+    b'\x00\x00\x00\x01\xea\x5f\x88\xe5\x4d\x98\x2c\xbb\x0c\x44\x1c\xde\x4e\x79\xbc\x30\x5e\x5b\x43\xbc\x12\x06\xca\x06'  # PARETO, PARETO
+    b'\x00\x00\x00\x01\xea\x61\x0b\x11\x53\x47\x77\x20\x74\x8d\xc1\x3e\xd3\x78\x00\x39\x41\xd8\x4f\xab\x12\x06\xd0\x04'  # ALIS, ALIS Token
+    b'\x00\x00\x00\x01\xea\xb4\x31\x93\xcf\x06\x23\x07\x3c\xa8\x9d\xb9\xb7\x12\x79\x63\x56\xfa\x74\x14\x12\x06\xd4\x05'  # GOLDX, GOLDX
+    b'\x00\x00\x00\x01\xeb\x7c\x20\x02\x71\x72\xe5\xd1\x43\xfb\x03\x0d\x50\xf9\x1c\xec\xe2\xd1\x48\x5d\x08\x06\xd9\x04'  # eBTC, eBTC
+    b'\x00\x00\x00\x01\xeb\x99\x51\x02\x16\x98\xb4\x2e\x43\x99\xf9\xcb\xb6\x26\x7a\xa3\x5f\x82\xd5\x9d\x12\x06\xdd\x03'  # LIF, LIF
+    b'\x00\x00\x00\x01\xeb\xed\x4f\xf9\xfe\x34\x41\x3d\xb8\xfc\x82\x94\x55\x6b\xbd\x15\x28\xa4\xda\xca\x03\x06\xe0\x05'  # VENUS, VENUS
+    b'\x00\x00\x00\x01\xec\x18\xf8\x98\xb4\x07\x6a\x3e\x18\xf1\x08\x9d\x33\x37\x6c\xc3\x80\xbd\xe6\x1d\x12\x06\xe5\x05'  # PETRO, PETRO
+    b'\x00\x00\x00\x01\xec\x46\xf8\x20\x7d\x76\x60\x12\x45\x4c\x40\x8d\xe2\x10\xbc\xbc\x22\x43\xe7\x1c\x12\x06\xea\x03'  # NOX, NOX
+    b'\x00\x00\x00\x01\xec\xd5\x70\xbb\xf7\x47\x61\xb9\x60\xfa\x04\xcc\x10\xfe\x2c\x4e\x86\xff\xda\x36\x08\x06\xed\x03'  # STP, StashPay
+    b'\x00\x00\x00\x01\xed\x24\x79\x80\x39\x6b\x10\x16\x9b\xb1\xd3\x6f\x6e\x27\x8e\xd1\x67\x00\xa6\x0f\x04\x06\xf0\x03'  # AVA, AVA
+    b'\x00\x00\x00\x01\xed\xba\xf3\xc5\x10\x03\x02\xdc\xdd\xa5\x32\x69\x32\x2f\x37\x30\xb1\xf0\x41\x6d\x05\x06\xf3\x03'  # VRS, Veros
+    b'\x00\x00\x00\x01\xee\x60\x9f\xe2\x92\x12\x8c\xad\x03\xb7\x86\xdb\xb9\xbc\x26\x34\xcc\xdb\xe7\xfc\x12\x06\xf6\x03'  # POS, PoSToken
+    b'\x00\x00\x00\x01\xee\xf6\xe9\x00\x34\xee\xa8\x9e\x31\xeb\x4b\x8e\xac\xd3\x23\xf2\x8a\x92\xea\xe4\x12\x06\xf9\x03'  # DOW, DOW
+    b'\x00\x00\x00\x01\xef\x2e\x99\x66\xeb\x61\xbb\x49\x4e\x53\x75\xd5\xdf\x8d\x67\xb7\xdb\x8a\x78\x0d\x00\x06\xfc\x04'  # SHIT, SHIT
+    b'\x00\x00\x00\x01\xef\x68\xe7\xc6\x94\xf4\x0c\x82\x02\x82\x1e\xdf\x52\x5d\xe3\x78\x24\x58\x63\x9f\x12\x07\x00\x03'  # LRC, LRC
+    b'\x00\x00\x00\x01\xef\x6b\x4c\xe8\xc9\xbc\x83\x74\x4f\xbc\xde\x26\x57\xb3\x2e\xc1\x87\x90\x45\x8a\x00\x07\x03\x03'  # PUC, Pour Coin
+    b'\x00\x00\x00\x01\xf0\x28\xad\xee\x51\x53\x3b\x1b\x47\xbe\xaa\x89\x0f\xeb\x54\xa4\x57\xf5\x1e\x89\x12\x07\x06\x03'  # BMT, BMT
+    b'\x00\x00\x00\x01\xf0\x4a\x8a\xc5\x53\xfc\xed\xb5\xba\x99\xa6\x47\x99\x15\x58\x26\xc1\x36\xb0\xbe\x12\x07\x09\x05'  # FLIXX, FLIXX
+    b'\x00\x00\x00\x01\xf0\x5a\x93\x82\xa4\xc3\xf2\x9e\x27\x84\x50\x27\x54\x29\x3d\x88\xb8\x35\x10\x9c\x12\x07\x0e\x03'  # REX, REX
+    b'\x00\x00\x00\x01\xf0\xda\x11\x86\xa4\x97\x72\x26\xb9\x13\x5d\x06\x13\xee\x72\xe2\x29\xec\x3f\x4d\x12\x07\x11\x03'  # CRT, CreamtoeCoin
+    b'\x00\x00\x00\x01\xf2\x30\xb7\x90\xe0\x53\x90\xfc\x82\x95\xf4\xd3\xf6\x03\x32\xc9\x3b\xed\x42\xe2\x06\x07\x14\x03'  # TRX, Tron Lab Token
+    b'\x00\x00\x00\x01\xf2\x6e\xf5\xe0\x54\x53\x84\xb7\xdc\xc0\xf2\x97\xf2\x67\x41\x89\x58\x68\x30\xdf\x12\x07\x17\x04'  # BSDC, BSDC
+    b'\x00\x00\x00\x01\xf3\x33\xb2\xac\xe9\x92\xac\x2b\xbd\x87\x98\xbf\x57\xbc\x65\xa0\x61\x84\xaf\xba\x00\x07\x1b\x03'  # SND, Sandcoin
+    b'\x00\x00\x00\x01\xf3\xdb\x5f\xa2\xc6\x6b\x7a\xf3\xeb\x0c\x0b\x78\x25\x10\x81\x6c\xbe\x48\x13\xb8\x04\x07\x1e\x03'  # EVX, EVX Token
+    b'\x00\x00\x00\x01\xf4\x13\x41\x46\xaf\x2d\x51\x1d\xd5\xea\x8c\xdb\x1c\x4a\xc8\x8c\x57\xd6\x04\x04\x12\x07\x21\x03'  # SNC, SNC
+    b'\x00\x00\x00\x01\xf4\x33\x08\x93\x66\x89\x9d\x83\xa9\xf2\x6a\x77\x3d\x59\xec\x7e\xcf\x30\x35\x5e\x08\x07\x24\x03'  # MTL, MetalPay
+    b'\x00\x00\x00\x01\xf4\x47\x45\xfb\xd4\x1f\x6a\x1b\xa1\x51\xdf\x19\x0d\xb0\x56\x4c\x5f\xcc\x44\x10\x12\x07\x27\x03'  # CPY, COPYTRACK
+    b'\x00\x00\x00\x01\xf6\x29\xcb\xd9\x4d\x37\x91\xc9\x25\x01\x52\xbd\x8d\xfb\xdf\x38\x0e\x2a\x3b\x9c\x12\x07\x2a\x03'  # ENJ, ENJIN
+    b'\x00\x00\x00\x01\xf6\x74\x51\xdc\x84\x21\xf0\xe0\xaf\xeb\x52\xfa\xa8\x10\x10\x34\xed\x08\x1e\xd9\x08\x07\x2d\x03'  # GAM, Gambit
+    b'\x00\x00\x00\x01\xf6\xb5\x5a\xcb\xbc\x49\xf4\x52\x4a\xa4\x8d\x19\x28\x1a\x9a\x77\xc5\x4d\xe1\x0f\x12\x07\x30\x04'  # WOLK, Wolk Token
+    b'\x00\x00\x00\x01\xf6\xcf\xe5\x3d\x6f\xeb\xae\xea\x05\x1f\x40\x0f\xf5\xfc\x14\xf0\xcb\xbd\xac\xa1\x12\x07\x34\x04'  # DGPT, DigiPulse
+    b'\x00\x00\x00\x01\xf7\x0a\x64\x2b\xd3\x87\xf9\x43\x80\xff\xb9\x04\x51\xc2\xc8\x1d\x4e\xb8\x2c\xbc\x12\x07\x38\x04'  # STAR, Star Token
+    b'\x00\x00\x00\x01\xf7\xb0\x98\x29\x8f\x7c\x69\xfc\x14\x61\x0b\xf7\x1d\x5e\x02\xc6\x07\x92\x89\x4c\x03\x07\x3c\x03'  # GUP, GUP
+    b'\x00\x00\x00\x01\xf7\xe9\x83\x78\x16\x09\x01\x23\x07\xf2\x51\x4f\x63\xd5\x26\xd8\x3d\x24\xf4\x66\x10\x07\x3f\x03'  # MYD, MYD
+    b'\x00\x00\x00\x01\xf8\x5f\xee\xa2\xfd\xd8\x1d\x51\x17\x7f\x6b\x8f\x35\xf0\xe6\x73\x4c\xe4\x5f\x5f\x12\x07\x42\x03'  # CMT, CyberMiles Token
+    b'\x00\x00\x00\x01\xf8\x7f\x0d\x91\x53\xfe\xa5\x49\xc7\x28\xad\x61\xcb\x80\x15\x95\xa6\x8b\x73\xde\x12\x07\x45\x04'  # BANX, BANX
+    b'\x00\x00\x00\x01\xf8\xe3\x86\xed\xa8\x57\x48\x4f\x5a\x12\xe4\xb5\xda\xa9\x98\x4e\x06\xe7\x37\x05\x12\x07\x49\x03'  # IND, Indorse
+    b'\x00\x00\x00\x01\xf9\xf0\xfc\x71\x67\xc3\x11\xdd\x2f\x1e\x21\xe9\x20\x4f\x87\xeb\xa9\x01\x2f\xb2\x08\x07\x4c\x03'  # EHT, EasyHomes
+    b'\x00\x00\x00\x01\xfa\x05\xa7\x3f\xfe\x78\xef\x8f\x1a\x73\x94\x73\xe4\x62\xc5\x4b\xae\x65\x67\xd9\x12\x07\x4f\x03'  # LUN, LUN
+    b'\x00\x00\x00\x01\xfa\xcc\xd5\xfc\x83\xc3\xe4\xc3\xc1\xac\x1e\xf3\x5d\x15\xad\xf0\x6b\xcf\x20\x9c\x08\x07\x52\x04'  # TBC2, TBC2
+    b'\x00\x00\x00\x01\xfa\xd5\x72\xdb\x56\x6e\x52\x34\xac\x9f\xc3\xd5\x70\xc4\xed\xc0\x05\x0e\xaa\x92\x12\x07\x56\x03'  # BTH, Bytether
+    b'\x00\x00\x00\x01\xfb\x12\xe3\xcc\xa9\x83\xb9\xf5\x9d\x90\x91\x2f\xd1\x7f\x8d\x74\x5a\x8b\x29\x53\x00\x07\x59\x04'  # LUCK, LUCK
+    b'\x00\x00\x00\x01\xfb\x2f\x26\xf2\x66\xfb\x28\x05\xa3\x87\x23\x0f\x2a\xa0\xa3\x31\xb4\xd9\x6f\xba\x12\x07\x5d\x04'  # DADI, DADI
+    b'\x00\x00\x00\x01\xfb\xd0\xd1\xc7\x7b\x50\x17\x96\xa3\x5d\x86\xcf\x91\xd6\x5d\x97\x78\xee\xe6\x95\x03\x07\x61\x05'  # TWNKL, Twinkle
+    b'\x00\x00\x00\x01\xfc\xa4\x79\x62\xd4\x5a\xdf\xdf\xd1\xab\x2d\x97\x23\x15\xdb\x4c\xe7\xcc\xf0\x94\x08\x07\x66\x03'  # IXT, InsureX
+    b'\x00\x00\x00\x01\xfc\xac\x7a\x75\x15\xe9\xa9\xd7\x61\x9f\xa7\x7a\x1f\xa7\x38\x11\x1f\x66\x72\x7e\x12\x07\x69\x03'  # PCH, PITCH
+    b'\x00\x00\x00\x01\xfd\x10\x7b\x47\x3a\xb9\x0e\x8f\xbd\x89\x87\x21\x44\xa3\xdc\x92\xc4\x0f\xa8\xc9\x12\x07\x6c\x04'  # LALA, LALA World Token
+    b'\x00\x00\x00\x01\xfd\xbc\x1a\xdc\x26\xf0\xf8\xf8\x60\x6a\x5d\x63\xb7\xd3\xa3\xcd\x21\xc2\x2b\x23\x08\x07\x70\x03'  # 1WO, 1WO
+    b'\x00\x00\x00\x01\xfe\xc0\xcf\x7f\xe0\x78\xa5\x00\xab\xf1\x5f\x12\x84\x95\x8f\x22\x04\x9c\x2c\x7e\x12\x07\x73\x03'  # ART, ART
+    b'\x00\x00\x00\x01\xff\x18\xdb\xc4\x87\xb4\xc2\xe3\x22\x2d\x11\x59\x52\xba\xbf\xda\x8b\xa5\x2f\x5f\x12\x07\x76\x04'  # LIFE, LIFE
+    b'\x00\x00\x00\x01\xff\xe8\x19\x6b\xc2\x59\xe8\xde\xdc\x54\x4d\x93\x57\x86\xaa\x47\x09\xec\x3e\x64\x12\x07\x7a\x03'  # HDG, Hedge Crypto
     # rin
-    (4, b'\x39\x8a\x7a\x69\xf3\xc5\x91\x81\xa1\xff\xe3\x4b\xed\x11\xdc\xb5\xdf\x86\x3a\x8a', 'AETH', 18),  # AKASHA Tokens
-    (4, b'\xe2\x78\x26\xee\x77\x8b\x6f\x78\xa4\x9a\x68\x6d\xa7\xd6\x4f\x6e\x7b\x08\x4a\x4f', 'BHNT', 0),  # Berlin Hack&Tell winner token
-    (4, b'\x0a\x05\x7a\x87\xce\x9c\x56\xd7\xe3\x36\xb4\x17\xc7\x9c\xf3\x0e\x8d\x27\x86\x0b', 'WALL', 15),  # WALLETH Community-Token
+    b'\x00\x00\x00\x04\x0a\x05\x7a\x87\xce\x9c\x56\xd7\xe3\x36\xb4\x17\xc7\x9c\xf3\x0e\x8d\x27\x86\x0b\x0f\x07\x7d\x04'  # WALL, WALLETH Community-Token
+    b'\x00\x00\x00\x04\x39\x8a\x7a\x69\xf3\xc5\x91\x81\xa1\xff\xe3\x4b\xed\x11\xdc\xb5\xdf\x86\x3a\x8a\x12\x07\x81\x04'  # AETH, AKASHA Tokens
+    b'\x00\x00\x00\x04\xe2\x78\x26\xee\x77\x8b\x6f\x78\xa4\x9a\x68\x6d\xa7\xd6\x4f\x6e\x7b\x08\x4a\x4f\x00\x07\x85\x04'  # BHNT, Berlin Hack&Tell winner token
     # ubq
-    (8, b'\xff\x3b\xf0\x57\xad\xf3\xb0\xe0\x15\xb6\x46\x53\x31\xa6\x23\x6e\x55\x68\x82\x74', 'BEER', 0),  # BEER
-    (8, b'\x08\x53\x3d\x6a\x06\xce\x36\x52\x98\xb1\x2e\xf9\x2e\xb4\x07\xcb\xa8\xaa\x82\x73', 'CEFS', 8),  # CEFS
-    (8, b'\x94\xad\x7e\x41\xc1\xd4\x40\x22\xc4\xf4\x7c\xb1\xba\x01\x9f\xd1\xa0\x22\xc5\x36', 'DOT', 8),  # DOT
-    (8, b'\x4b\x48\x99\xa1\x0f\x3e\x50\x7d\xb2\x07\xb0\xee\x24\x26\x02\x9e\xfa\x16\x8a\x67', 'QWARK', 8),  # QWARK
-    (8, b'\x5e\x17\x15\xbb\x79\x80\x5b\xd6\x72\x72\x97\x60\xb3\xf7\xf3\x4d\x6f\x48\x50\x98', 'RICKS', 8),  # RICKS
+    b'\x00\x00\x00\x08\x08\x53\x3d\x6a\x06\xce\x36\x52\x98\xb1\x2e\xf9\x2e\xb4\x07\xcb\xa8\xaa\x82\x73\x08\x07\x89\x04'  # CEFS, CEFS
+    b'\x00\x00\x00\x08\x4b\x48\x99\xa1\x0f\x3e\x50\x7d\xb2\x07\xb0\xee\x24\x26\x02\x9e\xfa\x16\x8a\x67\x08\x07\x8d\x05'  # QWARK, QWARK
+    b'\x00\x00\x00\x08\x5e\x17\x15\xbb\x79\x80\x5b\xd6\x72\x72\x97\x60\xb3\xf7\xf3\x4d\x6f\x48\x50\x98\x08\x07\x92\x05'  # RICKS, RICKS
+    b'\x00\x00\x00\x08\x94\xad\x7e\x41\xc1\xd4\x40\x22\xc4\xf4\x7c\xb1\xba\x01\x9f\xd1\xa0\x22\xc5\x36\x08\x07\x97\x03'  # DOT, DOT
+    b'\x00\x00\x00\x08\xff\x3b\xf0\x57\xad\xf3\xb0\xe0\x15\xb6\x46\x53\x31\xa6\x23\x6e\x55\x68\x82\x74\x00\x07\x9a\x04'  # BEER, BEER
     # kov
-    (42, b'\x86\x67\x55\x92\x54\x24\x1d\xde\xd4\xd1\x13\x92\xf8\x68\xd7\x20\x92\x76\x53\x67', 'Aeternity', 18),  # Aeternity
-    (42, b'\x3c\x67\xf7\xd4\xde\xcf\x77\x95\x22\x5f\x51\xb5\x41\x34\xf8\x11\x37\x38\x5f\x83', 'GUP', 3),  # GUP
+    b'\x00\x00\x00\x2a\x3c\x67\xf7\xd4\xde\xcf\x77\x95\x22\x5f\x51\xb5\x41\x34\xf8\x11\x37\x38\x5f\x83\x03\x07\x3c\x03'  # GUP, GUP
+    b'\x00\x00\x00\x2a\x86\x67\x55\x92\x54\x24\x1d\xde\xd4\xd1\x13\x92\xf8\x68\xd7\x20\x92\x76\x53\x67\x12\x07\x9e\x09'  # Aeternity, Aeternity
     # etc
-    (61, b'\x08\x5f\xb4\xf2\x40\x31\xea\xed\xbc\x2b\x61\x1a\xa5\x28\xf2\x23\x43\xeb\x52\xdb', 'BEC', 8),  # BEC
-    (61, b'\x5a\xce\x17\xf8\x7c\x73\x91\xe5\x79\x2a\x76\x83\x06\x9a\x80\x25\xb8\x3b\xbd\x85', 'PLAY', 0),  # Smart Billions
-]
+    b'\x00\x00\x00\x3d\x08\x5f\xb4\xf2\x40\x31\xea\xed\xbc\x2b\x61\x1a\xa5\x28\xf2\x23\x43\xeb\x52\xdb\x08\x07\xa7\x03'  # BEC, BEC
+    b'\x00\x00\x00\x3d\x5a\xce\x17\xf8\x7c\x73\x91\xe5\x79\x2a\x76\x83\x06\x9a\x80\x25\xb8\x3b\xbd\x85\x00\x06\x8d\x04'  # PLAY, Smart Billions
+)
+_SYMBOLS = (
+    b'\x53\x54\x58\x46\x4b\x58\x49\x43\x4f\x53\x44\x50\x50\x4f\x43\x43\x47\x54\x4b\x54\x57\x59\x56\x5a\x49\x4c\x43\x4b\x44\x41\x4c\x43'
+    b'\x44\x4c\x54\x42\x54\x54\x45\x44\x47\x42\x54\x43\x45\x44\x43\x4e\x54\x4e\x54\x52\x4e\x44\x52\x4a\x42\x58\x44\x4e\x54\x46\x52\x44'
+    b'\x49\x54\x54\x4d\x54\x58\x50\x4c\x42\x54\x50\x52\x53\x50\x44\x41\x54\x41\x43\x6f\x69\x6e\x4a\x38\x54\x42\x41\x54\x41\x56\x54\x50'
+    b'\x4f\x45\x59\x55\x50\x49\x45\x58\x53\x43\x4d\x41\x4e\x41\x47\x56\x54\x41\x49\x58\x42\x4c\x54\x53\x59\x4e\x43\x41\x54\x20\x28\x42'
+    b'\x69\x74\x43\x6c\x61\x76\x65\x29\x41\x52\x43\x54\x53\x55\x42\x47\x52\x49\x44\x53\x58\x44\x54\x43\x46\x49\x4d\x43\x49\x44\x49\x56'
+    b'\x58\x41\x43\x43\x48\x4b\x47\x44\x45\x42\x50\x52\x53\x49\x49\x43\x42\x54\x51\x41\x54\x48\x4e\x4d\x52\x43\x44\x54\x45\x43\x4f\x32'
+    b'\x41\x4c\x43\x4f\x50\x52\x4c\x46\x41\x4d\x42\x44\x47\x41\x50\x50\x43\x4d\x4e\x45\x44\x41\x54\x41\x42\x72\x6f\x6b\x65\x72\x45\x54'
+    b'\x42\x53\x42\x43\x50\x54\x43\x41\x4e\x44\x53\x43\x4d\x54\x52\x63\x42\x43\x44\x4e\x53\x2d\x41\x2d\x50\x41\x54\x53\x4f\x4c\x42\x4e'
+    b'\x54\x46\x54\x52\x43\x41\x52\x43\x4f\x43\x58\x43\x4c\x4f\x4b\x4d\x52\x50\x50\x52\x4f\x49\x4d\x54\x47\x58\x56\x43\x41\x50\x54\x47'
+    b'\x45\x4c\x44\x55\x4b\x47\x4c\x49\x56\x45\x53\x50\x41\x52\x54\x41\x52\x44\x4e\x43\x32\x30\x41\x53\x54\x4b\x49\x43\x4b\x41\x49\x52'
+    b'\x43\x43\x43\x20\x28\x43\x72\x79\x70\x74\x6f\x43\x72\x61\x73\x68\x43\x6f\x75\x72\x73\x65\x29\x57\x61\x42\x69\x52\x43\x54\x42\x54'
+    b'\x4c\x20\x28\x42\x61\x74\x74\x6c\x65\x29\x53\x4b\x49\x4e\x51\x54\x51\x4f\x53\x54\x53\x58\x55\x54\x56\x49\x42\x44\x4d\x54\x53\x4d'
+    b'\x54\x44\x49\x43\x45\x4c\x47\x52\x54\x57\x4e\x58\x47\x54\x43\x4f\x46\x49\x43\x43\x53\x53\x4b\x52\x50\x42\x50\x54\x56\x45\x45\x44'
+    b'\x45\x4e\x54\x50\x43\x4c\x4d\x42\x52\x53\x44\x43\x41\x44\x43\x4c\x57\x41\x58\x46\x4c\x50\x45\x54\x48\x42\x44\x52\x4f\x50\x52\x56'
+    b'\x54\x53\x2d\x45\x54\x48\x43\x4d\x42\x54\x4d\x2d\x45\x54\x48\x4d\x47\x4f\x52\x45\x4e\x53\x41\x4c\x54\x43\x4c\x4e\x44\x52\x47\x4e'
+    b'\x46\x55\x4e\x4d\x54\x4e\x43\x56\x43\x52\x56\x4c\x41\x44\x53\x54\x43\x41\x52\x53\x50\x41\x4e\x4b\x4f\x50\x54\x50\x4f\x49\x4e\x45'
+    b'\x4c\x54\x43\x4f\x49\x4e\x41\x44\x58\x53\x4e\x49\x50\x43\x54\x46\x4e\x78\x43\x53\x54\x52\x43\x44\x52\x4f\x50\x20\x28\x64\x72\x6f'
+    b'\x70\x69\x6c\x29\x52\x4f\x55\x4e\x44\x53\x4b\x4f\x31\x52\x4c\x58\x53\x4b\x52\x53\x65\x6e\x53\x61\x74\x6f\x72\x49\x4b\x45\x59\x41'
+    b'\x49\x4f\x4e\x57\x50\x52\x58\x43\x43\x42\x45\x45\x41\x4d\x42\x46\x4e\x44\x58\x41\x55\x52\x43\x52\x45\x44\x4f\x47\x45\x45\x42\x53'
+    b'\x54\x4c\x49\x4e\x4b\x20\x28\x43\x68\x61\x69\x6e\x6c\x69\x6e\x6b\x29\x56\x49\x55\x4d\x44\x41\x50\x43\x4c\x4f\x4c\x44\x58\x47\x4d'
+    b'\x52\x54\x4e\x50\x54\x57\x4f\x48\x53\x54\x50\x42\x4c\x44\x47\x58\x50\x45\x58\x54\x54\x52\x43\x4e\x43\x41\x54\x20\x28\x42\x6c\x6f'
+    b'\x63\x6b\x63\x61\x74\x29\x58\x4e\x54\x50\x45\x54\x53\x50\x41\x52\x43\x47\x58\x43\x50\x4c\x41\x53\x4d\x41\x50\x4f\x57\x52\x53\x54'
+    b'\x4e\x49\x43\x45\x42\x51\x58\x45\x44\x55\x49\x4e\x53\x4d\x45\x53\x54\x45\x4e\x54\x52\x50\x56\x53\x4c\x4e\x58\x58\x20\x4f\x4c\x44'
+    b'\x41\x45\x4c\x4f\x43\x57\x69\x43\x49\x54\x43\x52\x45\x42\x4c\x52\x4c\x43\x57\x50\x43\x44\x52\x50\x53\x54\x43\x57\x49\x43\x41\x54'
+    b'\x54\x4e\x41\x4c\x54\x53\x4c\x4e\x43\x4d\x57\x41\x54\x49\x50\x4c\x43\x4f\x53\x53\x54\x49\x4d\x45\x4f\x78\x20\x46\x69\x6e\x61\x43'
+    b'\x54\x58\x50\x54\x57\x49\x4e\x47\x53\x51\x41\x55\x43\x52\x45\x44\x53\x45\x4e\x53\x45\x5a\x41\x50\x47\x4e\x4f\x4d\x53\x50\x53\x52'
+    b'\x4e\x43\x41\x54\x73\x20\x28\x42\x69\x74\x43\x6c\x61\x76\x65\x29\x5f\x4f\x6c\x64\x50\x41\x54\x45\x4e\x54\x53\x51\x52\x4c\x57\x43'
+    b'\x54\x4c\x4e\x43\x2d\x4c\x69\x6e\x6b\x65\x72\x20\x43\x6f\x69\x6e\x53\x4d\x41\x52\x54\x43\x44\x58\x4f\x41\x58\x47\x41\x56\x45\x4c'
+    b'\x55\x54\x4b\x46\x4c\x58\x57\x52\x4b\x4b\x45\x45\x4e\x47\x43\x42\x43\x42\x43\x42\x54\x45\x53\x4e\x54\x57\x42\x41\x42\x65\x65\x72'
+    b'\x43\x6f\x69\x6e\x47\x42\x54\x41\x52\x44\x4e\x58\x58\x50\x52\x50\x53\x49\x46\x54\x52\x45\x41\x41\x52\x58\x50\x52\x47\x4a\x65\x74'
+    b'\x43\x6f\x69\x6e\x73\x50\x4f\x4f\x4c\x41\x54\x4c\x53\x43\x41\x4e\x44\x49\x53\x4c\x54\x53\x41\x4e\x43\x41\x47\x24\x54\x45\x41\x4b'
+    b'\x43\x4d\x43\x42\x4f\x50\x4f\x48\x4e\x49\x43\x52\x37\x4d\x54\x52\x43\x4c\x50\x43\x52\x50\x54\x54\x49\x4f\x49\x44\x45\x41\x4b\x49'
+    b'\x4e\x44\x41\x54\x4d\x4e\x54\x50\x56\x4f\x49\x53\x45\x48\x64\x70\x2e\xd1\x84\x53\x50\x46\x54\x45\x4c\x45\x4f\x53\x4a\x45\x54\x41'
+    b'\x44\x49\x56\x49\x42\x45\x58\x41\x54\x54\x49\x43\x4e\x50\x52\x45\x49\x4b\x42\x46\x59\x4e\x55\x6e\x69\x63\x6f\x72\x6e\x44\x41\x49'
+    b'\x53\x49\x46\x54\x43\x44\x4c\x42\x45\x54\x50\x54\x4f\x59\x47\x5a\x45\x41\x47\x49\x50\x49\x58\x56\x45\x52\x49\x52\x45\x51\x48\x41'
+    b'\x54\x58\x38\x58\x45\x56\x45\x42\x54\x4c\x20\x28\x42\x69\x74\x6c\x6c\x65\x29\x4d\x43\x41\x50\x41\x4d\x49\x53\x4b\x5a\x4e\x46\x4c'
+    b'\x55\x5a\x4d\x4f\x44\x45\x4d\x4f\x4e\x54\x41\x4e\x54\x53\x4e\x4d\x42\x4d\x58\x53\x45\x58\x59\x45\x41\x47\x4c\x45\x50\x4f\x4c\x59'
+    b'\x51\x53\x50\x53\x54\x41\x43\x51\x54\x55\x4d\x41\x58\x50\x44\x41\x4e\x4c\x4f\x43\x49\x55\x54\x4e\x2d\x50\x4e\x43\x54\x42\x52\x41'
+    b'\x54\x53\x57\x4d\x4d\x4b\x52\x53\x47\x45\x4c\x49\x43\x4f\x4e\x44\x43\x45\x43\x4e\x4a\x4e\x54\x4d\x59\x53\x54\x47\x4e\x54\x54\x46'
+    b'\x4c\x49\x4e\x58\x54\x4e\x45\x55\x4c\x55\x4d\x48\x49\x47\x4d\x4e\x54\x54\x4b\x4e\x46\x55\x43\x4b\x4d\x52\x56\x58\x4e\x4e\x45\x55'
+    b'\x52\x54\x41\x52\x43\x42\x43\x44\x54\x47\x49\x4d\x53\x54\x4b\x53\x4e\x47\x4c\x53\x33\x30\x30\x43\x52\x42\x31\x53\x54\x4d\x54\x48'
+    b'\x65\x42\x43\x48\x54\x42\x54\x58\x49\x44\x53\x53\x4f\x4e\x45\x4b\x58\x52\x4c\x42\x4b\x42\x43\x4f\x42\x47\x4d\x54\x48\x4f\x44\x4c'
+    b'\x43\x4f\x32\x52\x50\x4c\x65\x47\x41\x53\x49\x43\x58\x4d\x43\x4f\x53\x54\x4f\x52\x4a\x45\xe2\x82\xb9\x45\x4d\x4f\x4e\x43\x58\x4f'
+    b'\x47\x54\x43\x45\x4d\x56\x42\x4e\x42\x4e\x55\x4c\x53\x50\x41\x59\x41\x42\x54\x53\x57\x54\x44\x4b\x50\x48\x47\x54\x41\x52\x4e\x44'
+    b'\x41\x4f\x42\x43\x4c\x53\x4e\x4f\x56\x43\x43\x43\x20\x28\x49\x43\x4f\x4e\x4f\x4d\x49\x29\x52\x4c\x54\x59\x4d\x4c\x4e\x45\x4c\x46'
+    b'\x43\x54\x4c\x57\x45\x54\x48\x48\x56\x4e\x50\x58\x54\x43\x43\x33\x54\x41\x55\x42\x4f\x55\x49\x6f\x54\x50\x50\x50\x4f\x4c\x44\x5f'
+    b'\x4d\x4b\x52\x4c\x46\x52\x45\x4c\x49\x58\x45\x58\x4d\x52\x52\x4f\x4b\x54\x52\x43\x54\x52\x53\x54\x42\x54\x4d\x48\x4d\x51\x42\x4f'
+    b'\x4e\x44\x44\x46\x52\x4c\x54\x42\x4c\x58\x20\x28\x42\x75\x6c\x6c\x69\x6f\x6e\x29\x45\x44\x4f\x4e\x45\x54\x53\x4e\x47\x55\x51\x43'
+    b'\x53\x54\x4f\x52\x4d\x41\x44\x54\x44\x54\x52\x53\x47\x54\x4f\x4d\x47\x42\x4e\x54\x59\x6f\x6e\x47\x43\x43\x4c\x43\x57\x49\x4c\x44'
+    b'\x43\x4e\x44\x44\x55\x42\x49\x50\x50\x54\x4c\x45\x4d\x4f\x53\x43\x4c\x45\x56\x4e\x56\x45\x54\x50\x4c\x55\x63\x56\x44\x41\x42\x55'
+    b'\x53\x44\x54\x52\x49\x50\x54\x42\x4e\x43\x44\x65\x76\x63\x6f\x6e\x32\x20\x54\x6f\x6b\x65\x6e\x4b\x4e\x43\x42\x4d\x43\x53\x45\x54'
+    b'\x44\x47\x44\x57\x48\x4f\x4d\x49\x54\x4e\x49\x4d\x46\x41\x4c\x49\x4e\x4b\x20\x50\x6c\x61\x74\x66\x6f\x72\x6d\x50\x4c\x52\x49\x4d'
+    b'\x43\x5a\x53\x54\x43\x54\x54\x5a\x52\x58\x44\x4e\x58\x50\x4c\x41\x59\x43\x72\x79\x70\x74\x6f\x43\x61\x72\x62\x6f\x6e\x4c\x41\x42'
+    b'\x4c\x58\x20\x28\x49\x63\x6f\x6e\x6f\x6d\x69\x29\x50\x49\x50\x4c\x46\x54\x43\x54\x61\x61\x53\x43\x41\x53\x45\x53\x5a\x52\x45\x50'
+    b'\x48\x64\x70\x54\x49\x58\x46\x55\x45\x4c\x50\x41\x52\x45\x54\x4f\x41\x4c\x49\x53\x47\x4f\x4c\x44\x58\x65\x42\x54\x43\x4c\x49\x46'
+    b'\x56\x45\x4e\x55\x53\x50\x45\x54\x52\x4f\x4e\x4f\x58\x53\x54\x50\x41\x56\x41\x56\x52\x53\x50\x4f\x53\x44\x4f\x57\x53\x48\x49\x54'
+    b'\x4c\x52\x43\x50\x55\x43\x42\x4d\x54\x46\x4c\x49\x58\x58\x52\x45\x58\x43\x52\x54\x54\x52\x58\x42\x53\x44\x43\x53\x4e\x44\x45\x56'
+    b'\x58\x53\x4e\x43\x4d\x54\x4c\x43\x50\x59\x45\x4e\x4a\x47\x41\x4d\x57\x4f\x4c\x4b\x44\x47\x50\x54\x53\x54\x41\x52\x47\x55\x50\x4d'
+    b'\x59\x44\x43\x4d\x54\x42\x41\x4e\x58\x49\x4e\x44\x45\x48\x54\x4c\x55\x4e\x54\x42\x43\x32\x42\x54\x48\x4c\x55\x43\x4b\x44\x41\x44'
+    b'\x49\x54\x57\x4e\x4b\x4c\x49\x58\x54\x50\x43\x48\x4c\x41\x4c\x41\x31\x57\x4f\x41\x52\x54\x4c\x49\x46\x45\x48\x44\x47\x57\x41\x4c'
+    b'\x4c\x41\x45\x54\x48\x42\x48\x4e\x54\x43\x45\x46\x53\x51\x57\x41\x52\x4b\x52\x49\x43\x4b\x53\x44\x4f\x54\x42\x45\x45\x52\x41\x65'
+    b'\x74\x65\x72\x6e\x69\x74\x79\x42\x45\x43'
+)
@@ -9,11 +9,27 @@ from apps.common import storage, coins, cache
 
 
 async def respond_Features(ctx, msg):
+    import protobuf
 
     if msg.__qualname__ == 'Initialize':
         if msg.state is None or bytes(msg.state) != cache.get_state(state=bytes(msg.state)):
             cache.clear()
 
+    # the encoded message is cached until one of its fields changes, see
+    # cache.clear_features()
+    data = cache.get_features()
+    if data is None:
+        f = get_features()
+        counter = protobuf.CountingWriter()
+        await protobuf.dump_message(counter, f)
+        writer = protobuf.BytearrayWriter(counter.size)
+        await protobuf.dump_message(writer, f)
+        data = writer.buf
+        cache.set_features(data)
+    await ctx.write_raw(wire_types.Features, data)
+
+
+def get_features():
     f = Features()
     f.vendor = 'trezor.io'
     f.major_version = symbol('VERSION_MAJOR')
@@ -24,7 +40,7 @@ async def respond_Features(ctx, msg):
     f.passphrase_protection = storage.has_passphrase()
     f.language = 'english'
     f.label = storage.get_label()
-    f.coins = coins.COINS
+    f.coins = coins.all_coins()
     f.initialized = storage.is_initialized()
     f.revision = symbol('GITREV')
     f.pin_cached = config.has_pin()
@@ -34,7 +50,6 @@ async def respond_Features(ctx, msg):
     if model() in ['T', 'EMU']:  # emulator currently emulates model T
         f.model = 'T'
     f.unfinished_backup = storage.unfinished_backup()
-
     return f
 
 
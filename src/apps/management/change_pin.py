@@ -7,6 +7,7 @@ from trezor.messages.Success import Success
 from trezor.messages import wire_types
 from trezor.pin import pin_to_int, show_pin_timeout
 from trezor.ui.text import Text
+from apps.common import cache
 from apps.common.confirm import require_confirm
 from apps.common.request_pin import request_pin, PinCancelled
 
@@ -32,6 +33,7 @@ async def change_pin(ctx, msg):
 
     # write into storage
     if config.change_pin(pin_to_int(curpin), pin_to_int(newpin), show_pin_timeout):
+        cache.clear_features()
         if newpin:
             return Success(message='PIN changed')
         else:
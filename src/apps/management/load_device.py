@@ -4,7 +4,7 @@ from trezor.messages.FailureType import ProcessError, UnexpectedMessage
 from trezor.messages.Success import Success
 from trezor.pin import pin_to_int
 from trezor.ui.text import Text
-from apps.common import storage
+from apps.common import cache, storage
 from apps.common.confirm import require_confirm
 
 
@@ -30,5 +30,6 @@ async def load_device(ctx, msg):
         use_passphrase=msg.passphrase_protection, label=msg.label)
     if msg.pin:
         config.change_pin(pin_to_int(''), pin_to_int(msg.pin), None)
+        cache.clear_features()
 
     return Success(message='Device loaded')
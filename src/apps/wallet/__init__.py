@@ -1,13 +1,14 @@
-from trezor.wire import register, protobuf_workflow
+from trezor.wire import register, protobuf_workflow, typed_workflow
 from trezor.utils import unimport
 from trezor.messages.wire_types import \
     GetPublicKey, GetAddress, \
     GetEntropy, \
-    SignTx, \
+    SignTx, EstimateTxSize, \
     SignMessage, VerifyMessage, \
     SignIdentity, \
     GetECDHSessionKey, \
     CipherKeyValue
+from .messages import EstimateTxSizeExt, SignTxExt
 
 
 @unimport
@@ -34,6 +35,12 @@ def dispatch_SignTx(*args, **kwargs):
     return sign_tx(*args, **kwargs)
 
 
+@unimport
+def dispatch_EstimateTxSize(*args, **kwargs):
+    from .estimate_tx_size import estimate_tx_size
+    return estimate_tx_size(*args, **kwargs)
+
+
 @unimport
 def dispatch_SignMessage(*args, **kwargs):
     from .sign_message import sign_message
@@ -68,7 +75,8 @@ def boot():
     register(GetPublicKey, protobuf_workflow, dispatch_GetPublicKey)
     register(GetAddress, protobuf_workflow, dispatch_GetAddress)
     register(GetEntropy, protobuf_workflow, dispatch_GetEntropy)
-    register(SignTx, protobuf_workflow, dispatch_SignTx)
+    register(SignTx, typed_workflow, SignTxExt, dispatch_SignTx)
+    register(EstimateTxSize, typed_workflow, EstimateTxSizeExt, dispatch_EstimateTxSize)
     register(SignMessage, protobuf_workflow, dispatch_SignMessage)
     register(VerifyMessage, protobuf_workflow, dispatch_VerifyMessage)
     register(SignIdentity, protobuf_workflow, dispatch_SignIdentity)
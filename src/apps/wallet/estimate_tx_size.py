@@ -0,0 +1,25 @@
+from trezor import wire
+from trezor.messages.wire_types import TxAck
+
+
+async def estimate_tx_size(ctx, msg):
+    from apps.wallet.sign_tx import estimate, signing
+
+    estimator = estimate.estimate_tx_size(msg)
+    res = None
+    while True:
+        try:
+            req = estimator.send(res)
+        except StopIteration as e:
+            return e.value
+        except signing.SigningError as e:
+            raise wire.FailureError(*e.args)
+        except signing.MultisigError as e:
+            raise wire.FailureError(*e.args)
+        except signing.AddressError as e:
+            raise wire.FailureError(*e.args)
+        except signing.ScriptsError as e:
+            raise wire.FailureError(*e.args)
+        except signing.Bip143Error as e:
+            raise wire.FailureError(*e.args)
+        res = await ctx.call(req, TxAck)
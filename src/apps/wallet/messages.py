@@ -0,0 +1,58 @@
+'''
+Wallet messages extended with fields that are not in trezor-common yet, see
+`protobuf.extend_fields`.  Replace them by the generated messages once the
+fields are added to the .proto files.
+'''
+
+import protobuf as p
+from trezor.messages.EstimateTxSize import EstimateTxSize
+from trezor.messages.SignTx import SignTx
+from trezor.messages.TxSize import TxSize
+
+
+class EstimateTxSizeExt(EstimateTxSize):
+    FIELDS = p.extend_fields(EstimateTxSize.FIELDS, {
+        p.EXPERIMENTAL_TAG: ('stream', p.BoolType, 0),
+        p.EXPERIMENTAL_TAG + 1: ('selections', p.BytesType, p.FLAG_REPEATED),
+    })
+
+    def __init__(
+        self,
+        stream: bool = None,
+        selections: list = None,
+        **kwargs,
+    ):
+        self.stream = stream
+        self.selections = [] if selections is None else selections
+        EstimateTxSize.__init__(self, **kwargs)
+
+
+class TxSizeExt(TxSize):
+    FIELDS = p.extend_fields(TxSize.FIELDS, {
+        p.EXPERIMENTAL_TAG: ('tx_weight', p.UVarintType, 0),
+        p.EXPERIMENTAL_TAG + 1: ('selection_sizes', p.UVarintType, p.FLAG_REPEATED),
+    })
+
+    def __init__(
+        self,
+        tx_weight: int = None,
+        selection_sizes: list = None,
+        **kwargs,
+    ):
+        self.tx_weight = tx_weight
+        self.selection_sizes = [] if selection_sizes is None else selection_sizes
+        TxSize.__init__(self, **kwargs)
+
+
+class SignTxExt(SignTx):
+    FIELDS = p.extend_fields(SignTx.FIELDS, {
+        p.EXPERIMENTAL_TAG: ('sdcard_block', p.UVarintType, 0),
+    })
+
+    def __init__(
+        self,
+        sdcard_block: int = None,
+        **kwargs,
+    ):
+        self.sdcard_block = sdcard_block
+        SignTx.__init__(self, **kwargs)
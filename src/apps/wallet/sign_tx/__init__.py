@@ -1,5 +1,7 @@
 from trezor import ui, wire
-from trezor.messages.RequestType import TXFINISHED
+from trezor.messages.RequestType import TXFINISHED, TXOUTPUT
+from trezor.messages.TxRequest import TxRequest
+from trezor.messages.TxRequestDetailsType import TxRequestDetailsType
 from trezor.messages.wire_types import TxAck
 from apps.common import seed
 
@@ -11,34 +13,124 @@ async def sign_tx(ctx, msg):
     # TODO: rework this so we don't have to pass root to signing.sign_tx
     root = await seed.derive_node(ctx, [])
 
-    signer = signing.sign_tx(msg, root)
-    res = None
-    while True:
+    source = None  # transaction source other than the host
+    if msg.sdcard_block is not None:
+        # the transaction is stored on the SD card, starting at sdcard_block,
+        # the field is on the wire only in debug builds, see apps.wallet.messages
+        from apps.wallet.sign_tx.sdcard import SDCardTx
+        source = SDCardTx(block=msg.sdcard_block)
         try:
-            req = signer.send(res)
+            msg = await source.load()
         except signing.SigningError as e:
+            source.close()
             raise wire.FailureError(*e.args)
-        except signing.MultisigError as e:
-            raise wire.FailureError(*e.args)
-        except signing.AddressError as e:
-            raise wire.FailureError(*e.args)
-        except signing.ScriptsError as e:
-            raise wire.FailureError(*e.args)
-        except signing.Bip143Error as e:
-            raise wire.FailureError(*e.args)
-        if req.__qualname__ == 'TxRequest':
-            if req.request_type == TXFINISHED:
-                break
-            res = await ctx.call(req, TxAck)
-        elif req.__qualname__ == 'UiConfirmOutput':
-            res = await layout.confirm_output(ctx, req.output, req.coin)
-            progress.report_init()
-        elif req.__qualname__ == 'UiConfirmTotal':
-            res = await layout.confirm_total(ctx, req.spending, req.fee, req.coin)
-            progress.report_init()
-        elif req.__qualname__ == 'UiConfirmFeeOverThreshold':
-            res = await layout.confirm_feeoverthreshold(ctx, req.fee, req.coin)
-            progress.report_init()
-        else:
-            raise TypeError('Invalid signing instruction')
+
+    signer = signing.sign_tx(msg, root)
+    try:
+        res = None
+        output_index = None  # index of the last requested output
+        prefetch = None
+        while True:
+            try:
+                req = signer.send(res)
+            except signing.SigningError as e:
+                raise wire.FailureError(*e.args)
+            except signing.MultisigError as e:
+                raise wire.FailureError(*e.args)
+            except signing.AddressError as e:
+                raise wire.FailureError(*e.args)
+            except signing.ScriptsError as e:
+                raise wire.FailureError(*e.args)
+            except signing.Bip143Error as e:
+                raise wire.FailureError(*e.args)
+            if req.__qualname__ == 'TxRequest':
+                if source is not None:
+                    source.write(req.serialized)
+                if req.request_type == TXFINISHED:
+                    break
+                if req.request_type == TXOUTPUT and req.details.tx_hash is None:
+                    output_index = req.details.request_index
+                if prefetch is not None and prefetch.matches(req):
+                    res = prefetch.ack
+                elif source is not None:
+                    try:
+                        res = await source.ack(req)
+                    except signing.SigningError as e:
+                        raise wire.FailureError(*e.args)
+                else:
+                    res = await ctx.call(req, TxAck)
+                prefetch = None
+            elif req.__qualname__ == 'UiConfirmOutput':
+                # while the output is being confirmed, fetch the next one
+                if source is None and output_index is not None and output_index + 1 < msg.outputs_count:
+                    prefetch = OutputPrefetch(output_index + 1)
+                    fetch = prefetch.fetch(ctx, req.coin, root)
+                else:
+                    prefetch = fetch = None
+                res = await layout.confirm_output(ctx, req.output, req.coin, fetch)
+                progress.report_init()
+            elif req.__qualname__ == 'UiConfirmTotal':
+                res = await layout.confirm_total(ctx, req.spending, req.fee, req.coin)
+                progress.report_init()
+                if source is not None:
+                    source.mark()  # measure the signing without confirmations
+            elif req.__qualname__ == 'UiConfirmFeeOverThreshold':
+                res = await layout.confirm_feeoverthreshold(ctx, req.fee, req.coin)
+                progress.report_init()
+            else:
+                raise TypeError('Invalid signing instruction')
+        if source is not None:
+            # write the signed transaction before powering the card off
+            req = sdcard_finish(source)
+    finally:
+        # wipe the state of an unfinished signing, i.e. if the host went away
+        signer.close()
+        signing.prederived_clear()
+        if source is not None:
+            source.close()
     return req
+
+
+def sdcard_finish(source):
+    from trezor.messages.Success import Success
+    from apps.wallet.sign_tx.signing import SigningError
+
+    try:
+        ms = source.finish()
+    except SigningError as e:
+        raise wire.FailureError(*e.args)
+    return Success(message='Signed %d inputs to SD card in %d ms (%d inputs/s)' % (
+        source.inputs, ms, source.inputs * 1000 // max(ms, 1)))
+
+
+class OutputPrefetch:
+    '''
+    Request an output from the host ahead of the signer, and derive its script.
+    The acknowledgement is used only if the next request of the signer is the
+    same, otherwise it is discarded.
+    '''
+
+    def __init__(self, index):
+        self.index = index
+        self.ack = None
+
+    async def fetch(self, ctx, coin, root):
+        from apps.wallet.sign_tx import signing
+
+        req = TxRequest()
+        req.request_type = TXOUTPUT
+        req.details = TxRequestDetailsType(request_index=self.index)
+        ack = await ctx.call(req, TxAck)
+        try:
+            signing.prederive_output_script(ack.tx.outputs[0], coin, root)
+        except Exception:
+            # the signer reports the error when it gets to this output
+            pass
+        self.ack = ack
+
+    def matches(self, req):
+        return (self.ack is not None and
+                req.request_type == TXOUTPUT and
+                req.details.request_index == self.index and
+                req.details.tx_hash is None and
+                req.serialized is None)
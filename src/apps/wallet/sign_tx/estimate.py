@@ -0,0 +1,137 @@
+'''
+Transaction size estimation, see `EstimateTxSize`.
+
+The estimate needs neither the seed nor a confirmation: change outputs are
+estimated from their script type instead of being derived.  With `stream`
+set, the inputs and outputs are requested the same way `signing.sign_tx` does,
+otherwise all of them are assumed to be p2pkh.  Every one of `selections` is
+a bitmap of the streamed inputs followed by the outputs (bit `i % 8` of byte
+`i // 8` for the element `i`) and gets its own size in `selection_sizes`.
+These fields are on the wire only in debug builds, see apps.wallet.messages.
+'''
+
+from micropython import const
+
+from trezor.messages import FailureType, InputScriptType, OutputScriptType
+from trezor.messages.TxInputType import TxInputType
+from trezor.messages.TxRequest import TxRequest
+from trezor.messages.TxRequestDetailsType import TxRequestDetailsType
+
+from apps.common import coins
+from apps.wallet.messages import EstimateTxSizeExt, TxSizeExt
+from apps.wallet.sign_tx.helpers import *
+from apps.wallet.sign_tx.signing import Bitmap, SigningError, output_derive_script
+from apps.wallet.sign_tx.tx_weight_calculator import *
+
+# script sizes of change outputs, the scripts are never derived
+_P2PKH_SCRIPT_LEN = const(25)
+_P2SH_SCRIPT_LEN = const(23)
+_P2WPKH_SCRIPT_LEN = const(22)
+_P2WSH_SCRIPT_LEN = const(34)
+
+_P2PKH_INPUT = TxInputType(script_type=InputScriptType.SPENDADDRESS)
+
+
+def estimate_tx_size(msg: EstimateTxSizeExt):
+    coin = coins.by_name(msg.coin_name or 'Bitcoin')
+    inputs_count = msg.inputs_count or 0
+    outputs_count = msg.outputs_count or 0
+
+    weight = TxWeightCalculator(inputs_count, outputs_count)
+
+    if not msg.stream:
+        if msg.selections:
+            raise SigningError(FailureType.DataError,
+                               'Selections need streamed inputs and outputs')
+        weight.add_weight(inputs_count * weight.input_weight(_P2PKH_INPUT))
+        weight.add_weight(outputs_count * weight.output_weight(bytes(_P2PKH_SCRIPT_LEN)))
+        return tx_size(weight.get_total())
+
+    for selection in msg.selections:
+        if len(selection) * 8 < inputs_count + outputs_count:
+            raise SigningError(FailureType.DataError, 'Invalid selection')
+
+    # weights of the elements, kept only for the selections
+    weights = [] if msg.selections else None
+    segwit = Bitmap(inputs_count) if msg.selections else None
+
+    tx_req = TxRequest()
+    tx_req.details = TxRequestDetailsType()
+
+    for i in range(inputs_count):
+        txi = yield from request_tx_input(tx_req, i)
+        input_check(txi, coin)
+        is_segwit = is_segwit_input(txi)
+        w = weight.input_weight(txi)
+        weight.add_weight(w, is_segwit)
+        if weights is not None:
+            weights.append(w)
+            if is_segwit:
+                segwit.set(i)
+
+    for o in range(outputs_count):
+        txo = yield from request_tx_output(tx_req, o)
+        w = weight.output_weight(output_estimate_script(txo, coin))
+        weight.add_weight(w)
+        if weights is not None:
+            weights.append(w)
+
+    res = tx_size(weight.get_total())
+    for selection in msg.selections:
+        res.selection_sizes.append(selection_size(
+            selection, weights, segwit, inputs_count, outputs_count))
+    return res
+
+
+def selection_size(selection: bytes, weights: list, segwit: Bitmap,
+                   inputs_count: int, outputs_count: int) -> int:
+    selected_inputs = 0
+    selected_outputs = 0
+    any_segwit = False
+    total = 0
+    for i in range(inputs_count + outputs_count):
+        if not selection[i // 8] & (1 << (i % 8)):
+            continue
+        total += weights[i]
+        if i < inputs_count:
+            selected_inputs += 1
+            any_segwit = any_segwit or segwit.get(i)
+        else:
+            selected_outputs += 1
+    weight = TxWeightCalculator(selected_inputs, selected_outputs)
+    weight.add_weight(total, any_segwit)
+    return vsize(weight.get_total())
+
+
+def tx_size(weight: int) -> TxSizeExt:
+    return TxSizeExt(tx_size=vsize(weight), tx_weight=weight)
+
+
+def vsize(weight: int) -> int:
+    return (weight + 3) // 4
+
+
+def input_check(txi: TxInputType, coin: coins.CoinType):
+    if is_segwit_input(txi):
+        if not coin.segwit:
+            raise SigningError(FailureType.DataError,
+                               'Segwit not enabled on this coin')
+    elif txi.script_type not in (InputScriptType.SPENDADDRESS,
+                                 InputScriptType.SPENDMULTISIG):
+        raise SigningError(FailureType.DataError,
+                           'Wrong input script type')
+
+
+def output_estimate_script(o, coin: coins.CoinType) -> bytes:
+    if not o.address_n:
+        return output_derive_script(o, coin, None)
+
+    # change output, only the size of its script matters
+    if o.script_type == OutputScriptType.PAYTOADDRESS:
+        return bytes(_P2PKH_SCRIPT_LEN)
+    if o.script_type == OutputScriptType.PAYTOWITNESS:
+        return bytes(_P2WSH_SCRIPT_LEN if o.multisig else _P2WPKH_SCRIPT_LEN)
+    if (o.script_type == OutputScriptType.PAYTOMULTISIG or
+            o.script_type == OutputScriptType.PAYTOP2SHWITNESS):
+        return bytes(_P2SH_SCRIPT_LEN)
+    raise SigningError(FailureType.DataError, 'Invalid script type')
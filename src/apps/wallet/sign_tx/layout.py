@@ -20,7 +20,7 @@ def split_op_return(data):
     return chunks(data, 18)
 
 
-async def confirm_output(ctx, output, coin):
+async def confirm_output(ctx, output, coin, after_ack=None):
     if output.script_type == OutputScriptType.PAYTOOPRETURN:
         data = hexlify(output.op_return_data).decode()
         if len(data) >= 18 * 5:
@@ -32,7 +32,7 @@ async def confirm_output(ctx, output, coin):
         content = Text('Confirm sending', ui.ICON_SEND,
                        ui.NORMAL, format_coin_amount(output.amount, coin) + ' to',
                        ui.MONO, *split_address(address), icon_color=ui.GREEN)
-    return await confirm(ctx, content, ButtonRequestType.ConfirmOutput)
+    return await confirm(ctx, content, ButtonRequestType.ConfirmOutput, after_ack=after_ack)
 
 
 async def confirm_total(ctx, spending, fee, coin):
@@ -0,0 +1,89 @@
+from micropython import const
+
+from trezor.crypto.hashlib import sha256
+from trezor.messages.SignTx import SignTx
+from trezor.utils import HashWriter
+
+from apps.wallet.sign_tx.writers import *
+
+# size of an input serialized with an empty script_sig
+_BLANK_INPUT_LEN = const(32 + 4 + 1 + 4)
+
+# size of the control digest kept for every input
+_CHECK_LEN = const(32)
+
+# the maximum number of bytes kept in memory by LegacySighash
+_MAX_SIZE = const(40 * 1024)
+
+
+class LegacySighash:
+    '''
+    Computes the legacy (pre-segwit) signature digests of a transaction from
+    data recorded in Phase 1, so that Phase 2 does not need to stream all the
+    inputs and outputs again for every signed input.  Inputs are kept
+    serialized with an empty script_sig, outputs fully serialized, both only
+    if they fit into `_MAX_SIZE` bytes.  For every input a digest of its
+    control serialization is kept as well, to check that the input streamed
+    in Phase 2 is the one seen in Phase 1.
+    '''
+
+    def __init__(self, tx: SignTx):
+        self.tx = tx
+        self.inputs = bytearray()  # blank inputs
+        self.checks = bytearray()  # control digests of inputs
+        self.outputs = bytearray()  # outputs count and outputs
+        write_varint(self.outputs, tx.outputs_count)
+        # version, inputs count and blank inputs preceding input `self.hashed`
+        self.h_prefix = HashWriter(sha256)
+        write_uint32(self.h_prefix, tx.version)
+        write_varint(self.h_prefix, tx.inputs_count)
+        self.hashed = 0
+
+    @staticmethod
+    def fits(tx: SignTx) -> bool:
+        return tx.inputs_count * (_BLANK_INPUT_LEN + _CHECK_LEN) <= _MAX_SIZE
+
+    def add_input(self, txi: TxInputType) -> bool:
+        if len(txi.prev_hash) != 32:
+            return False
+        write_bytes_rev(self.inputs, txi.prev_hash)
+        write_uint32(self.inputs, txi.prev_index)
+        write_varint(self.inputs, 0)  # empty script_sig
+        write_uint32(self.inputs, txi.sequence)
+        write_bytes(self.checks, input_check_digest(txi))
+        return True
+
+    def add_output(self, txo_bin: TxOutputBinType) -> bool:
+        size = len(self.inputs) + len(self.checks) + len(self.outputs)
+        if size + 8 + 5 + len(txo_bin.script_pubkey) > _MAX_SIZE:
+            return False
+        write_tx_output(self.outputs, txo_bin)
+        return True
+
+    def check_input(self, index: int, txi: TxInputType) -> bool:
+        ofs = index * _CHECK_LEN
+        return self.checks[ofs:ofs + _CHECK_LEN] == input_check_digest(txi)
+
+    def preimage_hash(self, index: int, txi: TxInputType, sighash: int) -> bytes:
+        inputs = memoryview(self.inputs)
+
+        # extend the common prefix up to the signed input
+        if index > self.hashed:
+            write_bytes(self.h_prefix, inputs[self.hashed * _BLANK_INPUT_LEN:
+                                              index * _BLANK_INPUT_LEN])
+            self.hashed = index
+
+        h_sign = self.h_prefix.fork()
+        write_tx_input(h_sign, txi)
+        write_bytes(h_sign, inputs[(index + 1) * _BLANK_INPUT_LEN:])
+        write_bytes(h_sign, self.outputs)
+        write_uint32(h_sign, self.tx.lock_time)
+        write_uint32(h_sign, sighash)
+
+        return get_tx_hash(h_sign, True)
+
+
+def input_check_digest(txi: TxInputType) -> bytes:
+    h = HashWriter(sha256)
+    write_tx_input_check(h, txi)
+    return h.get_digest()
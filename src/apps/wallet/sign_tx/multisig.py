@@ -1,3 +1,5 @@
+from micropython import const
+
 from trezor.crypto.hashlib import sha256
 from trezor.crypto import bip32
 from trezor.utils import HashWriter
@@ -9,6 +11,17 @@ from trezor.messages import FailureType
 from apps.wallet.sign_tx.writers import *
 
 
+# the maximum number of cosigner public keys kept in the memo
+_PUBKEY_CACHE_SIZE = const(64)
+
+# cosigner public keys derived while a transaction is being signed, keyed by
+# the digest of their HDNodePathType, None outside of signing
+_pubkey_cache = None
+
+# keys of _pubkey_cache, least recently used first
+_pubkey_lru = None
+
+
 class MultisigError(ValueError):
     pass
 
@@ -74,6 +87,22 @@ def multisig_pubkey_index(multisig: MultisigRedeemScriptType, pubkey: bytes) ->
 
 
 def multisig_get_pubkey(hd: HDNodePathType) -> bytes:
+    if _pubkey_cache is None:
+        return multisig_derive_pubkey(hd)
+    key = multisig_node_fingerprint(hd)
+    pubkey = _pubkey_cache.get(key)
+    if pubkey is not None:
+        _pubkey_lru.remove(key)
+    else:
+        pubkey = multisig_derive_pubkey(hd)
+        if len(_pubkey_cache) >= _PUBKEY_CACHE_SIZE:
+            del _pubkey_cache[_pubkey_lru.pop(0)]
+        _pubkey_cache[key] = pubkey
+    _pubkey_lru.append(key)
+    return pubkey
+
+
+def multisig_derive_pubkey(hd: HDNodePathType) -> bytes:
     p = hd.address_n
     n = hd.node
     node = bip32.HDNode(
@@ -89,3 +118,30 @@ def multisig_get_pubkey(hd: HDNodePathType) -> bytes:
 
 def multisig_get_pubkeys(multisig: MultisigRedeemScriptType):
     return [multisig_get_pubkey(hd) for hd in multisig.pubkeys]
+
+
+def multisig_node_fingerprint(hd: HDNodePathType) -> bytes:
+    d = hd.node
+    h = HashWriter(sha256)
+    write_uint32(h, d.depth)
+    write_uint32(h, d.fingerprint)
+    write_uint32(h, d.child_num)
+    write_bytes(h, d.chain_code)
+    write_bytes(h, d.public_key)
+    write_uint32(h, len(hd.address_n))
+    for i in hd.address_n:
+        write_uint32(h, i)
+    return h.get_digest()
+
+
+def multisig_cache_begin():
+    '''Keep the derived cosigner public keys until `multisig_cache_end`.'''
+    global _pubkey_cache, _pubkey_lru
+    _pubkey_cache = {}
+    _pubkey_lru = []
+
+
+def multisig_cache_end():
+    global _pubkey_cache, _pubkey_lru
+    _pubkey_cache = None
+    _pubkey_lru = None
@@ -0,0 +1,256 @@
+'''
+Transactions signed from the SD card, without streaming them over USB.
+
+The card holds a container at the block given in `SignTxExt.sdcard_block`, so a
+partitioned card keeps its partition table.  All numbers are little-endian:
+
+>>> header:  b'TRZRSTX1', payload length (uint32), record count (uint32),
+>>>          reserved blocks (uint32)
+>>> record:  kind (uint8), index (uint32), hash length (uint8), hash,
+>>>          message length (uint32), message
+
+The first record is of kind `KIND_SIGNTX` and holds the `SignTx` message, the
+other records hold the `TransactionType` acknowledging the `TxRequest` of the
+same kind (request type), index and hash (empty for the signed transaction).
+The extra data of a previous transaction is stored raw, not as a message, in
+one record of kind `TXEXTRADATA` and index 0, so each request reads only the
+requested slice of it.
+
+The signed transaction is written to the reserved blocks following the
+container, nothing is written past them:
+
+>>> header:  b'TRZRSIG1', transaction length (uint32), signed inputs (uint32),
+>>>          signing time in ms (uint32), padded to a block
+>>> blocks:  the serialized transaction
+'''
+
+from micropython import const
+
+import protobuf
+import utime
+from trezor import io
+from trezor.messages import FailureType
+from trezor.messages.RequestType import TXEXTRADATA
+from trezor.messages.SignTx import SignTx
+from trezor.messages.TransactionType import TransactionType
+from trezor.messages.TxAck import TxAck
+
+from apps.wallet.sign_tx.signing import SigningError
+
+KIND_SIGNTX = const(0xFF)
+
+_BLOCK_SIZE = const(512)
+_HEADER_LEN = const(20)
+
+_TX_MAGIC = b'TRZRSTX1'
+_SIG_MAGIC = b'TRZRSIG1'
+
+
+def container_error():
+    return SigningError(FailureType.DataError, 'Invalid transaction on SD card')
+
+
+class SDCardReader:
+    '''Async reader of the card contents, see `protobuf.AsyncReader`.'''
+
+    def __init__(self, sd):
+        self.sd = sd
+        self.buf = bytearray(_BLOCK_SIZE)
+        self.block = None  # number of the block in buf
+        self.ofs = 0
+
+    def seek(self, ofs: int):
+        self.ofs = ofs
+
+    def read(self, n: int) -> bytearray:
+        buf = bytearray(n)
+        self.readinto(buf)
+        return buf
+
+    def readinto(self, buf):
+        nread = 0
+        while nread < len(buf):
+            block = self.ofs // _BLOCK_SIZE
+            if block != self.block:
+                if not self.sd.read(block, self.buf):
+                    raise container_error()
+                self.block = block
+            start = self.ofs % _BLOCK_SIZE
+            n = min(len(buf) - nread, _BLOCK_SIZE - start)
+            buf[nread:nread + n] = self.buf[start:start + n]
+            nread += n
+            self.ofs += n
+        return nread
+
+    async def areadinto(self, buf):
+        return self.readinto(buf)
+
+
+class SDCardWriter:
+    '''Writes whole blocks to the card, from block `block` up to `end`.'''
+
+    def __init__(self, sd, block: int, end: int):
+        self.sd = sd
+        self.block = block
+        self.end = end
+        self.buf = bytearray(_BLOCK_SIZE)
+        self.ofs = 0
+        self.size = 0
+
+    def write(self, data):
+        ofs = 0
+        while ofs < len(data):
+            n = min(len(data) - ofs, _BLOCK_SIZE - self.ofs)
+            self.buf[self.ofs:self.ofs + n] = data[ofs:ofs + n]
+            self.ofs += n
+            ofs += n
+            if self.ofs == _BLOCK_SIZE:
+                self.flush()
+        self.size += len(data)
+
+    def flush(self):
+        if self.ofs == 0:
+            return
+        for i in range(self.ofs, _BLOCK_SIZE):
+            self.buf[i] = 0
+        if self.block >= self.end:
+            raise SigningError(FailureType.DataError,
+                               'Signed transaction exceeds reserved SD card area')
+        if not self.sd.write(self.block, self.buf):
+            raise SigningError(FailureType.ProcessError, 'SD card write failed')
+        self.block += 1
+        self.ofs = 0
+
+
+class SDCardTx:
+    '''
+    Source of a transaction stored on the SD card, in the container at block
+    `block`.  `load` reads the container and returns the `SignTx` message,
+    `ack` answers the requests of the signer, `write` stores the serialized
+    parts of the signed transaction.
+    '''
+
+    def __init__(self, sd=None, block: int=0):
+        self.sd = sd if sd is not None else io.SDCard()
+        self.block = block
+        self.reader = SDCardReader(self.sd)
+        self.index = {}  # (kind, hash, index) -> offset of the message
+        self.writer = None
+        self.header_block = 0  # block of the signed transaction header
+        self.inputs = 0  # number of inputs of the signed transaction
+        self.start = 0
+
+    async def load(self) -> SignTx:
+        if not self.sd.present():
+            raise SigningError(FailureType.ProcessError, 'SD card not present')
+        self.sd.power(True)
+
+        r = self.reader
+        r.seek(self.block * _BLOCK_SIZE)
+        header = r.read(_HEADER_LEN)
+        if bytes(header[:8]) != _TX_MAGIC:
+            raise container_error()
+        length = uint32(header, 8)
+        count = uint32(header, 12)
+        reserved = uint32(header, 16)
+        end = self.block * _BLOCK_SIZE + _HEADER_LEN + length
+
+        # the signed transaction follows the container, after its header
+        # block, and has to fit into the reserved blocks of the card
+        self.header_block = (end + _BLOCK_SIZE - 1) // _BLOCK_SIZE
+        reserved_end = self.header_block + reserved
+        if reserved < 2 or reserved_end * _BLOCK_SIZE > self.sd.capacity():
+            raise container_error()
+
+        hashes = {}  # hashes shared by the index keys
+        signtx = None
+        for _ in range(count):
+            kind = r.read(1)[0]
+            index = uint32(r.read(4), 0)
+            tx_hash = bytes(r.read(r.read(1)[0]))
+            tx_hash = hashes.setdefault(tx_hash, tx_hash)
+            mlen = uint32(r.read(4), 0)
+            if r.ofs + mlen > end:
+                raise container_error()
+            if kind == KIND_SIGNTX:
+                signtx = r.ofs, mlen
+            else:
+                self.index[(kind, tx_hash, index)] = (r.ofs, mlen)
+            r.seek(r.ofs + mlen)
+        if signtx is None:
+            raise container_error()
+
+        self.writer = SDCardWriter(self.sd, self.header_block + 1, reserved_end)
+        self.mark()
+
+        msg = await self.load_message(signtx, SignTx)
+        self.inputs = msg.inputs_count or 0
+        return msg
+
+    async def load_message(self, record, msg_type):
+        ofs, mlen = record
+        self.reader.seek(ofs)
+        return await protobuf.load_message(
+            protobuf.LimitedReader(self.reader, mlen), msg_type)
+
+    async def ack(self, req) -> TxAck:
+        details = req.details
+        tx_hash = bytes(details.tx_hash) if details.tx_hash is not None else b''
+        if req.request_type == TXEXTRADATA:
+            index = 0
+        else:
+            index = details.request_index or 0
+        record = self.index.get((req.request_type, tx_hash, index))
+        if record is None:
+            raise container_error()
+        if req.request_type == TXEXTRADATA:
+            data = self.read_extra_data(record, details.extra_data_offset or 0,
+                                        details.extra_data_len or 0)
+            return TxAck(tx=TransactionType(extra_data=data))
+        tx = await self.load_message(record, TransactionType)
+        return TxAck(tx=tx)
+
+    def read_extra_data(self, record, ofs: int, n: int) -> bytearray:
+        rofs, rlen = record
+        if ofs + n > rlen:
+            raise container_error()
+        self.reader.seek(rofs + ofs)
+        return self.reader.read(n)
+
+    def write(self, serialized):
+        if serialized is not None and serialized.serialized_tx:
+            self.writer.write(serialized.serialized_tx)
+
+    def mark(self):
+        '''Start measuring the signing time.'''
+        self.start = utime.ticks_ms()
+
+    def finish(self) -> int:
+        '''
+        Write the header of the signed transaction, return the time in ms since
+        `mark`.
+        '''
+        self.writer.flush()
+        ms = utime.ticks_diff(utime.ticks_ms(), self.start)
+        header = bytearray(_BLOCK_SIZE)
+        header[:8] = _SIG_MAGIC
+        pack_uint32(header, 8, self.writer.size)
+        pack_uint32(header, 12, self.inputs)
+        pack_uint32(header, 16, ms)
+        if not self.sd.write(self.header_block, header):
+            raise SigningError(FailureType.ProcessError, 'SD card write failed')
+        return ms
+
+    def close(self):
+        self.sd.power(False)
+
+
+def uint32(buf, ofs: int) -> int:
+    return buf[ofs] | (buf[ofs + 1] << 8) | (buf[ofs + 2] << 16) | (buf[ofs + 3] << 24)
+
+
+def pack_uint32(buf, ofs: int, n: int):
+    buf[ofs] = n & 0xFF
+    buf[ofs + 1] = (n >> 8) & 0xFF
+    buf[ofs + 2] = (n >> 16) & 0xFF
+    buf[ofs + 3] = (n >> 24) & 0xFF
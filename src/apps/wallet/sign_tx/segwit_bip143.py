@@ -18,6 +18,9 @@ class Bip143:
         self.h_prevouts = HashWriter(sha256)
         self.h_sequence = HashWriter(sha256)
         self.h_outputs = HashWriter(sha256)
+        self.h_prefix = None  # nVersion, hashPrevouts and hashSequence
+        self.suffix = None  # hashOutputs, nLockTime and nHashType
+        self.sighash = None
 
     def add_prevouts(self, txi: TxInputType):
         write_bytes_rev(self.h_prevouts, txi.prev_hash)
@@ -38,25 +41,40 @@ class Bip143:
     def get_outputs_hash(self) -> bytes:
         return get_tx_hash(self.h_outputs, True)
 
-    def preimage_hash(self, tx: SignTx, txi: TxInputType, pubkeyhash: bytes, sighash: int) -> bytes:
-        h_preimage = HashWriter(sha256)
+    def freeze(self, tx: SignTx, sighash: int):
+        '''
+        Finalize the parts of the preimage common to all inputs.  Call after
+        all inputs and outputs were added.
+        '''
+        self.h_prefix = HashWriter(sha256)
+        write_uint32(self.h_prefix, tx.version)  # nVersion
+        write_bytes(self.h_prefix, self.get_prevouts_hash())  # hashPrevouts
+        write_bytes(self.h_prefix, self.get_sequence_hash())  # hashSequence
+
+        self.suffix = bytearray_with_cap(32 + 4 + 4)
+        write_bytes(self.suffix, self.get_outputs_hash())  # hashOutputs
+        write_uint32(self.suffix, tx.lock_time)  # nLockTime
+        write_uint32(self.suffix, sighash)  # nHashType
+        self.sighash = sighash
 
-        write_uint32(h_preimage, tx.version)  # nVersion
-        write_bytes(h_preimage, bytearray(self.get_prevouts_hash()))  # hashPrevouts
-        write_bytes(h_preimage, bytearray(self.get_sequence_hash()))  # hashSequence
-        write_bytes_rev(h_preimage, txi.prev_hash)  # outpoint
-        write_uint32(h_preimage, txi.prev_index)  # outpoint
+    def preimage_hash(self, tx: SignTx, txi: TxInputType, pubkeyhash: bytes, sighash: int) -> bytes:
+        if self.h_prefix is None or self.sighash != sighash:
+            self.freeze(tx, sighash)
 
         script_code = self.derive_script_code(txi, pubkeyhash)
-        write_varint(h_preimage, len(script_code))  # scriptCode length
-        write_bytes(h_preimage, script_code)  # scriptCode
-
-        write_uint64(h_preimage, txi.amount)  # amount
-        write_uint32(h_preimage, txi.sequence)  # nSequence
 
-        write_bytes(h_preimage, bytearray(self.get_outputs_hash()))  # hashOutputs
-        write_uint32(h_preimage, tx.lock_time)  # nLockTime
-        write_uint32(h_preimage, sighash)  # nHashType
+        # the per-input part is serialized first and hashed in one go
+        w = bytearray_with_cap(32 + 4 + 5 + len(script_code) + 8 + 4)
+        write_bytes_rev(w, txi.prev_hash)  # outpoint
+        write_uint32(w, txi.prev_index)  # outpoint
+        write_varint(w, len(script_code))  # scriptCode length
+        write_bytes(w, script_code)  # scriptCode
+        write_uint64(w, txi.amount)  # amount
+        write_uint32(w, txi.sequence)  # nSequence
+
+        h_preimage = self.h_prefix.fork()
+        write_bytes(h_preimage, w)
+        write_bytes(h_preimage, self.suffix)
 
         return get_tx_hash(h_preimage, True)
 
@@ -12,6 +12,7 @@ from trezor.messages.TxRequestSerializedType import TxRequestSerializedType
 from apps.common import address_type, coins
 from apps.wallet.sign_tx.addresses import *
 from apps.wallet.sign_tx.helpers import *
+from apps.wallet.sign_tx.legacy_sighash import LegacySighash
 from apps.wallet.sign_tx.scripts import *
 from apps.wallet.sign_tx.segwit_bip143 import *
 from apps.wallet.sign_tx.tx_weight_calculator import *
@@ -29,6 +30,17 @@ _BIP32_CHANGE_CHAIN = const(1)
 # use and still allow to quickly brute-force the correct bip32 path
 _BIP32_MAX_LAST_ELEMENT = const(1000000)
 
+# the maximum number of output amounts of previous transactions kept in memory
+# during signing, see get_prevtx_output_value
+_PREVTX_CACHE_OUTPUTS = const(512)
+
+# the maximum number of account-level nodes kept during signing, see node_derive
+_NODE_CACHE_SIZE = const(4)
+
+# the maximum number of bytes of output scripts kept during signing, see
+# OutputScripts
+_OUTPUT_SCRIPTS_SIZE = const(8 * 1024)
+
 
 class SigningError(ValueError):
     pass
@@ -54,6 +66,10 @@ async def check_tx_fee(tx: SignTx, root: bip32.HDNode):
     h_first = HashWriter(sha256)  # not a real tx hash
 
     bip143 = Bip143()  # bip143 transaction hashing
+    legacy = None  # legacy transaction hashing, if the tx fits into memory
+    scripts = OutputScripts()  # output scripts, reused in Phase 2
+    if not coin.force_bip143 and LegacySighash.fits(tx):
+        legacy = LegacySighash(tx)
     multifp = MultisigFingerprint()  # control checksum of multisig inputs
     weight = TxWeightCalculator(tx.inputs_count, tx.outputs_count)
 
@@ -62,7 +78,8 @@ async def check_tx_fee(tx: SignTx, root: bip32.HDNode):
     total_out = 0  # sum of output amounts
     change_out = 0  # change output amount
     wallet_path = []  # common prefix of input paths
-    segwit = {}  # dict of booleans stating if input is segwit
+    segwit = Bitmap(tx.inputs_count)  # bits stating if input is segwit
+    prevtx_cache = {}  # verified output amounts of previous transactions
 
     # output structures
     txo_bin = TxOutputBinType()
@@ -78,6 +95,8 @@ async def check_tx_fee(tx: SignTx, root: bip32.HDNode):
         weight.add_input(txi)
         bip143.add_prevouts(txi)  # all inputs are included (non-segwit as well)
         bip143.add_sequence(txi)
+        if legacy is not None and not legacy.add_input(txi):
+            legacy = None
 
         if txi.multisig:
             multifp.add(txi.multisig)
@@ -90,7 +109,7 @@ async def check_tx_fee(tx: SignTx, root: bip32.HDNode):
             if not txi.amount:
                 raise SigningError(FailureType.DataError,
                                    'Segwit input without amount')
-            segwit[i] = True
+            segwit.set(i)
             segwit_in += txi.amount
             total_in += txi.amount
 
@@ -100,13 +119,11 @@ async def check_tx_fee(tx: SignTx, root: bip32.HDNode):
                 if not txi.amount:
                     raise SigningError(FailureType.DataError,
                                        'BIP 143 input without amount')
-                segwit[i] = False
                 segwit_in += txi.amount
                 total_in += txi.amount
             else:
-                segwit[i] = False
                 total_in += await get_prevtx_output_value(
-                    tx_req, txi.prev_hash, txi.prev_index)
+                    tx_req, txi.prev_hash, txi.prev_index, prevtx_cache)
 
         else:
             raise SigningError(FailureType.DataError,
@@ -116,7 +133,9 @@ async def check_tx_fee(tx: SignTx, root: bip32.HDNode):
         # STAGE_REQUEST_3_OUTPUT
         txo = await request_tx_output(tx_req, o)
         txo_bin.amount = txo.amount
+        digest = output_digest(txo)
         txo_bin.script_pubkey = output_derive_script(txo, coin, root)
+        scripts.add(digest, txo_bin.script_pubkey)
         weight.add_output(txo_bin.script_pubkey)
 
         if change_out == 0 and is_change(txo, wallet_path, segwit_in, multifp):
@@ -128,6 +147,8 @@ async def check_tx_fee(tx: SignTx, root: bip32.HDNode):
 
         write_tx_output(h_first, txo_bin)
         bip143.add_output(txo_bin)
+        if legacy is not None and not legacy.add_output(txo_bin):
+            legacy = None
         total_out += txo_bin.amount
 
     fee = total_in - total_out
@@ -145,17 +166,31 @@ async def check_tx_fee(tx: SignTx, root: bip32.HDNode):
         raise SigningError(FailureType.ActionCancelled,
                            'Total cancelled')
 
-    return h_first, bip143, segwit, total_in, wallet_path
+    if segwit.count == tx.inputs_count:
+        legacy = None  # no input is signed the legacy way
+    if coin.force_bip143 or segwit.count:
+        bip143.freeze(tx, get_hash_type(coin))
+
+    return h_first, bip143, legacy, scripts, segwit, total_in, wallet_path
 
 
 async def sign_tx(tx: SignTx, root: bip32.HDNode):
+    multisig_cache_begin()
+    try:
+        await _sign_tx(tx, root)
+    finally:
+        node_cache_clear()
+        multisig_cache_end()
+
+
+async def _sign_tx(tx: SignTx, root: bip32.HDNode):
     tx = sanitize_sign_tx(tx)
 
     progress.init(tx.inputs_count, tx.outputs_count)
 
     # Phase 1
 
-    h_first, bip143, segwit, authorized_in, wallet_path = await check_tx_fee(tx, root)
+    h_first, bip143, legacy, scripts, segwit, authorized_in, wallet_path = await check_tx_fee(tx, root)
 
     # Phase 2
     # - sign inputs
@@ -175,7 +210,7 @@ async def sign_tx(tx: SignTx, root: bip32.HDNode):
         key_sign = None
         key_sign_pub = None
 
-        if segwit[i_sign]:
+        if segwit.get(i_sign):
             # STAGE_REQUEST_SEGWIT_INPUT
             txi_sign = await request_tx_input(tx_req, i_sign)
 
@@ -235,6 +270,42 @@ async def sign_tx(tx: SignTx, root: bip32.HDNode):
 
             tx_req.serialized = tx_ser
 
+        elif legacy is not None:
+            # STAGE_REQUEST_4_INPUT
+            # the other inputs and the outputs are hashed from the data
+            # recorded in Phase 1, this input is checked against it
+            txi_sign = await request_tx_input(tx_req, i_sign)
+            input_check_wallet_path(txi_sign, wallet_path)
+            if not legacy.check_input(i_sign, txi_sign):
+                raise SigningError(FailureType.ProcessError,
+                                   'Transaction has changed during signing')
+
+            key_sign = node_derive(root, txi_sign.address_n)
+            key_sign_pub = key_sign.public_key()
+            txi_sign.script_sig = input_derive_script_code(txi_sign, key_sign_pub)
+
+            # if multisig, check if singing with a key that is included in multisig
+            if txi_sign.multisig:
+                multisig_pubkey_index(txi_sign.multisig, key_sign_pub)
+
+            # compute the signature from the tx digest
+            signature = ecdsa_sign(key_sign, legacy.preimage_hash(
+                i_sign, txi_sign, get_hash_type(coin)))
+            tx_ser.signature_index = i_sign
+            tx_ser.signature = signature
+
+            # serialize input with correct signature
+            txi_sign.script_sig = input_derive_script(
+                coin, txi_sign, key_sign_pub, signature)
+            w_txi_sign = bytearray_with_cap(
+                5 + len(txi_sign.prev_hash) + 4 + len(txi_sign.script_sig) + 4)
+            if i_sign == 0:  # serializing first input => prepend headers
+                write_bytes(w_txi_sign, get_tx_header(tx))
+            write_tx_input(w_txi_sign, txi_sign)
+            tx_ser.serialized_tx = w_txi_sign
+
+            tx_req.serialized = tx_ser
+
         else:
             # hash of what we are signing with this input
             h_sign = HashWriter(sha256)
@@ -253,18 +324,7 @@ async def sign_tx(tx: SignTx, root: bip32.HDNode):
                     txi_sign = txi
                     key_sign = node_derive(root, txi.address_n)
                     key_sign_pub = key_sign.public_key()
-                    # for the signing process the script_sig is equal
-                    # to the previous tx's scriptPubKey (P2PKH) or a redeem script (P2SH)
-                    if txi_sign.script_type == InputScriptType.SPENDMULTISIG:
-                        txi_sign.script_sig = output_script_multisig(
-                            multisig_get_pubkeys(txi_sign.multisig),
-                            txi_sign.multisig.m)
-                    elif txi_sign.script_type == InputScriptType.SPENDADDRESS:
-                        txi_sign.script_sig = output_script_p2pkh(
-                            ecdsa_hash_pubkey(key_sign_pub))
-                    else:
-                        raise SigningError(FailureType.ProcessError,
-                                           'Unknown transaction type')
+                    txi_sign.script_sig = input_derive_script_code(txi_sign, key_sign_pub)
                 else:
                     txi.script_sig = bytes()
                 write_tx_input(h_sign, txi)
@@ -275,7 +335,7 @@ async def sign_tx(tx: SignTx, root: bip32.HDNode):
                 # STAGE_REQUEST_4_OUTPUT
                 txo = await request_tx_output(tx_req, o)
                 txo_bin.amount = txo.amount
-                txo_bin.script_pubkey = output_derive_script(txo, coin, root)
+                txo_bin.script_pubkey = scripts.get(o, txo, coin, root)
                 write_tx_output(h_second, txo_bin)
                 write_tx_output(h_sign, txo_bin)
 
@@ -314,7 +374,7 @@ async def sign_tx(tx: SignTx, root: bip32.HDNode):
         # STAGE_REQUEST_5_OUTPUT
         txo = await request_tx_output(tx_req, o)
         txo_bin.amount = txo.amount
-        txo_bin.script_pubkey = output_derive_script(txo, coin, root)
+        txo_bin.script_pubkey = scripts.get(o, txo, coin, root)
 
         # serialize output
         w_txo_bin = bytearray_with_cap(
@@ -329,11 +389,11 @@ async def sign_tx(tx: SignTx, root: bip32.HDNode):
 
         tx_req.serialized = tx_ser
 
-    any_segwit = True in segwit.values()
+    any_segwit = segwit.count > 0
 
     for i in range(tx.inputs_count):
         progress.advance()
-        if segwit[i]:
+        if segwit.get(i):
             # STAGE_REQUEST_SEGWIT_WITNESS
             txi = await request_tx_input(tx_req, i)
             input_check_wallet_path(txi, wallet_path)
@@ -373,12 +433,27 @@ async def sign_tx(tx: SignTx, root: bip32.HDNode):
     await request_tx_finish(tx_req)
 
 
-async def get_prevtx_output_value(tx_req: TxRequest, prev_hash: bytes, prev_index: int) -> int:
+async def get_prevtx_output_value(tx_req: TxRequest, prev_hash: bytes, prev_index: int, cache: dict=None) -> int:
+    # output amounts of already verified transactions are taken from the cache
+    if cache is not None:
+        amounts = cache.get(bytes(prev_hash))
+        if amounts is not None:
+            return amounts[prev_index] if prev_index < len(amounts) else 0
+
     total_out = 0  # sum of output amounts
 
     # STAGE_REQUEST_2_PREV_META
     tx = await request_tx_meta(tx_req, prev_hash)
 
+    # keep all output amounts if they fit into the cache
+    amounts = None
+    if cache is not None:
+        cached = 0
+        for a in cache.values():
+            cached += len(a)
+        if cached + tx.outputs_cnt <= _PREVTX_CACHE_OUTPUTS:
+            amounts = []
+
     txh = HashWriter(sha256)
 
     write_uint32(txh, tx.version)
@@ -397,6 +472,8 @@ async def get_prevtx_output_value(tx_req: TxRequest, prev_hash: bytes, prev_inde
         write_tx_output(txh, txo_bin)
         if o == prev_index:
             total_out += txo_bin.amount
+        if amounts is not None:
+            amounts.append(txo_bin.amount)
 
     write_uint32(txh, tx.lock_time)
 
@@ -411,6 +488,9 @@ async def get_prevtx_output_value(tx_req: TxRequest, prev_hash: bytes, prev_inde
         raise SigningError(FailureType.ProcessError,
                            'Encountered invalid prev_hash')
 
+    if amounts is not None:
+        cache[bytes(prev_hash)] = amounts
+
     return total_out
 
 
@@ -427,6 +507,26 @@ def get_hash_type(coin: CoinType) -> int:
     return hashtype
 
 
+class Bitmap:
+    '''
+    One bit per input, packed into a bytearray so that per-input flags of
+    large transactions stay small.  `count` is the number of set bits.
+    '''
+
+    def __init__(self, size: int):
+        self.bits = bytearray((size + 7) // 8)
+        self.count = 0
+
+    def set(self, i: int):
+        mask = 1 << (i & 7)
+        if not self.bits[i >> 3] & mask:
+            self.bits[i >> 3] |= mask
+            self.count += 1
+
+    def get(self, i: int) -> bool:
+        return bool(self.bits[i >> 3] & (1 << (i & 7)))
+
+
 def get_tx_header(tx: SignTx, segwit: bool = False):
     w_txi = bytearray()
     write_uint32(w_txi, tx.version)
@@ -441,7 +541,88 @@ def get_tx_header(tx: SignTx, segwit: bool = False):
 # ===
 
 
+class OutputScripts:
+    '''
+    Scripts of the outputs derived in Phase 1, each with a digest of the output
+    it was derived from.  Later phases check the streamed output against the
+    digest and reuse the script.  Only the leading outputs with scripts fitting
+    into `_OUTPUT_SCRIPTS_SIZE` bytes are kept, the rest is derived again.
+    '''
+
+    def __init__(self):
+        self.records = []  # (digest, script_pubkey) of the leading outputs
+        self.size = 0
+        self.full = False
+
+    def add(self, digest: bytes, script_pubkey: bytes):
+        size = len(digest) + len(script_pubkey)
+        if self.full or self.size + size > _OUTPUT_SCRIPTS_SIZE:
+            self.full = True
+            return
+        self.records.append((digest, script_pubkey))
+        self.size += size
+
+    def get(self, index: int, o: TxOutputType, coin: CoinType, root: bip32.HDNode) -> bytes:
+        if index >= len(self.records):
+            return output_derive_script(o, coin, root)
+        digest, script_pubkey = self.records[index]
+        if output_digest(o) != digest:
+            raise SigningError(FailureType.ProcessError,
+                               'Transaction has changed during signing')
+        return script_pubkey
+
+
+def output_digest(o: TxOutputType) -> bytes:
+    h = HashWriter(sha256)
+    write_uint64(h, o.amount)
+    write_uint32(h, o.script_type)
+    # the address of a change output is derived from address_n in Phase 1
+    address = o.address.encode() if o.address and not o.address_n else bytes()
+    write_varint(h, len(address))
+    write_bytes(h, address)
+    write_varint(h, len(o.address_n))
+    for n in o.address_n:
+        write_uint32(h, n)
+    op_return_data = o.op_return_data or bytes()
+    write_varint(h, len(op_return_data))
+    write_bytes(h, op_return_data)
+    if o.multisig:
+        write_bytes(h, multisig_fingerprint(o.multisig))
+    return h.get_digest()
+
+
+# one-slot memo of `output_derive_script`, see `prederive_output_script`
+_prederived_output = None
+_prederived_script = None
+
+
+def prederive_output_script(o: TxOutputType, coin: CoinType, root: bip32.HDNode):
+    '''
+    Derive the script of output `o` ahead of time, i.e. while the previous
+    output is being confirmed.  The next `output_derive_script` call on the same
+    output object returns the result.
+    '''
+    global _prederived_output, _prederived_script
+    prederived_clear()
+    if o.address_n:
+        # change output derivation fills in o.address, do not touch it
+        return
+    _prederived_script = output_derive_script(o, coin, root)
+    _prederived_output = o
+
+
+def prederived_clear():
+    '''Drop the output prederived by `prederive_output_script`, if any.'''
+    global _prederived_output, _prederived_script
+    _prederived_output = None
+    _prederived_script = None
+
+
 def output_derive_script(o: TxOutputType, coin: CoinType, root: bip32.HDNode) -> bytes:
+    if o is _prederived_output:
+        script = _prederived_script
+        prederived_clear()
+        return script
 
     if o.script_type == OutputScriptType.PAYTOOPRETURN:
         # op_return output
@@ -544,6 +725,19 @@ def input_derive_script(coin: CoinType, i: TxInputType, pubkey: bytes, signature
         raise SigningError(FailureType.ProcessError, 'Invalid script type')
 
 
+def input_derive_script_code(i: TxInputType, pubkey: bytes) -> bytes:
+    # for the signing process the script_sig is equal
+    # to the previous tx's scriptPubKey (P2PKH) or a redeem script (P2SH)
+    if i.script_type == InputScriptType.SPENDMULTISIG:
+        return output_script_multisig(
+            multisig_get_pubkeys(i.multisig), i.multisig.m)
+    elif i.script_type == InputScriptType.SPENDADDRESS:
+        return output_script_p2pkh(ecdsa_hash_pubkey(pubkey))
+    else:
+        raise SigningError(FailureType.ProcessError,
+                           'Unknown transaction type')
+
+
 def input_extract_wallet_path(txi: TxInputType, wallet_path: list) -> list:
     if wallet_path is None:
         return None  # there was a mismatch in previous inputs
@@ -566,12 +760,46 @@ def input_check_wallet_path(txi: TxInputType, wallet_path: list) -> list:
                            'Transaction has changed during signing')
 
 
+# account-level nodes derived during signing, keyed by the path without the
+# last _BIP32_WALLET_DEPTH levels
+_node_cache = {}
+_node_cache_root = None
+node_cache_stats = [0, 0]  # hits, misses
+
+
 def node_derive(root: bip32.HDNode, address_n: list):
-    node = root.clone()
-    node.derive_path(address_n)
+    global _node_cache_root
+    if len(address_n) <= _BIP32_WALLET_DEPTH:
+        node = root.clone()
+        node.derive_path(address_n)
+        return node
+
+    if root is not _node_cache_root:
+        node_cache_clear()
+        _node_cache_root = root
+
+    prefix = tuple(address_n[:-_BIP32_WALLET_DEPTH])
+    account = _node_cache.get(prefix)
+    if account is None:
+        node_cache_stats[1] += 1
+        account = root.clone()
+        account.derive_path(prefix)
+        if len(_node_cache) < _NODE_CACHE_SIZE:
+            _node_cache[prefix] = account
+    else:
+        node_cache_stats[0] += 1
+
+    node = account.clone()
+    node.derive_path(address_n[-_BIP32_WALLET_DEPTH:])
     return node
 
 
+def node_cache_clear():
+    global _node_cache_root
+    _node_cache.clear()
+    _node_cache_root = None
+
+
 def ecdsa_sign(node: bip32.HDNode, digest: bytes) -> bytes:
     sig = secp256k1.sign(node.private_key(), digest)
     sigder = der.encode_seq((sig[1:33], sig[33:65]))
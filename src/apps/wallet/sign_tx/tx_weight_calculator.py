@@ -51,6 +51,22 @@ class TxWeightCalculator:
             self.segwit = True
 
     def add_input(self, i: TxInputType):
+        if is_segwit_input(i):
+            self.add_witness_header()
+        self.counter += self.input_weight(i)
+
+    def add_output(self, script: bytes):
+        self.counter += self.output_weight(script)
+
+    def add_weight(self, weight: int, segwit: bool=False):
+        '''Add a weight computed by `input_weight` or `output_weight`.'''
+        if segwit:
+            self.add_witness_header()
+        self.counter += weight
+
+    @classmethod
+    def input_weight(cls, i: TxInputType) -> int:
+        '''Weight of the input, without the segwit header.'''
 
         if i.multisig:
             multisig_script_size = (
@@ -59,33 +75,34 @@ class TxWeightCalculator:
             input_script_size = (
                 1 +  # the OP_FALSE bug in multisig
                 i.multisig.m * (1 + _TXSIZE_SIGNATURE) +
-                self.op_push_size(multisig_script_size) +
+                cls.op_push_size(multisig_script_size) +
                 multisig_script_size)
         else:
             input_script_size = 1 + _TXSIZE_SIGNATURE + 1 + _TXSIZE_PUBKEY
 
-        self.counter += 4 * _TXSIZE_INPUT
+        weight = 4 * _TXSIZE_INPUT
 
         if (i.script_type == InputScriptType.SPENDADDRESS or
                 i.script_type == InputScriptType.SPENDMULTISIG):
-            input_script_size += self.ser_length_size(input_script_size)
-            self.counter += 4 * input_script_size
+            input_script_size += cls.ser_length_size(input_script_size)
+            weight += 4 * input_script_size
 
-        elif (i.script_type == InputScriptType.SPENDWITNESS or
-                i.script_type == InputScriptType.SPENDP2SHWITNESS):
-            self.add_witness_header()
+        elif is_segwit_input(i):
             if i.script_type == InputScriptType.SPENDP2SHWITNESS:
                 if i.multisig:
-                    self.counter += 4 * (2 + _TXSIZE_WITNESSSCRIPT)
+                    weight += 4 * (2 + _TXSIZE_WITNESSSCRIPT)
                 else:
-                    self.counter += 4 * (2 + _TXSIZE_WITNESSPKHASH)
+                    weight += 4 * (2 + _TXSIZE_WITNESSPKHASH)
             else:
-                self.counter += 4  # empty
-            self.counter += input_script_size  # discounted witness
+                weight += 4  # empty
+            weight += input_script_size  # discounted witness
 
-    def add_output(self, script: bytes):
-        size = len(script) + self.ser_length_size(len(script))
-        self.counter += 4 * (_TXSIZE_OUTPUT + size)
+        return weight
+
+    @classmethod
+    def output_weight(cls, script: bytes) -> int:
+        size = len(script) + cls.ser_length_size(len(script))
+        return 4 * (_TXSIZE_OUTPUT + size)
 
     def get_total(self) -> int:
         return self.counter
@@ -107,3 +124,8 @@ class TxWeightCalculator:
         if length < 0x10000:
             return 3
         return 5
+
+
+def is_segwit_input(i: TxInputType) -> bool:
+    return (i.script_type == InputScriptType.SPENDWITNESS or
+            i.script_type == InputScriptType.SPENDP2SHWITNESS)
@@ -1,4 +1,7 @@
+import ustruct
+
 from trezor.crypto.hashlib import sha256
+from trezor.utils import memcpy_rev
 
 from apps.wallet.sign_tx.writers import *
 
@@ -36,55 +39,47 @@ def write_op_push(w, n: int):
     if n < 0x4C:
         w.append(n & 0xFF)
     elif n < 0xFF:
-        w.append(0x4C)
-        w.append(n & 0xFF)
+        ustruct.pack_into('<BB', _buf2, 0, 0x4C, n)
+        w.extend(_buf2)
     elif n < 0xFFFF:
-        w.append(0x4D)
-        w.append(n & 0xFF)
-        w.append((n >> 8) & 0xFF)
+        ustruct.pack_into('<BH', _buf3, 0, 0x4D, n)
+        w.extend(_buf3)
     else:
-        w.append(0x4E)
-        w.append(n & 0xFF)
-        w.append((n >> 8) & 0xFF)
-        w.append((n >> 16) & 0xFF)
-        w.append((n >> 24) & 0xFF)
+        ustruct.pack_into('<BI', _buf5, 0, 0x4E, n)
+        w.extend(_buf5)
 
 
 # Buffer IO & Serialization
 # ===
 
+# the integers are packed into these buffers and written with a single extend
+_buf2 = bytearray(2)
+_buf3 = bytearray(3)
+_buf4 = bytearray(4)
+_buf5 = bytearray(5)
+_buf8 = bytearray(8)
+_buf32 = bytearray(32)  # reversed hashes
+
 
 def write_varint(w, n: int):
     if n < 253:
         w.append(n & 0xFF)
     elif n < 65536:
-        w.append(253)
-        w.append(n & 0xFF)
-        w.append((n >> 8) & 0xFF)
+        ustruct.pack_into('<BH', _buf3, 0, 253, n)
+        w.extend(_buf3)
     else:
-        w.append(254)
-        w.append(n & 0xFF)
-        w.append((n >> 8) & 0xFF)
-        w.append((n >> 16) & 0xFF)
-        w.append((n >> 24) & 0xFF)
+        ustruct.pack_into('<BI', _buf5, 0, 254, n)
+        w.extend(_buf5)
 
 
 def write_uint32(w, n: int):
-    w.append(n & 0xFF)
-    w.append((n >> 8) & 0xFF)
-    w.append((n >> 16) & 0xFF)
-    w.append((n >> 24) & 0xFF)
+    ustruct.pack_into('<I', _buf4, 0, n)
+    w.extend(_buf4)
 
 
 def write_uint64(w, n: int):
-    w.append(n & 0xFF)
-    w.append((n >> 8) & 0xFF)
-    w.append((n >> 16) & 0xFF)
-    w.append((n >> 24) & 0xFF)
-    w.append((n >> 32) & 0xFF)
-    w.append((n >> 40) & 0xFF)
-    w.append((n >> 48) & 0xFF)
-    w.append((n >> 56) & 0xFF)
+    ustruct.pack_into('<Q', _buf8, 0, n)
+    w.extend(_buf8)
 
 
 def write_bytes(w, buf: bytearray):
@@ -92,7 +87,9 @@ def write_bytes(w, buf: bytearray):
 
 
 def write_bytes_rev(w, buf: bytearray):
-    w.extend(bytearray(reversed(buf)))
+    rev = _buf32 if len(buf) == 32 else bytearray(len(buf))
+    memcpy_rev(rev, 0, buf, 0, len(buf))
+    w.extend(rev)
 
 
 def bytearray_with_cap(cap: int) -> bytearray:
@@ -110,5 +107,7 @@ def get_tx_hash(w, double: bool, reverse: bool=False) -> bytes:
     if double:
         d = sha256(d).digest()
     if reverse:
-        d = bytes(reversed(d))
+        rev = bytearray(len(d))
+        memcpy_rev(rev, 0, d, 0, len(d))
+        d = bytes(rev)
     return d
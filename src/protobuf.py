@@ -113,8 +113,36 @@ class CountingWriter:
         return nwritten
 
 
+class BytearrayWriter:
+    def __init__(self, size=0):
+        self.buf = bytearray(size)
+        self.ofs = 0
+
+    async def awrite(self, buf):
+        nwritten = len(buf)
+        self.buf[self.ofs:self.ofs + nwritten] = buf
+        self.ofs += nwritten
+        return nwritten
+
+
 FLAG_REPEATED = const(1)
 
+# first tag of the fields not in trezor-common yet, see extend_fields
+EXPERIMENTAL_TAG = const(1000)
+
+
+def extend_fields(fields: dict, extra: dict) -> dict:
+    '''
+    Return `fields` of a generated message with the `extra` fields that are not
+    in trezor-common yet, tagged from `EXPERIMENTAL_TAG` on.  The extra fields
+    are on the wire only in debug builds, release builds keep the protocol of
+    the generated messages.
+    '''
+    fields = dict(fields)
+    if __debug__:
+        fields.update(extra)
+    return fields
+
 
 async def load_message(reader, msg_type):
     fields = msg_type.FIELDS
@@ -1,54 +1,112 @@
+'''
+RLP encoding.  The `write*` functions emit the encoding into any writer with
+`append(int)` and `extend(bytes)`, e.g. a bytearray or `trezor.utils.HashWriter`,
+without building temporary buffers.  Items are ints, bytes, bytearrays and
+(nested) lists of items.
+'''
 
-def int_to_bytes(x: int) -> bytes:
-    if x == 0:
-        return b''
-    r = bytearray()
+
+def int_length(x: int) -> int:
+    n = 0
     while x:
-        r.append(x % 256)
-        x //= 256
-    return bytes(reversed(r))
+        n += 1
+        x >>= 8
+    return n
 
 
-def encode_length(l: int, is_list: bool) -> bytes:
+def header_length(length: int) -> int:
+    if length < 56:
+        return 1
+    return 1 + int_length(length)
+
+
+def payload_length(item) -> int:
+    if isinstance(item, int):
+        return int_length(item)
+    if isinstance(item, (bytes, bytearray)):
+        return len(item)
+    if isinstance(item, list):
+        return sum(length(i) for i in item)
+    raise TypeError('Invalid input of type ' + str(type(item)))
+
+
+def length(item) -> int:
+    '''Return the length of the encoded `item`, see `write()`.'''
+    if is_single_byte(item):
+        return 1
+    l = payload_length(item)
+    return header_length(l) + l
+
+
+def field_length(length: int, first_byte: bytearray) -> int:
+    '''Return the encoded length of `length` bytes starting with `first_byte`.'''
+    if length == 1 and first_byte[0] <= 0x7f:
+        return 1
+    return header_length(length) + length
+
+
+def is_single_byte(item) -> bool:
+    if isinstance(item, int):
+        return 0 < item < 0x80
+    if isinstance(item, (bytes, bytearray)):
+        return len(item) == 1 and item[0] < 0x80
+    return False
+
+
+def write_int(w, x: int, n: int):
+    for i in range(n - 1, -1, -1):
+        w.append((x >> (8 * i)) & 0xff)
+
+
+def write_header(w, length: int, is_list: bool):
     offset = 0xC0 if is_list else 0x80
-    if l < 56:
-        return bytes([l + offset])
-    elif l < 256 ** 8:
-        bl = int_to_bytes(l)
-        return bytes([len(bl) + offset + 55]) + bl
+    if length < 56:
+        w.append(offset + length)
+    elif length < 256 ** 8:
+        n = int_length(length)
+        w.append(offset + 55 + n)
+        write_int(w, length, n)
     else:
         raise ValueError('Input too long')
 
 
-def encode(data, include_length=True) -> bytes:
-    if isinstance(data, int):
-        data = int_to_bytes(data)
-    if isinstance(data, bytearray):
-        data = bytes(data)
-    if isinstance(data, bytes):
-        if (len(data) == 1 and ord(data) < 128) or not include_length:
-            return data
-        else:
-            return encode_length(len(data), is_list=False) + data
-    elif isinstance(data, list):
-        output = b''
-        for item in data:
-            output += encode(item)
-        if include_length:
-            return encode_length(len(output), is_list=True) + output
-        else:
-            return output
+def write_payload(w, item):
+    if isinstance(item, int):
+        write_int(w, item, int_length(item))
+    elif isinstance(item, (bytes, bytearray)):
+        w.extend(item)
+    elif isinstance(item, list):
+        for i in item:
+            write(w, i)
     else:
-        raise TypeError('Invalid input of type ' + str(type(data)))
+        raise TypeError('Invalid input of type ' + str(type(item)))
 
 
-def field_length(length: int, first_byte: bytearray) -> int:
-    if length == 1 and first_byte[0] <= 0x7f:
-        return 1
-    elif length <= 55:
-        return 1 + length
-    elif length <= 0xff:
-        return 2 + length
-    elif length <= 0xffff:
-        return 3 + length
-    return 4 + length
+def write(w, item):
+    '''Write the encoded `item` into `w`.'''
+    if is_single_byte(item):
+        write_payload(w, item)
+    else:
+        write_header(w, payload_length(item), isinstance(item, list))
+        write_payload(w, item)
+
+
+def int_to_bytes(x: int) -> bytes:
+    w = bytearray()
+    write_int(w, x, int_length(x))
+    return bytes(w)
+
+
+def encode_length(l: int, is_list: bool) -> bytes:
+    w = bytearray()
+    write_header(w, l, is_list)
+    return bytes(w)
+
+
+def encode(data, include_length=True) -> bytes:
+    w = bytearray()
+    if include_length:
+        write(w, data)
+    else:
+        write_payload(w, data)
+    return bytes(w)
@@ -154,6 +154,8 @@ def grid(i: int,
 
 
 class Widget:
+    drawn = False  # the first frame is already on the display, skip it
+
     def render(self):
         pass
 
@@ -164,7 +166,10 @@ class Widget:
         touch = loop.select(io.TOUCH)
         result = None
         while result is None:
-            self.render()
+            if self.drawn:
+                self.drawn = False
+            else:
+                self.render()
             event, *pos = yield touch
             result = self.touch(event, pos)
         return result
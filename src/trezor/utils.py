@@ -1,23 +1,101 @@
 import sys
 import gc
+import utime
+from micropython import const
 
-from trezorutils import halt, memcpy, set_mode_unprivileged, symbol, model  # noqa: F401
+from trezorutils import halt, memcpy, memcpy_rev, set_mode_unprivileged, symbol, model  # noqa: F401
+
+
+# Modules imported by the dispatchers wrapped in `unimport` stay resident in
+# `sys.modules` while the heap has at least `resident_budget` bytes free.  Under
+# pressure the least recently used group of modules is evicted, together with
+# all groups loaded after it, because those can hold references to its modules.
+resident_budget = 64 * 1024
+_resident = []  # module groups in load order: [dispatcher, modules, last use]
+_residency = {}  # dispatcher -> [cold calls, cold us, warm calls, warm us]
+_uses = 0
 
 
 def unimport(genfunc):
     async def inner(*args, **kwargs):
+        global _uses
+        _uses += 1
+        name = genfunc.__name__
+        warm = False
+        for group in _resident:
+            if group[0] == name:
+                group[2] = _uses
+                warm = True
         mods = set(sys.modules)
         try:
-            ret = await genfunc(*args, **kwargs)
+            started = utime.ticks_us()
+            ret = genfunc(*args, **kwargs)
+            _record_import(name, warm, utime.ticks_diff(utime.ticks_us(), started))
+            ret = await ret
         finally:
-            for mod in sys.modules:
-                if mod not in mods:
-                    del sys.modules[mod]
+            loaded = [mod for mod in sys.modules if mod not in mods]
+            if loaded:
+                _resident.append([name, loaded, _uses])
             gc.collect()
+            while _resident and gc.mem_free() < resident_budget:
+                _evict_lru()
+                gc.collect()
         return ret
     return inner
 
 
+def _record_import(name, warm, us):
+    s = _residency.get(name)
+    if s is None:
+        s = _residency[name] = [0, 0, 0, 0]
+    i = 2 if warm else 0
+    s[i] += 1
+    s[i + 1] += us
+
+
+def _evict(index):
+    for group in _resident[index:]:
+        for mod in group[1]:
+            if mod in sys.modules:
+                del sys.modules[mod]
+    del _resident[index:]
+
+
+def _evict_lru():
+    lru = 0
+    for i in range(1, len(_resident)):
+        if _resident[i][2] < _resident[lru][2]:
+            lru = i
+    _evict(lru)
+
+
+def unimport_all():
+    '''Evict all modules kept resident by `unimport`.'''
+    _evict(0)
+    gc.collect()
+
+
+def residency_report() -> str:
+    '''
+    Return the import statistics of `unimport` dispatchers, one line per
+    dispatcher: number of cold and warm calls with the average import time in
+    microseconds, and the total time saved by the warm calls.
+    '''
+    lines = []
+    for name in sorted(_residency):
+        cold_n, cold_us, warm_n, warm_us = _residency[name]
+        cold_avg = cold_us // cold_n if cold_n else 0
+        warm_avg = warm_us // warm_n if warm_n else 0
+        saved = max(0, cold_avg * warm_n - warm_us) if cold_n else 0
+        lines.append('%s cold=%d/%d warm=%d/%d saved=%d' % (
+            name, cold_n, cold_avg, warm_n, warm_avg, saved))
+    return '\n'.join(lines)
+
+
+def residency_reset():
+    _residency.clear()
+
+
 def ensure(cond, msg=None):
     if not cond:
         if msg is None:
@@ -64,18 +142,48 @@ def format_ordinal(number):
     return str(number) + {1: 'st', 2: 'nd', 3: 'rd'}.get(4 if 10 <= number % 100 < 20 else number % 10, 'th')
 
 
+# size of the block collecting small writes into a HashWriter
+_HASHWRITER_BLOCK = const(64)
+
+
 class HashWriter:
+    '''
+    Writer feeding a hash context.  Small writes are collected into a block
+    and hashed together, so that serializing integers does not call the
+    native hash for every few bytes.
+    '''
 
     def __init__(self, hashfunc):
         self.ctx = hashfunc()
-        self.buf = bytearray(1)  # used in append()
+        self.buf = bytearray(_HASHWRITER_BLOCK)  # pending bytes
+        self.ofs = 0
 
     def extend(self, buf: bytearray):
-        self.ctx.update(buf)
+        n = len(buf)
+        if self.ofs + n > _HASHWRITER_BLOCK:
+            self.flush()
+            if n >= _HASHWRITER_BLOCK:
+                self.ctx.update(buf)
+                return
+        memcpy(self.buf, self.ofs, buf, 0, n)
+        self.ofs += n
 
     def append(self, b: int):
-        self.buf[0] = b
-        self.ctx.update(self.buf)
+        if self.ofs == _HASHWRITER_BLOCK:
+            self.flush()
+        self.buf[self.ofs] = b
+        self.ofs += 1
+
+    def flush(self):
+        if self.ofs:
+            self.ctx.update(memoryview(self.buf)[:self.ofs])
+            self.ofs = 0
 
     def get_digest(self, *args) -> bytes:
+        self.flush()
         return self.ctx.digest(*args)
+
+    def fork(self):
+        '''Return a new HashWriter continuing from the current hash state.'''
+        self.flush()
+        return HashWriter(self.ctx.copy)
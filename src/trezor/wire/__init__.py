@@ -1,11 +1,12 @@
 import protobuf
+import utime
 
 from trezor import log
 from trezor import loop
 from trezor import messages
 from trezor import workflow
 
-from . import codec_v1
+from . import codec_v1, metrics
 
 workflow_handlers = {}
 
@@ -26,6 +27,7 @@ class Context:
     def __init__(self, iface, sid):
         self.iface = iface
         self.sid = sid
+        self.received = utime.ticks_us()  # time of the last received message
 
     async def call(self, msg, *types):
         '''
@@ -41,6 +43,18 @@ class Context:
         `UnexpectedMessageError` if the message type does not match one of
         `types`; and caller should always make sure to re-raise it.
         '''
+        reader = await self.read_raw(types)
+
+        # look up the protobuf class and parse the message
+        pbtype = messages.get_type(reader.type)
+        return await protobuf.load_message(reader, pbtype)
+
+    async def read_raw(self, types):
+        '''
+        Like `self.read()`, but return the opened reader instead of parsing
+        the message, so the caller can consume large fields as they arrive.
+        The caller has to read the whole message, `reader.size` bytes.
+        '''
         reader = self.getreader()
 
         if __debug__:
@@ -48,15 +62,14 @@ class Context:
                       self.iface.iface_num(), self.sid, types)
 
         await reader.aopen()  # wait for the message header
+        self.received = utime.ticks_us()
 
         # if we got a message with unexpected type, raise the reader via
         # `UnexpectedMessageError` and let the session handler deal with it
         if reader.type not in types:
             raise UnexpectedMessageError(reader)
-
-        # look up the protobuf class and parse the message
-        pbtype = messages.get_type(reader.type)
-        return await protobuf.load_message(reader, pbtype)
+        metrics.read(reader.type, reader.size)
+        return reader
 
     async def write(self, msg):
         '''
@@ -71,12 +84,30 @@ class Context:
         # get the message size
         counter = protobuf.CountingWriter()
         await protobuf.dump_message(counter, msg)
+        metrics.write(msg.MESSAGE_WIRE_TYPE, counter.size)
 
         # write the message
         writer.setheader(msg.MESSAGE_WIRE_TYPE, counter.size)
         await protobuf.dump_message(writer, msg)
         await writer.aclose()
 
+    async def write_raw(self, mtype, data):
+        '''
+        Write an already encoded protobuf message of type `mtype` to this wire
+        context.
+        '''
+        writer = self.getwriter()
+
+        if __debug__:
+            log.debug(__name__, '%s:%x write: %s (%dB)',
+                      self.iface.iface_num(), self.sid, mtype, len(data))
+
+        metrics.write(mtype, len(data))
+        writer.setheader(mtype, len(data))
+        if data:
+            await writer.awrite(data)
+        await writer.aclose()
+
     def wait(self, *tasks):
         '''
         Wait until one of the passed tasks finishes, and return the result,
@@ -109,22 +140,28 @@ async def session_handler(iface, sid):
     reader = None
     ctx = Context(iface, sid)
     while True:
+        mtype = None
         try:
             # wait for new message, if needed, and find handler
             if not reader:
                 reader = ctx.getreader()
                 await reader.aopen()
+                ctx.received = utime.ticks_us()
+            mtype = reader.type
+            metrics.request(mtype, reader.size)
             try:
-                handler, args = workflow_handlers[reader.type]
+                handler, args = workflow_handlers[mtype]
             except KeyError:
                 handler, args = unexpected_msg, ()
 
             w = handler(ctx, reader, *args)
+            started = utime.ticks_us()
             try:
                 workflow.onstart(w)
                 await w
             finally:
                 workflow.onclose(w)
+                metrics.latency(mtype, utime.ticks_diff(utime.ticks_us(), started))
 
         except UnexpectedMessageError as exc:
             # retry with opened reader from the exception
@@ -133,19 +170,29 @@ async def session_handler(iface, sid):
         except FailureError as exc:
             # we log FailureError as warning, not as exception
             log.warning(__name__, 'failure: %s', exc.message)
+            metrics.failure(mtype)
         except Exception as exc:
             # sessions are never closed by raised exceptions
             log.exception(__name__, exc)
+            metrics.error(mtype)
 
         # read new message in next iteration
         reader = None
 
 
-async def protobuf_workflow(ctx, reader, handler, *args):
+def protobuf_workflow(ctx, reader, handler, *args):
+    return typed_workflow(ctx, reader, messages.get_type(reader.type), handler, *args)
+
+
+async def typed_workflow(ctx, reader, pbtype, handler, *args):
+    '''
+    Like `protobuf_workflow`, but parse the message as `pbtype`, i.e. a message
+    extended by `protobuf.extend_fields`.
+    '''
     from trezor.messages.Failure import Failure
     from trezor.messages.FailureType import FirmwareError
 
-    req = await protobuf.load_message(reader, messages.get_type(reader.type))
+    req = await protobuf.load_message(reader, pbtype)
     try:
         res = await handler(ctx, req, *args)
     except UnexpectedMessageError:
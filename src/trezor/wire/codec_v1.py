@@ -19,7 +19,8 @@ SESSION_ID = const(0)
 class Reader:
     '''
     Decoder for legacy codec over the HID layer.  Provides readable
-    async-file-like interface.
+    async-file-like interface.  On the emulator, one received packet can carry
+    several consecutive reports of the message.
     '''
 
     def __init__(self, iface):
@@ -28,6 +29,8 @@ class Reader:
         self.size = None
         self.data = None
         self.ofs = 0
+        self.packet = None  # packet with reports following the current one
+        self.packet_ofs = 0
 
     def __repr__(self):
         return '<ReaderV1: type=%d size=%dB>' % (self.type, self.size)
@@ -52,8 +55,10 @@ class Reader:
         # load received message header
         self.type = mtype
         self.size = msize
-        self.data = report[_REP_INIT_DATA:_REP_INIT_DATA + msize]
+        self.data = report[_REP_INIT_DATA:min(_REP_LEN, _REP_INIT_DATA + msize)]
         self.ofs = 0
+        self.packet = report
+        self.packet_ofs = _REP_LEN
 
     async def areadinto(self, buf):
         '''
@@ -69,13 +74,20 @@ class Reader:
         while nread < len(buf):
             if self.ofs == len(self.data):
                 # we are at the end of received data
-                # wait for continuation report
+                # take continuation report from the packet, or wait for it
                 while True:
-                    report = await read
-                    marker = report[0]
+                    if self.packet_ofs < len(self.packet):
+                        ofs = self.packet_ofs
+                        self.packet_ofs += _REP_LEN
+                    else:
+                        self.packet = await read
+                        self.packet_ofs = _REP_LEN
+                        ofs = 0
+                    marker = self.packet[ofs]
                     if marker == _REP_MARKER:
                         break
-                self.data = report[_REP_CONT_DATA:_REP_CONT_DATA + self.size]
+                ofs += _REP_CONT_DATA
+                self.data = self.packet[ofs:ofs + min(_REP_LEN - _REP_CONT_DATA, self.size)]
                 self.ofs = 0
 
             # copy as much as possible to target buffer
@@ -0,0 +1,115 @@
+'''
+Per-message-type statistics of the wire layer.  Every message type seen on the
+wire gets an entry counting dispatched requests, read and written messages and
+their total size in bytes, handlers ending with `FailureError` or with another
+exception, and a histogram of handler latencies.  For `ButtonRequest`, the
+latency is the time from receiving the last message to the first frame of the
+confirmation dialog.
+
+Entries are plain lists indexed by the `_REQUESTS` ... `_HISTOGRAM` constants,
+so that recording a sample does not allocate.  See `report` for the textual
+form served over the debug link.
+'''
+
+from micropython import const
+
+from trezor import messages
+
+_REQUESTS = const(0)  # number of dispatched requests
+_READS = const(1)  # number of read messages
+_BYTES_IN = const(2)  # total size of read messages
+_WRITES = const(3)  # number of written messages
+_BYTES_OUT = const(4)  # total size of written messages
+_FAILURES = const(5)  # handlers ended with FailureError
+_ERRORS = const(6)  # handlers ended with other exceptions
+_LATENCY = const(7)  # total latency in milliseconds
+_SAMPLES = const(8)  # number of latency samples
+_HISTOGRAM = const(9)  # offset of the latency histogram
+
+# upper bounds (in milliseconds) of the latency histogram buckets, the last
+# bucket is unbounded
+BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000)
+
+_ENTRY_LEN = _HISTOGRAM + len(BUCKETS) + 1
+
+stats = {}  # wire type -> entry
+
+
+def _entry(mtype: int) -> list:
+    e = stats.get(mtype)
+    if e is None:
+        e = stats[mtype] = [0] * _ENTRY_LEN
+    return e
+
+
+def request(mtype: int, size: int):
+    '''Record a request of `mtype` dispatched to a workflow handler.'''
+    e = _entry(mtype)
+    e[_REQUESTS] += 1
+    e[_READS] += 1
+    e[_BYTES_IN] += size
+
+
+def read(mtype: int, size: int):
+    '''Record a message of `mtype` read by a running workflow.'''
+    e = _entry(mtype)
+    e[_READS] += 1
+    e[_BYTES_IN] += size
+
+
+def write(mtype: int, size: int):
+    '''Record a message of `mtype` written to the wire.'''
+    e = _entry(mtype)
+    e[_WRITES] += 1
+    e[_BYTES_OUT] += size
+
+
+def failure(mtype: int):
+    if mtype is not None:
+        _entry(mtype)[_FAILURES] += 1
+
+
+def error(mtype: int):
+    if mtype is not None:
+        _entry(mtype)[_ERRORS] += 1
+
+
+def latency(mtype: int, us: int):
+    '''Add a latency sample of `us` microseconds to the histogram of `mtype`.'''
+    e = _entry(mtype)
+    ms = us // 1000
+    e[_LATENCY] += ms
+    e[_SAMPLES] += 1
+    i = 0
+    for bound in BUCKETS:
+        if ms < bound:
+            break
+        i += 1
+    e[_HISTOGRAM + i] += 1
+
+
+def reset():
+    stats.clear()
+
+
+def report() -> str:
+    '''
+    Return the statistics as text, one line per message type:
+
+    >>> 'SignTx req=1 rd=1/13 wr=0/0 fail=0 err=0 ms=5210/1 hist=0,0,...,1,0'
+
+    `rd` and `wr` are message counts and total sizes in bytes, `ms` is the total
+    latency and the number of samples, `hist` are the counts in `BUCKETS`.
+    '''
+    lines = []
+    for mtype in sorted(stats):
+        e = stats[mtype]
+        lines.append('%s req=%d rd=%d/%d wr=%d/%d fail=%d err=%d ms=%d/%d hist=%s' % (
+            messages.get_type_name(mtype) or mtype,
+            e[_REQUESTS],
+            e[_READS], e[_BYTES_IN],
+            e[_WRITES], e[_BYTES_OUT],
+            e[_FAILURES], e[_ERRORS],
+            e[_LATENCY], e[_SAMPLES],
+            ','.join(str(n) for n in e[_HISTOGRAM:])))
+    return '\n'.join(lines)
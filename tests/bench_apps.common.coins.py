@@ -0,0 +1,34 @@
+from common import *
+from benchmark import *
+
+import gc
+
+# heap taken by the module itself, the CoinType objects are built on demand
+gc.collect()
+heap = gc.mem_alloc()
+from apps.common import coins  # noqa: E402
+gc.collect()
+print('%-40s %10d bytes' % ('import apps.common.coins', gc.mem_alloc() - heap))
+
+heap = gc.mem_alloc()
+all_coins = coins.all_coins()
+gc.collect()
+print('%-40s %10d bytes' % ('all CoinType objects built', gc.mem_alloc() - heap))
+
+last = all_coins[-1].coin_name
+
+
+def linear():
+    # the lookup before the indexes, scanning the list of coins
+    for c in all_coins:
+        if c.coin_name == last:
+            return c
+
+
+def indexed():
+    coins.by_name(last)
+
+
+scanned = measure('by_name, last coin (linear scan)', linear, iterations=10000)
+found = max(1, measure('by_name, last coin (indexed)', indexed, iterations=10000))
+print('speedup: %d.%02dx' % (scanned // found, scanned * 100 // found % 100))
@@ -0,0 +1,45 @@
+from common import *
+from benchmark import *
+
+import gc
+
+# heap taken by the token table, in the firmware it is frozen into flash
+gc.collect()
+heap = gc.mem_alloc()
+from apps.ethereum import tokens  # noqa: E402
+gc.collect()
+print('%-40s %10d bytes' % ('import apps.ethereum.tokens', gc.mem_alloc() - heap))
+
+# every known token, with the addresses as received in EthereumSignTx
+keys = []
+for i in range(tokens._count()):
+    token = tokens._token(i)
+    keys.append((token[0], bytearray(token[1])))
+table = [tokens._token(i) for i in range(tokens._count())]
+
+
+def linear():
+    # the lookup before the table was sorted, scanning a list of token tuples
+    for chain_id, address in keys:
+        for token in table:
+            if chain_id == token[0] and address == token[1]:
+                break
+
+
+def searched():
+    for chain_id, address in keys:
+        tokens.token_by_chain_address(chain_id, address)
+
+
+scanned = measure('all %d tokens (linear scan)' % len(keys), linear, iterations=1)
+found = max(1, measure('all %d tokens (binary search)' % len(keys), searched, iterations=10))
+print('speedup: %d.%02dx' % (scanned // found, scanned * 100 // found % 100))
+
+# heap allocated by a single lookup, independent of the number of tokens
+chain_id, address = keys[-1]
+gc.collect()
+gc.disable()
+heap = gc.mem_alloc()
+tokens.token_by_chain_address(chain_id, address)
+print('%-40s %10d bytes' % ('one lookup allocates', gc.mem_alloc() - heap))
+gc.enable()
@@ -0,0 +1,27 @@
+from common import *
+from benchmark import *
+
+from trezor import config, wire
+from trezor.messages.Initialize import Initialize
+
+from apps.common import cache
+from apps.homescreen import respond_Features
+
+config.init()
+
+iface = MockIface()
+ctx = wire.Context(iface, 0)
+
+
+def initialize():
+    run(respond_Features(ctx, Initialize()))
+
+
+def initialize_uncached():
+    cache.clear_features()
+    run(respond_Features(ctx, Initialize()))
+
+
+uncached = measure('Initialize (encoded on every request)', initialize_uncached)
+cached = max(1, measure('Initialize (cached Features)', initialize))
+print('speedup: %d.%02dx' % (uncached // cached, uncached * 100 // cached % 100))
@@ -0,0 +1,26 @@
+from common import *
+from benchmark import *
+
+from trezor.messages.MultisigRedeemScriptType import MultisigRedeemScriptType
+
+from apps.wallet.sign_tx import multisig
+
+from txgen import cosigners
+
+
+def sign_input(ms, cached):
+    # derivations of one multisig input in a transaction signing: the script
+    # in Phase 1, the script code and pubkey index in Phase 2, and the witness
+    if cached:
+        multisig.multisig_cache_begin()
+    for _ in range(3):
+        multisig.multisig_get_pubkeys(ms)
+    multisig.multisig_pubkey_index(ms, multisig.multisig_get_pubkey(ms.pubkeys[-1]))
+    multisig.multisig_cache_end()
+
+
+for m, n in ((2, 3), (15, 15)):
+    ms = MultisigRedeemScriptType(pubkeys=cosigners(n), m=m)
+    uncached = measure('%d-of-%d input (derived per call)' % (m, n), lambda: sign_input(ms, False), iterations=10)
+    cached = max(1, measure('%d-of-%d input (memoized)' % (m, n), lambda: sign_input(ms, True), iterations=10))
+    print('speedup: %d.%02dx' % (uncached // cached, uncached * 100 // cached % 100))
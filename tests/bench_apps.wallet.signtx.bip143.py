@@ -0,0 +1,38 @@
+from common import *
+from benchmark import *
+
+import txgen
+
+from trezor.messages import InputScriptType
+
+from apps.wallet.sign_tx import signing
+from apps.wallet.sign_tx.segwit_bip143 import Bip143
+
+INPUTS = 100
+
+tx, txis, txos, prevs = txgen.generate(INPUTS, InputScriptType.SPENDWITNESS)
+
+bip143 = Bip143()
+for txi in txis:
+    bip143.add_prevouts(txi)
+    bip143.add_sequence(txi)
+pubkeyhash = bytes(20)
+
+
+def preimage():
+    bip143.preimage_hash(tx, txis[0], pubkeyhash, 0x01)
+
+
+def preimage_unfrozen():
+    bip143.h_prefix = None  # the common hashes are finalized for every input
+    bip143.preimage_hash(tx, txis[0], pubkeyhash, 0x01)
+
+
+unfrozen = measure('BIP143 preimage (finalized per input)', preimage_unfrozen, iterations=1000)
+frozen = max(1, measure('BIP143 preimage (frozen)', preimage, iterations=1000))
+print('speedup: %d.%02dx' % (unfrozen // frozen, unfrozen * 100 // frozen % 100))
+
+host = txgen.Host(tx, txis, txos, prevs)
+us = measure('SignTx %d segwit inputs' % INPUTS,
+             lambda: host.sign(signing.sign_tx(tx, txgen.root())), iterations=1)
+print('%-40s %10d us/input' % ('', us // INPUTS))
@@ -0,0 +1,32 @@
+from common import *
+from benchmark import *
+
+import txgen
+
+from apps.wallet.sign_tx import legacy_sighash, signing
+
+fits = legacy_sighash.LegacySighash.fits
+
+
+def sign(inputs, recorded):
+    tx, txis, txos, prevs = txgen.generate(inputs)
+    host = txgen.Host(tx, txis, txos, prevs)
+    # without the recorded Phase 1 data, every input streams the whole tx
+    legacy_sighash.LegacySighash.fits = fits if recorded else lambda tx: False
+
+    def func():
+        host.sign(signing.sign_tx(tx, txgen.root()))
+
+    name = 'SignTx %d legacy inputs (%s)' % (inputs, 'recorded' if recorded else 'streamed')
+    host.requests = 0
+    us = measure(name, func, iterations=1)
+    print('%-40s %10d requests' % ('', host.requests // 2))  # warm up + run
+    return us
+
+
+for inputs in (10, 100, 500):
+    streamed = sign(inputs, False)
+    recorded = max(1, sign(inputs, True))
+    print('speedup: %d.%02dx' % (streamed // recorded, streamed * 100 // recorded % 100))
+
+legacy_sighash.LegacySighash.fits = fits
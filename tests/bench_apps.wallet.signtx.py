@@ -0,0 +1,89 @@
+import common  # noqa: F401
+
+import gc
+import utime
+
+import txgen
+
+from trezor.messages import InputScriptType
+from trezor.utils import HashWriter
+
+from apps.wallet.sign_tx import signing
+
+INPUTS = (1, 10, 100, 1000)
+
+CONFIGS = (
+    # name, script type, coin, multisig (m, n)
+    ('legacy', InputScriptType.SPENDADDRESS, 'Bitcoin', None),
+    ('p2sh-segwit', InputScriptType.SPENDP2SHWITNESS, 'Bitcoin', None),
+    ('segwit', InputScriptType.SPENDWITNESS, 'Bitcoin', None),
+    ('multisig 2-of-3', InputScriptType.SPENDMULTISIG, 'Bitcoin', (2, 3)),
+    ('bcash', InputScriptType.SPENDADDRESS, 'Bcash', None),
+)
+
+
+class TracingHost(txgen.Host):
+    '''Host sampling the live heap on every round trip.'''
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        gc.collect()
+        self.base = gc.mem_alloc()
+        self.peak = 0
+
+    def respond(self, req):
+        gc.collect()
+        self.peak = max(self.peak, gc.mem_alloc() - self.base)
+        return super().respond(req)
+
+
+class HashCounter:
+    '''Counts the bytes written into every HashWriter while installed.'''
+
+    def __init__(self):
+        self.hashed = 0
+        self.extend = HashWriter.extend
+        self.append = HashWriter.append
+
+    def __enter__(self):
+        counter = self
+
+        def extend(w, buf):
+            counter.hashed += len(buf)
+            counter.extend(w, buf)
+
+        def append(w, b):
+            counter.hashed += 1
+            counter.append(w, b)
+
+        HashWriter.extend = extend
+        HashWriter.append = append
+        return self
+
+    def __exit__(self, *args):
+        HashWriter.extend = self.extend
+        HashWriter.append = self.append
+
+
+def bench(name, inputs, script_type, coin_name, multisig):
+    tx, txis, txos, prevs = txgen.generate(inputs, script_type, coin_name, multisig)
+
+    # instrumented run, warms up the timed one as well
+    host = TracingHost(tx, txis, txos, prevs)
+    with HashCounter() as counter:
+        host.sign(signing.sign_tx(tx, txgen.root()))
+
+    timed = txgen.Host(tx, txis, txos, prevs)
+    gc.collect()
+    start = utime.ticks_us()
+    timed.sign(signing.sign_tx(tx, txgen.root()))
+    us = utime.ticks_diff(utime.ticks_us(), start)
+
+    print('%-16s %5d %10d %8d %10d %8d' % (
+        name, inputs, us // 1000, host.requests, counter.hashed // 1024, host.peak // 1024))
+
+
+print('%-16s %5s %10s %8s %10s %8s' % ('config', 'ins', 'ms', 'trips', 'hashed KiB', 'heap KiB'))
+for name, script_type, coin_name, multisig in CONFIGS:
+    for inputs in INPUTS:
+        bench(name, inputs, script_type, coin_name, multisig)
@@ -0,0 +1,20 @@
+from common import *
+from benchmark import *
+
+import txgen
+
+from apps.wallet.sign_tx import signing
+
+for inputs in (10, 100):
+    tx, txis, txos, prevs = txgen.generate(inputs)
+
+    host = txgen.Host(tx, txis, txos, prevs)
+    usb = measure('SignTx %d inputs (host)' % inputs,
+                  lambda: host.sign(signing.sign_tx(tx, txgen.root())), iterations=1)
+
+    sd = txgen.MockSDCard()
+    c = txgen.container(tx, txis, txos, prevs)
+    sd.data[:len(c)] = c
+    card = max(1, measure('SignTx %d inputs (SD card)' % inputs,
+                          lambda: txgen.sign_sdcard(sd, txgen.root()), iterations=1))
+    print('%-40s %10d inputs/s' % ('', inputs * 1000000 // card))
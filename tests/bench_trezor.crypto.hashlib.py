@@ -0,0 +1,27 @@
+from common import *
+from benchmark import *
+
+from trezor.crypto import hashlib
+
+# a shared prefix of the size of a BIP143 preimage prefix of a larger tx and
+# a short per-use suffix
+prefix = bytes(range(256)) * 8
+suffix = bytes(range(32))
+
+for name in ('blake256', 'blake2b', 'blake2s', 'ripemd160', 'sha1', 'sha256', 'sha3_256', 'sha3_512', 'sha512'):
+    func = getattr(hashlib, name)
+    midstate = func(prefix)
+
+    def rehash():
+        h = func(prefix)
+        h.update(suffix)
+        h.digest()
+
+    def fork():
+        h = midstate.copy()
+        h.update(suffix)
+        h.digest()
+
+    rehashed = measure('%s (prefix rehashed)' % name, rehash, iterations=1000)
+    forked = max(1, measure('%s (midstate copied)' % name, fork, iterations=1000))
+    print('speedup: %d.%02dx' % (rehashed // forked, rehashed * 100 // forked % 100))
@@ -0,0 +1,74 @@
+from common import *
+from benchmark import *
+
+import txgen
+
+from trezor.messages import InputScriptType
+from trezor.utils import HashWriter
+
+from apps.wallet.sign_tx import signing
+
+INPUTS = 100
+
+
+class CountingHash:
+    '''Hash context counting the calls of `update`.'''
+
+    calls = 0
+
+    def __init__(self, ctx):
+        self.ctx = ctx
+
+    def update(self, buf):
+        CountingHash.calls += 1
+        self.ctx.update(buf)
+
+    def digest(self, *args):
+        return self.ctx.digest(*args)
+
+    def copy(self):
+        return self.ctx.copy()
+
+
+init = HashWriter.__init__
+extend = HashWriter.extend
+append = HashWriter.append
+one = bytearray(1)
+
+
+def counting_init(w, hashfunc):
+    init(w, hashfunc)
+    w.ctx = CountingHash(w.ctx)
+
+
+def unbuffered_extend(w, buf):
+    w.ctx.update(buf)
+
+
+def unbuffered_append(w, b):
+    one[0] = b
+    w.ctx.update(one)
+
+
+def sign(tx, txis, txos, prevs, buffered):
+    # the unbuffered writer is the HashWriter before the block was added
+    HashWriter.extend = extend if buffered else unbuffered_extend
+    HashWriter.append = append if buffered else unbuffered_append
+    host = txgen.Host(tx, txis, txos, prevs)
+    CountingHash.calls = 0
+    us = measure('SignTx %d segwit inputs (%s)' % (INPUTS, 'buffered' if buffered else 'unbuffered'),
+                 lambda: host.sign(signing.sign_tx(tx, txgen.root())), iterations=1)
+    print('%-40s %10d hash updates' % ('', CountingHash.calls // 2))  # warm up + run
+    return us
+
+
+tx, txis, txos, prevs = txgen.generate(INPUTS, InputScriptType.SPENDWITNESS)
+
+HashWriter.__init__ = counting_init
+unbuffered = sign(tx, txis, txos, prevs, False)
+buffered = max(1, sign(tx, txis, txos, prevs, True))
+print('speedup: %d.%02dx' % (unbuffered // buffered, unbuffered * 100 // buffered % 100))
+
+HashWriter.__init__ = init
+HashWriter.extend = extend
+HashWriter.append = append
@@ -0,0 +1,45 @@
+'''
+Helpers for the benchmarks in `bench_*.py`, see `run_benchmarks.sh`.
+'''
+
+import gc
+import utime
+
+
+class MockIface:
+    '''USB interface accepting every written report.'''
+
+    def __init__(self, num=0):
+        self.num = num
+        self.written = 0
+
+    def iface_num(self):
+        return self.num
+
+    def write(self, buf):
+        self.written += len(buf)
+        return len(buf)
+
+
+def run(coro):
+    '''
+    Step through `coro` until it finishes, resuming every syscall immediately.
+    Only suitable for coroutines that do not wait for input.
+    '''
+    try:
+        while True:
+            coro.send(None)
+    except StopIteration as e:
+        return e.value
+
+
+def measure(name, func, iterations=100):
+    '''Call `func` `iterations` times and print the average time of a call.'''
+    func()  # warm up
+    gc.collect()
+    start = utime.ticks_us()
+    for _ in range(iterations):
+        func()
+    us = utime.ticks_diff(utime.ticks_us(), start)
+    print('%-40s %10d us/op %8d ops' % (name, us // iterations, iterations))
+    return us // iterations
@@ -0,0 +1,22 @@
+#!/bin/bash
+
+MICROPYTHON=../build/unix/micropython
+PYOPT=1
+
+error=0
+
+if [ -z "$*" ]; then
+    list="bench_*.py"
+else
+    list="$*"
+fi
+
+for i in $list; do
+    echo
+    echo "$i"
+    if ! $MICROPYTHON -O$PYOPT $i; then
+        error=1
+    fi
+done
+
+exit $error
@@ -0,0 +1,37 @@
+#!/bin/bash
+
+# slow tests run with the heap of the emulator, see emu.sh
+
+MICROPYTHON=../build/unix/micropython
+PYOPT=1
+HEAPSIZE="${HEAPSIZE:-800K}"
+
+results=()
+error=0
+
+if [ -z "$*" ]; then
+    list="slow_*.py"
+else
+    list="$*"
+fi
+
+for i in $list; do
+    echo
+    if $MICROPYTHON -O$PYOPT -X heapsize=$HEAPSIZE $i; then
+        results+=("OK   $i")
+    else
+        results+=("FAIL $i")
+        error=1
+    fi
+done
+
+echo
+echo 'Summary:'
+printf '%s\n' "${results[@]}"
+echo '-------------------'
+if [ $error == 0 ]; then
+    echo 'ALL OK'
+else
+    echo 'FAIL at least one error occurred'
+fi
+exit $error
@@ -0,0 +1,73 @@
+from common import *
+
+from trezor.crypto.hashlib import sha256
+from trezor.messages.SignTx import SignTx
+from trezor.messages.TxInputType import TxInputType
+from trezor.messages.TxOutputType import TxOutputType
+from trezor.messages.TxAck import TxAck
+from trezor.messages.TransactionType import TransactionType
+from trezor.messages.RequestType import TXINPUT, TXOUTPUT, TXFINISHED
+from trezor.messages import InputScriptType, OutputScriptType
+
+from apps.wallet.sign_tx import signing
+
+import txgen
+
+# run by run_slow_tests.sh with the heap of the emulator, a transaction that
+# does not fit into it fails with MemoryError
+
+
+class TestSignTxLarge(unittest.TestCase):
+
+    inputs_count = 5000
+
+    def get_input(self, i):
+        # inputs are generated when requested, the test keeps none of them
+        script_type = InputScriptType.SPENDWITNESS if i % 2 else InputScriptType.SPENDP2SHWITNESS
+        return TxInputType(address_n=[84 | 0x80000000, 0x80000000, 0x80000000, 0, i],
+                           prev_hash=sha256(('prev %d' % i).encode()).digest(),
+                           prev_index=0,
+                           amount=10000,
+                           script_type=script_type,
+                           sequence=0xffffffff)
+
+    def get_output(self):
+        return TxOutputType(address='1MJ2tj2ThBE62zXbBYA5ZaN3fdve5CPAz1',
+                            amount=self.inputs_count * 10000 - 100000,
+                            script_type=OutputScriptType.PAYTOADDRESS,
+                            address_n=[])
+
+    def test_5000_inputs(self):
+        try:
+            signatures = self.sign()
+        except MemoryError:
+            self.fail('MemoryError while signing %d inputs' % self.inputs_count)
+        # every input is signed with its witness, after the outputs
+        self.assertEqual(signatures, self.inputs_count)
+
+    def sign(self):
+        tx = SignTx(coin_name='Bitcoin', version=1, lock_time=0,
+                    inputs_count=self.inputs_count, outputs_count=1)
+        signer = signing.sign_tx(tx, txgen.root())
+
+        signatures = 0
+        res = None
+        while True:
+            req = signer.send(res)
+            if req.__qualname__ != 'TxRequest':
+                res = True  # confirm everything
+                continue
+            if req.serialized is not None and req.serialized.signature is not None:
+                signatures += 1
+            if req.request_type == TXFINISHED:
+                return signatures
+            if req.request_type == TXINPUT:
+                res = TxAck(tx=TransactionType(inputs=[self.get_input(req.details.request_index)]))
+            elif req.request_type == TXOUTPUT:
+                res = TxAck(tx=TransactionType(outputs=[self.get_output()]))
+            else:
+                self.fail('Unexpected request')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -24,6 +24,26 @@ class TestCoins(unittest.TestCase):
             self.assertEqual(c1, c3)
             self.assertEqual(c2, c3)
 
+    def test_lazy(self):
+        coins._coins.clear()
+        c = coins.by_name('Litecoin')
+        self.assertEqual(len(coins._coins), 1)
+        self.assertIs(coins.by_shortcut('LTC'), c)
+        self.assertEqual(c.address_type_p2sh, 50)
+        self.assertEqual(c.bech32_prefix, 'ltc')
+        self.assertEqual(c.xpub_magic, 0x019da462)
+        self.assertTrue(c.segwit)
+        # the first coin of an address type is found, as with a linear search
+        self.assertEqual(coins.by_address_type(0).coin_name, 'Bitcoin')
+        self.assertEqual(coins.by_address_type(111).coin_name, 'Testnet')
+
+    def test_all_coins(self):
+        all_coins = coins.all_coins()
+        self.assertEqual(len(all_coins), len(coins._COINS))
+        self.assertEqual(all_coins[0].coin_name, 'Bitcoin')
+        for c in all_coins:
+            self.assertIs(coins.by_name(c.coin_name), c)
+
     def test_failure(self):
         with self.assertRaises(ValueError):
             coins.by_shortcut('XXX')
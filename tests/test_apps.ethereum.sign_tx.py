@@ -0,0 +1,111 @@
+from common import *
+
+from trezor.crypto import rlp
+from trezor.crypto.hashlib import sha3_256
+from trezor.messages.EthereumSignTx import EthereumSignTx
+from trezor.utils import HashWriter
+
+from apps.ethereum import sign_tx
+from apps.ethereum.messages import EthereumSignTxExt
+
+
+def run(coro):
+    try:
+        coro.send(None)
+    except StopIteration as e:
+        return e.value
+
+
+class MockReader:
+
+    def __init__(self, data):
+        self.data = data
+        self.size = len(data)
+
+    async def areadinto(self, buf):
+        if self.size < len(buf):
+            raise EOFError
+        ofs = len(self.data) - self.size
+        buf[:] = self.data[ofs:ofs + len(buf)]
+        self.size -= len(buf)
+        return len(buf)
+
+
+class MockContext:
+
+    def __init__(self, *messages):
+        self.messages = list(messages)
+
+    async def read_raw(self, types):
+        return MockReader(self.messages.pop(0))
+
+
+def ack(chunk, prefix=b''):
+    n = len(chunk)
+    length = bytearray()
+    while n >= 0x80:
+        length.append((n & 0x7f) | 0x80)
+        n >>= 7
+    length.append(n)
+    return prefix + b'\x0a' + bytes(length) + chunk
+
+
+class TestEthereumSignTx(unittest.TestCase):
+
+    def test_chunk_size(self):
+        msg = EthereumSignTxExt()
+        self.assertEqual(sign_tx.get_chunk_size(msg), sign_tx.DEFAULT_CHUNK_SIZE)
+        msg.chunk_size = 100
+        self.assertEqual(sign_tx.get_chunk_size(msg), 100)
+        msg.chunk_size = 1000000
+        self.assertEqual(sign_tx.get_chunk_size(msg), sign_tx.MAX_CHUNK_SIZE)
+
+    def test_debug_fields(self):
+        # the chunk size and stream mode are on the wire only in debug builds
+        extra = len(EthereumSignTxExt.FIELDS) - len(EthereumSignTx.FIELDS)
+        self.assertEqual(extra, 2 if __debug__ else 0)
+        for tag in EthereumSignTx.FIELDS:
+            self.assertEqual(EthereumSignTxExt.FIELDS[tag], EthereumSignTx.FIELDS[tag])
+
+    def test_total_length(self):
+        for chain_id in (0, 1, 61, 128, 1000, 2147483630):
+            msg = EthereumSignTx(nonce=b'', gas_price=b'\x04\xa8\x17\xc8\x00',
+                                 gas_limit=b'\x52\x08', to=b'\x11' * 20,
+                                 value=b'\x01', data_initial_chunk=b'\x22' * 100,
+                                 chain_id=chain_id)
+            fields = [msg.nonce, msg.gas_price, msg.gas_limit, msg.to,
+                      msg.value, msg.data_initial_chunk]
+            if chain_id:
+                fields += [chain_id, 0, 0]
+            self.assertEqual(sign_tx.get_total_length(msg, 100),
+                             rlp.payload_length(fields))
+
+    def test_read_chunk(self):
+        chunks = [bytes(range(256)) * 3, b'\x01' * 1000, b'\x02']
+        ctx = MockContext(*[ack(c) for c in chunks])
+        sha = HashWriter(sha3_256)
+        for c in chunks:
+            self.assertEqual(run(sign_tx.read_chunk(ctx, sha, 1024)), len(c))
+        self.assertEqual(sha.get_digest(True),
+                         sha3_256(b''.join(chunks)).digest(True))
+
+    def test_read_chunk_unknown_field(self):
+        # unknown varint (tag 2) and bytes (tag 3) fields are skipped
+        ctx = MockContext(ack(b'\xaa' * 10, b'\x10\x81\x01' + b'\x1a\x03abc'))
+        sha = HashWriter(sha3_256)
+        self.assertEqual(run(sign_tx.read_chunk(ctx, sha, 10)), 10)
+        self.assertEqual(sha.get_digest(True),
+                         sha3_256(b'\xaa' * 10).digest(True))
+
+    def test_read_chunk_invalid(self):
+        sha = HashWriter(sha3_256)
+        with self.assertRaises(ValueError):
+            run(sign_tx.read_chunk(MockContext(ack(b'\x00' * 11)), sha, 10))
+        with self.assertRaises(ValueError):
+            run(sign_tx.read_chunk(MockContext(ack(b'')), sha, 10))
+        with self.assertRaises(ValueError):
+            run(sign_tx.read_chunk(MockContext(b''), sha, 10))
+
+
+if __name__ == '__main__':
+    unittest.main()
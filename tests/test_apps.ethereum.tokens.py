@@ -24,6 +24,26 @@ class TestEthereumTokens(unittest.TestCase):
         token = tokens.token_by_chain_address(999, b'\x00\xFF')
         self.assertEqual(token, None)
 
+    def test_all_tokens(self):
+        prev = None
+        for i in range(tokens._count()):
+            chain_id, address, symbol, decimals = tokens._token(i)
+            # the records are sorted for the binary search
+            if prev is not None:
+                self.assertTrue(prev < (chain_id, address))
+            prev = (chain_id, address)
+            # addresses come from the protobuf messages as bytearrays
+            token = tokens.token_by_chain_address(chain_id, bytearray(address))
+            self.assertEqual(token, (chain_id, address, symbol, decimals))
+
+    def test_invalid(self):
+        address = b'\x7d\xd7\xf5\x6d\x69\x7c\xc0\xf2\xb5\x2b\xd5\x5c\x05\x7f\x37\x8f\x1f\xe6\xab\x4b'
+        self.assertEqual(tokens.token_by_chain_address(None, address), None)
+        self.assertEqual(tokens.token_by_chain_address(2 ** 32 + 1, address), None)
+        self.assertEqual(tokens.token_by_chain_address(1, address[:19]), None)
+        self.assertEqual(tokens.token_by_chain_address(1, bytes(20)), None)
+        self.assertEqual(tokens.token_by_chain_address(1, b'\xff' * 20), None)
+
 
 if __name__ == '__main__':
     unittest.main()
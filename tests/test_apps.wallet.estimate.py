@@ -0,0 +1,132 @@
+from common import *
+
+from trezor.messages.EstimateTxSize import EstimateTxSize
+from trezor.messages.TxInputType import TxInputType
+from trezor.messages.TxOutputType import TxOutputType
+from trezor.messages.TxAck import TxAck
+from trezor.messages.TransactionType import TransactionType
+from trezor.messages.RequestType import TXINPUT, TXOUTPUT
+from trezor.messages import InputScriptType, OutputScriptType
+from trezor.wire import FailureError
+
+from apps.wallet import estimate_tx_size as workflow
+from apps.wallet.messages import EstimateTxSizeExt
+from apps.wallet.sign_tx.estimate import *
+from apps.wallet.sign_tx.signing import SigningError
+from apps.wallet.sign_tx.tx_weight_calculator import *
+
+
+def run(coro):
+    try:
+        coro.send(None)
+    except StopIteration as e:
+        return e.value
+
+
+class MockContext:
+
+    def __init__(self, outputs):
+        self.outputs = outputs
+
+    async def call(self, req, *types):
+        return TxAck(tx=TransactionType(outputs=[self.outputs[req.details.request_index]]))
+
+
+class TestEstimateTxSize(unittest.TestCase):
+    # pylint: disable=C0301
+
+    inputs = [
+        TxInputType(address_n=[44 | 0x80000000, 0x80000000, 0x80000000, 0, 0],
+                    prev_hash=bytes(32), prev_index=0, amount=10000,
+                    script_type=InputScriptType.SPENDADDRESS),
+        TxInputType(address_n=[84 | 0x80000000, 0x80000000, 0x80000000, 0, 0],
+                    prev_hash=bytes(32), prev_index=1, amount=20000,
+                    script_type=InputScriptType.SPENDWITNESS),
+        TxInputType(address_n=[49 | 0x80000000, 0x80000000, 0x80000000, 0, 0],
+                    prev_hash=bytes(32), prev_index=2, amount=30000,
+                    script_type=InputScriptType.SPENDP2SHWITNESS),
+    ]
+    outputs = [
+        TxOutputType(address='1MJ2tj2ThBE62zXbBYA5ZaN3fdve5CPAz1', amount=15000,
+                     script_type=OutputScriptType.PAYTOADDRESS),
+        TxOutputType(address_n=[84 | 0x80000000, 0x80000000, 0x80000000, 1, 0], amount=5000,
+                     script_type=OutputScriptType.PAYTOWITNESS),
+    ]
+
+    def estimate(self, msg):
+        estimator = estimate_tx_size(msg)
+        res = None
+        try:
+            while True:
+                req = estimator.send(res)
+                i = req.details.request_index
+                if req.request_type == TXINPUT:
+                    res = TxAck(tx=TransactionType(inputs=[self.inputs[i]]))
+                elif req.request_type == TXOUTPUT:
+                    res = TxAck(tx=TransactionType(outputs=[self.outputs[i]]))
+        except StopIteration as e:
+            return e.value
+
+    def expected_weight(self, inputs, outputs):
+        calculator = TxWeightCalculator(len(inputs), len(outputs))
+        for txi in inputs:
+            calculator.add_input(txi)
+        for script_len in outputs:
+            calculator.add_output(bytes(script_len))
+        return calculator.get_total()
+
+    def test_counts(self):
+        res = self.estimate(EstimateTxSizeExt(inputs_count=2, outputs_count=3, coin_name='Bitcoin'))
+        p2pkh = TxInputType(script_type=InputScriptType.SPENDADDRESS)
+        weight = self.expected_weight([p2pkh, p2pkh], [25, 25, 25])
+        self.assertEqual(res.tx_weight, weight)
+        self.assertEqual(res.tx_size, 10 + 2 * 148 + 3 * 34)
+
+    def test_stream(self):
+        res = self.estimate(EstimateTxSizeExt(inputs_count=3, outputs_count=2, coin_name='Bitcoin', stream=True))
+        weight = self.expected_weight(self.inputs, [25, 22])
+        self.assertEqual(res.tx_weight, weight)
+        self.assertEqual(res.tx_size, (weight + 3) // 4)
+        self.assertEqual(res.selection_sizes, [])
+
+    def test_selections(self):
+        selections = [
+            bytes([0b11111]),  # everything
+            bytes([0b01001]),  # legacy input, no change
+            bytes([0b11010]),  # segwit input with change
+        ]
+        res = self.estimate(EstimateTxSizeExt(inputs_count=3, outputs_count=2, coin_name='Bitcoin',
+                                              stream=True, selections=selections))
+        self.assertEqual(res.selection_sizes, [
+            res.tx_size,
+            (self.expected_weight([self.inputs[0]], [25]) + 3) // 4,
+            (self.expected_weight([self.inputs[1]], [25, 22]) + 3) // 4,
+        ])
+
+    def test_invalid(self):
+        with self.assertRaises(SigningError):
+            self.estimate(EstimateTxSizeExt(inputs_count=3, outputs_count=2, stream=True,
+                                            selections=[bytes()]))
+        with self.assertRaises(SigningError):
+            self.estimate(EstimateTxSizeExt(inputs_count=1, outputs_count=1,
+                                            selections=[bytes([0b11])]))
+        with self.assertRaises(SigningError):
+            # Dogecoin has no segwit
+            self.estimate(EstimateTxSizeExt(inputs_count=3, outputs_count=2, coin_name='Dogecoin', stream=True))
+
+    def test_debug_fields(self):
+        # stream and selections are on the wire only in debug builds
+        extra = len(EstimateTxSizeExt.FIELDS) - len(EstimateTxSize.FIELDS)
+        self.assertEqual(extra, 2 if __debug__ else 0)
+
+    def test_invalid_bech32(self):
+        # checksum of the address is broken, the workflow answers with a failure
+        output = TxOutputType(address='bc1qw508d6qejxtdg4y5r3zarvary0c5xw7kv8f3t5', amount=1000,
+                              script_type=OutputScriptType.PAYTOADDRESS)
+        msg = EstimateTxSizeExt(inputs_count=0, outputs_count=1, coin_name='Bitcoin', stream=True)
+        with self.assertRaises(FailureError):
+            run(workflow.estimate_tx_size(MockContext([output]), msg))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,96 @@
+from common import *
+
+from apps.wallet.sign_tx.legacy_sighash import *
+from trezor.crypto.hashlib import sha256
+from trezor.messages.SignTx import SignTx
+from trezor.messages.TxInputType import TxInputType
+from trezor.messages.TxOutputBinType import TxOutputBinType
+from trezor.messages import InputScriptType
+from trezor.utils import HashWriter
+
+
+class TestLegacySighash(unittest.TestCase):
+    # pylint: disable=C0301
+
+    tx = SignTx(coin_name='Bitcoin', version=1, lock_time=0x11, inputs_count=3, outputs_count=2)
+    inputs = [
+        TxInputType(address_n=[44 | 0x80000000, 0x80000000, 0x80000000, 0, i],
+                    prev_hash=sha256(bytes([i])).digest(),
+                    prev_index=i,
+                    script_type=InputScriptType.SPENDADDRESS,
+                    amount=None,
+                    sequence=0xffffffff - i)
+        for i in range(3)
+    ]
+    outputs = [
+        TxOutputBinType(amount=100000, script_pubkey=unhexlify('76a91424a56db43cf6f2b02e838ea493f95d8d6047423188ac')),
+        TxOutputBinType(amount=200000, script_pubkey=unhexlify('a9141e289a2ecb8e9b8ab27d26b49f2eabab64e4a3fe87')),
+    ]
+    script_code = unhexlify('76a914de9b2a8da088824e8fe51debea566617d851537888ac')
+
+    def full_preimage_hash(self, index):
+        # streamed the same way as before LegacySighash existed
+        h = HashWriter(sha256)
+        write_uint32(h, self.tx.version)
+        write_varint(h, self.tx.inputs_count)
+        for i, txi in enumerate(self.inputs):
+            script_sig = txi.script_sig
+            txi.script_sig = self.script_code if i == index else bytes()
+            write_tx_input(h, txi)
+            txi.script_sig = script_sig
+        write_varint(h, self.tx.outputs_count)
+        for txo_bin in self.outputs:
+            write_tx_output(h, txo_bin)
+        write_uint32(h, self.tx.lock_time)
+        write_uint32(h, 1)
+        return get_tx_hash(h, True)
+
+    def recorded(self):
+        legacy = LegacySighash(self.tx)
+        for txi in self.inputs:
+            self.assertTrue(legacy.add_input(txi))
+        for txo_bin in self.outputs:
+            self.assertTrue(legacy.add_output(txo_bin))
+        return legacy
+
+    def test_preimage_hash(self):
+        legacy = self.recorded()
+        # inputs are signed in order, reusing the common prefix
+        for i, txi in enumerate(self.inputs):
+            expected = self.full_preimage_hash(i)
+            txi.script_sig = self.script_code
+            self.assertEqual(legacy.preimage_hash(i, txi, 1), expected)
+            txi.script_sig = None
+
+    def test_preimage_hash_skipped(self):
+        legacy = self.recorded()
+        # inputs signed otherwise (i.e. segwit) are skipped in the prefix
+        txi = self.inputs[2]
+        expected = self.full_preimage_hash(2)
+        txi.script_sig = self.script_code
+        self.assertEqual(legacy.preimage_hash(2, txi, 1), expected)
+        txi.script_sig = None
+
+    def test_check_input(self):
+        legacy = self.recorded()
+        for i, txi in enumerate(self.inputs):
+            self.assertTrue(legacy.check_input(i, txi))
+        self.assertFalse(legacy.check_input(0, self.inputs[1]))
+
+        changed = TxInputType(address_n=[44 | 0x80000000, 0x80000000, 0x80000000, 1, 0],
+                              prev_hash=self.inputs[0].prev_hash,
+                              prev_index=self.inputs[0].prev_index,
+                              script_type=self.inputs[0].script_type,
+                              amount=None,
+                              sequence=self.inputs[0].sequence)
+        self.assertFalse(legacy.check_input(0, changed))
+
+    def test_fits(self):
+        self.assertTrue(LegacySighash.fits(self.tx))
+        self.assertFalse(LegacySighash.fits(SignTx(inputs_count=10000, outputs_count=1)))
+        self.assertFalse(LegacySighash(self.tx).add_output(
+            TxOutputBinType(amount=0, script_pubkey=bytes(64 * 1024))))
+
+
+if __name__ == '__main__':
+    unittest.main()
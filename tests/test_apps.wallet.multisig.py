@@ -0,0 +1,58 @@
+from common import *
+
+from trezor.messages.MultisigRedeemScriptType import MultisigRedeemScriptType
+
+from apps.wallet.sign_tx import multisig
+
+from txgen import cosigners
+
+
+class TestMultisig(unittest.TestCase):
+
+    def test_pubkey_cache(self):
+        ms = MultisigRedeemScriptType(pubkeys=cosigners(3), m=2)
+        uncached = multisig.multisig_get_pubkeys(ms)
+
+        multisig.multisig_cache_begin()
+        try:
+            self.assertEqual(multisig.multisig_get_pubkeys(ms), uncached)
+            self.assertEqual(len(multisig._pubkey_cache), 3)
+            # cached keys are returned
+            self.assertEqual(multisig.multisig_get_pubkeys(ms), uncached)
+            self.assertEqual(multisig.multisig_pubkey_index(ms, uncached[2]), 2)
+            # the path is a part of the key
+            ms.pubkeys[0].address_n = [0, 1]
+            self.assertNotEqual(multisig.multisig_get_pubkeys(ms)[0], uncached[0])
+            self.assertEqual(len(multisig._pubkey_cache), 4)
+        finally:
+            multisig.multisig_cache_end()
+        self.assertEqual(multisig._pubkey_cache, None)
+
+    def test_pubkey_cache_eviction(self):
+        size = 64  # _PUBKEY_CACHE_SIZE
+        hds = [cosigners(1, (0, i))[0] for i in range(size + 8)]
+        uncached = [multisig.multisig_get_pubkey(hd) for hd in hds]
+
+        multisig.multisig_cache_begin()
+        try:
+            for hd in hds[:size]:
+                multisig.multisig_get_pubkey(hd)
+            # the first key is used again, the second is the least recent
+            self.assertEqual(multisig.multisig_get_pubkey(hds[0]), uncached[0])
+            # keys past the cap are cached, evicting the least recent ones
+            for i in range(size, len(hds)):
+                self.assertEqual(multisig.multisig_get_pubkey(hds[i]), uncached[i])
+                self.assertEqual(len(multisig._pubkey_cache), size)
+                self.assertIn(multisig.multisig_node_fingerprint(hds[i]), multisig._pubkey_cache)
+            self.assertIn(multisig.multisig_node_fingerprint(hds[0]), multisig._pubkey_cache)
+            for hd in hds[1:9]:
+                self.assertNotIn(multisig.multisig_node_fingerprint(hd), multisig._pubkey_cache)
+            # evicted keys are derived again
+            self.assertEqual(multisig.multisig_get_pubkey(hds[1]), uncached[1])
+        finally:
+            multisig.multisig_cache_end()
+        self.assertEqual(multisig._pubkey_lru, None)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,118 @@
+from common import *
+
+import txgen
+
+from trezor.messages.RequestType import TXEXTRADATA
+from trezor.messages.SignTx import SignTx
+from trezor.messages.TxRequest import TxRequest
+from trezor.messages.TxRequestDetailsType import TxRequestDetailsType
+
+from apps.wallet.messages import SignTxExt
+from apps.wallet.sign_tx import signing
+from apps.wallet.sign_tx.sdcard import SDCardTx
+
+
+class TestSignTxSDCard(unittest.TestCase):
+
+    def test_sign(self):
+        tx, txis, txos, prevs = txgen.generate(3)
+
+        # signed over USB
+        host = txgen.Host(tx, txis, txos, prevs)
+        host.sign(signing.sign_tx(tx, txgen.root()))
+
+        # signed from the SD card
+        sd = txgen.MockSDCard()
+        c = txgen.container(tx, txis, txos, prevs)
+        sd.data[:len(c)] = c
+        source = txgen.sign_sdcard(sd, txgen.root())
+        self.assertEqual(source.inputs, 3)
+        self.assertFalse(sd.powered)
+
+        ofs = (len(c) + 511) // 512 * 512
+        self.assertEqual(sd.data[ofs:ofs + 8], b'TRZRSIG1')
+        size = int.from_bytes(sd.data[ofs + 8:ofs + 12], 'little')
+        self.assertEqual(size, len(host.serialized))
+        self.assertEqual(sd.data[ofs + 512:ofs + 512 + size], host.serialized)
+
+    def test_sign_partitioned(self):
+        tx, txis, txos, prevs = txgen.generate(2)
+        host = txgen.Host(tx, txis, txos, prevs)
+        host.sign(signing.sign_tx(tx, txgen.root()))
+
+        # the container is in a region after the partition table
+        sd = txgen.MockSDCard()
+        sd.data[:512] = b'\xaa' * 512
+        c = txgen.container(tx, txis, txos, prevs, reserved=8)
+        sd.data[2048:2048 + len(c)] = c
+        txgen.sign_sdcard(sd, txgen.root(), block=4)
+        self.assertEqual(sd.data[:512], b'\xaa' * 512)
+
+        ofs = (2048 + len(c) + 511) // 512 * 512
+        self.assertEqual(sd.data[ofs:ofs + 8], b'TRZRSIG1')
+        size = int.from_bytes(sd.data[ofs + 8:ofs + 12], 'little')
+        self.assertEqual(sd.data[ofs + 512:ofs + 512 + size], host.serialized)
+
+    def test_reserved(self):
+        tx, txis, txos, prevs = txgen.generate(10)
+        for reserved in (0, 1, 2, 1024):
+            sd = txgen.MockSDCard()
+            sd.data[:] = b'\xbb' * len(sd.data)
+            c = txgen.container(tx, txis, txos, prevs, reserved=reserved)
+            sd.data[:len(c)] = c
+            with self.assertRaises(signing.SigningError):
+                txgen.sign_sdcard(sd, txgen.root())
+            # nothing is written past the reserved blocks
+            end = ((len(c) + 511) // 512 + reserved) * 512
+            self.assertEqual(sd.data[end:], b'\xbb' * (len(sd.data) - end))
+
+    def test_extra_data(self):
+        tx, txis, txos, prevs = txgen.generate(1)
+        prev_hash = list(prevs)[0]
+        extra = bytes(range(256)) * 40
+        sd = txgen.MockSDCard()
+        c = txgen.container(tx, txis, txos, prevs, extra={prev_hash: extra})
+        sd.data[:len(c)] = c
+
+        reads = []
+        sd_read = sd.read
+        sd.read = lambda block, buf: reads.append(block) or sd_read(block, buf)
+        source = SDCardTx(sd)
+        txgen.run(source.load())
+
+        for ofs, n in ((0, 1024), (5000, 1024), (len(extra) - 10, 10)):
+            del reads[:]
+            req = TxRequest(request_type=TXEXTRADATA, details=TxRequestDetailsType(
+                tx_hash=prev_hash, extra_data_offset=ofs, extra_data_len=n))
+            ack = txgen.run(source.ack(req))
+            self.assertEqual(ack.tx.extra_data, extra[ofs:ofs + n])
+            # only the blocks of the requested slice are read
+            self.assertTrue(len(reads) <= (n + 511) // 512 + 1)
+
+        req = TxRequest(request_type=TXEXTRADATA, details=TxRequestDetailsType(
+            tx_hash=prev_hash, extra_data_offset=len(extra) - 10, extra_data_len=11))
+        with self.assertRaises(signing.SigningError):
+            txgen.run(source.ack(req))
+        source.close()
+
+    def test_debug_field(self):
+        # SD card signing is requested only in debug builds
+        extra = len(SignTxExt.FIELDS) - len(SignTx.FIELDS)
+        self.assertEqual(extra, 1 if __debug__ else 0)
+        self.assertIsNone(SignTxExt().sdcard_block)
+
+    def test_invalid(self):
+        sd = txgen.MockSDCard()
+        with self.assertRaises(signing.SigningError):
+            txgen.sign_sdcard(sd, txgen.root())
+
+        # missing record
+        tx, txis, txos, prevs = txgen.generate(2)
+        c = txgen.container(tx, txis[:1], txos, prevs)
+        sd.data[:len(c)] = c
+        with self.assertRaises(signing.SigningError):
+            txgen.sign_sdcard(sd, txgen.root())
+
+
+if __name__ == '__main__':
+    unittest.main()
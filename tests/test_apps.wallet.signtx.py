@@ -79,8 +79,7 @@ class TestSignTx(unittest.TestCase):
             # ButtonRequest(code=ButtonRequest_SignTx),
             TxRequest(request_type=TXINPUT, details=TxRequestDetailsType(request_index=0, tx_hash=None), serialized=None),
             TxAck(tx=TransactionType(inputs=[inp1])),
-            TxRequest(request_type=TXOUTPUT, details=TxRequestDetailsType(request_index=0, tx_hash=None), serialized=None),
-            TxAck(tx=TransactionType(outputs=[out1])),
+            # the outputs are not streamed again, the digest is computed from Phase 1 data
             TxRequest(request_type=TXOUTPUT, details=TxRequestDetailsType(request_index=0, tx_hash=None), serialized=TxRequestSerializedType(
                 signature_index=0,
                 signature=unhexlify('30450221009a0b7be0d4ed3146ee262b42202841834698bb3ee39c24e7437df208b8b7077102202b79ab1e7736219387dffe8d615bbdba87e11477104b867ef47afed1a5ede781'),
@@ -102,6 +101,100 @@ class TestSignTx(unittest.TestCase):
         with self.assertRaises(StopIteration):
             signer.send(None)
 
+    def test_prevtx_cache(self):
+        # previous tx d5f65ee80147b4bcc70b75e4bbf2d7382021b871bd8867ef8fa525ef50864882
+        # is streamed and verified once, further inputs spending it use the cache
+        prev_hash = unhexlify('d5f65ee80147b4bcc70b75e4bbf2d7382021b871bd8867ef8fa525ef50864882')
+
+        ptx1 = TransactionType(version=1, lock_time=0, inputs_cnt=2, outputs_cnt=1, extra_data_len=0)
+        pinp1 = TxInputType(script_sig=unhexlify('483045022072ba61305fe7cb542d142b8f3299a7b10f9ea61f6ffaab5dca8142601869d53c0221009a8027ed79eb3b9bc13577ac2853269323434558528c6b6a7e542be46e7e9a820141047a2d177c0f3626fc68c53610b0270fa6156181f46586c679ba6a88b34c6f4874686390b4d92e5769fbb89c8050b984f4ec0b257a0e5c4ff8bd3b035a51709503'),
+                            prev_hash=unhexlify('c16a03f1cf8f99f6b5297ab614586cacec784c2d259af245909dedb0e39eddcf'),
+                            prev_index=1,
+                            script_type=None,
+                            sequence=None)
+        pinp2 = TxInputType(script_sig=unhexlify('48304502200fd63adc8f6cb34359dc6cca9e5458d7ea50376cbd0a74514880735e6d1b8a4c0221008b6ead7fe5fbdab7319d6dfede3a0bc8e2a7c5b5a9301636d1de4aa31a3ee9b101410486ad608470d796236b003635718dfc07c0cac0cfc3bfc3079e4f491b0426f0676e6643a39198e8e7bdaffb94f4b49ea21baa107ec2e237368872836073668214'),
+                            prev_hash=unhexlify('1ae39a2f8d59670c8fc61179148a8e61e039d0d9e8ab08610cb69b4a19453eaf'),
+                            prev_index=1,
+                            script_type=None,
+                            sequence=None)
+        pout1 = TxOutputBinType(script_pubkey=unhexlify('76a91424a56db43cf6f2b02e838ea493f95d8d6047423188ac'),
+                                amount=390000,
+                                address_n=[])
+
+        messages = [
+            None,
+            TxRequest(request_type=TXMETA, details=TxRequestDetailsType(request_index=None, tx_hash=prev_hash), serialized=None),
+            TxAck(tx=ptx1),
+            TxRequest(request_type=TXINPUT, details=TxRequestDetailsType(request_index=0, tx_hash=prev_hash), serialized=None),
+            TxAck(tx=TransactionType(inputs=[pinp1])),
+            TxRequest(request_type=TXINPUT, details=TxRequestDetailsType(request_index=1, tx_hash=prev_hash), serialized=None),
+            TxAck(tx=TransactionType(inputs=[pinp2])),
+            TxRequest(request_type=TXOUTPUT, details=TxRequestDetailsType(request_index=0, tx_hash=prev_hash), serialized=None),
+        ]
+
+        cache = {}
+        tx_req = TxRequest(details=TxRequestDetailsType())
+        g = signing.get_prevtx_output_value(tx_req, prev_hash, 0, cache)
+        for request, response in chunks(messages, 2):
+            self.assertEqual(g.send(request), response)
+        with self.assertRaises(StopIteration) as e:
+            g.send(TxAck(tx=TransactionType(bin_outputs=[pout1])))
+        self.assertEqual(e.value.value, 390000)
+        self.assertEqual(cache, {prev_hash: [390000]})
+
+        # no more requests
+        for prev_index, amount in ((0, 390000), (1, 0)):
+            g = signing.get_prevtx_output_value(tx_req, prev_hash, prev_index, cache)
+            with self.assertRaises(StopIteration) as e:
+                g.send(None)
+            self.assertEqual(e.value.value, amount)
+
+    def test_node_cache(self):
+        seed = bip39.seed('alcohol woman abuse must during monitor noble actual mixed trade anger aisle', '')
+        root = bip32.from_seed(seed, 'secp256k1')
+        account = [44 | 0x80000000, 0x80000000, 0x80000000]
+
+        signing.node_cache_clear()
+        hits, misses = signing.node_cache_stats
+        for address_n in (account + [0, 0], account + [0, 1], account + [1, 0], [0]):
+            node = root.clone()
+            node.derive_path(address_n)
+            self.assertEqual(signing.node_derive(root, address_n).private_key(), node.private_key())
+        self.assertEqual(signing.node_cache_stats, [hits + 2, misses + 1])
+
+        # a different root does not use the nodes derived from the previous one
+        other = bip32.from_seed(bip39.seed('all all all all all all all all all all all all', ''), 'secp256k1')
+        node = other.clone()
+        node.derive_path(account + [0, 0])
+        self.assertEqual(signing.node_derive(other, account + [0, 0]).private_key(), node.private_key())
+        self.assertEqual(signing.node_cache_stats, [hits + 2, misses + 2])
+        signing.node_cache_clear()
+
+    def test_output_scripts(self):
+        coin_bitcoin = coins.by_name('Bitcoin')
+        out1 = TxOutputType(address='1MJ2tj2ThBE62zXbBYA5ZaN3fdve5CPAz1',
+                            amount=390000 - 10000,
+                            script_type=OutputScriptType.PAYTOADDRESS,
+                            address_n=[],
+                            multisig=None)
+
+        scripts = signing.OutputScripts()
+        script_pubkey = signing.output_derive_script(out1, coin_bitcoin, None)
+        scripts.add(signing.output_digest(out1), script_pubkey)
+        self.assertEqual(scripts.get(0, out1, coin_bitcoin, None), script_pubkey)
+
+        # outputs not recorded are derived
+        out2 = TxOutputType(address='1MJ2tj2ThBE62zXbBYA5ZaN3fdve5CPAz1',
+                            amount=10000,
+                            script_type=OutputScriptType.PAYTOADDRESS,
+                            address_n=[],
+                            multisig=None)
+        self.assertEqual(scripts.get(1, out2, coin_bitcoin, None), script_pubkey)
+
+        # a changed output is detected
+        with self.assertRaises(signing.SigningError):
+            scripts.get(0, out2, coin_bitcoin, None)
+
     def assertEqualEx(self, a, b):
         # hack to avoid adding __eq__ to signing.Ui* classes
         if ((isinstance(a, signing.UiConfirmOutput) and isinstance(b, signing.UiConfirmOutput)) or
@@ -0,0 +1,58 @@
+from common import *
+
+from apps.wallet.sign_tx.writers import *
+
+
+def bytewise(n: int, size: int) -> bytearray:
+    # the serialization before the writers packed with ustruct
+    w = bytearray()
+    for i in range(size):
+        w.append((n >> (8 * i)) & 0xFF)
+    return w
+
+
+class TestWriters(unittest.TestCase):
+
+    def test_uint(self):
+        for n in (0, 1, 0xFF, 0x100, 0x12345678, 0xFFFFFFFF):
+            w = bytearray()
+            write_uint32(w, n)
+            self.assertEqual(w, bytewise(n, 4))
+        for n in (0, 1, 0x12345678, 0xFFFFFFFF, 0x100000000, 2100000000000000):
+            w = bytearray()
+            write_uint64(w, n)
+            self.assertEqual(w, bytewise(n, 8))
+
+    def test_varint(self):
+        for n, size in ((0, 1), (252, 1), (253, 3), (0xFFFF, 3), (0x10000, 5), (0xFFFFFFFF, 5)):
+            w = bytearray()
+            write_varint(w, n)
+            self.assertEqual(len(w), size)
+            if size == 1:
+                self.assertEqual(w, bytewise(n, 1))
+            else:
+                self.assertEqual(w[1:], bytewise(n, size - 1))
+
+    def test_op_push(self):
+        for n, prefix, size in ((0x4B, None, 0), (0x4C, 0x4C, 1), (0xFE, 0x4C, 1),
+                                (0xFF, 0x4D, 2), (0xFFFF, 0x4E, 4)):
+            w = bytearray()
+            write_op_push(w, n)
+            if prefix is None:
+                self.assertEqual(w, bytewise(n, 1))
+            else:
+                self.assertEqual(w[0], prefix)
+                self.assertEqual(w[1:], bytewise(n, size))
+
+    def test_bytes_rev(self):
+        h = bytes(range(32))
+        w = bytearray(b'x')
+        write_bytes_rev(w, h)
+        self.assertEqual(w, bytearray(b'x') + bytearray(reversed(h)))
+        w = bytearray()
+        write_bytes_rev(w, b'abc')
+        self.assertEqual(w, bytearray(b'cba'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -49,6 +49,16 @@ class TestCryptoBlake256(unittest.TestCase):
         self.assertEqual(d0, d1)
         self.assertEqual(d0, d2)
 
+    def test_copy(self):
+        for b, d in self.vectors:
+            b = unhexlify(b)
+            x = hashlib.blake256(b[:len(b) // 2])
+            c = x.copy()
+            c.update(b[len(b) // 2:])
+            self.assertEqual(c.digest(), unhexlify(d))
+            # the original context is not affected
+            self.assertEqual(x.digest(), hashlib.blake256(b[:len(b) // 2]).digest())
+
 
 if __name__ == '__main__':
     unittest.main()
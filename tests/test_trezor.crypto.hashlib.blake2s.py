@@ -45,6 +45,23 @@ class TestCryptoBlake2s(unittest.TestCase):
         self.assertEqual(d0, d1)
         self.assertEqual(d0, d2)
 
+    def test_copy(self):
+        key = unhexlify('000102030405060708090a0b0c0d0e0f101112131415161718191a1b1c1d1e1f')
+        x = hashlib.blake2s(b'', key)
+        x.update(bytes(range(10)))
+        c = x.copy()
+        x.update(bytes(range(10, 30)))
+        c.update(bytes(range(10, 30)))
+        self.assertEqual(c.digest(), x.digest())
+        c.update(bytes(range(30, 80)))
+        self.assertNotEqual(c.digest(), x.digest())
+        for d, h in self.vectors:
+            d = unhexlify(d)
+            x = hashlib.blake2s(d[:len(d) // 2], key)
+            c = x.copy()
+            c.update(d[len(d) // 2:])
+            self.assertEqual(c.digest(), unhexlify(h))
+
 
 if __name__ == '__main__':
     unittest.main()
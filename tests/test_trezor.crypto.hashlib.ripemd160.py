@@ -40,6 +40,15 @@ class TestCryptoRipemd160(unittest.TestCase):
         self.assertEqual(d0, d1)
         self.assertEqual(d0, d2)
 
+    def test_copy(self):
+        for b, d in self.vectors:
+            x = hashlib.ripemd160(b[:len(b) // 2])
+            c = x.copy()
+            c.update(b[len(b) // 2:])
+            self.assertEqual(c.digest(), unhexlify(d))
+            # the original context is not affected
+            self.assertEqual(x.digest(), hashlib.ripemd160(b[:len(b) // 2]).digest())
+
 
 if __name__ == '__main__':
     unittest.main()
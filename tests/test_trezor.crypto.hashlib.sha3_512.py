@@ -68,6 +68,22 @@ class TestCryptoSha3_512(unittest.TestCase):
         self.assertEqual(d0, d1)
         self.assertEqual(d0, d2)
 
+    def test_copy(self):
+        for b, d in self.vectors:
+            x = hashlib.sha3_512(b[:len(b) // 2])
+            c = x.copy()
+            c.update(b[len(b) // 2:])
+            self.assertEqual(c.digest(), unhexlify(d))
+            # the original context is not affected
+            self.assertEqual(x.digest(), hashlib.sha3_512(b[:len(b) // 2]).digest())
+
+    def test_copy_keccak(self):
+        for b, d in self.vectors_keccak:
+            x = hashlib.sha3_512(b[:len(b) // 2])
+            c = x.copy()
+            c.update(b[len(b) // 2:])
+            self.assertEqual(c.digest(True), unhexlify(d))
+
 
 if __name__ == '__main__':
     unittest.main()
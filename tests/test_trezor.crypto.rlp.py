@@ -64,6 +64,20 @@ class TestCryptoRlp(unittest.TestCase):
             o2 = rlp.encode(i)
             self.assertEqual(o, o2)
 
+    def test_rlp_write(self):
+
+        for i, o in self.vectors:
+            o = unhexlify(o)
+            w = bytearray()
+            rlp.write(w, i)
+            self.assertEqual(w, o)
+            self.assertEqual(rlp.length(i), len(o))
+
+    def test_rlp_field_length(self):
+
+        for i in (b'', b'\x00', b'\x80', b'dog', b'x' * 56, b'x' * 256, b'x' * 70000):
+            self.assertEqual(rlp.field_length(len(i), i[:1]), len(rlp.encode(i)))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,8 +1,27 @@
 from common import *
 
+import sys
+
 from trezor import utils
 
 
+def run(coro):
+    try:
+        coro.send(None)
+    except StopIteration as e:
+        return e.value
+
+
+@utils.unimport
+def dispatch_TxWeight():
+    from apps.wallet.sign_tx import tx_weight_calculator
+    return _workflow(tx_weight_calculator)
+
+
+async def _workflow(mod):
+    return mod.__name__
+
+
 class TestUtils(unittest.TestCase):
 
     def test_chunks(self):
@@ -13,6 +32,82 @@ class TestUtils(unittest.TestCase):
             self.assertEqual(c[i].stop, 100 if (i == 14) else (i + 1) * 7)
             self.assertEqual(c[i].step, 1)
 
+    def test_memcpy_rev(self):
+        dst = bytearray(6)
+        self.assertEqual(utils.memcpy_rev(dst, 1, b'abcdef', 2, 3), 3)
+        self.assertEqual(dst, bytearray(b'\x00edc\x00\x00'))
+        # limited by the remaining space in both buffers
+        self.assertEqual(utils.memcpy_rev(dst, 4, b'abcdef', 0, 6), 2)
+        self.assertEqual(dst, bytearray(b'\x00edcba'))
+        self.assertEqual(utils.memcpy_rev(dst, 0, b'ab', 5, 1), 0)
+
+    def test_hashwriter_fork(self):
+        from trezor.crypto.hashlib import sha256
+        w = utils.HashWriter(sha256)
+        w.extend(b'abc')
+        f = w.fork()
+        f.append(0x64)
+        w.extend(b'x')
+        self.assertEqual(f.get_digest(), sha256(b'abcd').digest())
+        self.assertEqual(w.get_digest(), sha256(b'abcx').digest())
+
+    def test_hashwriter_blocks(self):
+        from trezor.crypto.hashlib import sha256
+        # small and large writes across the block boundaries
+        writes = [b'a', bytes(range(60)), b'bcd', bytes(200), b'', bytes(range(64)), b'efgh']
+        w = utils.HashWriter(sha256)
+        data = bytearray()
+        for i, buf in enumerate(writes):
+            w.extend(buf)
+            w.append(i)
+            data.extend(buf)
+            data.append(i)
+        f = w.fork()
+        f.extend(b'x')
+        self.assertEqual(w.get_digest(), sha256(data).digest())
+        self.assertEqual(f.get_digest(), sha256(data + b'x').digest())
+        for i in range(100):
+            w.append(i)
+            data.append(i)
+        self.assertEqual(w.get_digest(), sha256(data).digest())
+
+    def test_unimport_resident(self):
+        mod = 'apps.wallet.sign_tx.tx_weight_calculator'
+        budget = utils.resident_budget
+        utils.unimport_all()
+        utils.residency_reset()
+        try:
+            # plenty of free heap, modules stay resident between calls
+            utils.resident_budget = 0
+            self.assertEqual(run(dispatch_TxWeight()), mod)
+            self.assertTrue(mod in sys.modules)
+            self.assertEqual(run(dispatch_TxWeight()), mod)
+            self.assertTrue(mod in sys.modules)
+            self.assertTrue(utils.residency_report().startswith('dispatch_TxWeight cold=1/'))
+            self.assertTrue(' warm=1/' in utils.residency_report())
+
+            # under pressure everything gets evicted
+            utils.resident_budget = 1 << 30
+            self.assertEqual(run(dispatch_TxWeight()), mod)
+            self.assertFalse(mod in sys.modules)
+            self.assertFalse(utils._resident)
+        finally:
+            utils.resident_budget = budget
+            utils.unimport_all()
+            utils.residency_reset()
+
+    def test_unimport_evict_lru(self):
+        utils.unimport_all()
+        utils._resident.extend([
+            ['a', [], 3],
+            ['b', [], 1],
+            ['c', [], 2],
+        ])
+        # 'b' is least recently used, 'c' was loaded after it
+        utils._evict_lru()
+        self.assertEqual([g[0] for g in utils._resident], ['a'])
+        utils.unimport_all()
+
 
 if __name__ == '__main__':
     unittest.main()
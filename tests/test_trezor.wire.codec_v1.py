@@ -94,6 +94,37 @@ def test_reader():
     assert_async(reader.areadinto(onebyte_buffer), [(None, EOFError()), ])
 
 
+def test_reader_packet():
+    rep_len = 64
+    interface_num = 0xdeadbeef
+    message_type = 0x4321
+    message_len = 250
+    interface = MockHID(interface_num)
+    reader = codec_v1.Reader(interface)
+
+    message = bytearray(range(message_len))
+    report_header = bytearray(unhexlify('3f23234321000000fa'))
+
+    # all reports of the message in one packet, as sent by the emulator host
+    # with bulk framing
+    first_payload = message[:rep_len - len(report_header)]
+    next_payloads = list(chunks(message[len(first_payload):], rep_len - 1))
+    packet = report_header + first_payload
+    for p in next_payloads:
+        packet += bytearray(unhexlify('3f')) + p + bytearray(rep_len - 1 - len(p))
+
+    # open, expected one read
+    assert_async(reader.aopen(), [(None, select(io.POLL_READ | interface_num)), (packet, StopIteration()), ])
+    assert_eq(reader.type, message_type)
+    assert_eq(reader.size, message_len)
+
+    # read the whole message, expected no more reads
+    buffer = bytearray(message_len)
+    assert_async(reader.areadinto(buffer), [(None, StopIteration()), ])
+    assert_eq(buffer, message)
+    assert_eq(reader.size, 0)
+
+
 def test_writer():
     rep_len = 64
     interface_num = 0xdeadbeef
@@ -0,0 +1,55 @@
+from common import *
+
+from trezor.messages import wire_types
+from trezor.wire import metrics
+
+
+class TestWireMetrics(unittest.TestCase):
+
+    def setUp(self):
+        metrics.reset()
+
+    def test_counters(self):
+        metrics.request(wire_types.SignTx, 13)
+        metrics.read(wire_types.TxAck, 100)
+        metrics.read(wire_types.TxAck, 50)
+        metrics.write(wire_types.TxRequest, 20)
+        metrics.failure(wire_types.SignTx)
+        metrics.error(None)  # aborted before the message type was known
+
+        signtx = metrics.stats[wire_types.SignTx]
+        self.assertEqual(signtx[:7], [1, 1, 13, 0, 0, 1, 0])
+        txack = metrics.stats[wire_types.TxAck]
+        self.assertEqual(txack[:3], [0, 2, 150])
+        txreq = metrics.stats[wire_types.TxRequest]
+        self.assertEqual(txreq[3:5], [1, 20])
+        self.assertEqual(len(metrics.stats), 3)
+
+    def test_latency(self):
+        metrics.latency(wire_types.Initialize, 500)  # 0 ms
+        metrics.latency(wire_types.Initialize, 1000)  # 1 ms
+        metrics.latency(wire_types.Initialize, 150 * 1000)
+        metrics.latency(wire_types.Initialize, 60 * 1000 * 1000)
+
+        e = metrics.stats[wire_types.Initialize]
+        hist = e[-len(metrics.BUCKETS) - 1:]
+        self.assertEqual(sum(hist), 4)
+        self.assertEqual(hist[0], 1)
+        self.assertEqual(hist[1], 1)
+        self.assertEqual(hist[metrics.BUCKETS.index(200)], 1)
+        self.assertEqual(hist[-1], 1)
+
+    def test_report(self):
+        metrics.request(wire_types.Initialize, 0)
+        metrics.write(wire_types.Features, 120)
+        metrics.latency(wire_types.Initialize, 3000)
+        lines = metrics.report().split('\n')
+        self.assertEqual(len(lines), 2)
+        self.assertTrue(lines[0].startswith('Initialize req=1 rd=1/0 wr=0/0 fail=0 err=0 ms=3/1 hist=0,0,1,'))
+        self.assertTrue(lines[1].startswith('Features req=0 rd=0/0 wr=1/120 '))
+        metrics.reset()
+        self.assertEqual(metrics.report(), '')
+
+
+if __name__ == '__main__':
+    unittest.main()
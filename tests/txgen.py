@@ -0,0 +1,287 @@
+'''
+Synthetic transactions for the signing benchmarks, see `bench_*.py`.
+
+`generate` builds a transaction spending outputs of generated previous
+transactions, `Host` answers the requests of `signing.sign_tx` for it the way
+a wallet would.
+'''
+
+from ubinascii import unhexlify
+
+import protobuf
+from trezor.crypto import bip32, bip39
+from trezor.crypto.hashlib import sha256
+from trezor.messages.SignTx import SignTx
+from trezor.messages.TxInputType import TxInputType
+from trezor.messages.TxOutputType import TxOutputType
+from trezor.messages.TxOutputBinType import TxOutputBinType
+from trezor.messages.TxAck import TxAck
+from trezor.messages.HDNodeType import HDNodeType
+from trezor.messages.HDNodePathType import HDNodePathType
+from trezor.messages.MultisigRedeemScriptType import MultisigRedeemScriptType
+from trezor.messages.TransactionType import TransactionType
+from trezor.messages.RequestType import TXINPUT, TXOUTPUT, TXMETA, TXEXTRADATA, TXFINISHED
+from trezor.messages import InputScriptType, OutputScriptType
+from trezor.utils import HashWriter
+
+from apps.wallet.sign_tx.writers import *
+
+MNEMONIC = 'alcohol woman abuse must during monitor noble actual mixed trade anger aisle'
+
+_root = None
+
+
+def root():
+    global _root
+    if _root is None:
+        _root = bip32.from_seed(bip39.seed(MNEMONIC, ''), 'secp256k1')
+    return _root
+
+
+def prev_tx(i: int, amount: int):
+    '''Previous transaction with a single input and output paying `amount`.'''
+    meta = TransactionType(version=1, lock_time=0, inputs_cnt=1, outputs_cnt=1, extra_data_len=0)
+    txi = TxInputType(prev_hash=sha256(('coinbase %d' % i).encode()).digest(),
+                      prev_index=0,
+                      script_sig=unhexlify('00'),
+                      sequence=0xffffffff)
+    txo = TxOutputBinType(amount=amount,
+                          script_pubkey=unhexlify('76a91424a56db43cf6f2b02e838ea493f95d8d6047423188ac'))
+    h = HashWriter(sha256)
+    write_uint32(h, meta.version)
+    write_varint(h, 1)
+    write_tx_input(h, txi)
+    write_varint(h, 1)
+    write_tx_output(h, txo)
+    write_uint32(h, meta.lock_time)
+    return get_tx_hash(h, True, True), meta, txi, txo
+
+
+def cosigners(n: int, address_n=(0, 0)):
+    '''Public nodes of `n` cosigners of a multisig account.'''
+    pubkeys = []
+    for i in range(n):
+        node = root().clone()
+        node.derive_path([45 | 0x80000000, i])
+        pubkeys.append(HDNodePathType(
+            node=HDNodeType(depth=node.depth(),
+                            fingerprint=node.fingerprint(),
+                            child_num=node.child_num(),
+                            chain_code=node.chain_code(),
+                            public_key=node.public_key()),
+            address_n=list(address_n)))
+    return pubkeys
+
+
+def generate(inputs: int, script_type=InputScriptType.SPENDADDRESS, coin_name='Bitcoin', multisig=None):
+    '''
+    Transaction with `inputs` inputs of 10000 satoshi and one output.  With
+    `multisig` as (m, n), the inputs are m-of-n multisig with us as the first
+    cosigner.
+    '''
+    tx = SignTx(coin_name=coin_name, version=1, lock_time=0, inputs_count=inputs, outputs_count=1)
+    nodes = [p.node for p in cosigners(multisig[1])] if multisig else None
+    prevs = {}
+    txis = []
+    for i in range(inputs):
+        prev_hash, meta, ptxi, ptxo = prev_tx(i, 10000)
+        prevs[prev_hash] = (meta, ptxi, ptxo)
+        if multisig:
+            address_n = [45 | 0x80000000, 0, 0, i]
+            ms = MultisigRedeemScriptType(
+                pubkeys=[HDNodePathType(node=node, address_n=[0, i]) for node in nodes],
+                m=multisig[0],
+                signatures=[b''] * multisig[1])
+        else:
+            address_n = [44 | 0x80000000, 0x80000000, 0x80000000, 0, i]
+            ms = None
+        txis.append(TxInputType(address_n=address_n,
+                                prev_hash=prev_hash,
+                                prev_index=0,
+                                amount=10000,
+                                script_type=script_type,
+                                sequence=0xffffffff,
+                                multisig=ms))
+    txos = [TxOutputType(address='1MJ2tj2ThBE62zXbBYA5ZaN3fdve5CPAz1',
+                         amount=inputs * 10000 - 1000,
+                         script_type=OutputScriptType.PAYTOADDRESS,
+                         address_n=[])]
+    return tx, txis, txos, prevs
+
+
+class Host:
+    '''Answers the requests of the signer, counting them.'''
+
+    def __init__(self, tx, txis, txos, prevs):
+        self.tx = tx
+        self.txis = txis
+        self.txos = txos
+        self.prevs = prevs
+        self.requests = 0
+        self.serialized = bytearray()  # the signed transaction
+
+    def sign(self, signer):
+        res = None
+        while True:
+            req = signer.send(res)
+            if req.__qualname__ != 'TxRequest':
+                res = True  # confirm everything
+                continue
+            if req.serialized is not None and req.serialized.serialized_tx:
+                self.serialized.extend(req.serialized.serialized_tx)
+            if req.request_type == TXFINISHED:
+                return
+            self.requests += 1
+            res = self.respond(req)
+
+    def respond(self, req):
+        i = req.details.request_index
+        tx_hash = req.details.tx_hash
+        if tx_hash is None:
+            if req.request_type == TXINPUT:
+                return TxAck(tx=TransactionType(inputs=[copy_input(self.txis[i])]))
+            if req.request_type == TXOUTPUT:
+                return TxAck(tx=TransactionType(outputs=[copy_output(self.txos[i])]))
+        else:
+            meta, ptxi, ptxo = self.prevs[bytes(tx_hash)]
+            if req.request_type == TXMETA:
+                return TxAck(tx=meta)
+            if req.request_type == TXINPUT:
+                return TxAck(tx=TransactionType(inputs=[ptxi]))
+            if req.request_type == TXOUTPUT:
+                return TxAck(tx=TransactionType(bin_outputs=[ptxo]))
+        raise ValueError('Unexpected request')
+
+
+# the signer modifies the received messages, send fresh objects as a wallet would
+
+def copy_input(txi):
+    ms = txi.multisig
+    if ms is not None:
+        ms = MultisigRedeemScriptType(pubkeys=ms.pubkeys,
+                                      m=ms.m,
+                                      signatures=[b''] * len(ms.pubkeys))
+    return TxInputType(address_n=txi.address_n,
+                       prev_hash=txi.prev_hash,
+                       prev_index=txi.prev_index,
+                       amount=txi.amount,
+                       script_type=txi.script_type,
+                       sequence=txi.sequence,
+                       multisig=ms)
+
+
+def copy_output(txo):
+    return TxOutputType(address=txo.address,
+                        amount=txo.amount,
+                        script_type=txo.script_type,
+                        address_n=txo.address_n)
+
+
+# SD card container, see apps.wallet.sign_tx.sdcard
+
+class MockSDCard:
+    '''SD card kept in memory.'''
+
+    def __init__(self, blocks=1024):
+        self.data = bytearray(blocks * 512)
+        self.powered = False
+
+    def present(self):
+        return True
+
+    def capacity(self):
+        return len(self.data)
+
+    def power(self, state):
+        self.powered = state
+        return True
+
+    def read(self, block_num, buf):
+        if not self.powered:
+            return False
+        n = len(buf) // 512 * 512
+        buf[:n] = self.data[block_num * 512:block_num * 512 + n]
+        return True
+
+    def write(self, block_num, buf):
+        if not self.powered:
+            return False
+        n = len(buf) // 512 * 512
+        self.data[block_num * 512:block_num * 512 + n] = buf[:n]
+        return True
+
+
+def encode(msg) -> bytes:
+    counter = protobuf.CountingWriter()
+    run(protobuf.dump_message(counter, msg))
+    w = protobuf.BytearrayWriter(counter.size)
+    run(protobuf.dump_message(w, msg))
+    return w.buf
+
+
+def container(tx, txis, txos, prevs, reserved=64, extra=None) -> bytearray:
+    '''
+    Container of the transaction for the SD card, with `reserved` free blocks
+    for the signed transaction.  `extra` maps previous transaction hashes to
+    their raw extra data.
+    '''
+    records = [(0xFF, b'', 0, tx)]
+    for i, txi in enumerate(txis):
+        records.append((TXINPUT, b'', i, TransactionType(inputs=[txi])))
+    for i, txo in enumerate(txos):
+        records.append((TXOUTPUT, b'', i, TransactionType(outputs=[txo])))
+    for prev_hash, (meta, ptxi, ptxo) in prevs.items():
+        records.append((TXMETA, prev_hash, 0, meta))
+        records.append((TXINPUT, prev_hash, 0, TransactionType(inputs=[ptxi])))
+        records.append((TXOUTPUT, prev_hash, 0, TransactionType(bin_outputs=[ptxo])))
+    for prev_hash, data in (extra or {}).items():
+        records.append((TXEXTRADATA, prev_hash, 0, data))
+
+    payload = bytearray()
+    for kind, tx_hash, index, msg in records:
+        data = msg if isinstance(msg, (bytes, bytearray)) else encode(msg)
+        payload.append(kind)
+        write_uint32(payload, index)
+        payload.append(len(tx_hash))
+        payload.extend(tx_hash)
+        write_uint32(payload, len(data))
+        payload.extend(data)
+
+    c = bytearray(b'TRZRSTX1')
+    write_uint32(c, len(payload))
+    write_uint32(c, len(records))
+    write_uint32(c, reserved)
+    c.extend(payload)
+    return c
+
+
+def run(coro):
+    try:
+        while True:
+            coro.send(None)
+    except StopIteration as e:
+        return e.value
+
+
+def sign_sdcard(sd, root, block=0):
+    '''Sign the transaction on `sd` the way the SignTx workflow does.'''
+    from apps.wallet.sign_tx import signing
+    from apps.wallet.sign_tx.sdcard import SDCardTx
+
+    source = SDCardTx(sd, block)
+    try:
+        signer = signing.sign_tx(run(source.load()), root)
+        res = None
+        while True:
+            req = signer.send(res)
+            if req.__qualname__ != 'TxRequest':
+                res = True  # confirm everything
+                continue
+            source.write(req.serialized)
+            if req.request_type == TXFINISHED:
+                break
+            res = run(source.ack(req))
+        source.finish()
+    finally:
+        source.close()
+    return source
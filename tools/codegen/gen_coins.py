@@ -1,42 +1,52 @@
 #!/usr/bin/env python3
 import json
 
+# only the fields used by the firmware are kept, see apps/common/coins.py
 fields = [
     'coin_name',
     'coin_shortcut',
-    'coin_label',
     'address_type',
     'address_type_p2sh',
     'maxfee_kb',
-    'minfee_kb',
     'signed_message_header',
-    'hash_genesis_block',
     'xprv_magic',
     'xpub_magic',
     'bech32_prefix',
-    'bip44',
     'segwit',
     'forkid',
     'force_bip143',
-    'default_fee_b',
-    'dust_limit',
-    'blocktime_minutes',
-    'firmware',
-    'address_prefix',
-    'min_address_length',
-    'max_address_length',
-    'bitcore',
 ]
 
 coins = json.load(open('../../vendor/trezor-common/coins.json', 'r'))
 
-print('COINS = [')
+
+def value(c, n):
+    if n in ['xpub_magic', 'xprv_magic']:
+        return '0x%s' % c[n]
+    return repr(c[n])
+
+
+def index(key):
+    # the first coin wins, as with the linear search
+    idx = {}
+    for i, c in enumerate(coins):
+        idx.setdefault(c[key], i)
+    print('_BY_%s = {' % key.upper())
+    for k, i in idx.items():
+        print('    %s: %d,' % (repr(k), i))
+    print('}\n')
+
+
+print('_FIELDS = (')
+for n in fields:
+    print('    %s,' % repr(n))
+print(')\n')
+
+print('_COINS = (')
 for c in coins:
-    print('    CoinType(')
-    for n in fields:
-        if n in ['xpub_magic', 'xprv_magic']:
-            print('        %s=0x%s,' % (n, c[n]))
-        else:
-            print('        %s=%s,' % (n, repr(c[n])))
-    print('    ),')
-print(']\n')
+    print('    (%s),' % ', '.join(value(c, n) for n in fields))
+print(')\n')
+
+index('coin_name')
+index('coin_shortcut')
+index('address_type')
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+# generates the token table at the end of src/apps/ethereum/tokens.py from a
+# JSON list of tokens with the keys chain, chain_id, address, symbol, decimals
+# and name
+import json
+import struct
+import sys
+
+tokens = json.load(open(sys.argv[1], 'r'))
+
+
+def literal(data):
+    return "b'%s'" % ''.join('\\x%02x' % b for b in data)
+
+
+# records are sorted by their key, chain id (uint32 big-endian) and address
+records = {}
+for t in tokens:
+    address = bytes.fromhex(t['address'][2:] if t['address'].startswith('0x') else t['address'])
+    key = struct.pack('>I', t['chain_id']) + address
+    records.setdefault(key, t)  # the first token wins, as with the linear search
+
+pool = bytearray()
+offsets = {}
+for key in sorted(records):
+    symbol = records[key]['symbol'].encode()
+    if symbol not in offsets:
+        offsets[symbol] = len(pool)
+        pool.extend(symbol)
+
+print('# rest of the file is generated using tools/codegen/gen_tokens.py')
+print('# DO NOT EDIT MANUALLY!')
+print('_TOKENS = (')
+chain = None
+for key in sorted(records):
+    t = records[key]
+    if t['chain'] != chain:
+        chain = t['chain']
+        print('    # %s' % chain)
+    symbol = t['symbol'].encode()
+    rest = struct.pack('>BHB', t['decimals'], offsets[symbol], len(symbol))
+    print('    %s  # %s, %s' % (literal(key + rest), t['symbol'], t['name']))
+print(')')
+print('_SYMBOLS = (')
+for i in range(0, len(pool), 32):
+    print('    %s' % literal(pool[i:i + 32]))
+print(')')